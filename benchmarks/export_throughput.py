@@ -0,0 +1,133 @@
+"""Time and peak memory of call exports, old in-memory path against streaming
+
+Seeds a scratch database with synthetic calls, then runs every export in a
+fresh process so each reports its own peak RSS:
+
+    python benchmarks/export_throughput.py --rows 5000000
+
+"in-memory CSV" is the previous path: every matching call loaded as a
+``CallRecord``, one DataFrame, one ``to_csv`` string. The other rows stream
+through ``callcenter.exports`` a chunk at a time.
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORMATS = ["CSV", "JSON", "Parquet", "Arrow IPC", "Excel"]
+SEED_BATCH = 100000
+
+
+def seed(path: str, rows: int):
+    from callcenter.models import CallRecord, CallStatus
+    from callcenter.store import CallStore
+
+    store = CallStore(path, batch_size=SEED_BATCH)
+    statuses = list(CallStatus)
+    now = datetime.now()
+    for batch_start in range(0, rows, SEED_BATCH):
+        store.upsert(
+            CallRecord(
+                call_id=f"call_{i:09d}",
+                assistant_id=f"assistant_{i % 25 + 1}",
+                phone_number=f"+1555{i % 200000:07d}",
+                start_time=now - timedelta(seconds=i * 0.5),
+                end_time=now - timedelta(seconds=i * 0.5 - 90),
+                duration=90,
+                status=statuses[i % len(statuses)],
+                transcript="",
+                sentiment_score=(i % 21 - 10) / 10,
+                lead_score=i % 11,
+                cost=0.45,
+                recording_url="",
+                custom_data={"campaign": f"campaign_{i % 7}"},
+            )
+            for i in range(batch_start, min(batch_start + SEED_BATCH, rows))
+        )
+
+
+def run_export(path: str, mode: str, out_path: str) -> int:
+    import pandas as pd
+
+    from callcenter.exports import export_calls
+    from callcenter.store import CallStore
+
+    store = CallStore(path)
+    if mode != "in-memory CSV":
+        with open(out_path, "wb") as out:
+            return export_calls(store, mode, out)
+    records = [record for page in store.iter_pages() for record in page]
+    frame = pd.DataFrame([
+        {
+            "Call ID": record.call_id,
+            "Assistant": record.assistant_id,
+            "Phone Number": record.phone_number,
+            "Start Time": record.start_time,
+            "End Time": record.end_time,
+            "Duration": record.duration,
+            "Status": record.status.value,
+            "Campaign": record.custom_data.get("campaign", ""),
+            "Transcript": record.transcript,
+            "Sentiment Score": record.sentiment_score,
+            "Lead Score": record.lead_score,
+            "Cost": record.cost,
+        }
+        for record in records
+    ])
+    with open(out_path, "w") as out:
+        out.write(frame.to_csv(index=False))
+    return len(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000000)
+    parser.add_argument("--formats", nargs="*", default=FORMATS)
+    parser.add_argument("--skip-in-memory", action="store_true", help="skip the old path, which needs several GB at 5M rows")
+    parser.add_argument("--db", help="reuse an already seeded database, or where to keep a new one")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    sys.path.insert(0, ROOT)
+
+    if args.run:
+        started = time.perf_counter()
+        rows = run_export(args.db, args.run, args.out)
+        elapsed = time.perf_counter() - started
+        # ru_maxrss is in kilobytes on Linux
+        print(rows, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+        return
+
+    scratch = tempfile.mkdtemp()
+    db_path = args.db or os.path.join(scratch, "bench.db")
+    if not os.path.exists(db_path):
+        started = time.perf_counter()
+        seed(db_path, args.rows)
+        print(f"seeded {args.rows:,} calls in {time.perf_counter() - started:.1f} s")
+
+    modes = ([] if args.skip_in_memory else ["in-memory CSV"]) + args.formats
+    print(f"{'export':<16}{'rows':>12}{'seconds':>10}{'peak RSS MB':>14}{'file MB':>10}")
+    for mode in modes:
+        out_path = os.path.join(scratch, "export.out")
+        result = subprocess.run(
+            [sys.executable, __file__, "--db", db_path, "--run", mode, "--out", out_path],
+            capture_output=True, text=True,
+        )
+        if result.returncode:
+            # A negative code is a signal, e.g. -9 when the OOM killer stepped in
+            reason = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit code {result.returncode}"
+            print(f"{mode:<16} failed: {reason}")
+            continue
+        rows, elapsed, peak_mb = result.stdout.split()
+        size_mb = os.path.getsize(out_path) / 1e6
+        print(f"{mode:<16}{int(rows):>12,}{float(elapsed):>10.1f}{float(peak_mb):>14.0f}{size_mb:>10.1f}")
+        os.remove(out_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Startup and rerun latency of the dashboard, per page
+
+Runs the app headlessly with Streamlit's AppTest against a scratch
+database and reports the first (cold) run and the median of repeated
+reruns for every page:
+
+    python benchmarks/page_latency.py --reruns 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = [
+    "dashboard", "call_center", "live_analytics", "advanced_reports", "assistant_config",
+    "bulk_operations", "realtime_monitor", "call_logs", "campaign_manager", "system_admin",
+]
+
+
+def timed_run(app_test) -> float:
+    started = time.perf_counter()
+    app_test.run()
+    if app_test.exception:
+        raise RuntimeError(app_test.exception[0].message)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--pages", nargs="*", default=PAGES)
+    args = parser.parse_args()
+
+    os.environ.setdefault("CALLCENTER_DB", os.path.join(tempfile.mkdtemp(), "bench.db"))
+    sys.path.insert(0, ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    print(f"startup (first run, cold caches): {timed_run(app_test) * 1000:8.1f} ms")
+    print(f"{'page':<20}{'first run ms':>14}{'median rerun ms':>18}")
+    for page in args.pages:
+        app_test.switch_page(f"ui/pages/{page}.py")
+        first = timed_run(app_test)
+        reruns = [timed_run(app_test) for _ in range(args.reruns)]
+        print(f"{page:<20}{first * 1000:>14.1f}{statistics.median(reruns) * 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
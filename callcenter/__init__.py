@@ -0,0 +1,5 @@
+"""Backend services for the VAPI AI Call Center Pro dashboard
+
+Everything in this package is importable without a running Streamlit
+script, so background workers and side services can share it with app.py.
+"""
@@ -0,0 +1,220 @@
+"""Assistant performance analytics over the call rollups
+
+Everything here reads the hourly ``call_rollups`` buckets maintained by
+``callcenter.rollups`` rather than raw calls, so each page costs
+O(assistants x buckets) however many calls are stored; only the sentiment
+trend, which classifies each call, reads the last few days of calls. Per-assistant
+metrics are additionally memoized per database version, so the Dashboard,
+Live Analytics and Advanced Reports pages share a single computation. Call
+volume forecasts are delegated to ``callcenter.forecast``.
+
+Buckets are UTC epoch seconds; each is placed on the local clock with the
+offset in force at that moment, so days and hours either side of a DST
+change stay right.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .columnar import to_local
+from .forecast import ForecastEngine
+from .models import AssistantConfig
+from .rollups import MEASURES, RollupStore, summarize
+from .store import CallStore, local_day, local_midnight
+
+
+def local_times(seconds: Iterable[int]) -> pd.Series:
+    """Naive local wall-clock times for UTC epoch seconds"""
+    return to_local(pd.Series(pd.to_datetime(np.asarray(seconds), unit="s", utc=True)))
+
+
+class AnalyticsEngine:
+    def __init__(self, call_store: CallStore, rollups: RollupStore, window: timedelta = timedelta(days=30)):
+        self.call_store = call_store
+        self.rollups = rollups
+        self.window = window
+        self.forecaster = ForecastEngine(call_store)
+        self._activity: Optional[Tuple[tuple, pd.DataFrame]] = None
+        self._lock = threading.Lock()
+
+    def assistant_activity(self, now: Optional[datetime] = None) -> pd.DataFrame:
+        """Per-assistant totals for the window, recomputed only when the calls change
+
+        The windows slide with the clock, so results are also refreshed once
+        a minute when nothing has been written.
+        """
+        now = now or datetime.now()
+        key = (self.call_store.data_version(), now.replace(second=0, microsecond=0))
+        with self._lock:
+            if self._activity is not None and self._activity[0] == key:
+                return self._activity[1]
+
+            buckets = self.rollups.buckets("hour", "assistant", now - self.window)
+            buckets["hour"] = local_times(buckets["bucket"]).dt.hour.to_numpy()
+            buckets["day_calls"] = buckets["calls"].where(buckets["bucket"] >= (now - timedelta(days=1)).timestamp(), 0)
+            buckets["week_calls"] = buckets["calls"].where(buckets["bucket"] >= (now - timedelta(days=7)).timestamp(), 0)
+
+            by_assistant = buckets.groupby("key")
+            activity = by_assistant[MEASURES + ["day_calls", "week_calls"]].sum()
+            activity["last_call"] = by_assistant["last_call"].max()
+            # Hour of day with the most calls
+            by_hour = buckets.groupby(["key", "hour"])["calls"].sum()
+            if not by_hour.empty:
+                activity["peak_hour"] = by_hour.groupby(level=0).idxmax().str[1]
+            else:
+                activity["peak_hour"] = 0
+            self._activity = (key, activity)
+            return activity
+
+    def kpis(self, days: int = 30, now: Optional[datetime] = None) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Headline KPIs for the last ``days`` days and for the period before it"""
+        now = now or datetime.now()
+        start = now - timedelta(days=days)
+        current = summarize(self.rollups.totals("assistant", start))
+        previous = summarize(self.rollups.totals("assistant", start - timedelta(days=days), until=start))
+        return current, previous
+
+    def daily_trend(
+        self, days: int = 30, assistant_ids: Optional[Iterable[str]] = None, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Calls and success rate per local day"""
+        now = now or datetime.now()
+        buckets = self.rollups.buckets("hour", "assistant", now - timedelta(days=days), keys=assistant_ids)
+        buckets["Date"] = local_times(buckets["bucket"]).dt.normalize().to_numpy()
+        daily = buckets.groupby("Date")[["calls", "completed", "finished"]].sum()
+        daily = daily.reindex(pd.date_range(end=pd.Timestamp(now.date()), periods=days + 1, freq="D"), fill_value=0)
+        return pd.DataFrame({
+            "Date": daily.index,
+            "Calls": daily["calls"].to_numpy().astype(int),
+            "Success Rate": np.divide(
+                daily["completed"].to_numpy() * 100.0, daily["finished"].to_numpy(),
+                out=np.zeros(len(daily)), where=daily["finished"].to_numpy() > 0
+            ),
+        })
+
+    def sentiment_trend(self, days: int = 7, now: Optional[datetime] = None) -> pd.DataFrame:
+        """Share of positive, neutral and negative scored calls per local day, in percent"""
+        now = now or datetime.now()
+        today = local_day(now)
+        counts = self.call_store.daily_sentiment(local_midnight(today - days), now + timedelta(seconds=1))
+        day_numbers = range(today - days, today + 1)
+        daily = np.array([counts.get(day, (0, 0, 0)) for day in day_numbers], dtype=float)
+        totals = daily.sum(axis=1, keepdims=True)
+        shares = np.divide(daily * 100.0, totals, out=np.zeros_like(daily), where=totals > 0)
+        return pd.DataFrame({
+            "Date": pd.to_datetime([day * 86400 for day in day_numbers], unit="s"),
+            "Positive": shares[:, 0],
+            "Neutral": shares[:, 1],
+            "Negative": shares[:, 2],
+            "Calls": totals[:, 0].astype(int),
+        })
+
+    def keyword_hits(
+        self, assistant_ids: Optional[Iterable[str]] = None, days: int = 7, limit: int = 15, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Most heard tracked keywords over the last ``days`` days"""
+        now = now or datetime.now()
+        totals = self.rollups.keyword_totals(now - timedelta(days=days), assistant_ids=assistant_ids)
+        by_keyword = totals.groupby(["keyword", "category"], as_index=False)["hits"].sum()
+        top = by_keyword.sort_values(["hits", "keyword"], ascending=[False, True]).head(limit)
+        return pd.DataFrame({
+            "Keyword": top["keyword"].to_numpy(),
+            "Category": top["category"].str.replace("_", " ").str.title().to_numpy(),
+            "Hits": top["hits"].to_numpy().astype(int),
+        })
+
+    def minute_trend(self, minutes: int = 60, now: Optional[datetime] = None) -> pd.DataFrame:
+        """Calls and success rate per minute across all assistants, for the live views"""
+        now = now or datetime.now()
+        buckets = self.rollups.buckets("minute", "assistant", now - timedelta(minutes=minutes))
+        per_minute = buckets.groupby("bucket")[["calls", "completed", "finished"]].sum()
+        last = int(now.timestamp()) // 60 * 60
+        per_minute = per_minute.reindex(range(last - (minutes - 1) * 60, last + 60, 60), fill_value=0)
+        return pd.DataFrame({
+            "Time": local_times(per_minute.index).to_numpy(),
+            "Calls": per_minute["calls"].to_numpy().astype(int),
+            "Success Rate": np.divide(
+                per_minute["completed"].to_numpy() * 100.0, per_minute["finished"].to_numpy(),
+                out=np.zeros(len(per_minute)), where=per_minute["finished"].to_numpy() > 0
+            ),
+        })
+
+    def specialization_summary(
+        self, assistant_configs: Dict[str, AssistantConfig], days: int = 30, now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Calls and success rate per specialization, grouped from the assistant rollups"""
+        now = now or datetime.now()
+        totals = self.rollups.totals("assistant", now - timedelta(days=days))
+        specializations = pd.Series({config.id: config.specialization for config in assistant_configs.values()})
+        grouped = totals.groupby(specializations.reindex(totals.index))[["calls", "completed", "finished"]].sum()
+        grouped = grouped.reindex(sorted(specializations.unique()), fill_value=0)
+        return pd.DataFrame({
+            "Specialization": grouped.index,
+            "Calls": grouped["calls"].to_numpy().astype(int),
+            "Success Rate": np.divide(
+                grouped["completed"].to_numpy() * 100.0, grouped["finished"].to_numpy(),
+                out=np.zeros(len(grouped)), where=grouped["finished"].to_numpy() > 0
+            ),
+        })
+
+    def hourly_heatmap(self, assistant_id: str, days: int = 28, now: Optional[datetime] = None) -> np.ndarray:
+        """Calls by local day of week (rows, Monday first) and hour of day (columns)"""
+        now = now or datetime.now()
+        buckets = self.rollups.buckets("hour", "assistant", now - timedelta(days=days), keys=[assistant_id])
+        local = local_times(buckets["bucket"])
+        heatmap = np.zeros((7, 24))
+        np.add.at(heatmap, (local.dt.dayofweek.to_numpy(), local.dt.hour.to_numpy()), buckets["calls"].to_numpy())
+        return heatmap
+
+    def calculate_performance_metrics(self, assistant_configs: Dict[str, AssistantConfig]) -> pd.DataFrame:
+        """Calculate comprehensive performance metrics"""
+        configs = pd.DataFrame({
+            'Assistant ID': [config.id for config in assistant_configs.values()],
+            'Assistant Name': [config.name for config in assistant_configs.values()],
+            'Specialization': [config.specialization for config in assistant_configs.values()],
+            'Status': [config.status.value for config in assistant_configs.values()],
+            'Revenue Generated': [config.total_revenue for config in assistant_configs.values()],
+            'Language': [config.language for config in assistant_configs.values()],
+            'Voice': [config.voice for config in assistant_configs.values()],
+        })
+        activity = self.assistant_activity().reindex(configs['Assistant ID']).fillna(0).astype(float)
+
+        calls = activity['calls'].to_numpy()
+        finished = activity['finished'].to_numpy()
+
+        def ratio(numerator: str, denominator: np.ndarray) -> np.ndarray:
+            return np.divide(
+                activity[numerator].to_numpy(), denominator,
+                out=np.zeros(len(activity)), where=denominator > 0
+            )
+
+        # Sentiment scores run from -1 to 1; map them onto a 1-5 rating
+        satisfaction = np.where(calls > 0, 3 + 2 * ratio('sentiment', calls), 0.0)
+        last_call = pd.to_datetime(activity['last_call'].where(activity['last_call'] > 0), unit='s', utc=True)
+
+        return configs.assign(**{
+            'Daily Calls': activity['day_calls'].to_numpy().astype(int),
+            'Weekly Calls': activity['week_calls'].to_numpy().astype(int),
+            'Monthly Calls': calls.astype(int),
+            'Success Rate': (ratio('completed', finished) * 100).round(1),
+            'Avg Duration': ratio('duration', calls).round().astype(int),
+            'Cost per Call': ratio('cost', calls).round(2),
+            'Lead Conversion': (ratio('leads', calls) * 100).round(1),
+            'Customer Satisfaction': satisfaction.round(1),
+            'Error Rate': (ratio('failed', calls) * 100).round(1),
+            'Peak Performance Hour': activity['peak_hour'].to_numpy().astype(int),
+            'Last Active': to_local(last_call).to_numpy(),
+        })
+
+    def generate_forecasting_data(
+        self,
+        days: int = 30,
+        model_type: str = "Linear Trend",
+        confidence_level: float = 95,
+        assistant_id: Optional[str] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Forecast daily calls for the next N days, or None without enough history"""
+        return self.forecaster.forecast(days, model_type, confidence_level, assistant_id)
@@ -0,0 +1,268 @@
+"""Persistent registry of assistant configurations
+
+Assistant configs live in the shared database, so an edit made on the
+Assistant Config page survives restarts and is seen by every session. The
+registry keeps an in-memory copy with lookups by id, status and
+specialization, and reloads it only when the ``assistants_version`` row,
+bumped by triggers on every write to the table, has moved.
+"""
+import dataclasses
+import json
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Any, Iterable, Optional
+
+from .db import DEFAULT_DB_PATH, connect
+from .models import AssistantConfig, AssistantStatus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assistants (
+    key TEXT PRIMARY KEY,
+    assistant_id TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL,
+    config TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+-- Bumped by every write to assistants and nothing else, unlike PRAGMA data_version,
+-- which moves on commits to any table in the shared database
+CREATE TABLE IF NOT EXISTS assistants_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO assistants_version (id, version) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS assistants_version_insert AFTER INSERT ON assistants BEGIN
+    UPDATE assistants_version SET version = version + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS assistants_version_update AFTER UPDATE ON assistants BEGIN
+    UPDATE assistants_version SET version = version + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS assistants_version_delete AFTER DELETE ON assistants BEGIN
+    UPDATE assistants_version SET version = version + 1 WHERE id = 0;
+END;
+"""
+
+SPECIALIZATIONS = [
+    "Sales & Lead Generation", "Customer Support", "Appointment Scheduling",
+    "Market Research & Surveys", "Debt Collection", "Insurance Claims",
+    "Real Estate Inquiries", "Healthcare Appointments", "E-commerce Support",
+    "Technical Support", "Event Registration", "Fundraising & Donations",
+    "Product Demonstrations", "Quality Assurance", "Emergency Response",
+    "Educational Outreach", "Political Campaigns", "Travel Booking",
+    "Financial Services", "Legal Consultations", "HR Recruitment",
+    "Property Management", "Automotive Services", "Food Delivery",
+    "Subscription Management"
+]
+
+VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer", "custom_voice_1", "custom_voice_2"]
+LANGUAGES = ["en-US", "en-GB", "es-ES", "es-MX", "fr-FR", "de-DE", "it-IT", "pt-BR", "ja-JP", "ko-KR", "zh-CN", "hi-IN"]
+BACKGROUND_SOUNDS = ["none", "office", "cafe", "nature", "city", "white_noise", "classical_music"]
+
+# Fields the registry never lets an edit change
+READ_ONLY_FIELDS = {"id"}
+
+
+def default_assistants(count: int = 25) -> Dict[str, AssistantConfig]:
+    """The starter fleet written to an empty registry"""
+    configs = {}
+    for i in range(count):
+        specialization = SPECIALIZATIONS[i] if i < len(SPECIALIZATIONS) else "General Purpose"
+        configs[f"assistant_{i+1}"] = AssistantConfig(
+            id=f"vapi_assistant_{i+1:02d}",
+            name=f"AI Assistant {i+1} - {specialization}",
+            description=f"Specialized AI assistant for {specialization}",
+            phone_number=f"+1-555-{1000 + i:04d}",
+            voice=VOICES[i % len(VOICES)],
+            language=LANGUAGES[i % len(LANGUAGES)],
+            max_duration=300 + (i * 30),
+            background_sound=BACKGROUND_SOUNDS[i % len(BACKGROUND_SOUNDS)],
+            temperature=0.3 + (i * 0.02),
+            response_speed=["slow", "normal", "fast"][i % 3],
+            custom_prompt=f"You are a professional {specialization.lower()} assistant.",
+            webhook_url=f"https://webhook.site/{uuid.uuid4()}",
+            sheet_id=f"1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms_{i+1}",
+            status=AssistantStatus(["active", "idle", "busy"][i % 3]),
+            specialization=specialization,
+            cost_per_minute=0.05 + (i * 0.01),
+            success_rate=65 + (i * 1.2),
+            total_calls=100 + (i * 50),
+            total_revenue=500 + (i * 250),
+        )
+    return configs
+
+
+def config_to_json(config: AssistantConfig) -> str:
+    data = dataclasses.asdict(config)
+    data["status"] = config.status.value
+    return json.dumps(data)
+
+
+def config_from_json(text: str) -> AssistantConfig:
+    data = json.loads(text)
+    data["status"] = AssistantStatus(data["status"])
+    # Configs written before a field was added take its default
+    known = {field.name for field in dataclasses.fields(AssistantConfig)}
+    return AssistantConfig(**{name: value for name, value in data.items() if name in known})
+
+
+class AssistantRegistry:
+    def __init__(self, path: str = DEFAULT_DB_PATH, defaults: Optional[Dict[str, AssistantConfig]] = None):
+        self.path = path
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._loaded_version: Optional[int] = None
+        self.stats = {"reloads": 0}
+        self._configs: Dict[str, AssistantConfig] = {}
+        self._by_id: Dict[str, str] = {}
+        self._by_status: Dict[AssistantStatus, List[str]] = {}
+        self._by_specialization: Dict[str, List[str]] = {}
+        self._seed(defaults if defaults is not None else default_assistants())
+
+    def _seed(self, defaults: Dict[str, AssistantConfig]):
+        """Write the defaults once, when no process has populated the table yet"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._conn.execute("SELECT 1 FROM assistants LIMIT 1").fetchone() is None:
+                    now = time.time()
+                    self._conn.executemany(
+                        "INSERT INTO assistants (key, assistant_id, position, config, updated_at) VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (key, config.id, position, config_to_json(config), now)
+                            for position, (key, config) in enumerate(defaults.items())
+                        ],
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    # Cache upkeep; callers hold the lock
+
+    def _version(self) -> int:
+        return self._conn.execute("SELECT version FROM assistants_version WHERE id = 0").fetchone()[0]
+
+    def _refresh(self):
+        version = self._version()
+        if version == self._loaded_version:
+            return
+        rows = self._conn.execute("SELECT key, config FROM assistants ORDER BY position").fetchall()
+        configs = {row["key"]: config_from_json(row["config"]) for row in rows}
+        by_status = defaultdict(list)
+        by_specialization = defaultdict(list)
+        for key, config in configs.items():
+            by_status[config.status].append(key)
+            by_specialization[config.specialization].append(key)
+        self._configs = configs
+        self._by_id = {config.id: key for key, config in configs.items()}
+        self._by_status = dict(by_status)
+        self._by_specialization = dict(by_specialization)
+        self._loaded_version = version
+        self.stats["reloads"] += 1
+
+    # Lookups
+
+    @property
+    def version(self) -> int:
+        """Changes whenever any process edits the registry"""
+        with self._lock:
+            self._refresh()
+            return self._loaded_version
+
+    @property
+    def configs(self) -> Dict[str, AssistantConfig]:
+        """Every assistant by registry key, in display order; treat as read-only"""
+        with self._lock:
+            self._refresh()
+            return self._configs
+
+    def get(self, key: str) -> Optional[AssistantConfig]:
+        return self.configs.get(key)
+
+    def key_for_id(self, assistant_id: str) -> Optional[str]:
+        with self._lock:
+            self._refresh()
+            return self._by_id.get(assistant_id)
+
+    def by_id(self, assistant_id: str) -> Optional[AssistantConfig]:
+        with self._lock:
+            self._refresh()
+            key = self._by_id.get(assistant_id)
+            return self._configs[key] if key is not None else None
+
+    def with_status(self, *statuses: AssistantStatus) -> Dict[str, AssistantConfig]:
+        return self._subset(self._by_status, statuses)
+
+    def with_specialization(self, *specializations: str) -> Dict[str, AssistantConfig]:
+        return self._subset(self._by_specialization, specializations)
+
+    def _subset(self, index: Dict[Any, List[str]], values: Iterable) -> Dict[str, AssistantConfig]:
+        with self._lock:
+            self._refresh()
+            keys = {key for value in values for key in index.get(value, ())}
+            return {key: config for key, config in self._configs.items() if key in keys}
+
+    def filter(
+        self,
+        statuses: Optional[Iterable[AssistantStatus]] = None,
+        specializations: Optional[Iterable[str]] = None,
+    ) -> Dict[str, AssistantConfig]:
+        """Assistants matching every given criterion; None means no restriction"""
+        with self._lock:
+            self._refresh()
+            keys = set(self._configs)
+            if statuses is not None:
+                keys &= {key for status in statuses for key in self._by_status.get(status, ())}
+            if specializations is not None:
+                keys &= {key for spec in specializations for key in self._by_specialization.get(spec, ())}
+            return {key: config for key, config in self._configs.items() if key in keys}
+
+    def status_counts(self) -> Dict[AssistantStatus, int]:
+        with self._lock:
+            self._refresh()
+            return {status: len(keys) for status, keys in self._by_status.items()}
+
+    def specializations(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return sorted(self._by_specialization)
+
+    # Edits
+
+    def update(self, key: str, **changes) -> Dict[str, Any]:
+        """Apply field changes to one assistant"""
+        return self.update_many([key], **changes)
+
+    def update_many(self, keys: Iterable[str], **changes) -> Dict[str, Any]:
+        """Apply the same field changes to several assistants in one transaction"""
+        keys = list(keys)
+        known = {field.name for field in dataclasses.fields(AssistantConfig)} - READ_ONLY_FIELDS
+        unknown = set(changes) - known
+        if unknown:
+            return {"success": False, "error": f"Unknown assistant fields: {', '.join(sorted(unknown))}"}
+        if "status" in changes and not isinstance(changes["status"], AssistantStatus):
+            changes["status"] = AssistantStatus(changes["status"])
+        with self._lock:
+            self._refresh()
+            missing = [key for key in keys if key not in self._configs]
+            if missing:
+                return {"success": False, "error": f"Unknown assistants: {', '.join(missing)}"}
+            now = time.time()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-read inside the transaction so a concurrent edit to other fields is kept
+                for key in keys:
+                    row = self._conn.execute("SELECT config FROM assistants WHERE key = ?", (key,)).fetchone()
+                    config = dataclasses.replace(config_from_json(row["config"]), **changes)
+                    self._conn.execute(
+                        "UPDATE assistants SET config = ?, updated_at = ? WHERE key = ?",
+                        (config_to_json(config), now, key),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._refresh()
+        return {"success": True, "updated": len(keys)}
@@ -0,0 +1,232 @@
+"""Weighted-fair sharing of call capacity among concurrent campaigns
+
+Every campaign's dialer asks the shared ``CampaignQueue`` for a slot before
+it places a call. The queue caps how many calls are in flight across all
+campaigns and, whenever a slot frees up, grants it by stride scheduling:
+each campaign advances a virtual "pass" by 1/weight per call and the
+lowest pass goes next. Urgent campaigns therefore get eight times the
+throughput of Low ones while both have work, and idle campaigns bank no
+credit. A request that has waited longer than ``max_wait`` is served
+ahead of the weights, so no campaign starves.
+
+A slot is held for the whole call, not just the placement request: the
+dialer ``bind``s a placed call to its slot, and ``finish_call`` frees it
+when the call's end arrives (from the event log, see
+``CallEndFollower``), or ``call_timeout`` after it was placed if that is
+never seen. A call that fails to place gives its slot straight back.
+
+Budgets are enforced on grant: a slot is only granted while the
+campaign's spend plus the estimated cost of its in-flight calls leaves
+room for another call. Each call's estimate is replaced by its actual
+cost when it ends.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from .vapi import DEFAULT_CALL_COST
+
+PRIORITY_WEIGHTS = {"Low": 1, "Normal": 2, "High": 4, "Urgent": 8}
+DEFAULT_CAPACITY = 10
+# Longer than any assistant's max_duration; a bound call's slot is freed by then at the latest
+DEFAULT_CALL_TIMEOUT = 1800.0
+# Ends seen before their call was bound, kept so the bind can settle at once
+MAX_EARLY_ENDS = 10000
+
+
+class CampaignShare:
+    """One campaign's slot accounting inside the queue"""
+
+    def __init__(self, name: str, priority: str, budget: Optional[float]):
+        self.name = name
+        self.priority = priority
+        self.weight = PRIORITY_WEIGHTS[priority]
+        self.budget = budget
+        self.spent = 0.0
+        self.reserved = 0.0
+        self.pass_value = 0.0
+        self.in_flight = 0
+        self.dispatched = 0
+        # (ticket, arrival time) of each dialer worker waiting for a slot, oldest first
+        self.arrivals: deque = deque()
+        self.waits: deque = deque(maxlen=500)
+
+    def can_afford(self, estimate: float) -> bool:
+        return self.budget is None or self.spent + self.reserved + estimate <= self.budget
+
+
+class CampaignQueue:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        max_wait: float = 120.0,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.call_timeout = call_timeout
+        self.clock = clock
+        self._campaigns: Dict[str, CampaignShare] = {}
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._tickets = itertools.count()
+        # call_id -> (campaign, estimate) of each call holding a slot
+        self._calls: Dict[str, Tuple[str, float]] = {}
+        self._expiry: List[tuple] = []
+        self._early_ends: "OrderedDict[str, Optional[float]]" = OrderedDict()
+        self._cond = threading.Condition()
+
+    def register(self, name: str, priority: str = "Normal", budget: Optional[float] = None):
+        """Add a campaign, or update its priority and budget while keeping its spend"""
+        with self._cond:
+            share = self._campaigns.get(name)
+            if share is None or (not share.in_flight and not share.arrivals):
+                spent = share.spent if share is not None else 0.0
+                share = self._campaigns[name] = CampaignShare(name, priority, budget)
+                share.spent = spent
+                share.pass_value = self._virtual_time
+            else:
+                share.priority, share.weight, share.budget = priority, PRIORITY_WEIGHTS[priority], budget
+            self._cond.notify_all()
+
+    def set_capacity(self, capacity: int):
+        with self._cond:
+            self.capacity = capacity
+            self._cond.notify_all()
+
+    def acquire(
+        self,
+        name: str,
+        stop_event: Optional[threading.Event] = None,
+        estimate: float = DEFAULT_CALL_COST,
+    ) -> bool:
+        """Block until ``name`` is granted a call slot
+
+        Returns False when the campaign's budget can't cover another call or
+        ``stop_event`` is set.
+        """
+        with self._cond:
+            share = self._campaigns[name]
+            if not share.arrivals and not share.in_flight:
+                # Back from idle: no credit for the time it had nothing to dial
+                share.pass_value = max(share.pass_value, self._virtual_time)
+            ticket = (next(self._tickets), self.clock())
+            share.arrivals.append(ticket)
+            try:
+                while True:
+                    self._expire_calls()
+                    if stop_event is not None and stop_event.is_set():
+                        return False
+                    if not share.can_afford(estimate):
+                        return False
+                    if self._in_flight < self.capacity and self._select(estimate) is share and share.arrivals[0] is ticket:
+                        break
+                    # Bounded so stop requests and aging are noticed without a notify
+                    self._cond.wait(1.0)
+            finally:
+                share.arrivals.remove(ticket)
+                self._cond.notify_all()
+
+            now = self.clock()
+            share.waits.append(now - ticket[1])
+            share.in_flight += 1
+            share.dispatched += 1
+            share.reserved += estimate
+            self._in_flight += 1
+            self._virtual_time = share.pass_value
+            share.pass_value += 1.0 / share.weight
+            return True
+
+    def release(self, name: str, cost: float = 0.0, estimate: float = DEFAULT_CALL_COST):
+        """Return a slot, charging the call's actual cost to the campaign"""
+        with self._cond:
+            self._release(name, cost, estimate)
+
+    def _release(self, name: str, cost: float, estimate: float):
+        share = self._campaigns[name]
+        share.in_flight -= 1
+        share.reserved = max(share.reserved - estimate, 0.0)
+        share.spent += cost
+        self._in_flight -= 1
+        self._cond.notify_all()
+
+    def bind(self, name: str, call_id: str, estimate: float = DEFAULT_CALL_COST):
+        """Keep a granted slot until ``finish_call`` sees the placed call end"""
+        with self._cond:
+            if call_id in self._early_ends:
+                cost = self._early_ends.pop(call_id)
+                self._release(name, estimate if cost is None else cost, estimate)
+                return
+            self._calls[call_id] = (name, estimate)
+            heapq.heappush(self._expiry, (self.clock() + self.call_timeout, call_id))
+
+    def finish_call(self, call_id: str, cost: Optional[float] = None):
+        """Free a bound call's slot and charge its actual cost, or its estimate when the cost is unknown"""
+        with self._cond:
+            bound = self._calls.pop(call_id, None)
+            if bound is None:
+                # The end can land before the dialer has bound the call
+                self._early_ends[call_id] = cost
+                if len(self._early_ends) > MAX_EARLY_ENDS:
+                    self._early_ends.popitem(last=False)
+                return
+            name, estimate = bound
+            self._release(name, estimate if cost is None else cost, estimate)
+
+    def _expire_calls(self):
+        """Free the slots of calls bound longer than ``call_timeout``, charging their estimates"""
+        now = self.clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, call_id = heapq.heappop(self._expiry)
+            bound = self._calls.pop(call_id, None)
+            if bound is not None:
+                self._release(bound[0], bound[1], bound[1])
+
+    def _select(self, estimate: float) -> Optional[CampaignShare]:
+        """The campaign owed the next slot: the longest-starved one, else the lowest pass"""
+        waiting = [share for share in self._campaigns.values() if share.arrivals and share.can_afford(estimate)]
+        if not waiting:
+            return None
+        now = self.clock()
+        starved = [share for share in waiting if now - share.arrivals[0][1] >= self.max_wait]
+        if starved:
+            return min(starved, key=lambda share: share.arrivals[0])
+        return min(waiting, key=lambda share: (share.pass_value, share.arrivals[0]))
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Queue depth, wait times and throughput share per campaign"""
+        with self._cond:
+            self._expire_calls()
+            now = self.clock()
+            total = sum(share.dispatched for share in self._campaigns.values())
+            rows = []
+            for share in self._campaigns.values():
+                waits = sorted(share.waits)
+                rows.append({
+                    "campaign": share.name,
+                    "priority": share.priority,
+                    "weight": share.weight,
+                    "queue_depth": len(share.arrivals),
+                    "in_flight": share.in_flight,
+                    "dispatched": share.dispatched,
+                    "share": share.dispatched / total * 100 if total else 0.0,
+                    "avg_wait": sum(waits) / len(waits) if waits else 0.0,
+                    "p95_wait": waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+                    "oldest_wait": now - share.arrivals[0][1] if share.arrivals else 0.0,
+                    "spent": share.spent,
+                    "budget": share.budget,
+                })
+            return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            self._expire_calls()
+            return {
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "queue_depth": sum(len(share.arrivals) for share in self._campaigns.values()),
+            }
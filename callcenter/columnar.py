@@ -0,0 +1,360 @@
+"""Columnar buffer of call records
+
+A ``CallRecord`` dataclass costs a ``__dict__``, a datetime per timestamp,
+an Enum reference and a ``custom_data`` dict per call. ``CallBuffer`` keeps
+the same fields as growable NumPy columns instead: times are int64 epoch
+nanoseconds (NaT for "not ended"), statuses are small integer codes, and
+assistant ids, phone numbers and campaigns are interned into shared string
+pools. ``to_pandas()`` wraps the numeric columns without copying, and
+``CallRow`` gives record-style attribute access to a single row.
+
+Frames carry tz-aware UTC times; ``to_local`` turns them into the server's
+wall-clock time row by row, so calls on either side of a DST change each
+get the offset in force when they were placed. ``CallRow`` matches
+``CallRecord`` and returns naive local datetimes.
+"""
+import json
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+from dateutil import tz
+
+from .models import CallRecord, CallStatus, CALL_STATUS_LABELS, campaign_name
+
+STATUSES = list(CallStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+STATUS_VALUE_CODES = {status.value: code for code, status in enumerate(STATUSES)}
+# int64 minimum doubles as NaT when the column is viewed as datetime64[ns]
+NO_TIME = np.iinfo(np.int64).min
+NANOS = 1_000_000_000
+
+NUMERIC_COLUMNS = {
+    "start_time": np.int64,
+    "end_time": np.int64,
+    "duration": np.int32,
+    "status": np.int8,
+    "sentiment_score": np.float64,
+    "lead_score": np.float64,
+    "cost": np.float64,
+    "assistant_id": np.int32,
+    "phone_number": np.int32,
+    "campaign": np.int32,
+}
+INTERNED_COLUMNS = ["assistant_id", "phone_number", "campaign"]
+# The server's zone with its DST rules; SQLite's 'localtime' modifier follows the same one
+LOCAL_TZ = tz.tzlocal()
+
+
+def to_local(times: pd.Series) -> pd.Series:
+    """Naive local wall-clock times for tz-aware ones, each shifted by the offset in force at that moment"""
+    return times.dt.tz_convert(LOCAL_TZ).dt.tz_localize(None)
+
+
+class StringPool:
+    """Interns repeated strings as int32 codes"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def codes(self, values: Iterable[str]) -> np.ndarray:
+        """Codes for many values, hashing each distinct value once"""
+        value_codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        return np.array([self.code(value) for value in uniques], dtype=np.int32)[value_codes]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _epoch_nanos(moment: Optional[datetime]) -> int:
+    return round(moment.timestamp() * NANOS) if moment is not None else NO_TIME
+
+
+class CallBuffer:
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in NUMERIC_COLUMNS.items()}
+        self._pools = {name: StringPool() for name in INTERNED_COLUMNS}
+        # Unique or free text per call stays as plain lists; empty transcripts share one string
+        self.call_ids: List[str] = []
+        self.transcripts: List[str] = []
+        self.recording_urls: List[str] = []
+        # Only calls that carry more than a campaign keep their custom_data dict
+        self._custom: Dict[int, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[CallRecord]) -> "CallBuffer":
+        records = list(records)
+        buffer = cls(capacity=max(len(records), 1))
+        buffer.extend(records)
+        return buffer
+
+    @classmethod
+    def from_rows(cls, rows: List[Any]) -> "CallBuffer":
+        """Build from ``calls`` table rows column by column, without a ``CallRecord`` per row"""
+        size = len(rows)
+        buffer = cls(capacity=max(size, 1))
+        if not size:
+            return buffer
+        values = dict(zip(rows[0].keys(), zip(*rows)))
+        columns = buffer._columns
+        columns["start_time"][:size] = np.round(np.array(values["start_time"], dtype=np.float64) * NANOS)
+        # None (still in progress) becomes NaN here and NO_TIME below
+        end_times = np.array(values["end_time"], dtype=np.float64)
+        columns["end_time"][:size] = np.where(np.isnan(end_times), NO_TIME, np.round(np.nan_to_num(end_times) * NANOS))
+        for name in ("duration", "sentiment_score", "lead_score", "cost"):
+            columns[name][:size] = values[name]
+        columns["status"][:size] = [STATUS_VALUE_CODES[status] for status in values["status"]]
+        for name in ("assistant_id", "phone_number"):
+            columns[name][:size] = buffer._pools[name].codes(values[name])
+        columns["campaign"][:size] = buffer._pools["campaign"].codes(["" if value is None else value for value in values["campaign"]])
+        buffer.call_ids = list(values["call_id"])
+        buffer.transcripts = list(values["transcript"])
+        buffer.recording_urls = list(values["recording_url"])
+
+        # Most rows carry nothing but their campaign; only parse the JSON of the others
+        campaign_only = {}
+        for index, (campaign, custom_data) in enumerate(zip(values["campaign"], values["custom_data"])):
+            if campaign not in campaign_only:
+                campaign_only[campaign] = json.dumps({"campaign": campaign}) if campaign else "{}"
+            if custom_data != campaign_only[campaign] and custom_data not in ("", "{}"):
+                custom_data = json.loads(custom_data)
+                if any(key != "campaign" for key in custom_data):
+                    buffer._custom[index] = custom_data
+        buffer._size = size
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int):
+        capacity = len(self._columns["start_time"])
+        if self._size + extra <= capacity:
+            return
+        capacity = max(capacity * 2, self._size + extra)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _append(
+        self, call_id, assistant_id, phone_number, start_ns, end_ns, duration, status_code,
+        transcript, sentiment_score, lead_score, cost, recording_url, custom_data,
+    ):
+        self._reserve(1)
+        index = self._size
+        columns = self._columns
+        columns["start_time"][index] = start_ns
+        columns["end_time"][index] = end_ns
+        columns["duration"][index] = duration
+        columns["status"][index] = status_code
+        columns["sentiment_score"][index] = sentiment_score
+        columns["lead_score"][index] = lead_score
+        columns["cost"][index] = cost
+        columns["assistant_id"][index] = self._pools["assistant_id"].code(assistant_id)
+        columns["phone_number"][index] = self._pools["phone_number"].code(phone_number)
+        columns["campaign"][index] = self._pools["campaign"].code(campaign_name(custom_data))
+        self.call_ids.append(call_id)
+        self.transcripts.append(transcript or "")
+        self.recording_urls.append(recording_url or "")
+        if any(key != "campaign" for key in custom_data):
+            self._custom[index] = custom_data
+        self._size += 1
+
+    def append(self, record: CallRecord):
+        self._append(
+            record.call_id, record.assistant_id, record.phone_number,
+            _epoch_nanos(record.start_time), _epoch_nanos(record.end_time), record.duration,
+            STATUS_CODES[record.status], record.transcript, record.sentiment_score, record.lead_score,
+            record.cost, record.recording_url, record.custom_data or {},
+        )
+
+    def extend(self, records: Iterable[CallRecord]):
+        for record in records:
+            self.append(record)
+
+    # Column access
+
+    def column(self, name: str) -> np.ndarray:
+        """A read-only view of one numeric column, trimmed to the rows in use"""
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def strings(self, name: str) -> np.ndarray:
+        """An interned column decoded to Python strings"""
+        values = np.array(self._pools[name].values, dtype=object)
+        return values[self.column(name)] if len(values) else np.empty(0, dtype=object)
+
+    def custom_data(self, index: int) -> Dict[str, Any]:
+        custom_data = dict(self._custom.get(index, {}))
+        campaign = self._pools["campaign"].values[self._columns["campaign"][index]]
+        if campaign:
+            custom_data["campaign"] = campaign
+        return custom_data
+
+    def custom_field(self, key: str, default: Any = "") -> List[Any]:
+        """One ``custom_data`` key for every row, e.g. the call notes"""
+        values = [default] * self._size
+        for index, custom_data in self._custom.items():
+            if key in custom_data:
+                values[index] = custom_data[key]
+        return values
+
+    def __getitem__(self, index: int) -> "CallRow":
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return CallRow(self, index)
+
+    def __iter__(self) -> Iterator["CallRow"]:
+        return (CallRow(self, index) for index in range(self._size))
+
+    def to_records(self) -> List[CallRecord]:
+        return [row.to_record() for row in self]
+
+    def to_pandas(self) -> pd.DataFrame:
+        """One column per field; numeric columns share this buffer's memory
+
+        Times are tz-aware UTC (see ``to_local``), with NaT for calls still in
+        progress. Interned columns are categoricals over the string pools.
+        """
+        def utc(name: str) -> pd.DatetimeIndex:
+            return pd.DatetimeIndex(self.column(name).view("datetime64[ns]")).tz_localize("UTC")
+
+        def categorical(name: str) -> pd.Categorical:
+            return pd.Categorical.from_codes(self.column(name), categories=pd.Index(self._pools[name].values, dtype="str"), validate=False)
+
+        frame = pd.DataFrame({
+            "call_id": pd.array(self.call_ids, dtype="str"),
+            "assistant_id": categorical("assistant_id"),
+            "phone_number": categorical("phone_number"),
+            "start_time": utc("start_time"),
+            "end_time": utc("end_time"),
+            "duration": self.column("duration"),
+            "status": pd.Categorical.from_codes(
+                self.column("status"), categories=pd.Index([status.value for status in STATUSES]), validate=False
+            ),
+            "transcript": pd.array(self.transcripts, dtype="str"),
+            "sentiment_score": self.column("sentiment_score"),
+            "lead_score": self.column("lead_score"),
+            "cost": self.column("cost"),
+            "recording_url": pd.array(self.recording_urls, dtype="str"),
+            "campaign": categorical("campaign"),
+        }, copy=False)
+        return frame
+
+    def status_labels(self) -> pd.Categorical:
+        """Display labels for the status column"""
+        return pd.Categorical.from_codes(
+            self.column("status"), categories=pd.Index([CALL_STATUS_LABELS[status] for status in STATUSES]),
+            validate=False
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held, counting each distinct string once"""
+        total = sum(column[:self._size].nbytes for column in self._columns.values())
+        total += sum(len(value) + 49 for pool in self._pools.values() for value in pool.values)
+        total += sum(len(call_id) + 49 for call_id in self.call_ids)
+        total += sum(len(text) + 49 for text in set(self.transcripts) | set(self.recording_urls))
+        # List slots for call ids, transcripts and recording URLs
+        return total + 24 * self._size
+
+
+class CallRow:
+    """Record-style, read-only view of one row of a ``CallBuffer``"""
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, buffer: CallBuffer, index: int):
+        self._buffer = buffer
+        self._index = index
+
+    def _time(self, name: str) -> Optional[datetime]:
+        nanos = int(self._buffer._columns[name][self._index])
+        return datetime.fromtimestamp(nanos / NANOS) if nanos != NO_TIME else None
+
+    def _interned(self, name: str) -> str:
+        return self._buffer._pools[name].values[self._buffer._columns[name][self._index]]
+
+    @property
+    def call_id(self) -> str:
+        return self._buffer.call_ids[self._index]
+
+    @property
+    def assistant_id(self) -> str:
+        return self._interned("assistant_id")
+
+    @property
+    def phone_number(self) -> str:
+        return self._interned("phone_number")
+
+    @property
+    def start_time(self) -> datetime:
+        return self._time("start_time")
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        return self._time("end_time")
+
+    @property
+    def duration(self) -> int:
+        return int(self._buffer._columns["duration"][self._index])
+
+    @property
+    def status(self) -> CallStatus:
+        return STATUSES[self._buffer._columns["status"][self._index]]
+
+    @property
+    def transcript(self) -> str:
+        return self._buffer.transcripts[self._index]
+
+    @property
+    def sentiment_score(self) -> float:
+        return float(self._buffer._columns["sentiment_score"][self._index])
+
+    @property
+    def lead_score(self) -> float:
+        return float(self._buffer._columns["lead_score"][self._index])
+
+    @property
+    def cost(self) -> float:
+        return float(self._buffer._columns["cost"][self._index])
+
+    @property
+    def recording_url(self) -> str:
+        return self._buffer.recording_urls[self._index]
+
+    @property
+    def custom_data(self) -> Dict[str, Any]:
+        return self._buffer.custom_data(self._index)
+
+    def to_record(self) -> CallRecord:
+        return CallRecord(
+            call_id=self.call_id,
+            assistant_id=self.assistant_id,
+            phone_number=self.phone_number,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            duration=self.duration,
+            status=self.status,
+            transcript=self.transcript,
+            sentiment_score=self.sentiment_score,
+            lead_score=self.lead_score,
+            cost=self.cost,
+            recording_url=self.recording_url,
+            custom_data=self.custom_data,
+        )
+
+    def __repr__(self) -> str:
+        return f"CallRow({self.call_id!r}, {self.assistant_id!r}, {self.status.value!r})"
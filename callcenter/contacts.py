@@ -0,0 +1,353 @@
+"""Streaming contact-list ingestion into a persistent contact store
+
+Uploads are read in chunks (``pandas.read_csv(chunksize=...)`` for CSV,
+openpyxl's read-only row iterator for Excel), each chunk's phone numbers
+are validated and normalized to E.164 in one batch, and valid rows are
+written to the ``contacts`` table, deduplicated per list by phone number.
+Only one chunk is ever held in memory next to the upload itself. A
+stopped import can be resumed: each chunk's rows are committed together
+with the running row count, so the resumed pass skips exactly the rows
+already written. Campaigns then stream contacts back out of the store
+instead of keeping a DataFrame in session state.
+"""
+import itertools
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, List, Any, Iterator, Optional
+
+import pandas as pd
+
+from .db import DEFAULT_DB_PATH, connect
+from .phones import DEFAULT_REGION, infer_region, normalize_batch
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_lists (
+    list_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    phone_column TEXT NOT NULL,
+    columns TEXT NOT NULL DEFAULT '[]',
+    created_at REAL NOT NULL,
+    rows_read INTEGER NOT NULL DEFAULT 0,
+    valid INTEGER NOT NULL DEFAULT 0,
+    duplicates INTEGER NOT NULL DEFAULT 0,
+    invalid INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'importing'
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    list_id TEXT NOT NULL,
+    phone_number TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    UNIQUE (list_id, phone_number)
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_list ON contacts (list_id, id);
+CREATE TABLE IF NOT EXISTS contact_errors (
+    list_id TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    error TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contact_errors_list ON contact_errors (list_id, row_number);
+"""
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def read_upload(
+    file, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE, skip_rows: int = 0
+) -> Iterator[pd.DataFrame]:
+    """Yield the rows of a CSV or Excel upload as string DataFrames of ``chunk_size`` rows
+
+    The first ``skip_rows`` data rows after the header are skipped.
+    """
+    if filename.lower().endswith(".csv"):
+        yield from pd.read_csv(
+            file, dtype=str, keep_default_na=False, chunksize=chunk_size, skiprows=range(1, skip_rows + 1)
+        )
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [_cell(name) or f"Column {index + 1}" for index, name in enumerate(header)]
+        batch = []
+        for row in itertools.islice(rows, skip_rows, None):
+            batch.append([_cell(value) for value in row[:len(columns)]])
+            if len(batch) >= chunk_size:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def preview_upload(file, filename: str, rows: int = 10) -> pd.DataFrame:
+    """First ``rows`` rows of an upload, leaving the file rewound"""
+    try:
+        return next(read_upload(file, filename, chunk_size=rows), pd.DataFrame())
+    finally:
+        file.seek(0)
+
+
+class ContactStore:
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def create_list(self, name: str, filename: str, phone_column: str) -> str:
+        list_id = f"list_{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO contact_lists (list_id, name, filename, phone_column, created_at) VALUES (?, ?, ?, ?, ?)",
+                (list_id, name, filename, phone_column, time.time()),
+            )
+        return list_id
+
+    def add_chunk(
+        self,
+        list_id: str,
+        contacts: List[tuple],
+        errors: List[tuple],
+        progress: Dict[str, Any],
+    ) -> int:
+        """Write one chunk's contacts, errors and running totals in a single transaction
+
+        ``contacts`` are ``(phone_number, row_number, fields)`` and ``errors``
+        ``(row_number, value, error)``. Returns how many contacts were new.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO contacts (list_id, phone_number, row_number, fields) VALUES (?, ?, ?, ?)",
+                    [(list_id, phone, row_number, json.dumps(fields)) for phone, row_number, fields in contacts],
+                )
+                inserted = self._conn.total_changes - before
+                self._conn.executemany(
+                    "INSERT INTO contact_errors (list_id, row_number, value, error) VALUES (?, ?, ?, ?)",
+                    [(list_id, *error) for error in errors],
+                )
+                self._conn.execute(
+                    "UPDATE contact_lists SET columns = ?, rows_read = ?, valid = valid + ?, duplicates = duplicates + ?, "
+                    "invalid = invalid + ? WHERE list_id = ?",
+                    (
+                        json.dumps(progress["columns"]), progress["rows_read"], inserted,
+                        len(contacts) - inserted, len(errors), list_id,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return inserted
+
+    def set_status(self, list_id: str, status: str):
+        with self._lock:
+            self._conn.execute("UPDATE contact_lists SET status = ? WHERE list_id = ?", (status, list_id))
+
+    def get_list(self, list_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM contact_lists WHERE list_id = ?", (list_id,)).fetchone()
+        if row is None:
+            return None
+        return {**dict(row), "columns": json.loads(row["columns"])}
+
+    def lists(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM contact_lists ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [{**dict(row), "columns": json.loads(row["columns"])} for row in rows]
+
+    def count(self, list_id: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM contacts WHERE list_id = ?", (list_id,)).fetchone()[0]
+
+    def iter_contacts(self, list_id: str, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Contacts in upload order, read a page at a time"""
+        after = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, fields FROM contacts WHERE list_id = ? AND id > ? ORDER BY id LIMIT ?",
+                    (list_id, after, page_size),
+                ).fetchall()
+            for row in rows:
+                yield json.loads(row["fields"])
+            if len(rows) < page_size:
+                return
+            after = rows[-1]["id"]
+
+    def preview(self, list_id: str, limit: int = 10) -> pd.DataFrame:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fields FROM contacts WHERE list_id = ? ORDER BY id LIMIT ?", (list_id, limit)
+            ).fetchall()
+        return pd.DataFrame([json.loads(row["fields"]) for row in rows])
+
+    def errors(self, list_id: str, limit: int = 1000) -> pd.DataFrame:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT row_number, value, error FROM contact_errors WHERE list_id = ? ORDER BY row_number LIMIT ?",
+                (list_id, limit),
+            ).fetchall()
+        return pd.DataFrame([tuple(row) for row in rows], columns=["Row", "Value", "Error"])
+
+
+class ContactImport:
+    """Streams one upload into the contact store on a background thread"""
+
+    def __init__(
+        self,
+        store: ContactStore,
+        file,
+        filename: str,
+        phone_column: str,
+        name: Optional[str] = None,
+        region: str = DEFAULT_REGION,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.store = store
+        self.file = file
+        self.filename = filename
+        self.phone_column = phone_column
+        self.region = region
+        self.chunk_size = chunk_size
+        self.list_id = store.create_list(name or filename, filename, phone_column)
+
+        self.stats = {"rows_read": 0, "valid": 0, "duplicates": 0, "invalid": 0}
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self._errors: deque = deque(maxlen=100)
+        self._size = self._file_size(file)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _file_size(file) -> int:
+        position = file.tell()
+        file.seek(0, 2)
+        size = file.tell()
+        file.seek(position)
+        return size
+
+    def start(self) -> "ContactImport":
+        self.status = "importing"
+        self._thread = threading.Thread(target=self._run, name=f"contact-import-{self.list_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+
+    def resume(self) -> "ContactImport":
+        """Continue a stopped import from the first row it had not written"""
+        if self.status != "stopped" or self.is_running:
+            return self
+        self.file.seek(0)
+        self._stop_event.clear()
+        self.store.set_status(self.list_id, "importing")
+        return self.start()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _regions(self, chunk: pd.DataFrame) -> Optional[List[str]]:
+        """Per-row parsing regions from country or timezone columns, if the list has them"""
+        country = next((col for col in chunk.columns if "country" in str(col).lower()), None)
+        timezone = next(
+            (col for col in chunk.columns if str(col).lower().replace(" ", "") in ("timezone", "tz")), None
+        )
+        if country is None and timezone is None:
+            return None
+        countries = chunk[country] if country is not None else [""] * len(chunk)
+        timezones = chunk[timezone] if timezone is not None else [""] * len(chunk)
+        return [infer_region(c, t, self.region) for c, t in zip(countries, timezones)]
+
+    def _run(self):
+        with self._lock:
+            skip_rows = self.stats["rows_read"]
+        row_number = 1 + skip_rows  # the header row, then the rows already written
+        try:
+            for chunk in read_upload(self.file, self.filename, self.chunk_size, skip_rows):
+                if self._stop_event.is_set():
+                    self.status = "stopped"
+                    break
+                if self.phone_column not in chunk.columns:
+                    raise ValueError(f"Column '{self.phone_column}' not found")
+                batch = normalize_batch(chunk[self.phone_column], self._regions(chunk), self.region)
+                contacts, row_errors = [], []
+                for offset, (fields, number, error) in enumerate(
+                    zip(chunk.to_dict("records"), batch.numbers, batch.errors), start=row_number + 1
+                ):
+                    if error:
+                        row_errors.append((offset, fields[self.phone_column], error))
+                    else:
+                        contacts.append((number, offset, {**fields, self.phone_column: number}))
+                row_number += len(chunk)
+
+                with self._lock:
+                    rows_read = self.stats["rows_read"] + len(chunk)
+                inserted = self.store.add_chunk(
+                    self.list_id, contacts, row_errors, {"columns": list(chunk.columns), "rows_read": rows_read}
+                )
+                with self._lock:
+                    self.stats["rows_read"] = rows_read
+                    self.stats["valid"] += inserted
+                    self.stats["duplicates"] += len(contacts) - inserted
+                    self.stats["invalid"] += len(row_errors)
+                    self._errors.extend(
+                        {"Row": row, "Value": value, "Error": error} for row, value, error in row_errors
+                    )
+            else:
+                self.status = "completed"
+        except Exception as error:
+            self.status = "failed"
+            self.error = str(error)
+        self.store.set_status(self.list_id, self.status)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Progress for display; ``progress`` is the fraction of the file read"""
+        with self._lock:
+            stats = dict(self.stats)
+            recent_errors = list(self._errors)
+        try:
+            position = self.file.tell() if self.is_running else self._size
+        except ValueError:
+            position = self._size
+        return {
+            **stats,
+            "list_id": self.list_id,
+            "status": self.status,
+            "error": self.error,
+            "progress": min(position / self._size, 1.0) if self._size else 1.0,
+            "recent_errors": recent_errors,
+        }
@@ -0,0 +1,21 @@
+"""SQLite connection helpers shared by the on-disk stores
+
+The Streamlit app and the webhook receiver run in separate processes and
+share one database file, so connections use WAL mode: readers never block
+the writer and vice versa.
+"""
+import os
+import sqlite3
+
+DEFAULT_DB_PATH = os.environ.get("CALLCENTER_DB", "callcenter.db")
+
+
+def connect(path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Open a connection tuned for one writer and many concurrent readers"""
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    if path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
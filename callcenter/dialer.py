@@ -0,0 +1,410 @@
+"""Background bulk-dial engine for calling campaigns
+
+The dialer runs on its own worker threads so a large contact list never
+blocks the Streamlit script thread. The page only starts it, reads
+``snapshot()`` and drains finished call records on each rerun.
+"""
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, time as dt_time
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional
+
+import pytz
+
+from .campaign_queue import CampaignQueue
+from .models import CallRecord
+from .phones import timezone_for_number
+from .router import AssistantRouter
+from .store import CallStore
+from .vapi import VAPIManager
+
+logger = logging.getLogger(__name__)
+
+# Jobs parked until their call window opens; past this the dialer stops pulling new contacts
+MAX_DEFERRED = 10000
+
+
+@dataclass
+class DialJob:
+    phone_number: str
+    assistant_id: str
+    custom_prompt: str = ""
+    contact: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    # The contact's pytz zone for local call windows; empty means system time
+    timezone: str = ""
+
+
+@dataclass
+class DialSettings:
+    max_concurrent: int = 3
+    call_delay: float = 30.0
+    max_retries: int = 2
+    retry_backoff: float = 30.0
+    call_window_start: dt_time = dt_time(9, 0)
+    call_window_end: dt_time = dt_time(17, 0)
+    weekend_calling: bool = False
+
+
+def jobs_from_contacts(
+    contacts: Iterable[Dict[str, Any]],
+    phone_column: str,
+    assistant_ids: List[str],
+    custom_prompt: str = "",
+    contact_fields: Optional[Dict[str, Any]] = None,
+    respect_local_time: bool = False,
+) -> Iterator[DialJob]:
+    """Lazily turn contact rows into dial jobs, spreading them round-robin over the assistants
+
+    With ``respect_local_time`` each job's call window is applied in the
+    timezone of the contact's number, where the number pins one down.
+    """
+    assistants = itertools.cycle(assistant_ids)
+    for contact in contacts:
+        phone_number = str(contact.get(phone_column) or "").strip()
+        if not phone_number:
+            continue
+        yield DialJob(
+            phone_number=phone_number,
+            assistant_id=next(assistants),
+            custom_prompt=custom_prompt,
+            contact={**contact, **(contact_fields or {})},
+            timezone=timezone_for_number(phone_number) if respect_local_time else "",
+        )
+
+
+class AssistantRateLimiter:
+    """Spaces out calls per assistant by at least ``min_interval`` seconds"""
+
+    def __init__(self, min_interval: float, clock: Callable[[], float] = time.monotonic):
+        self.min_interval = min_interval
+        self.clock = clock
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, assistant_id: str) -> float:
+        """Reserve the next call slot and return how long to wait for it"""
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot.get(assistant_id, now))
+            self._next_slot[assistant_id] = slot + self.min_interval
+            return slot - now
+
+
+def seconds_until_window(now: datetime, settings: DialSettings) -> float:
+    """Seconds until ``now`` falls inside the campaign's call window (0 if it already does)"""
+    start, end = settings.call_window_start, settings.call_window_end
+    if start >= end:
+        raise ValueError("Call window start must be before call window end")
+
+    # Eight days is enough to reach a weekday window from any starting point
+    for day_offset in range(8):
+        day = now.date() + timedelta(days=day_offset)
+        if day.weekday() >= 5 and not settings.weekend_calling:
+            continue
+        window_start = datetime.combine(day, start)
+        window_end = datetime.combine(day, end)
+        if now < window_end:
+            return max((window_start - now).total_seconds(), 0.0)
+    raise ValueError("Call window never opens")
+
+
+def validate_settings(settings: DialSettings):
+    """Raise ``ValueError`` for a call window no job could ever be placed in"""
+    seconds_until_window(datetime(2000, 1, 3), settings)
+
+
+class BulkDialer:
+    """Fans dial jobs out to VAPI with bounded concurrency, rate limits and retries"""
+
+    def __init__(
+        self,
+        vapi_manager: VAPIManager,
+        jobs: Iterable[DialJob],
+        settings: DialSettings,
+        total: Optional[int] = None,
+        on_result: Optional[Callable[[DialJob, Dict[str, Any]], None]] = None,
+        now: Callable[[], datetime] = datetime.now,
+        queue: Optional[CampaignQueue] = None,
+        campaign: str = "",
+        router: Optional[AssistantRouter] = None,
+        assistant_ids: Optional[List[str]] = None,
+        call_store: Optional[CallStore] = None,
+        keep_open: bool = False,
+    ):
+        # A bad window would otherwise fail every job once the workers are running
+        validate_settings(settings)
+        self.vapi_manager = vapi_manager
+        self.settings = settings
+        self.total = total
+        self.on_result = on_result
+        self.now = now
+        # Shared capacity and budget across campaigns; each call needs a slot from it
+        self.queue = queue
+        self.campaign = campaign
+        self.budget_exhausted = False
+        # With a router each call goes to the least-loaded of ``assistant_ids``
+        # rather than the job's round-robin assistant
+        self.router = router
+        self.assistant_ids = assistant_ids
+        # Placed calls are stored from the worker, before any webhook for them can arrive
+        self.call_store = call_store
+
+        self._jobs: Iterator[DialJob] = iter(jobs)
+        self._jobs_exhausted = False
+        # Kept open, the workers wait for ``feed`` once the jobs run out instead of finishing
+        self.keep_open = keep_open
+        self._fed: deque = deque()
+        self._retry_heap: List[tuple] = []
+        self._retry_seq = itertools.count()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._rate_limiter = AssistantRateLimiter(settings.call_delay)
+        self._records: deque = deque()
+        self._errors: deque = deque(maxlen=100)
+        self._workers: List[threading.Thread] = []
+
+        self.stats = {
+            "dispatched": 0,
+            "successful": 0,
+            "failed": 0,
+            "retries": 0,
+            "cost": 0.0,
+        }
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    # Lifecycle
+
+    def start(self) -> "BulkDialer":
+        """Start the worker threads and return immediately"""
+        if self._workers:
+            return self
+        self.started_at = self.now()
+        for i in range(max(1, self.settings.max_concurrent)):
+            worker = threading.Thread(target=self._worker, name=f"bulk-dialer-{i}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+        return self
+
+    def stop(self):
+        """Ask the workers to stop after their current call"""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every worker to exit; returns True when the dialer is done"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            worker.join(remaining)
+        return not self.is_running
+
+    @property
+    def is_running(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    # Progress reporting for the UI thread
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the campaign counters"""
+        with self._cond:
+            completed = self.stats["successful"] + self.stats["failed"]
+            return {
+                **self.stats,
+                "completed": completed,
+                "total": self.total,
+                "in_flight": self._in_flight,
+                "pending_retries": len(self._retry_heap),
+                "running": self.is_running,
+                "stopped": self._stop_event.is_set(),
+                "budget_exhausted": self.budget_exhausted,
+                "recent_errors": list(self._errors),
+            }
+
+    def feed(self, jobs: Iterable[DialJob]):
+        """Queue more jobs behind the ones the dialer started with"""
+        with self._cond:
+            added = len(self._fed)
+            self._fed.extend(jobs)
+            if self.total is not None:
+                self.total += len(self._fed) - added
+            self._cond.notify_all()
+
+    def drain_records(self) -> List[CallRecord]:
+        """Pop the call records created since the previous drain"""
+        records = []
+        while self._records:
+            records.append(self._records.popleft())
+        return records
+
+    # Worker internals
+
+    def _next_job(self) -> Optional[DialJob]:
+        """Block until a job is ready, or return None once the campaign is finished"""
+        with self._cond:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+                if self._retry_heap and self._retry_heap[0][0] <= now:
+                    _, _, job = heapq.heappop(self._retry_heap)
+                    self._in_flight += 1
+                    return job
+
+                if not self._jobs_exhausted and len(self._retry_heap) < MAX_DEFERRED:
+                    job = next(self._jobs, None)
+                    if job is not None:
+                        self._in_flight += 1
+                        return job
+                    self._jobs_exhausted = True
+
+                if self._fed:
+                    self._in_flight += 1
+                    return self._fed.popleft()
+
+                if not self._retry_heap and self._in_flight == 0 and not self.keep_open:
+                    # Nothing queued and nobody can produce a retry: we're done
+                    if self.finished_at is None:
+                        self.finished_at = self.now()
+                    self._cond.notify_all()
+                    return None
+
+                timeout = self._retry_heap[0][0] - now if self._retry_heap else None
+                self._cond.wait(timeout)
+            return None
+
+    def _wait(self, seconds: float) -> bool:
+        """Sleep for ``seconds`` unless stopped; returns False when stopped"""
+        return not self._stop_event.wait(seconds) if seconds > 0 else not self._stop_event.is_set()
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                self._dial(job)
+            except Exception as error:
+                # An unexpected error fails this job rather than killing the worker
+                logger.exception("Dialing %s failed", job.phone_number)
+                self._fail(job, f"Unexpected error: {error}")
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _local_now(self, job: DialJob) -> datetime:
+        """Wall-clock time for the contact, or the system's when the job has no timezone"""
+        now = self.now()
+        if not job.timezone:
+            return now
+        return now.astimezone(pytz.timezone(job.timezone)).replace(tzinfo=None)
+
+    def _dial(self, job: DialJob):
+        try:
+            wait = seconds_until_window(self._local_now(job), self.settings)
+        except pytz.UnknownTimeZoneError:
+            self._fail(job, f"Unknown timezone: {job.timezone}")
+            return
+        if wait > 0:
+            # Park the job until the contact's window opens rather than holding a worker
+            with self._cond:
+                heapq.heappush(self._retry_heap, (time.monotonic() + wait, next(self._retry_seq), job))
+                self._cond.notify_all()
+            return
+        if self.router is None:
+            self._place(job)
+            return
+
+        assistant_id = self.router.route(self.assistant_ids, self._stop_event)
+        if assistant_id is None:
+            if not self._stop_event.is_set():
+                self._fail(job, "No eligible assistant")
+            return
+        job.assistant_id = assistant_id
+        result = None
+        try:
+            result = self._place(job)
+        finally:
+            record = (result or {}).get("call_record")
+            if record is not None:
+                # The slot is held until the call ends
+                self.router.bind(record.call_id, assistant_id)
+            else:
+                self.router.release(assistant_id)
+
+    def _place(self, job: DialJob) -> Optional[Dict[str, Any]]:
+        """Place one call for ``job``; returns the VAPI result, or None if it was never placed"""
+        if not self._wait(self._rate_limiter.reserve(job.assistant_id)):
+            return None
+
+        if self.queue is not None and not self.queue.acquire(self.campaign, self._stop_event):
+            if not self._stop_event.is_set():
+                self.budget_exhausted = True
+                self.stop()
+            return None
+
+        job.attempts += 1
+        result: Dict[str, Any] = {}
+        try:
+            result = self.vapi_manager.initiate_call(job.assistant_id, job.phone_number, job.custom_prompt)
+        finally:
+            if self.queue is not None:
+                if result.get("call_id") and "success" in result:
+                    # The slot stays taken until the call ends, when its actual cost is charged
+                    self.queue.bind(self.campaign, result["call_id"])
+                else:
+                    self.queue.release(self.campaign)
+
+        record = result.get("call_record") if "success" in result else None
+        if record is not None:
+            record.custom_data = {**(record.custom_data or {}), **job.contact}
+            if self.call_store is not None:
+                try:
+                    self.call_store.insert_new([record])
+                except Exception:
+                    logger.exception("Storing placed call %s failed", record.call_id)
+
+        with self._cond:
+            self.stats["dispatched"] += 1
+            if "success" in result:
+                self.stats["successful"] += 1
+                self.stats["cost"] += result.get("estimated_cost", 0.0)
+                if record is not None:
+                    self._records.append(record)
+            elif result.get("retryable", True) and job.attempts <= self.settings.max_retries:
+                # Exponential backoff with jitter so retries don't arrive in lockstep
+                delay = self.settings.retry_backoff * (2 ** (job.attempts - 1))
+                delay *= random.uniform(0.8, 1.2)
+                heapq.heappush(self._retry_heap, (time.monotonic() + delay, next(self._retry_seq), job))
+                self.stats["retries"] += 1
+            else:
+                self._record_failure(job, result.get("error", "Unknown error"))
+
+        if self.on_result is not None:
+            self.on_result(job, result)
+        return result
+
+    def _fail(self, job: DialJob, error: str):
+        """Fail a job that was never placed, reporting it like any other result"""
+        with self._cond:
+            self._record_failure(job, error)
+        if self.on_result is not None:
+            self.on_result(job, {"error": error, "retryable": False})
+
+    def _record_failure(self, job: DialJob, error: str):
+        """Count a job as failed for good; callers hold the condition"""
+        self.stats["failed"] += 1
+        self._errors.append({
+            "phone_number": job.phone_number,
+            "assistant_id": job.assistant_id,
+            "attempts": job.attempts,
+            "error": error,
+        })
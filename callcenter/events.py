@@ -0,0 +1,209 @@
+"""Append-only store of call events pushed by VAPI webhooks
+
+The webhook receiver appends events; every Streamlit session keeps a
+cursor (the last ``seq`` it applied) and reads only newer events on each
+rerun, so live pages update in O(new events) instead of re-polling VAPI.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Iterable, Optional
+
+from .db import DEFAULT_DB_PATH, connect
+from .models import CallRecord, CallStatus
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_EVENTS = [
+    "call_started", "call_ended", "call_failed", "lead_qualified",
+    "appointment_scheduled", "objection_raised", "positive_sentiment", "transcript"
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS call_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type TEXT NOT NULL,
+    call_id TEXT NOT NULL,
+    assistant_id TEXT NOT NULL,
+    occurred_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_call_events_call_id ON call_events (call_id);
+"""
+
+
+class EventStore:
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def append(self, events: Iterable[Dict[str, Any]]) -> int:
+        """Append events in a single transaction and return how many were written"""
+        rows = [
+            (
+                event["event_type"],
+                event["call_id"],
+                event.get("assistant_id", ""),
+                event.get("occurred_at") or time.time(),
+                json.dumps(event.get("data", {})),
+            )
+            for event in events
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO call_events (event_type, call_id, assistant_id, occurred_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def read_since(self, cursor: int, limit: int = 5000) -> List[Dict[str, Any]]:
+        """Events with ``seq`` greater than ``cursor``, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, event_type, call_id, assistant_id, occurred_at, payload "
+                "FROM call_events WHERE seq > ? ORDER BY seq LIMIT ?",
+                (cursor, limit),
+            ).fetchall()
+        return [
+            {
+                "seq": row["seq"],
+                "event_type": row["event_type"],
+                "call_id": row["call_id"],
+                "assistant_id": row["assistant_id"],
+                "occurred_at": row["occurred_at"],
+                "data": json.loads(row["payload"]),
+            }
+            for row in rows
+        ]
+
+    def last_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM call_events").fetchone()
+        return row[0]
+
+
+class CallEndFollower:
+    """Hands each ``call_ended`` and ``call_failed`` event to ``handlers`` as it reaches the store
+
+    Runs on its own thread, so slots held by placed calls are freed
+    whether or not any page is open.
+    """
+
+    def __init__(
+        self,
+        event_store: EventStore,
+        handlers: Iterable[Callable[[Dict[str, Any]], Any]],
+        poll_interval: float = 1.0,
+        batch_size: int = 5000,
+    ):
+        self.event_store = event_store
+        self.handlers = list(handlers)
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        # Slots are only held in this process from now on, so older events can't free any
+        self.cursor = event_store.last_seq()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "CallEndFollower":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="call-end-follower", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+
+    def poll(self) -> int:
+        """Handle the calls that ended since the last poll; returns how many events were read"""
+        read = 0
+        while True:
+            events = self.event_store.read_since(self.cursor, self.batch_size)
+            for event in events:
+                if event["event_type"] in ("call_ended", "call_failed"):
+                    for handler in self.handlers:
+                        handler(event)
+            if events:
+                self.cursor = events[-1]["seq"]
+                read += len(events)
+            if len(events) < self.batch_size:
+                return read
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Following call ends failed")
+            self._stop_event.wait(self.poll_interval)
+
+
+def fold_event(call: Optional[CallRecord], event: Dict[str, Any]) -> CallRecord:
+    """Apply one event to a call record, creating the record if the call is new"""
+    data = event["data"]
+    occurred_at = datetime.fromtimestamp(event["occurred_at"])
+    if call is None:
+        call = CallRecord(
+            call_id=event["call_id"],
+            assistant_id=event["assistant_id"],
+            phone_number=data.get("phone_number", ""),
+            start_time=occurred_at,
+            custom_data={}
+        )
+
+    if event["event_type"] == "call_started":
+        call.status = CallStatus.CONNECTED
+
+    elif event["event_type"] in ("call_ended", "call_failed"):
+        call.end_time = occurred_at
+        call.status = CallStatus.COMPLETED if event["event_type"] == "call_ended" else CallStatus.FAILED
+        call.duration = data.get("duration", int((call.end_time - call.start_time).total_seconds()))
+        call.cost = data.get("cost", call.cost)
+        call.transcript = data.get("transcript", call.transcript)
+        call.recording_url = data.get("recording_url", call.recording_url)
+
+    elif event["event_type"] == "transcript":
+        # Utterances are scored by the transcript pipeline, which writes the call's scores itself
+        pass
+
+    else:
+        if "lead_score" in data:
+            call.lead_score = data["lead_score"]
+        if "sentiment_score" in data:
+            call.sentiment_score = data["sentiment_score"]
+        call.custom_data = {**(call.custom_data or {}), event["event_type"]: data}
+
+    return call
+
+
+def apply_events(events: Iterable[Dict[str, Any]], active_calls: Dict[str, CallRecord]) -> Optional[int]:
+    """Fold webhook events into a session's live view of active calls
+
+    Persisting the calls is the receiver's job (see ``CallStore.apply_events``);
+    sessions only track which calls are live. Returns the ``seq`` of the last
+    event applied, or None if there were none.
+    """
+    last_seq = None
+    for event in events:
+        last_seq = event["seq"]
+        call = active_calls.get(event["call_id"])
+        if event["event_type"] == "call_started":
+            active_calls[event["call_id"]] = fold_event(call, event)
+        elif event["event_type"] in ("call_ended", "call_failed"):
+            active_calls.pop(event["call_id"], None)
+        elif call is not None:
+            fold_event(call, event)
+    return last_seq
@@ -0,0 +1,307 @@
+"""Background export jobs with deduplicated, persistent artifacts
+
+``ExportJobRunner.submit`` records an export request in the ``export_jobs``
+table and returns its job straight away; a small pool of worker threads
+claims queued jobs, streams each one into a file under ``export_dir`` a
+chunk at a time while recording progress, and moves the finished file into
+place. The job id is a stable handle on the artifact: any session, or the
+same one after a rerun or restart, can poll it and download the result.
+
+Requests are keyed by kind, format, parameters and the version of the data
+the kind reads, when it registers one. Submitting one that is already
+queued or running, or that completed less than ``max_age`` seconds ago,
+returns the existing job instead of exporting again; once the data has
+changed the key does too, so a range that includes today is exported
+afresh instead of served stale. Jobs left
+running by a process that died are requeued once their progress goes
+stale.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from .db import DEFAULT_DB_PATH, connect
+from .exports import EXPORT_FORMATS, write_export
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS export_jobs (
+    job_id TEXT PRIMARY KEY,
+    request_key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    export_format TEXT NOT NULL,
+    params TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    rows INTEGER NOT NULL DEFAULT 0,
+    total INTEGER,
+    path TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_export_jobs_request ON export_jobs (request_key, created_at);
+CREATE INDEX IF NOT EXISTS idx_export_jobs_queued ON export_jobs (created_at) WHERE status = 'queued';
+"""
+
+DEFAULT_EXPORT_DIR = os.path.join(tempfile.gettempdir(), "callcenter_exports")
+PENDING_STATUSES = ("queued", "running")
+# A running job whose progress hasn't moved for this long belonged to a dead process
+STALE_AFTER = 300.0
+PRUNE_INTERVAL = 3600.0
+
+
+def request_key(kind: str, export_format: str, params: Dict[str, Any], data_version: Any = None) -> str:
+    """Identical requests over the same data share a key however their parameters were ordered"""
+    payload = json.dumps([kind, export_format, params, data_version], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ExportJobRunner:
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        export_dir: str = DEFAULT_EXPORT_DIR,
+        workers: int = 2,
+        max_age: float = 900.0,
+        retention: float = 24 * 3600,
+        poll_interval: float = 5.0,
+    ):
+        self.export_dir = export_dir
+        self.workers = workers
+        self.max_age = max_age
+        self.retention = retention
+        # Other processes may queue jobs too, so idle waits are bounded
+        self.poll_interval = poll_interval
+        self.stats = {"submitted": 0, "deduplicated": 0, "completed": 0, "failed": 0}
+        os.makedirs(export_dir, exist_ok=True)
+
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        # kind -> (frames for the params, optional row count for progress, optional data version)
+        self._kinds: Dict[str, tuple] = {}
+        self._last_prune = 0.0
+
+    def register(
+        self,
+        kind: str,
+        frames: Callable[[Dict[str, Any]], Iterable[pd.DataFrame]],
+        total: Optional[Callable[[Dict[str, Any]], int]] = None,
+        version: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        """Teach the runner how to produce one kind of export from its parameters
+
+        ``version`` returns something that changes whenever the data the
+        export reads does; a finished job is only reused while it is unchanged.
+        """
+        self._kinds[kind] = (frames, total, version)
+
+    # Submitting and polling
+
+    def submit(self, kind: str, export_format: str, params: Dict[str, Any], name: str = "export") -> Dict[str, Any]:
+        """Queue an export, or return the job already producing or holding the same one
+
+        ``params`` must be JSON-serializable; datetimes are stored as ISO
+        strings and handed back to the kind's callables that way.
+        """
+        if kind not in self._kinds:
+            raise ValueError(f"Unknown export kind: {kind}")
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+        version = self._kinds[kind][2]
+        key = request_key(kind, export_format, params, version(params) if version is not None else None)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._conn.execute(
+                    "SELECT * FROM export_jobs WHERE request_key = ? AND "
+                    "(status IN ('queued', 'running') OR (status = 'completed' AND finished_at >= ?)) "
+                    "ORDER BY created_at DESC LIMIT 1",
+                    (key, now - self.max_age),
+                ).fetchone()
+                if existing is not None and (existing["status"] != "completed" or os.path.exists(existing["path"])):
+                    self._conn.execute("COMMIT")
+                    self.stats["deduplicated"] += 1
+                    return self._snapshot(existing)
+                job_id = f"export_{uuid.uuid4().hex[:12]}"
+                self._conn.execute(
+                    "INSERT INTO export_jobs (job_id, request_key, kind, export_format, params, name, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, key, kind, export_format, json.dumps(params, default=str), name, now, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.stats["submitted"] += 1
+        with self._cond:
+            self._cond.notify()
+        return self.job(job_id)
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM export_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._snapshot(row) if row is not None else None
+
+    def jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent jobs first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM export_jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._snapshot(row) for row in rows]
+
+    def artifact(self, job_id: str) -> Optional[str]:
+        """Path of a completed job's file, if it is still on disk"""
+        job = self.job(job_id)
+        if job is None or job["status"] != "completed" or not os.path.exists(job["path"]):
+            return None
+        return job["path"]
+
+    @staticmethod
+    def _snapshot(row) -> Dict[str, Any]:
+        """A job for display; ``progress`` is a fraction when the row total is known"""
+        export_info = EXPORT_FORMATS[row["export_format"]]
+        created = datetime.fromtimestamp(row["created_at"])
+        if row["status"] == "completed":
+            progress = 1.0
+        elif row["total"]:
+            progress = min(row["rows"] / row["total"], 1.0)
+        else:
+            progress = None
+        return {
+            **dict(row),
+            "params": json.loads(row["params"]),
+            "progress": progress,
+            "file_name": f"{row['name']}_{created.strftime('%Y%m%d_%H%M%S')}.{export_info['extension']}",
+            "mime": export_info["mime"],
+        }
+
+    # Workers
+
+    def start(self) -> "ExportJobRunner":
+        if self._threads:
+            return self
+        self._stop_event.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"export-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: float = 10.0):
+        """Stop claiming jobs; a job being written finishes first"""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        """Take the oldest queued job, first requeueing any abandoned by a dead process"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE export_jobs SET status = 'queued', rows = 0 WHERE status = 'running' AND updated_at < ?",
+                    (now - STALE_AFTER,),
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM export_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE export_jobs SET status = 'running', updated_at = ? WHERE job_id = ?",
+                        (now, row["job_id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return dict(row) if row is not None else None
+
+    def _update(self, job_id: str, **fields):
+        fields["updated_at"] = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE export_jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE job_id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def _counted(self, job_id: str, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Pass frames through, recording the rows written so far after each one"""
+        rows = 0
+        for frame in frames:
+            yield frame
+            rows += len(frame)
+            self._update(job_id, rows=rows)
+
+    def _execute(self, job: Dict[str, Any]):
+        job_id = job["job_id"]
+        params = json.loads(job["params"])
+        path = os.path.join(self.export_dir, f"{job_id}.{EXPORT_FORMATS[job['export_format']]['extension']}")
+        partial = path + ".partial"
+        try:
+            frames, total, _ = self._kinds[job["kind"]]
+            if total is not None:
+                self._update(job_id, total=total(params))
+            with open(partial, "wb") as out:
+                rows = write_export(self._counted(job_id, frames(params)), job["export_format"], out)
+            # Only complete files ever appear under the final name
+            os.replace(partial, path)
+            self._update(job_id, status="completed", rows=rows, path=path, finished_at=time.time())
+            self.stats["completed"] += 1
+        except Exception as error:
+            logger.exception("Export job %s failed", job_id)
+            if os.path.exists(partial):
+                os.remove(partial)
+            self._update(job_id, status="failed", error=str(error), finished_at=time.time())
+            self.stats["failed"] += 1
+
+    def _prune(self):
+        """Delete artifacts and job rows past the retention period"""
+        if time.monotonic() - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = time.monotonic()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, path FROM export_jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                (time.time() - self.retention,),
+            ).fetchall()
+            self._conn.executemany("DELETE FROM export_jobs WHERE job_id = ?", [(row["job_id"],) for row in rows])
+        for row in rows:
+            if row["path"] and os.path.exists(row["path"]):
+                os.remove(row["path"])
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            job = None
+            try:
+                self._prune()
+                job = self._claim()
+            except Exception:
+                logger.exception("Claiming an export job failed")
+            if job is not None:
+                self._execute(job)
+                continue
+            with self._cond:
+                if not self._stop_event.is_set():
+                    self._cond.wait(self.poll_interval)
@@ -0,0 +1,212 @@
+"""Streaming exports of the call history
+
+Calls are read from the store a chunk at a time with keyset paging and each
+chunk goes straight to the output file: a row group for Parquet, a record
+batch for Arrow IPC, and appended rows for CSV, JSON and Excel. Memory stays
+bounded by the chunk size however many calls match, so a 30 day "Complete
+Dataset" export costs the same RAM as a single day.
+"""
+from typing import Dict, List, Any, BinaryIO, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+from .columnar import CallBuffer, to_local
+from .store import CallStore
+
+EXPORT_CHUNK_SIZE = 50000
+# Excel caps a sheet at 1,048,576 rows including the header
+EXCEL_SHEET_ROWS = 1048575
+
+# Optional per-call columns, by the "Include Data" choice that adds them
+OPTIONAL_COLUMNS = {
+    "Call Transcripts": ["Transcript"],
+    "Sentiment Analysis": ["Sentiment Score"],
+    "Lead Scores": ["Lead Score"],
+    "Cost Analysis": ["Cost"],
+}
+
+
+def export_frame(
+    calls: CallBuffer,
+    assistant_names: Optional[Dict[str, str]] = None,
+    include: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Export columns for one chunk of calls in local time; ``include=None`` adds every optional column"""
+    columns = calls.to_pandas()
+    assistant_names = assistant_names or {}
+    frame = pd.DataFrame({
+        "Call ID": columns["call_id"],
+        "Assistant": columns["assistant_id"].map(lambda assistant_id: assistant_names.get(assistant_id, assistant_id)),
+        "Phone Number": columns["phone_number"],
+        "Start Time": to_local(columns["start_time"]),
+        "End Time": to_local(columns["end_time"]),
+        "Duration": columns["duration"],
+        "Status": calls.status_labels(),
+        "Campaign": columns["campaign"],
+        "Transcript": columns["transcript"],
+        "Sentiment Score": columns["sentiment_score"],
+        "Lead Score": columns["lead_score"],
+        "Cost": columns["cost"],
+    })
+    included = set(OPTIONAL_COLUMNS if include is None else include)
+    dropped = [column for choice, names in OPTIONAL_COLUMNS.items() if choice not in included for column in names]
+    return frame.drop(columns=dropped)
+
+
+def iter_call_frames(
+    call_store: CallStore,
+    to_frame: Callable[[CallBuffer], pd.DataFrame],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    **filters,
+) -> Iterator[pd.DataFrame]:
+    """Matching calls a chunk at a time, newest first, each turned into a frame by ``to_frame``
+
+    Yields one empty frame when nothing matches, so every format can still
+    write its header or schema.
+    """
+    found = False
+    for calls in call_store.iter_pages(chunk_size=chunk_size, columnar=True, **filters):
+        found = True
+        yield to_frame(calls)
+    if not found:
+        yield to_frame(CallBuffer(capacity=1))
+
+
+def iter_export_frames(
+    call_store: CallStore,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    assistant_names: Optional[Dict[str, str]] = None,
+    include: Optional[Iterable[str]] = None,
+    **filters,
+) -> Iterator[pd.DataFrame]:
+    """Matching calls as ``export_frame`` chunks"""
+    include = None if include is None else list(include)
+    return iter_call_frames(
+        call_store, lambda calls: export_frame(calls, assistant_names, include), chunk_size, **filters
+    )
+
+
+def _write_csv(frames: Iterable[pd.DataFrame], out: BinaryIO) -> int:
+    rows, header = 0, True
+    for frame in frames:
+        out.write(frame.to_csv(index=False, header=header).encode("utf-8"))
+        rows += len(frame)
+        header = False
+    return rows
+
+
+def _write_json(frames: Iterable[pd.DataFrame], out: BinaryIO) -> int:
+    """One JSON array of records, written a chunk of objects at a time"""
+    rows = 0
+    out.write(b"[")
+    for frame in frames:
+        if frame.empty:
+            continue
+        if rows:
+            out.write(b",")
+        # Strip each chunk's own brackets so the chunks join into one array
+        out.write(frame.to_json(orient="records", date_format="iso")[1:-1].encode("utf-8"))
+        rows += len(frame)
+    out.write(b"]")
+    return rows
+
+
+def _write_excel(frames: Iterable[pd.DataFrame], out: BinaryIO) -> int:
+    """Write-only workbook, starting a new sheet whenever one fills up"""
+    workbook = Workbook(write_only=True)
+    sheet, sheet_rows, rows, header = None, 0, 0, None
+    for frame in frames:
+        header = list(frame.columns)
+        # openpyxl has no NaT; blank cells instead
+        values = frame.astype(object).where(frame.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if sheet is None or sheet_rows == EXCEL_SHEET_ROWS:
+                sheet = workbook.create_sheet(f"Calls {len(workbook.worksheets) + 1}")
+                sheet.append(header)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+            rows += 1
+    if sheet is None:
+        workbook.create_sheet("Calls 1").append(header or [])
+    workbook.save(out)
+    return rows
+
+
+def _arrow_batches(frames: Iterable[pd.DataFrame]) -> Iterator[pa.Table]:
+    """Each frame as an Arrow table with the schema of the first
+
+    Categoricals arrive with a different dictionary per chunk, so they are
+    written as plain strings; Parquet dictionary-encodes them again itself.
+    """
+    schema = None
+    for frame in frames:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if schema is None:
+            schema = pa.schema([
+                field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ]).remove_metadata()
+        yield table.cast(schema)
+
+
+def _write_parquet(frames: Iterable[pd.DataFrame], out: BinaryIO) -> int:
+    rows, writer = 0, None
+    for table in _arrow_batches(frames):
+        if writer is None:
+            writer = pq.ParquetWriter(out, table.schema)
+        # One row group per chunk
+        writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        rows += table.num_rows
+    if writer is not None:
+        writer.close()
+    return rows
+
+
+def _write_arrow(frames: Iterable[pd.DataFrame], out: BinaryIO) -> int:
+    rows, writer = 0, None
+    for table in _arrow_batches(frames):
+        if writer is None:
+            writer = pa.ipc.new_file(out, table.schema)
+        writer.write_table(table)
+        rows += table.num_rows
+    if writer is not None:
+        writer.close()
+    return rows
+
+
+EXPORT_FORMATS: Dict[str, Dict[str, Any]] = {
+    "CSV": {"extension": "csv", "mime": "text/csv", "writer": _write_csv},
+    "Excel": {
+        "extension": "xlsx",
+        "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "writer": _write_excel,
+    },
+    "JSON": {"extension": "json", "mime": "application/json", "writer": _write_json},
+    "Parquet": {"extension": "parquet", "mime": "application/vnd.apache.parquet", "writer": _write_parquet},
+    "Arrow IPC": {"extension": "arrow", "mime": "application/vnd.apache.arrow.file", "writer": _write_arrow},
+}
+
+
+def write_export(frames: Iterable[pd.DataFrame], export_format: str, out: BinaryIO) -> int:
+    """Stream frames into ``out`` in one of ``EXPORT_FORMATS``; returns the rows written"""
+    writer: Callable[[Iterable[pd.DataFrame], BinaryIO], int] = EXPORT_FORMATS[export_format]["writer"]
+    return writer(frames, out)
+
+
+def export_calls(
+    call_store: CallStore,
+    export_format: str,
+    out: BinaryIO,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    assistant_names: Optional[Dict[str, str]] = None,
+    include: Optional[List[str]] = None,
+    **filters,
+) -> int:
+    """Export the calls matching ``filters`` without holding more than one chunk in memory"""
+    frames = iter_export_frames(call_store, chunk_size, assistant_names, include, **filters)
+    return write_export(frames, export_format, out)
+
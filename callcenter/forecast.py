@@ -0,0 +1,295 @@
+"""Daily call-volume forecasting on the stored call history
+
+Every model is a least-squares fit kept as sufficient statistics (XᵀX,
+Xᵀy, yᵀy), so when a new day of history arrives only that day's row is
+added and the coefficients are re-solved; nothing is retrained from
+scratch. The last few cached days are re-read on every forecast, and a
+day whose count was revised has its old rows subtracted and new ones
+added. Fitted models are cached per assistant and model type, and the
+forecast horizon only affects prediction, so moving the horizon slider
+never refits.
+
+- Linear Trend: intercept and slope
+- Seasonal: linear trend plus day-of-week effects
+- ARIMA: ARIMA(7, 1, 0), an autoregression on day-over-day changes
+- Prophet: Prophet-style additive model, piecewise-linear trend with
+  regularized changepoints every four weeks plus weekly Fourier terms
+"""
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from statistics import NormalDist
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .store import CallStore, local_day, local_midnight
+
+HISTORY_DAYS = 365
+MIN_HISTORY_DAYS = 14
+# Cached days re-read on every forecast, for calls stored after their day was loaded
+REFRESH_DAYS = 2
+# Same planning assumptions the dashboard has always used
+REVENUE_PER_CALL = 2.5
+CALLS_PER_ASSISTANT = 50
+
+
+def day_of_week(days: np.ndarray) -> np.ndarray:
+    """Monday = 0 for days counted from the epoch (a Thursday)"""
+    return (days + 3) % 7
+
+
+class RegressionModel(ABC):
+    """Least squares kept as sufficient statistics, updated one day at a time"""
+
+    ridge = 1e-6
+
+    def __init__(self, first_day: int):
+        self.first_day = first_day
+        self.n = 0
+        k = self.feature_count()
+        self.xtx = np.zeros((k, k))
+        self.xty = np.zeros(k)
+        self.yty = 0.0
+        self.rows = 0
+        self.seen = np.zeros(0)
+
+    @abstractmethod
+    def feature_count(self) -> int:
+        """Number of columns in the design matrix"""
+
+    @abstractmethod
+    def _training_rows(self, history: np.ndarray, start: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Design rows and targets for every row that depends on ``history[start:]``"""
+
+    @abstractmethod
+    def predict(self, history: np.ndarray, horizon: int, z: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean forecast and half-width of the prediction interval"""
+
+    def needs_refit(self, history: np.ndarray) -> bool:
+        """True when the feature set has changed and the statistics must be rebuilt"""
+        return False
+
+    def penalty(self) -> np.ndarray:
+        return np.full(self.feature_count(), self.ridge)
+
+    def _accumulate(self, history: np.ndarray, start: int, sign: float):
+        X, y = self._training_rows(history, start)
+        self.xtx += sign * (X.T @ X)
+        self.xty += sign * (X.T @ y)
+        self.yty += sign * float(y @ y)
+        self.rows += int(sign) * len(y)
+
+    def update(self, history: np.ndarray):
+        """Fold in the days of ``history`` not seen yet, and any seen days whose counts were revised"""
+        overlap = min(len(history), self.n)
+        revised = np.flatnonzero(history[:overlap] != self.seen[:overlap])
+        start = int(revised[0]) if len(revised) else overlap
+        if start == len(history) == self.n:
+            return
+        if start < self.n:
+            # Take the stale rows back out before adding them again with the revised counts
+            self._accumulate(self.seen, start, -1.0)
+        self._accumulate(history, start, 1.0)
+        self.n = len(history)
+        self.seen = history.copy()
+        self._solve()
+
+    def _solve(self):
+        regularized = self.xtx + np.diag(self.penalty())
+        self.inverse = np.linalg.pinv(regularized)
+        self.beta = self.inverse @ self.xty
+        sse = self.yty - 2 * self.beta @ self.xty + self.beta @ self.xtx @ self.beta
+        self.sigma2 = max(sse, 0.0) / max(self.rows - self.feature_count(), 1)
+
+
+class DayRegressionModel(RegressionModel):
+    """Regression of each day's count on features of its day index"""
+
+    @abstractmethod
+    def features(self, days: np.ndarray) -> np.ndarray:
+        """Design rows for ``days``, counted from the epoch"""
+
+    def _training_rows(self, history: np.ndarray, start: int) -> Tuple[np.ndarray, np.ndarray]:
+        days = self.first_day + np.arange(start, len(history))
+        return self.features(days), history[start:]
+
+    def predict(self, history: np.ndarray, horizon: int, z: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean forecast and half-width of the prediction interval"""
+        days = self.first_day + len(history) + np.arange(horizon)
+        X = self.features(days)
+        leverage = np.einsum("ij,jk,ik->i", X, self.inverse, X)
+        return X @ self.beta, z * np.sqrt(self.sigma2 * (1 + leverage))
+
+
+class LinearTrendModel(DayRegressionModel):
+    def feature_count(self) -> int:
+        return 2
+
+    def features(self, days: np.ndarray) -> np.ndarray:
+        return np.column_stack([np.ones(len(days)), days - self.first_day])
+
+
+class SeasonalModel(DayRegressionModel):
+    def feature_count(self) -> int:
+        return 8
+
+    def features(self, days: np.ndarray) -> np.ndarray:
+        weekday = np.eye(7)[day_of_week(days)][:, 1:]
+        return np.column_stack([np.ones(len(days)), days - self.first_day, weekday])
+
+
+class ProphetModel(DayRegressionModel):
+    changepoint_spacing = 28
+    # Changepoints need this many days after them before they are fitted
+    changepoint_margin = 14
+    changepoint_prior = 50.0
+    fourier_order = 3
+
+    def __init__(self, first_day: int, history_length: int = 0):
+        self.changepoints = self._changepoints_for(history_length)
+        super().__init__(first_day)
+
+    def _changepoints_for(self, history_length: int) -> np.ndarray:
+        count = max(history_length - self.changepoint_margin, 0) // self.changepoint_spacing
+        return self.changepoint_spacing * np.arange(1, count + 1)
+
+    def needs_refit(self, history: np.ndarray) -> bool:
+        return len(self._changepoints_for(len(history))) != len(self.changepoints)
+
+    def feature_count(self) -> int:
+        return 2 + len(self.changepoints) + 2 * self.fourier_order
+
+    def penalty(self) -> np.ndarray:
+        penalty = super().penalty()
+        penalty[2:2 + len(self.changepoints)] = self.changepoint_prior
+        return penalty
+
+    def features(self, days: np.ndarray) -> np.ndarray:
+        t = (days - self.first_day).astype(float)
+        hinges = np.maximum(t[:, None] - self.changepoints[None, :], 0.0)
+        angles = 2 * np.pi * np.outer(day_of_week(days), np.arange(1, self.fourier_order + 1)) / 7
+        return np.column_stack([np.ones(len(days)), t, hinges, np.sin(angles), np.cos(angles)])
+
+
+class ArimaModel(RegressionModel):
+    """ARIMA(p, 1, 0): intercept plus ``p`` lagged day-over-day changes"""
+
+    p = 7
+
+    def feature_count(self) -> int:
+        return 1 + self.p
+
+    def _training_rows(self, history: np.ndarray, start: int) -> Tuple[np.ndarray, np.ndarray]:
+        diffs = np.diff(history)
+        # Row i predicts diffs[i] from the p changes before it
+        first = max(start - 1, self.p)
+        if first >= len(diffs):
+            return np.zeros((0, self.feature_count())), np.zeros(0)
+        lags = np.lib.stride_tricks.sliding_window_view(diffs, self.p)[first - self.p:len(diffs) - self.p][:, ::-1]
+        return np.column_stack([np.ones(len(lags)), lags]), diffs[first:]
+
+    def predict(self, history: np.ndarray, horizon: int, z: float) -> Tuple[np.ndarray, np.ndarray]:
+        intercept, phi = self.beta[0], self.beta[1:]
+        recent = list(np.diff(history)[-self.p:][::-1])
+        changes = np.empty(horizon)
+        for h in range(horizon):
+            changes[h] = intercept + phi @ np.array(recent[:self.p])
+            recent.insert(0, changes[h])
+        # Error variance through the psi weights of the differenced process, then integrated
+        psi = np.zeros(horizon)
+        psi[0] = 1.0
+        for j in range(1, horizon):
+            psi[j] = phi[:min(j, self.p)] @ psi[j - 1::-1][:min(j, self.p)]
+        variance = self.sigma2 * np.cumsum(np.cumsum(psi) ** 2)
+        return history[-1] + np.cumsum(changes), z * np.sqrt(variance)
+
+
+MODELS = {
+    "Linear Trend": LinearTrendModel,
+    "Seasonal": SeasonalModel,
+    "ARIMA": ArimaModel,
+    "Prophet": ProphetModel,
+}
+
+
+class ForecastEngine:
+    def __init__(self, call_store: CallStore, history_days: int = HISTORY_DAYS):
+        self.call_store = call_store
+        self.history_days = history_days
+        # assistant_id (None = all) -> (first day, calls per day through yesterday)
+        self._histories: Dict[Optional[str], Tuple[int, np.ndarray]] = {}
+        self._models: Dict[Tuple[Optional[str], str], RegressionModel] = {}
+        self._lock = threading.Lock()
+
+    def _history(self, assistant_id: Optional[str], today: int) -> Tuple[int, np.ndarray]:
+        """Daily counts up to yesterday
+
+        After the first load only new days and the last ``REFRESH_DAYS``
+        cached days are queried, so calls that are stored late (webhook
+        retries, status polling) still reach the history.
+        """
+        cached = self._histories.get(assistant_id)
+        if cached is not None and len(cached[1]):
+            first_day, known = cached
+            fetch_from = max(first_day + len(known) - REFRESH_DAYS, first_day)
+        else:
+            first_day, known = None, None
+            fetch_from = today - self.history_days
+        counts = self.call_store.daily_counts(
+            since=local_midnight(fetch_from),
+            until=local_midnight(today),
+            assistant_id=assistant_id,
+        )
+        fetched = np.array([counts.get(day, 0) for day in range(fetch_from, today)], dtype=float)
+        if known is not None:
+            history = (first_day, np.concatenate([known[:fetch_from - first_day], fetched]))
+        else:
+            # Start at the first day with any calls
+            nonzero = np.flatnonzero(fetched)
+            start = int(nonzero[0]) if len(nonzero) else len(fetched)
+            history = (fetch_from + start, fetched[start:])
+        self._histories[assistant_id] = history
+        return history
+
+    def _model(self, assistant_id: Optional[str], model_type: str, first_day: int, history: np.ndarray) -> RegressionModel:
+        key = (assistant_id, model_type)
+        model = self._models.get(key)
+        if model is None or model.first_day != first_day or model.needs_refit(history):
+            model_class = MODELS[model_type]
+            if model_class is ProphetModel:
+                model = ProphetModel(first_day, len(history))
+            else:
+                model = model_class(first_day)
+            self._models[key] = model
+        model.update(history)
+        return model
+
+    def forecast(
+        self,
+        days: int = 30,
+        model_type: str = "Linear Trend",
+        confidence_level: float = 95,
+        assistant_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Forecast the next ``days`` days, or None if there isn't enough history"""
+        now = now or datetime.now()
+        today = local_day(now)
+        with self._lock:
+            first_day, history = self._history(assistant_id, today)
+            if len(history) < MIN_HISTORY_DAYS:
+                return None
+            model = self._model(assistant_id, model_type, first_day, history)
+            mean, half_width = model.predict(history, days, NormalDist().inv_cdf(0.5 + confidence_level / 200))
+
+        predicted = np.maximum(mean, 0)
+        return pd.DataFrame({
+            'Date': pd.to_datetime((today + np.arange(days)) * 86400, unit='s'),
+            'Predicted Calls': predicted.round().astype(int),
+            'Confidence Lower': np.maximum(mean - half_width, 0).round().astype(int),
+            'Confidence Upper': np.maximum(mean + half_width, 0).round().astype(int),
+            'Expected Revenue': predicted * REVENUE_PER_CALL,
+            'Resource Requirement': np.ceil(predicted / CALLS_PER_ASSISTANT).astype(int),
+        })
@@ -0,0 +1,155 @@
+"""Keyword and phrase tracking over call transcripts
+
+Each assistant's keyword list is compiled into an Aho-Corasick automaton
+over word tokens, so an utterance is scanned in one pass, in time
+proportional to its length plus the matches found, however many keywords
+the assistant tracks. Assistants with identical lists share an automaton,
+and automata are only recompiled when the assistant registry changes.
+
+Keywords are grouped by category. A match in a category listed in
+``KEYWORD_EVENTS`` is reported as that webhook event, e.g. an
+``objection`` phrase raises ``objection_raised``.
+"""
+import json
+import re
+import threading
+from collections import deque
+from typing import Dict, List, Iterable, Optional, Tuple
+
+from .assistants import AssistantRegistry
+
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Tracked for assistants that haven't set their own list
+DEFAULT_KEYWORDS = {
+    "buying_intent": [
+        "interested", "sign up", "sign me up", "how much", "pricing", "demo", "schedule",
+        "appointment", "book", "free trial", "quote", "send me", "next step", "buy", "purchase",
+    ],
+    "objection": [
+        "too expensive", "not interested", "no budget", "call back later", "already have",
+        "not right now", "remove me", "do not call", "don't call", "think about it", "competitor",
+    ],
+    "positive": [
+        "thank you", "appreciate it", "sounds great", "sounds good", "perfect", "that's great",
+        "very helpful", "love it", "excellent",
+    ],
+}
+KEYWORD_EVENTS = {"objection": "objection_raised", "positive": "positive_sentiment"}
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower().replace("’", "'"))
+
+
+class KeywordAutomaton:
+    """Aho-Corasick matcher over tokens, reporting leftmost-longest, non-overlapping matches
+
+    "not interested" matches as one objection, not as an objection plus
+    buying intent.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per state: (length, category, phrase) of every keyword ending there
+        self._output: List[List[Tuple[int, str, str]]] = [[]]
+        self.size = 0
+        seen = set()
+        for category, phrases in keywords.items():
+            for phrase in phrases:
+                tokens = tuple(tokenize(phrase))
+                # The first category listing a phrase keeps it
+                if not tokens or tokens in seen:
+                    continue
+                seen.add(tokens)
+                state = 0
+                for token in tokens:
+                    next_state = self._goto[state].get(token)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._output.append([])
+                        self._goto[state][token] = next_state
+                    state = next_state
+                self._output[state].append((len(tokens), category, phrase))
+                self.size += 1
+        self._link()
+
+    def _link(self):
+        """Failure links breadth first, so a state's links are set before its children's"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(token, 0)
+                # Keywords that are suffixes of this one end here too
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def matches(self, tokens: List[str]) -> List[Tuple[str, str]]:
+        """``(category, phrase)`` for every match, in order"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = []
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for length, category, phrase in output[state]:
+                found.append((index - length + 1, -length, category, phrase))
+        if not found:
+            return []
+        found.sort()
+        selected, free_from = [], 0
+        for start, negative_length, category, phrase in found:
+            if start >= free_from:
+                selected.append((category, phrase))
+                free_from = start - negative_length
+        return selected
+
+
+DEFAULT_AUTOMATON = KeywordAutomaton(DEFAULT_KEYWORDS)
+EMPTY_AUTOMATON = KeywordAutomaton({})
+
+
+class KeywordTracker:
+    """Each assistant's compiled automaton, kept in step with the registry"""
+
+    def __init__(self, registry: Optional[AssistantRegistry] = None):
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._version = None
+        self._by_assistant: Dict[str, KeywordAutomaton] = {}
+        # Keyword lists as canonical JSON -> automaton, so identical lists compile once
+        self._compiled: Dict[str, KeywordAutomaton] = {}
+
+    def automaton_for(self, assistant_id: str) -> KeywordAutomaton:
+        """Unknown assistants track the default keywords"""
+        if self.registry is None:
+            return DEFAULT_AUTOMATON
+        version = self.registry.version
+        with self._lock:
+            if version != self._version:
+                self._rebuild()
+                self._version = version
+            return self._by_assistant.get(assistant_id, DEFAULT_AUTOMATON)
+
+    def _rebuild(self):
+        compiled, by_assistant = {}, {}
+        for config in self.registry.configs.values():
+            if not config.keyword_tracking:
+                by_assistant[config.id] = EMPTY_AUTOMATON
+                continue
+            keywords = config.keywords if config.keywords is not None else DEFAULT_KEYWORDS
+            key = json.dumps(keywords, sort_keys=True)
+            automaton = compiled.get(key) or self._compiled.get(key)
+            if automaton is None:
+                automaton = DEFAULT_AUTOMATON if keywords == DEFAULT_KEYWORDS else KeywordAutomaton(keywords)
+            compiled[key] = by_assistant[config.id] = automaton
+        self._compiled = compiled
+        self._by_assistant = by_assistant
@@ -0,0 +1,74 @@
+"""Shared data classes and enums for the VAPI call center"""
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Any
+
+class CallStatus(Enum):
+    INITIATED = "initiated"
+    RINGING = "ringing"
+    CONNECTED = "connected"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    BUSY = "busy"
+    NO_ANSWER = "no_answer"
+
+CALL_STATUS_LABELS = {status: status.value.replace('_', ' ').title() for status in CallStatus}
+TERMINAL_CALL_STATUSES = [CallStatus.COMPLETED, CallStatus.FAILED, CallStatus.BUSY, CallStatus.NO_ANSWER]
+
+def sentiment_label(score: float) -> str:
+    return "Positive" if score > 0.2 else "Negative" if score < -0.2 else "Neutral"
+
+def campaign_name(custom_data: Dict[str, Any]) -> str:
+    """A call's campaign, or "" when it has none (a missing key and None alike)"""
+    campaign = (custom_data or {}).get("campaign")
+    return "" if campaign is None else str(campaign)
+
+class AssistantStatus(Enum):
+    ACTIVE = "active"
+    IDLE = "idle"
+    BUSY = "busy"
+    MAINTENANCE = "maintenance"
+    ERROR = "error"
+
+@dataclass
+class CallRecord:
+    call_id: str
+    assistant_id: str
+    phone_number: str
+    start_time: datetime
+    end_time: datetime = None
+    duration: int = 0
+    status: CallStatus = CallStatus.INITIATED
+    transcript: str = ""
+    sentiment_score: float = 0.0
+    lead_score: float = 0.0
+    cost: float = 0.0
+    recording_url: str = ""
+    custom_data: Dict[str, Any] = None
+
+@dataclass
+class AssistantConfig:
+    id: str
+    name: str
+    description: str
+    phone_number: str
+    voice: str
+    language: str
+    max_duration: int
+    background_sound: str
+    temperature: float
+    response_speed: str
+    custom_prompt: str
+    webhook_url: str
+    sheet_id: str
+    status: AssistantStatus
+    specialization: str
+    cost_per_minute: float
+    success_rate: float
+    total_calls: int
+    total_revenue: float
+    max_concurrent_calls: int = 3
+    keyword_tracking: bool = True
+    # Category -> keywords and phrases; None tracks the default list
+    keywords: Dict[str, List[str]] = None
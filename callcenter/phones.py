@@ -0,0 +1,237 @@
+"""Phone number validation and normalization to E.164
+
+Parsing with ``phonenumbers`` costs tens of microseconds per number, so
+results are memoized per (number, region) and large batches are deduplicated,
+checked against the memo and only then spread over a process pool, whose
+results are memoized in turn. Numbers written without a country code
+are parsed in a region inferred from the contact's country or timezone.
+"""
+import math
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Iterable, Optional, Sequence, Tuple
+
+import phonenumbers
+import pytz
+from phonenumbers import timezone as phone_timezones
+
+DEFAULT_REGION = "US"
+# Batches with fewer distinct numbers than this are parsed in-process
+PARALLEL_THRESHOLD = 20000
+CACHE_SIZE = 200000
+
+# Abbreviations used by the scheduling UI and common in contact exports
+TIMEZONE_ALIASES = {
+    "EST": "US", "EDT": "US", "CST": "US", "CDT": "US", "MST": "US", "MDT": "US",
+    "PST": "US", "PDT": "US", "AKST": "US", "HST": "US",
+    "GMT": "GB", "BST": "GB", "CET": "DE", "IST": "IN", "AEST": "AU", "JST": "JP",
+}
+COUNTRY_ALIASES = {
+    "USA": "US", "UNITED STATES OF AMERICA": "US", "UK": "GB", "UNITED KINGDOM": "GB", "GREAT BRITAIN": "GB",
+    "ENGLAND": "GB", "SOUTH KOREA": "KR", "RUSSIA": "RU", "UAE": "AE",
+}
+
+
+@dataclass
+class PhoneBatch:
+    """Normalization results as parallel columns, one entry per input value"""
+    numbers: List[Optional[str]] = field(default_factory=list)
+    errors: List[Optional[str]] = field(default_factory=list)
+    regions: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def valid_indices(self) -> List[int]:
+        return [index for index, number in enumerate(self.numbers) if number is not None]
+
+    @property
+    def valid_count(self) -> int:
+        return sum(number is not None for number in self.numbers)
+
+
+def _clean(value) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer():
+            # Spreadsheets hand back bare numbers as floats
+            value = int(value)
+    return str(value if value is not None else "").strip()
+
+
+def _parse_text(text: str, region: str) -> Tuple[Optional[str], Optional[str]]:
+    if not text:
+        return None, "Missing phone number"
+    try:
+        number = phonenumbers.parse(text, region)
+    except phonenumbers.NumberParseException as error:
+        return None, f"Could not parse: {error}"
+    if not phonenumbers.is_valid_number(number):
+        return None, "Invalid number"
+    return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164), None
+
+
+class _ResultMemo:
+    """LRU of parse results per (number, region), filled from this process and the pool's"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._results: "OrderedDict[Tuple[str, str], Tuple[Optional[str], Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_many(self, pairs: Iterable[Tuple[str, str]]) -> List[Optional[Tuple[Optional[str], Optional[str]]]]:
+        """Each pair's result, or None where it isn't memoized"""
+        results = []
+        with self._lock:
+            for pair in pairs:
+                result = self._results.get(pair)
+                if result is not None:
+                    self._results.move_to_end(pair)
+                results.append(result)
+        return results
+
+    def put_many(self, items: Iterable[Tuple[Tuple[str, str], Tuple[Optional[str], Optional[str]]]]):
+        with self._lock:
+            for pair, result in items:
+                self._results[pair] = result
+                self._results.move_to_end(pair)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+_memo = _ResultMemo(CACHE_SIZE)
+
+
+def _normalize_text(text: str, region: str) -> Tuple[Optional[str], Optional[str]]:
+    [result] = _memo.get_many([(text, region)])
+    if result is None:
+        result = _parse_text(text, region)
+        _memo.put_many([((text, region), result)])
+    return result
+
+
+def normalize_phone(value, region: str = DEFAULT_REGION) -> Tuple[Optional[str], Optional[str]]:
+    """``(e164, None)`` for a valid number, ``(None, error)`` otherwise"""
+    return _normalize_text(_clean(value), region)
+
+
+@lru_cache(maxsize=1)
+def _timezone_regions() -> Dict[str, str]:
+    regions = {}
+    for country, timezones in pytz.country_timezones.items():
+        for timezone in timezones:
+            # Shared zones keep their first country, which pytz lists alphabetically
+            regions.setdefault(timezone.lower(), country.upper())
+    regions.update({alias.lower(): region for alias, region in TIMEZONE_ALIASES.items()})
+    return regions
+
+
+@lru_cache(maxsize=1)
+def _country_regions() -> Dict[str, str]:
+    regions = {}
+    for code, name in pytz.country_names.items():
+        # pytz writes some names as "Britain (UK)" or "Korea (South)"
+        regions[name.upper()] = regions[name.split(" (")[0].upper()] = code.upper()
+    regions.update(COUNTRY_ALIASES)
+    return regions
+
+
+@lru_cache(maxsize=4096)
+def infer_region(country: str = "", timezone: str = "", default: str = DEFAULT_REGION) -> str:
+    """Region to parse local-format numbers in, from a country name or code or a timezone"""
+    country = _clean(country).upper()
+    if country:
+        if country in phonenumbers.SUPPORTED_REGIONS:
+            return country
+        if country.lstrip("+").isdigit():
+            region = phonenumbers.region_code_for_country_code(int(country.lstrip("+")))
+            if region != phonenumbers.UNKNOWN_REGION:
+                return region
+        if country in _country_regions():
+            return _country_regions()[country]
+    timezone = _clean(timezone).lower()
+    if timezone in _timezone_regions():
+        return _timezone_regions()[timezone]
+    return default
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def timezone_for_number(e164: str) -> str:
+    """The number's timezone when its prefix maps to exactly one, else an empty string"""
+    try:
+        timezones = phone_timezones.time_zones_for_number(phonenumbers.parse(e164))
+    except phonenumbers.NumberParseException:
+        return ""
+    return timezones[0] if len(timezones) == 1 and timezones[0] != phone_timezones.UNKNOWN_TIMEZONE else ""
+
+
+def _normalize_pairs(pairs: Sequence[Tuple[str, str]]) -> List[Tuple[Optional[str], Optional[str]]]:
+    # Runs in the pool; the parent memoizes what comes back
+    return [_parse_text(text, region) for text, region in pairs]
+
+
+# Pools by worker count, kept for the life of the process
+_executors: Dict[int, ProcessPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    with _executor_lock:
+        if workers not in _executors:
+            # Spawned rather than forked: callers run on Streamlit and worker threads
+            _executors[workers] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executors[workers]
+
+
+def normalize_batch(
+    values: Iterable,
+    regions: Optional[Iterable[str]] = None,
+    default_region: str = DEFAULT_REGION,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+    workers: Optional[int] = None,
+) -> PhoneBatch:
+    """Normalize a batch of numbers, each in its own region or ``default_region``
+
+    Each distinct (number, region) pair is parsed once, and only if it
+    isn't memoized already; when at least ``parallel_threshold`` of them
+    need parsing the work is split across a pool of ``workers`` processes.
+    """
+    texts = [_clean(value) for value in values]
+    regions = list(regions) if regions is not None else [default_region] * len(texts)
+
+    unique: Dict[Tuple[str, str], int] = {}
+    slots = [unique.setdefault((text, region), len(unique)) for text, region in zip(texts, regions)]
+    pairs = list(unique)
+    results = _memo.get_many(pairs)
+    missing = [index for index, result in enumerate(results) if result is None]
+    workers = workers or os.cpu_count() or 1
+    if len(missing) >= parallel_threshold and workers > 1:
+        size = math.ceil(len(missing) / workers)
+        chunks = [[pairs[index] for index in missing[start:start + size]] for start in range(0, len(missing), size)]
+        parsed = [result for chunk in _process_pool(workers).map(_normalize_pairs, chunks) for result in chunk]
+    else:
+        parsed = _normalize_pairs([pairs[index] for index in missing])
+    for index, result in zip(missing, parsed):
+        results[index] = result
+    _memo.put_many((pairs[index], results[index]) for index in missing)
+
+    return PhoneBatch(
+        numbers=[results[slot][0] for slot in slots],
+        errors=[results[slot][1] for slot in slots],
+        regions=regions,
+    )
@@ -0,0 +1,121 @@
+"""Replay recorded webhook events against the receiver as a load test
+
+    python -m callcenter.replay events.jsonl --url http://localhost:8502 \\
+        --secret $VAPI_WEBHOOK_SECRET --concurrency 32 --repeat 20
+
+Each line of the input file is ``{"assistant_id": ..., "body": {...}}``.
+Bodies are re-stamped with the current time and re-signed before sending,
+so the receiver's replay window accepts them, and call ids get a
+per-repeat suffix so repeated passes create distinct calls. Prints
+throughput and latency percentiles when done.
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
+
+from .transport import LatencyHistogram, PooledTransport
+from .webhooks import sign
+
+
+def load_events(path: str) -> List[Dict[str, Any]]:
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def with_call_suffix(body: Dict[str, Any], suffix: str) -> Dict[str, Any]:
+    """Copy of ``body`` stamped now, with its call id made unique for this repeat"""
+    body = json.loads(json.dumps(body))
+    if "call_id" in body:
+        body["call_id"] = f"{body['call_id']}{suffix}"
+    if "timestamp" in body:
+        body["timestamp"] = time.time()
+    message = body.get("message", {})
+    if "timestamp" in message:
+        message["timestamp"] = int(time.time() * 1000)
+    call = message.get("call")
+    if call and "id" in call:
+        call["id"] = f"{call['id']}{suffix}"
+    return body
+
+
+def replay(
+    events: List[Dict[str, Any]],
+    url: str,
+    secret: str,
+    concurrency: int = 16,
+    repeat: int = 1,
+    rate: float = 0.0,
+) -> Dict[str, Any]:
+    """Post ``events`` ``repeat`` times; ``rate`` caps requests per second (0 = unlimited)"""
+    transport = PooledTransport(pool_maxsize=concurrency, max_retries=0)
+    histogram = LatencyHistogram()
+    status_counts: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    def post(assistant_id: str, payload: bytes):
+        start = time.perf_counter()
+        response = transport.request(
+            "POST",
+            f"{url.rstrip('/')}/webhooks/{assistant_id}",
+            endpoint="/webhooks/{assistant_id}",
+            data=payload,
+            headers={"Content-Type": "application/json", "X-Vapi-Signature": sign(payload, secret)},
+        )
+        with lock:
+            histogram.observe(time.perf_counter() - start, response.status_code >= 400)
+            status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+
+    interval = 1.0 / rate if rate > 0 else 0.0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for iteration in range(repeat):
+            suffix = f"-r{iteration}" if repeat > 1 else ""
+            for index, event in enumerate(events):
+                if interval:
+                    delay = started + (iteration * len(events) + index) * interval - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                payload = json.dumps(with_call_suffix(event["body"], suffix)).encode()
+                futures.append(pool.submit(post, event["assistant_id"], payload))
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - started
+    transport.close()
+
+    summary = histogram.summary()
+    return {
+        "requests": summary["count"],
+        "errors": summary["errors"],
+        "status_counts": status_counts,
+        "elapsed_s": elapsed,
+        "requests_per_s": summary["count"] / elapsed if elapsed else 0.0,
+        "mean_ms": summary["mean_ms"],
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+        "p99_ms": summary["p99_ms"],
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("events", help="JSONL file of recorded webhook events")
+    parser.add_argument("--url", default="http://localhost:8502", help="Webhook receiver base URL")
+    parser.add_argument("--secret", required=True, help="Webhook secret used to sign each body")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=1, help="Number of passes over the file")
+    parser.add_argument("--rate", type=float, default=0.0, help="Max requests per second (0 = unlimited)")
+    args = parser.parse_args(argv)
+
+    result = replay(load_events(args.events), args.url, args.secret, args.concurrency, args.repeat, args.rate)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    return 0 if result["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
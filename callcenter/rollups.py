@@ -0,0 +1,305 @@
+"""Minute, hour and day rollups of the calls table
+
+Triggers on ``calls`` keep ``call_rollups`` in step inside the same
+transaction as every insert, update and delete: an update subtracts the
+row's old contribution and adds its new one, so a call that is upserted
+again as it progresses is never double counted. Rollups are kept per
+assistant and per campaign; specialization is a property of the assistant
+config rather than the call, so it is grouped from the assistant rollups
+when read. Buckets are UTC epoch seconds.
+
+Keyword hits live in ``keyword_rollups``, hourly and daily per assistant
+and keyword. Hit counts are kept in call JSON rather than columns, so no
+trigger can see them; the transcript pipeline adds them with
+``add_keyword_hits`` in the same transaction as the scores.
+
+Dashboards read O(buckets) rows from here instead of scanning raw calls.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .db import DEFAULT_DB_PATH, connect
+from .models import TERMINAL_CALL_STATUSES
+
+GRANULARITIES = {"minute": 60, "hour": 3600, "day": 86400}
+# Older buckets are pruned; day buckets are kept forever
+RETENTION = {"minute": timedelta(days=2), "hour": timedelta(days=100), "day": None}
+DIMENSIONS = {"assistant": "assistant_id", "campaign": "campaign"}
+MEASURES = ["calls", "completed", "failed", "finished", "duration", "cost", "leads", "sentiment"]
+
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS call_rollups (
+    granularity TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0,
+    duration INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    leads INTEGER NOT NULL DEFAULT 0,
+    sentiment REAL NOT NULL DEFAULT 0,
+    last_call REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, dimension, bucket, key)
+) WITHOUT ROWID;
+"""
+
+# Keyword hits per assistant, written by the transcript pipeline alongside the scores
+KEYWORD_GRANULARITIES = ["hour", "day"]
+KEYWORD_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyword_rollups (
+    granularity TEXT NOT NULL,
+    assistant_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, bucket, assistant_id, category, keyword)
+) WITHOUT ROWID;
+"""
+
+
+def _measure_sql(p: str) -> Dict[str, str]:
+    terminal = ", ".join(f"'{status.value}'" for status in TERMINAL_CALL_STATUSES)
+    return {
+        "calls": "1",
+        "completed": f"{p}.status = 'completed'",
+        "failed": f"{p}.status = 'failed'",
+        "finished": f"{p}.status IN ({terminal})",
+        "duration": f"{p}.duration",
+        "cost": f"{p}.cost",
+        "leads": f"{p}.lead_score >= 7",
+        "sentiment": f"{p}.sentiment_score",
+    }
+
+
+def _apply_row_sql(p: str, sign: int, base: Optional[str] = None) -> str:
+    """Statements adding (sign=1) or removing (sign=-1) one call's contribution
+
+    With ``base``, adds the difference between row ``p`` and row ``base``
+    instead, for updates that leave the call in the same buckets.
+    """
+    measures = _measure_sql(p)
+    base_measures = _measure_sql(base) if base else {}
+    statements = []
+    for granularity, size in GRANULARITIES.items():
+        for dimension, column in DIMENSIONS.items():
+            if base:
+                values = ", ".join(f"({measures[name]}) - ({base_measures[name]})" for name in MEASURES)
+            else:
+                values = ", ".join(f"{sign} * ({measures[name]})" for name in MEASURES)
+            last_call = f"{p}.start_time" if sign > 0 else "0"
+            statements.append(
+                f"INSERT INTO call_rollups (granularity, dimension, key, bucket, {', '.join(MEASURES)}, last_call) "
+                f"SELECT '{granularity}', '{dimension}', {p}.{column}, "
+                f"CAST({p}.start_time / {size} AS INTEGER) * {size}, {values}, {last_call} "
+                f"WHERE {p}.{column} != '' "
+                "ON CONFLICT (granularity, dimension, bucket, key) DO UPDATE SET "
+                + ", ".join(f"{name} = {name} + excluded.{name}" for name in MEASURES)
+                + ", last_call = MAX(last_call, excluded.last_call);"
+            )
+    return "\n    ".join(statements)
+
+
+_SAME_BUCKETS = (
+    "old.start_time IS new.start_time AND old.assistant_id IS new.assistant_id AND old.campaign IS new.campaign"
+)
+
+ROLLUP_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS call_rollups_insert AFTER INSERT ON calls BEGIN
+    {_apply_row_sql("new", 1)}
+END""",
+    # The common case: a call progresses without moving buckets, so one delta per rollup
+    f"""CREATE TRIGGER IF NOT EXISTS call_rollups_update AFTER UPDATE ON calls
+WHEN {_SAME_BUCKETS} AND (old.status IS NOT new.status
+    OR old.duration IS NOT new.duration OR old.cost IS NOT new.cost
+    OR old.lead_score IS NOT new.lead_score OR old.sentiment_score IS NOT new.sentiment_score)
+BEGIN
+    {_apply_row_sql("new", 1, base="old")}
+END""",
+    f"""CREATE TRIGGER IF NOT EXISTS call_rollups_move AFTER UPDATE ON calls
+WHEN NOT ({_SAME_BUCKETS})
+BEGIN
+    {_apply_row_sql("old", -1)}
+    {_apply_row_sql("new", 1)}
+END""",
+    f"""CREATE TRIGGER IF NOT EXISTS call_rollups_delete AFTER DELETE ON calls BEGIN
+    {_apply_row_sql("old", -1)}
+END""",
+]
+
+
+def ensure_rollups(conn):
+    """Create the rollup tables and triggers, backfilling from existing calls the first time"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'call_rollups'"
+        ).fetchone()
+        if not exists:
+            conn.execute(ROLLUP_SCHEMA)
+            measures = _measure_sql("calls")
+            for granularity, size in GRANULARITIES.items():
+                retention = RETENTION[granularity]
+                since = time.time() - retention.total_seconds() if retention else 0
+                for dimension, column in DIMENSIONS.items():
+                    conn.execute(
+                        f"INSERT INTO call_rollups (granularity, dimension, key, bucket, {', '.join(MEASURES)}, last_call) "
+                        f"SELECT '{granularity}', '{dimension}', {column}, CAST(start_time / {size} AS INTEGER) * {size} AS b, "
+                        + ", ".join(f"SUM({measures[name]})" for name in MEASURES)
+                        + f", MAX(start_time) FROM calls WHERE {column} != '' AND start_time >= ? GROUP BY {column}, b",
+                        (since,),
+                    )
+        for trigger in ROLLUP_TRIGGERS:
+            conn.execute(trigger)
+        conn.execute(KEYWORD_ROLLUP_SCHEMA)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def add_keyword_hits(conn, hits: Iterable[Tuple[str, str, str, float, int]]):
+    """Add ``(assistant_id, category, keyword, occurred_at, hits)`` to the keyword rollups
+
+    Runs inside the caller's transaction.
+    """
+    totals: Dict[Tuple, int] = {}
+    for assistant_id, category, keyword, occurred_at, count in hits:
+        for granularity in KEYWORD_GRANULARITIES:
+            size = GRANULARITIES[granularity]
+            key = (granularity, assistant_id, category, keyword, int(occurred_at // size * size))
+            totals[key] = totals.get(key, 0) + count
+    conn.executemany(
+        "INSERT INTO keyword_rollups (granularity, assistant_id, category, keyword, bucket, hits) "
+        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (granularity, bucket, assistant_id, category, keyword) "
+        "DO UPDATE SET hits = hits + excluded.hits",
+        [(*key, count) for key, count in totals.items()],
+    )
+
+
+class RollupStore:
+    def __init__(self, path: str = DEFAULT_DB_PATH, prune_interval: float = 3600.0):
+        self.path = path
+        self.prune_interval = prune_interval
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+
+    @staticmethod
+    def granularity_for(since: datetime, now: Optional[datetime] = None) -> str:
+        """Finest granularity still retained back to ``since``"""
+        age = (now or datetime.now()) - since
+        for granularity in ("minute", "hour"):
+            if age <= RETENTION[granularity]:
+                return granularity
+        return "day"
+
+    def buckets(
+        self,
+        granularity: str,
+        dimension: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        keys: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Rollup rows for buckets starting in ``[since, until)``"""
+        sql = (
+            f"SELECT key, bucket, {', '.join(MEASURES)}, last_call FROM call_rollups "
+            "WHERE granularity = ? AND dimension = ? AND bucket >= ?"
+        )
+        size = GRANULARITIES[granularity]
+        # Include the bucket that ``since`` falls in
+        params: List = [granularity, dimension, int(since.timestamp() // size * size)]
+        if until is not None:
+            sql += " AND bucket < ?"
+            params.append(until.timestamp())
+        if keys is not None:
+            keys = list(keys)
+            sql += f" AND key IN ({', '.join('?' for _ in keys)})"
+            params.extend(keys)
+        self._maybe_prune()
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        frame = pd.DataFrame([tuple(row) for row in rows], columns=["key", "bucket"] + MEASURES + ["last_call"])
+        return frame.astype({"bucket": "int64", "last_call": "float64", **{name: "float64" for name in MEASURES}})
+
+    def totals(
+        self,
+        dimension: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        keys: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Measures summed per key over ``[since, until)``, at the finest retained granularity"""
+        frame = self.buckets(self.granularity_for(since), dimension, since, until, keys)
+        grouped = frame.groupby("key")
+        totals = grouped[MEASURES].sum()
+        totals["last_call"] = grouped["last_call"].max()
+        return totals
+
+    def keyword_totals(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        assistant_ids: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Keyword hits summed per assistant, category and keyword over ``[since, until)``, most hit first"""
+        granularity = "hour" if self.granularity_for(since) != "day" else "day"
+        size = GRANULARITIES[granularity]
+        sql = (
+            "SELECT assistant_id, category, keyword, SUM(hits) AS hits FROM keyword_rollups "
+            "WHERE granularity = ? AND bucket >= ?"
+        )
+        params: List = [granularity, int(since.timestamp() // size * size)]
+        if until is not None:
+            sql += " AND bucket < ?"
+            params.append(until.timestamp())
+        if assistant_ids is not None:
+            assistant_ids = list(assistant_ids)
+            sql += f" AND assistant_id IN ({', '.join('?' for _ in assistant_ids)})"
+            params.extend(assistant_ids)
+        self._maybe_prune()
+        with self._lock:
+            rows = self._conn.execute(
+                sql + " GROUP BY assistant_id, category, keyword ORDER BY hits DESC, keyword", params
+            ).fetchall()
+        frame = pd.DataFrame([tuple(row) for row in rows], columns=["assistant_id", "category", "keyword", "hits"])
+        return frame.astype({"hits": "int64"})
+
+    def _maybe_prune(self):
+        if time.monotonic() - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = time.monotonic()
+        self.prune()
+
+    def prune(self, now: Optional[float] = None):
+        """Drop buckets past their granularity's retention"""
+        now = now or time.time()
+        with self._lock:
+            for granularity, retention in RETENTION.items():
+                if retention is not None:
+                    for table in ("call_rollups", "keyword_rollups"):
+                        self._conn.execute(
+                            f"DELETE FROM {table} WHERE granularity = ? AND bucket < ?",
+                            (granularity, now - retention.total_seconds()),
+                        )
+
+
+def summarize(totals: pd.DataFrame) -> Dict[str, float]:
+    """Headline KPIs for a set of rollup totals"""
+    calls = float(totals["calls"].sum())
+    finished = float(totals["finished"].sum())
+    return {
+        "calls": int(calls),
+        "success_rate": float(totals["completed"].sum()) / finished * 100 if finished else 0.0,
+        "avg_cost": float(totals["cost"].sum()) / calls if calls else 0.0,
+        "avg_duration": float(totals["duration"].sum()) / calls if calls else 0.0,
+        "error_rate": float(totals["failed"].sum()) / calls * 100 if calls else 0.0,
+    }
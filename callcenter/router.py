@@ -0,0 +1,211 @@
+"""Least-loaded routing of calls across assistants
+
+The router counts in-flight calls per assistant against each assistant's
+concurrency limit and sends a new call to the eligible assistant with the
+lowest utilization. Utilization can be scaled by a preference factor so
+that, at equal load, assistants with a higher success rate or a lower cost
+per minute are picked first.
+
+Each pool of candidate assistants (all of them, or a campaign's selection)
+keeps a min-heap keyed by score. Load changes push a fresh entry and the
+outdated one is skipped when it surfaces, so routing and release are
+O(log n) per pool even with hundreds of assistants.
+
+Slots of bound calls are freed by ``finish_call``, fed from the webhook
+event log by a ``CallEndFollower``, so campaigns keep their full
+concurrency whether or not anyone has a page open.
+"""
+import heapq
+import threading
+import time
+from typing import Dict, List, Any, Callable, FrozenSet, Iterable, Optional
+
+from .models import AssistantConfig, AssistantStatus
+
+# Assistants in these states are never routed to
+UNAVAILABLE_STATUSES = {AssistantStatus.MAINTENANCE, AssistantStatus.ERROR}
+# A bound call whose end is never observed frees its slot this long after max_duration
+CALL_END_GRACE = 120
+
+
+class AssistantRouter:
+    def __init__(
+        self,
+        success_weight: float = 0.0,
+        cost_weight: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.success_weight = success_weight
+        self.cost_weight = cost_weight
+        self.clock = clock
+        self._limits: Dict[str, int] = {}
+        self._max_hold: Dict[str, float] = {}
+        self._factors: Dict[str, float] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._versions: Dict[str, int] = {}
+        self._pools: Dict[FrozenSet[str], List[tuple]] = {}
+        self._calls: Dict[str, str] = {}
+        self._expiry: List[tuple] = []
+        self._config_version: Any = None
+        self._cond = threading.Condition()
+
+    def update_assistants(self, configs: Iterable[AssistantConfig], version: Any = None):
+        """Refresh limits, eligibility and preference factors; in-flight counts carry over
+
+        With a ``version`` (e.g. the registry's), a repeat call for the version
+        already applied is a no-op.
+        """
+        with self._cond:
+            if version is not None and version == self._config_version:
+                return
+            self._config_version = version
+            configs = [config for config in configs if config.status not in UNAVAILABLE_STATUSES]
+            self._limits = {config.id: max(config.max_concurrent_calls, 0) for config in configs}
+            self._max_hold = {config.id: config.max_duration + CALL_END_GRACE for config in configs}
+            self._factors = self._preference_factors(configs)
+            for assistant_id in self._limits:
+                self._in_flight.setdefault(assistant_id, 0)
+            self._pools.clear()
+            self._cond.notify_all()
+
+    def _preference_factors(self, configs: List[AssistantConfig]) -> Dict[str, float]:
+        """Multipliers on utilization, below 1 for assistants better than the average"""
+        if not configs:
+            return {}
+        mean_success = sum(config.success_rate for config in configs) / len(configs) or 1.0
+        mean_cost = sum(config.cost_per_minute for config in configs) / len(configs) or 1.0
+        factors = {}
+        for config in configs:
+            success = max(config.success_rate, 1e-6) / mean_success
+            cost = max(config.cost_per_minute, 1e-6) / mean_cost
+            factors[config.id] = cost ** self.cost_weight / success ** self.success_weight
+        return factors
+
+    # Heap upkeep; callers hold the condition
+
+    def _entry(self, assistant_id: str) -> tuple:
+        in_flight = self._in_flight[assistant_id]
+        score = (in_flight + 1) / self._limits[assistant_id] * self._factors[assistant_id]
+        return (score, in_flight, assistant_id, self._versions.get(assistant_id, 0))
+
+    def _pool(self, assistant_ids: Optional[Iterable[str]]) -> FrozenSet[str]:
+        key = frozenset(self._limits) if assistant_ids is None else frozenset(assistant_ids) & frozenset(self._limits)
+        if key not in self._pools:
+            heap = [self._entry(assistant_id) for assistant_id in key if self._has_capacity(assistant_id)]
+            heapq.heapify(heap)
+            self._pools[key] = heap
+        return key
+
+    def _has_capacity(self, assistant_id: str) -> bool:
+        return self._in_flight[assistant_id] < self._limits.get(assistant_id, 0)
+
+    def _changed(self, assistant_id: str):
+        self._versions[assistant_id] = self._versions.get(assistant_id, 0) + 1
+        if assistant_id not in self._limits or not self._has_capacity(assistant_id):
+            return
+        entry = self._entry(assistant_id)
+        for key, heap in self._pools.items():
+            if assistant_id not in key:
+                continue
+            if len(heap) > 2 * len(key) + 16:
+                # Mostly outdated entries: rebuild from the live ones
+                heap[:] = [self._entry(other) for other in key if self._has_capacity(other)]
+                heapq.heapify(heap)
+            else:
+                heapq.heappush(heap, entry)
+
+    def _pop(self, key: FrozenSet[str]) -> Optional[str]:
+        heap = self._pools[key]
+        while heap:
+            _, _, assistant_id, version = heapq.heappop(heap)
+            if version == self._versions.get(assistant_id, 0) and self._has_capacity(assistant_id):
+                return assistant_id
+        return None
+
+    # Routing
+
+    def route(
+        self,
+        assistant_ids: Optional[Iterable[str]] = None,
+        stop_event: Optional[threading.Event] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Reserve a slot on the least-loaded assistant among ``assistant_ids`` (default: all)
+
+        Waits while every candidate is at its limit; returns None if none
+        is eligible, ``stop_event`` is set or ``timeout`` passes.
+        """
+        with self._cond:
+            key = self._pool(assistant_ids)
+            if not key:
+                return None
+            waited = False
+            while True:
+                self._expire_calls()
+                assistant_id = self._pop(key)
+                if assistant_id is not None:
+                    self._in_flight[assistant_id] += 1
+                    self._changed(assistant_id)
+                    return assistant_id
+                if (stop_event is not None and stop_event.is_set()) or (timeout is not None and waited):
+                    return None
+                # Bounded so a stop request is noticed without a notify
+                self._cond.wait(min(timeout, 1.0) if timeout is not None else 1.0)
+                waited = timeout is not None
+                key = self._pool(key)
+
+    def bind(self, call_id: str, assistant_id: str):
+        """Hold the routed slot until ``finish_call`` sees the call end, or it can no longer be running"""
+        with self._cond:
+            self._calls[call_id] = assistant_id
+            deadline = self.clock() + self._max_hold.get(assistant_id, CALL_END_GRACE)
+            heapq.heappush(self._expiry, (deadline, call_id))
+
+    def release(self, assistant_id: str):
+        """Give back a slot whose call never started"""
+        with self._cond:
+            self._release(assistant_id)
+
+    def _release(self, assistant_id: str):
+        if self._in_flight.get(assistant_id, 0) > 0:
+            self._in_flight[assistant_id] -= 1
+            self._changed(assistant_id)
+            self._cond.notify_all()
+
+    def finish_call(self, call_id: str):
+        """Release the slot of a bound call; unknown or repeated call ids are ignored"""
+        with self._cond:
+            assistant_id = self._calls.pop(call_id, None)
+            if assistant_id is not None:
+                self._release(assistant_id)
+
+    def _expire_calls(self):
+        now = self.clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, call_id = heapq.heappop(self._expiry)
+            assistant_id = self._calls.pop(call_id, None)
+            if assistant_id is not None:
+                self._release(assistant_id)
+
+    def status(self, assistant_id: str) -> AssistantStatus:
+        """Live status from the current load"""
+        with self._cond:
+            if assistant_id not in self._limits:
+                return AssistantStatus.MAINTENANCE
+            in_flight = self._in_flight[assistant_id]
+            if in_flight >= self._limits[assistant_id]:
+                return AssistantStatus.BUSY
+            return AssistantStatus.ACTIVE if in_flight else AssistantStatus.IDLE
+
+    def load(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            return [
+                {
+                    "assistant_id": assistant_id,
+                    "in_flight": self._in_flight[assistant_id],
+                    "limit": limit,
+                    "utilization": self._in_flight[assistant_id] / limit * 100 if limit else 100.0,
+                }
+                for assistant_id, limit in self._limits.items()
+            ]
+
@@ -0,0 +1,450 @@
+"""Persistent scheduler for future and recurring calls
+
+Scheduled calls live in the ``scheduled_calls`` table. A partial index on
+``due_at`` over pending rows makes it a priority queue on disk: inserting
+a call and popping the earliest due ones are both O(log n) B-tree
+operations, however many millions of calls are queued, and the queue
+survives restarts.
+
+Recurring schedules keep only their next occurrence. Every due time is
+computed in the contact's own timezone and pushed forward into its call
+window. Due calls are claimed before they are handed to the dispatcher,
+so two app processes sharing the database never both place one. Only
+once the call has been placed (or has failed for good) is the row marked
+dispatched, or a recurring one moved to its following occurrence; a
+claim that is never finished, because the process died, is released
+back to pending after ``claim_timeout``.
+"""
+import json
+import logging
+import threading
+import time
+from functools import lru_cache
+from datetime import datetime, time as dt_time, timedelta
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+import pytz
+from dateutil.relativedelta import relativedelta
+
+from .campaign_queue import CampaignQueue
+from .db import DEFAULT_DB_PATH, connect
+from .dialer import BulkDialer, DialJob, DialSettings, seconds_until_window
+from .models import CallRecord
+from .store import CallStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    due_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    phone_number TEXT NOT NULL,
+    assistant_id TEXT NOT NULL,
+    custom_prompt TEXT NOT NULL DEFAULT '',
+    timezone TEXT NOT NULL,
+    anchor TEXT NOT NULL,
+    repeat TEXT NOT NULL DEFAULT 'Once',
+    occurrence INTEGER NOT NULL DEFAULT 0,
+    window_start TEXT NOT NULL DEFAULT '00:00:00',
+    window_end TEXT NOT NULL DEFAULT '23:59:59',
+    weekend_calling INTEGER NOT NULL DEFAULT 1,
+    campaign TEXT NOT NULL DEFAULT '',
+    contact TEXT NOT NULL DEFAULT '{}',
+    dispatched_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_scheduled_calls_due ON scheduled_calls (due_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_scheduled_calls_claimed ON scheduled_calls (dispatched_at) WHERE status = 'claimed';
+"""
+
+REPEAT_INTERVALS = {
+    "Once": None,
+    "Daily": relativedelta(days=1),
+    "Weekly": relativedelta(weeks=1),
+    "Monthly": relativedelta(months=1),
+}
+# Abbreviations offered by the scheduling UI
+TIMEZONE_NAMES = {
+    "EST": "US/Eastern",
+    "CST": "US/Central",
+    "MST": "US/Mountain",
+    "PST": "US/Pacific",
+}
+ALL_DAY = (dt_time(0, 0), dt_time(23, 59, 59))
+# The scheduler has already placed calls inside their windows
+DISPATCH_SETTINGS = DialSettings(
+    max_concurrent=3, call_delay=0, max_retries=1,
+    call_window_start=ALL_DAY[0], call_window_end=ALL_DAY[1], weekend_calling=True
+)
+
+
+def resolve_timezone(name: str):
+    """A pytz timezone from a zone name or one of the UI's abbreviations"""
+    try:
+        return pytz.timezone(TIMEZONE_NAMES.get(name, name or "UTC"))
+    except pytz.UnknownTimeZoneError:
+        raise ValueError(f"Unknown timezone: {name}")
+
+
+@lru_cache(maxsize=65536)
+def _utc_offset(timezone: str, local_hour: datetime) -> timedelta:
+    # Offsets only change at DST transitions, which fall on the hour, so
+    # bulk scheduling localizes once per zone and hour
+    tz = resolve_timezone(timezone)
+    return tz.normalize(tz.localize(local_hour)).utcoffset()
+
+
+def next_call_time(
+    local: datetime,
+    timezone: str,
+    window: Tuple[dt_time, dt_time] = ALL_DAY,
+    weekend_calling: bool = True,
+) -> float:
+    """Epoch seconds of the first moment at or after local time ``local`` inside the call window"""
+    settings = DialSettings(call_window_start=window[0], call_window_end=window[1], weekend_calling=weekend_calling)
+    local += timedelta(seconds=seconds_until_window(local, settings))
+    offset = _utc_offset(timezone, local.replace(minute=0, second=0, microsecond=0))
+    return (local - offset).replace(tzinfo=pytz.utc).timestamp()
+
+
+class CallScheduler:
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        batch_size: int = 500,
+        poll_interval: float = 30.0,
+        claim_timeout: float = 15 * 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        # Other processes may add calls too, so idle waits are bounded
+        self.poll_interval = poll_interval
+        # Longer than any call takes to place, retries included
+        self.claim_timeout = claim_timeout
+        self.clock = clock
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._dispatch: Optional[Callable[[List[DialJob]], None]] = None
+        self._capacity: Optional[Callable[[], int]] = None
+        self.stats = {"scheduled": 0, "claimed": 0, "dispatched": 0, "failed": 0, "reclaimed": 0}
+
+    # Queueing
+
+    def schedule(
+        self,
+        phone_number: str,
+        assistant_id: str,
+        at: datetime,
+        timezone: str = "UTC",
+        repeat: str = "Once",
+        window: Tuple[dt_time, dt_time] = ALL_DAY,
+        weekend_calling: bool = True,
+        custom_prompt: str = "",
+        campaign: str = "",
+        contact: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Schedule one call at local time ``at`` in ``timezone``"""
+        if repeat not in REPEAT_INTERVALS:
+            return {"error": f"Unknown repeat frequency: {repeat}"}
+        try:
+            due_at = next_call_time(at, timezone, window, weekend_calling)
+        except ValueError as error:
+            return {"error": str(error)}
+        added = self.schedule_many([{
+            "phone_number": phone_number, "assistant_id": assistant_id, "at": at, "timezone": timezone,
+            "repeat": repeat, "window": window, "weekend_calling": weekend_calling,
+            "custom_prompt": custom_prompt, "campaign": campaign, "contact": contact,
+        }])
+        return {"success": True, "scheduled": added, "due_at": datetime.fromtimestamp(due_at)}
+
+    def schedule_many(self, calls: Iterable[Dict[str, Any]], chunk_size: int = 5000) -> int:
+        """Bulk-insert calls given as ``schedule`` keyword dicts, a chunk per transaction"""
+        added = 0
+        chunk = []
+        for call in calls:
+            window = call.get("window", ALL_DAY)
+            weekend_calling = call.get("weekend_calling", True)
+            timezone = call.get("timezone") or "UTC"
+            chunk.append((
+                next_call_time(call["at"], timezone, window, weekend_calling),
+                call["phone_number"], call["assistant_id"], call.get("custom_prompt", ""), timezone,
+                call["at"].isoformat(), call.get("repeat", "Once"),
+                window[0].isoformat(), window[1].isoformat(), int(weekend_calling),
+                call.get("campaign", ""), json.dumps(call.get("contact") or {}),
+            ))
+            if len(chunk) >= chunk_size:
+                added += self._insert(chunk)
+                chunk = []
+        if chunk:
+            added += self._insert(chunk)
+        return added
+
+    def _insert(self, rows: List[tuple]) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO scheduled_calls (due_at, phone_number, assistant_id, custom_prompt, timezone, anchor, "
+                    "repeat, window_start, window_end, weekend_calling, campaign, contact) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.stats["scheduled"] += len(rows)
+        with self._cond:
+            self._cond.notify_all()
+        return len(rows)
+
+    def cancel(self, schedule_id: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE scheduled_calls SET status = 'cancelled' WHERE id = ? AND status = 'pending'", (schedule_id,)
+            )
+        return cursor.rowcount > 0
+
+    # Popping due calls
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(due_at) FROM scheduled_calls WHERE status = 'pending'"
+            ).fetchone()
+        return row[0]
+
+    def pop_due(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[DialJob]:
+        """Claim calls due by ``now``; each must be handed back to ``finish`` once dialed
+
+        Claims older than ``claim_timeout`` are released first, so calls a
+        crashed process had claimed are picked up again.
+        """
+        now = self.clock() if now is None else now
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                reclaimed = self._conn.execute(
+                    "UPDATE scheduled_calls SET status = 'pending' WHERE status = 'claimed' AND dispatched_at < ?",
+                    (now - self.claim_timeout,),
+                ).rowcount
+                rows = self._conn.execute(
+                    "SELECT * FROM scheduled_calls WHERE status = 'pending' AND due_at <= ? ORDER BY due_at LIMIT ?",
+                    (now, limit or self.batch_size),
+                ).fetchall()
+                # While a row is claimed, dispatched_at holds the claim time
+                self._conn.executemany(
+                    "UPDATE scheduled_calls SET status = 'claimed', dispatched_at = ? WHERE id = ?",
+                    [(now, row["id"]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        jobs = [self._job(row) for row in rows]
+        self.stats["reclaimed"] += reclaimed
+        self.stats["claimed"] += len(jobs)
+        return jobs
+
+    def finish(self, job: DialJob, placed: bool, now: Optional[float] = None) -> bool:
+        """Settle a claimed call: mark it dispatched or failed, or move a recurring one to its next occurrence
+
+        Returns False if the call is no longer claimed, e.g. its claim timed
+        out and another process has settled it since.
+        """
+        now = self.clock() if now is None else now
+        schedule_id, occurrence = job.contact["scheduled_call_id"], job.contact["occurrence"]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM scheduled_calls WHERE id = ? AND status = 'claimed' AND occurrence = ?",
+                    (schedule_id, occurrence),
+                ).fetchone()
+                next_due = self._next_occurrence(row) if row is not None else None
+                if row is not None and next_due is None:
+                    self._conn.execute(
+                        "UPDATE scheduled_calls SET status = ?, dispatched_at = ? WHERE id = ?",
+                        ("dispatched" if placed else "failed", now, schedule_id),
+                    )
+                elif row is not None:
+                    self._conn.execute(
+                        "UPDATE scheduled_calls SET status = 'pending', due_at = ?, occurrence = occurrence + 1, "
+                        "dispatched_at = ? WHERE id = ?",
+                        (next_due, now, schedule_id),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return False
+        self.stats["dispatched" if placed else "failed"] += 1
+        # A freed slot may let the dispatch loop claim more
+        with self._cond:
+            self._cond.notify_all()
+        return True
+
+    @staticmethod
+    def _job(row) -> DialJob:
+        contact = json.loads(row["contact"])
+        contact.update({"scheduled_call_id": row["id"], "occurrence": row["occurrence"]})
+        if row["campaign"]:
+            contact["campaign"] = row["campaign"]
+        return DialJob(
+            phone_number=row["phone_number"],
+            assistant_id=row["assistant_id"],
+            custom_prompt=row["custom_prompt"],
+            contact=contact,
+        )
+
+    @staticmethod
+    def _next_occurrence(row) -> Optional[float]:
+        interval = REPEAT_INTERVALS.get(row["repeat"])
+        if interval is None:
+            return None
+        # Counted from the anchor so month ends and DST shifts don't drift
+        local = datetime.fromisoformat(row["anchor"]) + interval * (row["occurrence"] + 1)
+        window = (dt_time.fromisoformat(row["window_start"]), dt_time.fromisoformat(row["window_end"]))
+        return next_call_time(local, row["timezone"], window, bool(row["weekend_calling"]))
+
+    # Listing
+
+    def upcoming(self, limit: int = 20, assistant_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = "SELECT * FROM scheduled_calls WHERE status = 'pending'"
+        params: List[Any] = []
+        if assistant_id:
+            sql += " AND assistant_id = ?"
+            params.append(assistant_id)
+        sql += " ORDER BY due_at LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "due_at": datetime.fromtimestamp(row["due_at"]),
+                "phone_number": row["phone_number"],
+                "assistant_id": row["assistant_id"],
+                "timezone": row["timezone"],
+                "repeat": row["repeat"],
+                "occurrence": row["occurrence"],
+                "campaign": row["campaign"],
+            }
+            for row in rows
+        ]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scheduled_calls WHERE status = 'pending'").fetchone()[0]
+
+    # Background dispatch
+
+    def start(
+        self, dispatch: Callable[[List[DialJob]], None], capacity: Optional[Callable[[], int]] = None
+    ) -> "CallScheduler":
+        """Hand due calls to ``dispatch`` from a background thread
+
+        With ``capacity``, only as many calls are claimed as it reports free
+        slots for; otherwise up to ``batch_size`` at a time.
+        """
+        if self._thread is not None:
+            return self
+        self._dispatch = dispatch
+        self._capacity = capacity
+        self._thread = threading.Thread(target=self._run, name="call-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            limit = self.batch_size if self._capacity is None else min(self._capacity(), self.batch_size)
+            if limit > 0:
+                jobs = self.pop_due(limit=limit)
+                if jobs:
+                    self._dispatch(jobs)
+                    continue
+                next_due = self.next_due()
+                wait = self.poll_interval if next_due is None else min(max(next_due - self.clock(), 0), self.poll_interval)
+            else:
+                # Every slot is taken; ``finish`` wakes us when one frees up
+                wait = self.poll_interval
+            with self._cond:
+                if not self._stop_event.is_set():
+                    self._cond.wait(wait)
+
+
+class ScheduledDialer:
+    """Places due scheduled calls through one long-lived bulk dialer
+
+    The dialer has ``settings.max_concurrent`` slots, and the scheduler
+    only claims as many calls as there are free ones, so a backlog of due
+    calls waits on disk rather than in memory.
+    """
+
+    campaign = "Scheduled Calls"
+
+    def __init__(
+        self,
+        vapi_manager,
+        scheduler: CallScheduler,
+        settings: DialSettings = DISPATCH_SETTINGS,
+        queue: Optional[CampaignQueue] = None,
+        priority: str = "High",
+        call_store: Optional[CallStore] = None,
+    ):
+        self.scheduler = scheduler
+        self.settings = settings
+        if queue is not None:
+            queue.register(self.campaign, priority)
+        self.dialer = BulkDialer(
+            vapi_manager, [], settings, total=0, on_result=self._on_result, queue=queue, campaign=self.campaign,
+            call_store=call_store, keep_open=True
+        )
+        # Claimed calls not yet placed or failed for good, retries included
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> "ScheduledDialer":
+        self.dialer.start()
+        self.scheduler.start(self, capacity=self.free_slots)
+        return self
+
+    def stop(self):
+        self.scheduler.stop()
+        self.dialer.stop()
+
+    def free_slots(self) -> int:
+        with self._lock:
+            return max(self.settings.max_concurrent - self._outstanding, 0)
+
+    def __call__(self, jobs: List[DialJob]):
+        with self._lock:
+            self._outstanding += len(jobs)
+        self.dialer.feed(jobs)
+
+    def _on_result(self, job: DialJob, result: Dict[str, Any]):
+        placed = "success" in result
+        if not placed and result.get("retryable", True) and job.attempts <= self.settings.max_retries:
+            # The dialer retries it; the slot stays taken
+            return
+        with self._lock:
+            self._outstanding -= 1
+        try:
+            self.scheduler.finish(job, placed)
+        except Exception:
+            logger.exception("Settling scheduled call %s failed", job.contact.get("scheduled_call_id"))
+
+    def drain_records(self) -> List[CallRecord]:
+        """Call records placed since the previous drain"""
+        return self.dialer.drain_records()
@@ -0,0 +1,324 @@
+"""Buffered write-back of call outcomes to each assistant's Google Sheet
+
+``SheetWriter.submit`` spills rows to an on-disk outbox table first, so
+nothing queued is lost on restart; a background thread then appends them
+with one ``append_rows`` request per sheet per batch, flushing when a sheet
+has ``batch_size`` rows waiting or the oldest row has waited
+``flush_interval`` seconds. Quota (429) and server errors back off per
+sheet with jitter while other sheets keep flowing. Errors retrying won't
+fix, such as a revoked permission (403) or a deleted sheet (404), move the
+batch to the ``sheet_dead_letters`` table, from where ``requeue_dead_letters``
+puts it back once the sheet is fixed. ``submit`` waits up to its
+``timeout`` once ``max_pending`` rows are waiting, pushing back on
+producers; rows it still can't queue are dead-lettered rather than lost.
+
+Delivery is at-least-once: a crash between a successful append and marking
+the rows written can append them again on restart. Rows are unique per
+(sheet, call), so resubmitting an outcome is a no-op.
+"""
+import json
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Any, Iterable, Optional
+
+import requests
+
+from .db import DEFAULT_DB_PATH, connect
+from .models import CallRecord
+from .sheets import record_to_sheet_row
+from .transport import RETRYABLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheet_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sheet_id TEXT NOT NULL,
+    call_id TEXT NOT NULL,
+    row TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    written_at REAL,
+    UNIQUE (sheet_id, call_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sheet_outbox_pending ON sheet_outbox (sheet_id, id) WHERE written_at IS NULL;
+CREATE TABLE IF NOT EXISTS sheet_dead_letters (
+    sheet_id TEXT NOT NULL,
+    call_id TEXT NOT NULL,
+    row TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    failed_at REAL NOT NULL,
+    error TEXT NOT NULL,
+    PRIMARY KEY (sheet_id, call_id)
+);
+"""
+
+# Sheets that keep failing are parked this long before trying again
+MAX_BACKOFF = 300.0
+PRUNE_INTERVAL = 3600.0
+
+
+def is_retryable(error: Exception) -> bool:
+    """Quota, timeout and server errors are worth retrying; bad requests and permissions are not"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code in RETRYABLE_STATUS_CODES
+
+
+class SheetWriter:
+    def __init__(
+        self,
+        backend,
+        path: str = DEFAULT_DB_PATH,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_pending: int = 20000,
+        retry_backoff: float = 2.0,
+        retention: float = 7 * 24 * 3600,
+    ):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.retry_backoff = retry_backoff
+        self.retention = retention
+        self.stats = {"queued": 0, "written": 0, "batches": 0, "retries": 0, "failures": 0, "dead_lettered": 0}
+
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+        self._cond = threading.Condition()
+        # Rows spilled by a previous run are picked up on start
+        self._pending = self._conn.execute(
+            "SELECT COUNT(*) FROM sheet_outbox WHERE written_at IS NULL"
+        ).fetchone()[0]
+        self._oldest_pending_at = time.monotonic() if self._pending else None
+        # sheet_id -> (failed attempts, monotonic time of the next try)
+        self._backoff: Dict[str, tuple] = {}
+        self._last_prune = 0.0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="sheet-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the flusher after one last attempt to drain the outbox"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, sheet_id: str, records: Iterable[CallRecord], agent: str = "", timeout: float = 5.0) -> int:
+        """Queue call outcomes for ``sheet_id`` and return how many were new
+
+        Blocks up to ``timeout`` seconds while the outbox is full; if it stays
+        full the rows are dead-lettered and 0 is returned. Pass ``timeout=0``
+        from the UI thread so a stuck outbox never stalls a rerun.
+        """
+        now = time.time()
+        rows = [
+            (sheet_id, record.call_id, json.dumps(record_to_sheet_row(record, agent)), now)
+            for record in records
+        ]
+        if not rows:
+            return 0
+
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending < self.max_pending, timeout):
+                logger.warning("Sheet outbox full; dead-lettering %d rows for %s", len(rows), sheet_id)
+                self._dead_letter(rows, "Sheet outbox full")
+                return 0
+            with self._db_lock:
+                cursor = self._conn.executemany(
+                    "INSERT OR IGNORE INTO sheet_outbox (sheet_id, call_id, row, queued_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            queued = cursor.rowcount
+            if queued:
+                self._pending += queued
+                self.stats["queued"] += queued
+                if self._oldest_pending_at is None:
+                    self._oldest_pending_at = time.monotonic()
+                self._cond.notify_all()
+        return queued
+
+    def flush(self) -> int:
+        """Write one batch per ready sheet and return how many rows were written"""
+        now = time.monotonic()
+        with self._db_lock:
+            sheet_ids = [
+                row[0] for row in self._conn.execute(
+                    "SELECT DISTINCT sheet_id FROM sheet_outbox WHERE written_at IS NULL"
+                ).fetchall()
+            ]
+        written = 0
+        for sheet_id in sheet_ids:
+            attempts, retry_at = self._backoff.get(sheet_id, (0, 0.0))
+            if retry_at > now:
+                continue
+            written += self._flush_sheet(sheet_id, attempts)
+        self._prune()
+        return written
+
+    def _flush_sheet(self, sheet_id: str, attempts: int) -> int:
+        with self._db_lock:
+            batch = self._conn.execute(
+                "SELECT id, call_id, row, queued_at FROM sheet_outbox WHERE sheet_id = ? AND written_at IS NULL ORDER BY id LIMIT ?",
+                (sheet_id, self.batch_size),
+            ).fetchall()
+        if not batch:
+            return 0
+
+        try:
+            self.backend.append_rows(sheet_id, [json.loads(row["row"]) for row in batch])
+        except Exception as error:
+            if not is_retryable(error):
+                self.stats["failures"] += 1
+                logger.warning("Writing %d rows to sheet %s failed; dead-lettering them", len(batch), sheet_id, exc_info=True)
+                self._backoff.pop(sheet_id, None)
+                self._dead_letter(
+                    [(sheet_id, row["call_id"], row["row"], row["queued_at"]) for row in batch],
+                    str(error) or type(error).__name__,
+                    outbox_ids=[row["id"] for row in batch],
+                )
+                return 0
+            delay = min(MAX_BACKOFF, self.retry_backoff * 2 ** attempts)
+            self._backoff[sheet_id] = (attempts + 1, time.monotonic() + delay * random.uniform(0.5, 1.0))
+            self.stats["retries"] += 1
+            logger.warning("Writing %d rows to sheet %s failed; retrying in %.1fs", len(batch), sheet_id, delay, exc_info=True)
+            return 0
+
+        self._backoff.pop(sheet_id, None)
+        ids = [row["id"] for row in batch]
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE sheet_outbox SET written_at = ? WHERE id = ?", [(time.time(), id_) for id_ in ids]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self._release(len(ids))
+        self.stats["written"] += len(ids)
+        self.stats["batches"] += 1
+        return len(ids)
+
+    def _release(self, count: int):
+        """Take ``count`` rows off the pending total and wake blocked producers"""
+        with self._cond:
+            self._pending -= count
+            if self._pending == 0:
+                self._oldest_pending_at = None
+            self._cond.notify_all()
+
+    def _dead_letter(self, rows: List[tuple], error: str, outbox_ids: Iterable[int] = ()):
+        """Park ``(sheet_id, call_id, row, queued_at)`` rows, taking them out of the outbox if they were in it"""
+        outbox_ids = list(outbox_ids)
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sheet_dead_letters (sheet_id, call_id, row, queued_at, failed_at, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(*row, now, error) for row in rows],
+                )
+                self._conn.executemany("DELETE FROM sheet_outbox WHERE id = ?", [(id_,) for id_ in outbox_ids])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if outbox_ids:
+            self._release(len(outbox_ids))
+        self.stats["dead_lettered"] += len(rows)
+
+    def dead_letters(self, sheet_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Rows that could not be written, newest failures first"""
+        sql, params = "SELECT sheet_id, call_id, queued_at, failed_at, error FROM sheet_dead_letters", []
+        if sheet_id is not None:
+            sql += " WHERE sheet_id = ?"
+            params.append(sheet_id)
+        with self._db_lock:
+            rows = self._conn.execute(sql + " ORDER BY failed_at DESC LIMIT ?", params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def requeue_dead_letters(self, sheet_id: Optional[str] = None) -> int:
+        """Move dead-lettered rows back into the outbox, e.g. once a sheet's permissions are fixed"""
+        where, params = (" WHERE sheet_id = ?", [sheet_id]) if sheet_id is not None else ("", [])
+        with self._cond:
+            with self._db_lock:
+                self._conn.execute("BEGIN")
+                try:
+                    requeued = self._conn.execute(
+                        "INSERT OR IGNORE INTO sheet_outbox (sheet_id, call_id, row, queued_at) "
+                        f"SELECT sheet_id, call_id, row, queued_at FROM sheet_dead_letters{where}",
+                        params,
+                    ).rowcount
+                    self._conn.execute(f"DELETE FROM sheet_dead_letters{where}", params)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            if requeued:
+                self._pending += requeued
+                if self._oldest_pending_at is None:
+                    self._oldest_pending_at = time.monotonic()
+                self._cond.notify_all()
+        return requeued
+
+    def _prune(self):
+        """Forget written rows once they are past the dedupe window"""
+        if time.monotonic() - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = time.monotonic()
+        with self._db_lock:
+            self._conn.execute(
+                "DELETE FROM sheet_outbox WHERE written_at IS NOT NULL AND written_at < ?",
+                (time.time() - self.retention,),
+            )
+
+    def _next_flush_in(self) -> Optional[float]:
+        """Seconds until a flush is due, 0 if due now, None if nothing is waiting"""
+        if self._pending == 0:
+            return None
+        if self._pending >= self.batch_size or self._pending >= self.max_pending:
+            return 0.0
+        return max(0.0, self._oldest_pending_at + self.flush_interval - time.monotonic())
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    wait = self._next_flush_in()
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(wait)
+                stopping = self._stopping
+            try:
+                written = self.flush()
+            except Exception:
+                logger.exception("Sheet writer flush failed")
+                written = 0
+            if stopping:
+                return
+            if written == 0:
+                # Every waiting sheet is backing off; don't spin on the outbox
+                with self._cond:
+                    self._cond.wait(min(self.flush_interval, 1.0))
+            elif self._pending and self._oldest_pending_at is not None:
+                with self._cond:
+                    self._oldest_pending_at = time.monotonic()
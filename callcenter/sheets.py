@@ -0,0 +1,319 @@
+"""Google Sheets call logs, cached and shared by every session
+
+Each assistant logs its calls to a sheet. ``SheetCache`` keeps one copy of
+every sheet per process: within ``ttl`` reads are served from memory, after
+that the sheet's revision (Drive ``modifiedTime``) is checked and, if it
+moved, only the rows appended since the last read are fetched. Edits above
+the end of the sheet are detected by re-reading the last known row and fall
+back to a full reload, as does a periodic ``full_refresh_interval``.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+import gspread
+import pandas as pd
+
+from .models import AssistantConfig, CallRecord, CALL_STATUS_LABELS, sentiment_label
+
+logger = logging.getLogger(__name__)
+
+CALL_LOG_COLUMNS = [
+    "Call ID", "Time", "Phone", "Duration", "Status", "Lead Score",
+    "Sentiment", "Cost", "Agent", "Campaign", "Notes"
+]
+NUMERIC_COLUMNS = ["Duration", "Lead Score", "Cost"]
+SENTIMENT_RATINGS = {"Positive": 5.0, "Neutral": 3.0, "Negative": 1.0}
+# Simulated logs are regenerated at most this often
+SIMULATED_TTL = 300
+
+
+class GspreadBackend:
+    """Reads the first worksheet of each spreadsheet through gspread"""
+
+    def __init__(self, credentials_json: str):
+        self.client = gspread.service_account_from_dict(json.loads(credentials_json))
+        self._spreadsheets: Dict[str, gspread.Spreadsheet] = {}
+        self._has_header = set()
+
+    def _spreadsheet(self, sheet_id: str) -> gspread.Spreadsheet:
+        if sheet_id not in self._spreadsheets:
+            self._spreadsheets[sheet_id] = self.client.open_by_key(sheet_id)
+        return self._spreadsheets[sheet_id]
+
+    def revision(self, sheet_id: str) -> str:
+        """Drive modification time; a single small metadata request"""
+        spreadsheet = self._spreadsheet(sheet_id)
+        if hasattr(spreadsheet, "get_lastUpdateTime"):
+            return spreadsheet.get_lastUpdateTime()
+        return self.client.get_file_drive_metadata(sheet_id)["modifiedTime"]
+
+    def read_rows(self, sheet_id: str, first_row: int) -> List[List[str]]:
+        """Rows from ``first_row`` (1-based) to the end of the sheet"""
+        return list(self._spreadsheet(sheet_id).sheet1.get(f"A{first_row}:ZZ"))
+
+    def append_rows(self, sheet_id: str, rows: List[List[Any]]):
+        """Append ``rows`` after the last row of the sheet, adding the header to empty sheets"""
+        worksheet = self._spreadsheet(sheet_id).sheet1
+        if sheet_id not in self._has_header and not worksheet.row_values(1):
+            rows = [CALL_LOG_COLUMNS] + rows
+        worksheet.append_rows(rows, value_input_option="USER_ENTERED", table_range="A1")
+        self._has_header.add(sheet_id)
+
+
+def record_to_sheet_row(record: CallRecord, agent: str = "") -> List[Any]:
+    """Call log row for ``record``, in ``CALL_LOG_COLUMNS`` order"""
+    custom_data = record.custom_data or {}
+    return [
+        record.call_id,
+        record.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+        record.phone_number,
+        record.duration,
+        CALL_STATUS_LABELS[record.status],
+        round(record.lead_score, 1),
+        sentiment_label(record.sentiment_score),
+        round(record.cost, 2),
+        agent,
+        custom_data.get("campaign", ""),
+        custom_data.get("notes", ""),
+    ]
+
+
+class _SheetEntry:
+    __slots__ = ("header", "frame", "row_count", "last_row", "revision", "version", "checked_at", "loaded_at")
+
+
+def rows_to_frame(header: List[str], rows: List[List[str]]) -> pd.DataFrame:
+    """Typed DataFrame from raw sheet rows (gspread drops trailing empty cells)"""
+    width = len(header)
+    frame = pd.DataFrame([(row + [""] * width)[:width] for row in rows], columns=header)
+    if "Time" in frame:
+        frame["Time"] = pd.to_datetime(frame["Time"], errors="coerce")
+    for column in NUMERIC_COLUMNS:
+        if column in frame:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").fillna(0)
+    return frame
+
+
+class SheetCache:
+    def __init__(
+        self,
+        backend,
+        ttl: float = 30.0,
+        full_refresh_interval: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.full_refresh_interval = full_refresh_interval
+        self.clock = clock
+        self.stats = {"hits": 0, "revision_checks": 0, "incremental_reads": 0, "full_reads": 0, "errors": 0}
+
+        self._entries: Dict[str, _SheetEntry] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self._sheet_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, sheet_id: str) -> Tuple[pd.DataFrame, int]:
+        """Current call log for ``sheet_id`` and a version that changes whenever it does
+
+        Concurrent callers for the same sheet wait on one fetch. If Sheets
+        fails and a copy is cached, the stale copy is served.
+        """
+        with self._lock:
+            sheet_lock = self._sheet_locks.setdefault(sheet_id, threading.Lock())
+        with sheet_lock:
+            entry = self._entries.get(sheet_id)
+            now = self.clock()
+            if entry is not None and now - entry.checked_at < self.ttl:
+                self.stats["hits"] += 1
+                return entry.frame, entry.version
+            try:
+                if entry is None or now - entry.loaded_at >= self.full_refresh_interval:
+                    entry = self._load(sheet_id, now)
+                else:
+                    entry = self._refresh(sheet_id, entry, now)
+            except Exception:
+                self.stats["errors"] += 1
+                if entry is None:
+                    raise
+                logger.warning("Serving cached copy of sheet %s", sheet_id, exc_info=True)
+                entry.checked_at = now
+            return entry.frame, entry.version
+
+    def invalidate(self, sheet_id: str):
+        with self._lock:
+            self._entries.pop(sheet_id, None)
+
+    def _next_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def _load(self, sheet_id: str, now: float) -> _SheetEntry:
+        revision = self.backend.revision(sheet_id)
+        rows = self.backend.read_rows(sheet_id, 1)
+        self.stats["full_reads"] += 1
+
+        entry = _SheetEntry()
+        entry.header = rows[0] if rows else list(CALL_LOG_COLUMNS)
+        entry.frame = rows_to_frame(entry.header, rows[1:])
+        entry.row_count = max(len(rows) - 1, 0)
+        entry.last_row = rows[-1] if len(rows) > 1 else None
+        entry.revision = revision
+        entry.version = self._next_version()
+        entry.checked_at = entry.loaded_at = now
+        with self._lock:
+            self._entries[sheet_id] = entry
+        return entry
+
+    def _refresh(self, sheet_id: str, entry: _SheetEntry, now: float) -> _SheetEntry:
+        """Fetch rows appended since the last read, or reload if the sheet was edited"""
+        self.stats["revision_checks"] += 1
+        revision = self.backend.revision(sheet_id)
+        if revision == entry.revision:
+            entry.checked_at = now
+            return entry
+
+        # Re-read the last known row too: if it moved, rows were edited or removed
+        first_row = entry.row_count + 1 if entry.last_row is not None else 2
+        rows = self.backend.read_rows(sheet_id, first_row)
+        if entry.last_row is not None:
+            if not rows or rows[0] != entry.last_row:
+                return self._load(sheet_id, now)
+            rows = rows[1:]
+        if not rows:
+            # Revision moved without new rows: an in-place edit
+            return self._load(sheet_id, now)
+
+        self.stats["incremental_reads"] += 1
+        entry.frame = pd.concat([entry.frame, rows_to_frame(entry.header, rows)], ignore_index=True)
+        entry.row_count += len(rows)
+        entry.last_row = rows[-1]
+        entry.revision = revision
+        entry.version = self._next_version()
+        entry.checked_at = now
+        return entry
+
+
+def call_log_metrics(call_log: pd.DataFrame, assistant_config: AssistantConfig, now: datetime) -> Dict[str, Any]:
+    """Dashboard metrics computed from a call log"""
+    if call_log.empty:
+        call_log = pd.DataFrame(columns=CALL_LOG_COLUMNS)
+    times = pd.to_datetime(call_log["Time"], errors="coerce")
+    completed = call_log["Status"].eq("Completed")
+    leads = call_log["Lead Score"].ge(7)
+    total = len(call_log)
+    lead_count = int(leads.sum())
+    sentiment = call_log["Sentiment"].value_counts(normalize=True) * 100
+    ratings = call_log["Sentiment"].map(SENTIMENT_RATINGS).dropna()
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    total_cost = float(call_log["Cost"].sum())
+
+    return {
+        "calls_today": int((times >= start_of_day).sum()),
+        "calls_this_week": int((times >= now - timedelta(days=7)).sum()),
+        "calls_this_month": int((times >= now - timedelta(days=30)).sum()),
+        "success_rate": float(completed.mean() * 100) if total else 0.0,
+        "avg_duration": int(call_log.loc[completed, "Duration"].mean()) if completed.any() else 0,
+        "leads_generated": lead_count,
+        "conversion_rate": lead_count / total * 100 if total else 0.0,
+        "customer_satisfaction": float(ratings.mean()) if not ratings.empty else 0.0,
+        "total_revenue": assistant_config.total_revenue,
+        "cost_per_lead": total_cost / lead_count if lead_count else 0.0,
+        "avg_call_cost": total_cost / total if total else 0.0,
+        "peak_hours": sorted(times.dt.hour.value_counts().head(6).index.astype(int).tolist()),
+        "sentiment_positive": float(sentiment.get("Positive", 0.0)),
+        "sentiment_neutral": float(sentiment.get("Neutral", 0.0)),
+        "sentiment_negative": float(sentiment.get("Negative", 0.0)),
+    }
+
+
+def simulated_sheet_data(sheet_id: str, assistant_config: AssistantConfig) -> tuple:
+    """Realistic-looking metrics and call log for sheets that can't be read"""
+    base_calls = 50 + hash(sheet_id) % 100
+    time_factor = datetime.now().hour / 24.0
+
+    metrics_data = {
+        "calls_today": int(base_calls * (0.5 + time_factor)),
+        "calls_this_week": int(base_calls * 7 * 0.8),
+        "calls_this_month": int(base_calls * 30 * 0.6),
+        "success_rate": assistant_config.success_rate + (hash(sheet_id) % 20 - 10),
+        "avg_duration": 180 + (hash(sheet_id) % 120),
+        "leads_generated": int((base_calls * 0.3) + (hash(sheet_id) % 15)),
+        "conversion_rate": 15 + (hash(sheet_id) % 25),
+        "customer_satisfaction": 4.2 + (hash(sheet_id) % 8) / 10,
+        "total_revenue": assistant_config.total_revenue + (hash(sheet_id) % 1000),
+        "cost_per_lead": 12.50 + (hash(sheet_id) % 20),
+        "avg_call_cost": assistant_config.cost_per_minute * 3,
+        "peak_hours": [9, 10, 11, 14, 15, 16],
+        "sentiment_positive": 70 + (hash(sheet_id) % 20),
+        "sentiment_neutral": 20 + (hash(sheet_id) % 10),
+        "sentiment_negative": 10 + (hash(sheet_id) % 10)
+    }
+
+    call_log_data = []
+    for i in range(50):
+        seed = hash(f"{sheet_id}_{i}")
+        duration = 60 + (seed % 300)
+        status_options = ["Completed", "Missed", "Busy", "No Answer", "Failed"]
+        call_log_data.append({
+            "Call ID": f"call_{i+1:03d}",
+            "Time": datetime.now() - timedelta(hours=i*2, minutes=seed % 60),
+            "Phone": f"+1-555-{2000 + (seed % 9000):04d}",
+            "Duration": duration,
+            "Status": status_options[seed % len(status_options)],
+            "Lead Score": round(1 + (seed % 90) / 10, 1),
+            "Sentiment": ["Positive", "Neutral", "Negative"][seed % 3],
+            "Cost": round(duration * 0.02, 2),
+            "Agent": assistant_config.name,
+            "Campaign": f"Campaign {(seed % 5) + 1}",
+            "Notes": f"Call notes for {assistant_config.specialization}"
+        })
+
+    return metrics_data, pd.DataFrame(call_log_data)
+
+
+class GoogleSheetsManager:
+    """Sheet-backed metrics; one instance per credentials, shared across sessions"""
+
+    def __init__(self, credentials_json: str, backend=None, ttl: float = 30.0):
+        self.credentials_json = credentials_json
+        if backend is None and credentials_json.strip():
+            try:
+                backend = GspreadBackend(credentials_json)
+            except Exception:
+                logger.warning("Invalid Google credentials; using simulated sheet data", exc_info=True)
+        self.backend = backend
+        self.cache = SheetCache(backend, ttl=ttl) if backend is not None else None
+        # sheet_id -> (key, result); only the latest result per sheet is kept
+        self._results: Dict[str, Tuple[tuple, tuple]] = {}
+        self._lock = threading.Lock()
+
+    def get_sheet_data(self, sheet_id: str, assistant_config: AssistantConfig) -> tuple:
+        """Get data from Google Sheets"""
+        if self.cache is not None and sheet_id:
+            try:
+                call_log, version = self.cache.get(sheet_id)
+            except Exception:
+                logger.warning("Could not read sheet %s; using simulated data", sheet_id, exc_info=True)
+            else:
+                now = datetime.now()
+                key = ("sheet", version, assistant_config.id, now.date())
+                return self._memoized(sheet_id, key, lambda: (call_log_metrics(call_log, assistant_config, now), call_log))
+
+        key = ("simulated", assistant_config.id, int(time.time() // SIMULATED_TTL))
+        return self._memoized(sheet_id, key, lambda: simulated_sheet_data(sheet_id, assistant_config))
+
+    def _memoized(self, sheet_id: str, key: tuple, compute: Callable[[], tuple]) -> tuple:
+        with self._lock:
+            cached = self._results.get(sheet_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = compute()
+        with self._lock:
+            self._results[sheet_id] = (key, result)
+        return result
@@ -0,0 +1,210 @@
+"""Batched call-status polling shared by every session
+
+Instead of one ``GET /call/{id}`` per active call, ``CallStatusPoller``
+asks VAPI for every call updated since its last pass, keeps the latest
+status per call and hands each viewer only what changed since the cursor
+that viewer last saw.
+
+Passes run on a background thread started by ``start``, and only while
+some viewer has asked for changes recently, so a rerun never waits on
+VAPI. The cache keeps the ``max_tracked`` most recently changed calls.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Callable, Iterable, Optional, Set, Tuple
+
+from .vapi import VAPIManager
+
+logger = logging.getLogger(__name__)
+
+
+class CallStatusPoller:
+    def __init__(
+        self,
+        vapi_manager: VAPIManager,
+        page_size: int = 1000,
+        max_pages: int = 10,
+        lookback: timedelta = timedelta(hours=1),
+        max_tracked: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.vapi_manager = vapi_manager
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_tracked = max_tracked
+        self.clock = clock
+
+        self._statuses: Dict[str, Dict[str, Any]] = {}
+        # call_id -> version of its last change, ordered oldest change first
+        self._changes: "OrderedDict[str, int]" = OrderedDict()
+        self._version = 0
+        # Same format VAPI uses for updatedAt, so cursors compare as strings
+        self._updated_since = (datetime.utcnow() - lookback).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        # Calls already read at exactly ``_updated_since``; the inclusive bound returns them again
+        self._seen_at_cursor: Set[str] = set()
+        self._lock = threading.Lock()
+        self._refresh_in_flight: Optional[Future] = None
+        self._single_in_flight: Dict[str, Future] = {}
+        self._last_read: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def cursor(self) -> int:
+        """Version of the most recent change; pass it back to ``changes_since``"""
+        return self._version
+
+    def _apply(self, status: Dict[str, Any]) -> bool:
+        """Store a status if it differs from the cached one; caller holds the lock"""
+        call_id = status["call_id"]
+        previous = self._statuses.get(call_id)
+        if previous is not None and all(previous.get(key) == status.get(key) for key in ("status", "duration", "cost")):
+            return False
+        self._statuses[call_id] = status
+        self._version += 1
+        self._changes[call_id] = self._version
+        self._changes.move_to_end(call_id)
+        # Evict the calls that changed longest ago; a viewer that far behind rereads from the store
+        while len(self._changes) > self.max_tracked:
+            evicted, _ = self._changes.popitem(last=False)
+            del self._statuses[evicted]
+        return True
+
+    def start(self, interval: float = 5.0, idle_timeout: float = 60.0) -> "CallStatusPoller":
+        """Refresh every ``interval`` seconds on a background thread
+
+        Passes are skipped while no viewer has called ``changes_since`` for
+        ``idle_timeout`` seconds, so an idle dashboard costs no API calls.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, args=(interval, idle_timeout), name="call-status-poller", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self, interval: float, idle_timeout: float):
+        while not self._stop_event.is_set():
+            last_read = self._last_read
+            if last_read is not None and self.clock() - last_read < idle_timeout:
+                try:
+                    result = self.refresh()
+                    if "error" in result:
+                        logger.warning("Call status poll failed: %s", result["error"])
+                except Exception:
+                    logger.exception("Call status poll failed")
+            self._stop_event.wait(interval)
+
+    def refresh(self) -> Dict[str, Any]:
+        """Fetch every call updated since the previous pass in as few requests as possible
+
+        Concurrent callers share the pass that is already running instead of
+        starting their own.
+        """
+        with self._lock:
+            future = self._refresh_in_flight
+            owner = future is None
+            if owner:
+                future = self._refresh_in_flight = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._fetch_updates()
+            future.set_result(result)
+            return result
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._refresh_in_flight = None
+
+    def _fetch_updates(self) -> Dict[str, Any]:
+        changed = 0
+        for _ in range(self.max_pages):
+            # The inclusive bound returns the calls already read at the cursor again; ask
+            # for that many extra so every page still reaches past them
+            limit = self.page_size + len(self._seen_at_cursor)
+            page = self.vapi_manager.list_calls(self._updated_since, limit=limit)
+            if "error" in page:
+                return {"error": page["error"], "changed": changed}
+
+            calls = page["calls"]
+            fresh = 0
+            with self._lock:
+                for status in calls:
+                    call_id, updated_at = status["call_id"], status["updated_at"]
+                    if not call_id:
+                        continue
+                    if updated_at == self._updated_since and call_id in self._seen_at_cursor:
+                        continue
+                    fresh += 1
+                    if self._apply(status):
+                        changed += 1
+                    if updated_at > self._updated_since:
+                        self._updated_since = updated_at
+                        self._seen_at_cursor = {call_id}
+                    elif updated_at == self._updated_since:
+                        self._seen_at_cursor.add(call_id)
+
+            if len(calls) < limit or not fresh:
+                break
+        return {"changed": changed, "cursor": self.cursor}
+
+    def get(self, call_id: str) -> Dict[str, Any]:
+        """Fetch one call's status, coalescing concurrent lookups of the same id"""
+        with self._lock:
+            future = self._single_in_flight.get(call_id)
+            owner = future is None
+            if owner:
+                future = self._single_in_flight[call_id] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            status = self.vapi_manager.get_call_status(call_id)
+            if "error" not in status:
+                with self._lock:
+                    self._apply(status)
+            future.set_result(status)
+            return status
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._single_in_flight[call_id]
+
+    def changes_since(self, cursor: int, call_ids: Optional[Iterable[str]] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Return statuses that changed after ``cursor`` plus the new cursor
+
+        Walks the change log newest first and stops at ``cursor``, so the
+        cost is proportional to the number of changes, not tracked calls.
+        """
+        wanted = set(call_ids) if call_ids is not None else None
+        changes = []
+        with self._lock:
+            self._last_read = self.clock()
+            for call_id in reversed(self._changes):
+                if self._changes[call_id] <= cursor:
+                    break
+                if wanted is None or call_id in wanted:
+                    changes.append(self._statuses[call_id])
+            return changes[::-1], self._version
+
+    def forget(self, call_ids: Iterable[str]):
+        """Drop finished calls from the cache"""
+        with self._lock:
+            for call_id in call_ids:
+                self._statuses.pop(call_id, None)
+                self._changes.pop(call_id, None)
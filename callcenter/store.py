@@ -0,0 +1,582 @@
+"""Persistent SQLite store for call records
+
+Replaces the per-session ``call_history`` list: every session and the
+webhook receiver read and write the same indexed ``calls`` table, so
+history survives restarts and paging stays cheap as the table grows.
+"""
+import json
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from .columnar import CallBuffer
+from .db import DEFAULT_DB_PATH, connect
+from .events import fold_event
+from .models import CallRecord, CallStatus, TERMINAL_CALL_STATUSES, campaign_name
+from .rollups import add_keyword_hits, ensure_rollups
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    call_id TEXT PRIMARY KEY,
+    assistant_id TEXT NOT NULL,
+    phone_number TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL,
+    duration INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    transcript TEXT NOT NULL DEFAULT '',
+    sentiment_score REAL NOT NULL DEFAULT 0,
+    lead_score REAL NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    recording_url TEXT NOT NULL DEFAULT '',
+    campaign TEXT NOT NULL DEFAULT '',
+    custom_data TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_calls_start_time ON calls (start_time, call_id);
+CREATE INDEX IF NOT EXISTS idx_calls_assistant_start ON calls (assistant_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_calls_status_start ON calls (status, start_time);
+CREATE INDEX IF NOT EXISTS idx_calls_campaign_start ON calls (campaign, start_time);
+-- Covers the Call Logs filters and summary so they never touch the table rows
+CREATE INDEX IF NOT EXISTS idx_calls_log ON calls (start_time, assistant_id, status, duration, cost, lead_score);
+"""
+
+# A counter bumped by every write to ``calls`` and nothing else, so caches keyed
+# on it survive commits to the other tables sharing the database file
+VERSION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO calls_version (id, version) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS calls_version_insert AFTER INSERT ON calls BEGIN
+    UPDATE calls_version SET version = version + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS calls_version_update AFTER UPDATE ON calls BEGIN
+    UPDATE calls_version SET version = version + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS calls_version_delete AFTER DELETE ON calls BEGIN
+    UPDATE calls_version SET version = version + 1 WHERE id = 0;
+END;
+"""
+
+SEARCH_COLUMNS_SQL = (
+    "{p}.transcript, COALESCE(json_extract({p}.custom_data, '$.notes'), ''), {p}.campaign, "
+    "phone_search_tokens({p}.phone_number)"
+)
+
+# Full-text index over transcripts, notes, campaign names and phone numbers,
+# kept in step with the calls table by triggers
+SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS calls_fts USING fts5(
+    transcript, notes, campaign, phone, tokenize = 'unicode61', prefix = '2 3 4'
+);
+CREATE TRIGGER IF NOT EXISTS calls_fts_insert AFTER INSERT ON calls BEGIN
+    INSERT INTO calls_fts (rowid, transcript, notes, campaign, phone)
+    VALUES (new.rowid, {SEARCH_COLUMNS_SQL.format(p="new")});
+END;
+-- Only when an indexed value changed: score writes also touch custom_data (keyword hits)
+DROP TRIGGER IF EXISTS calls_fts_update;
+CREATE TRIGGER IF NOT EXISTS calls_fts_update_indexed
+AFTER UPDATE OF transcript, custom_data, campaign, phone_number ON calls
+WHEN old.transcript IS NOT new.transcript OR old.campaign IS NOT new.campaign
+    OR old.phone_number IS NOT new.phone_number
+    OR json_extract(old.custom_data, '$.notes') IS NOT json_extract(new.custom_data, '$.notes')
+BEGIN
+    DELETE FROM calls_fts WHERE rowid = old.rowid;
+    INSERT INTO calls_fts (rowid, transcript, notes, campaign, phone)
+    VALUES (new.rowid, {SEARCH_COLUMNS_SQL.format(p="new")});
+END;
+CREATE TRIGGER IF NOT EXISTS calls_fts_delete AFTER DELETE ON calls BEGIN
+    DELETE FROM calls_fts WHERE rowid = old.rowid;
+END;
+"""
+
+# A run of digits and phone punctuation, e.g. "+1 (415) 555-0123" or "0123"
+PHONE_RUN_RE = re.compile(r"\+?\(?\d[\d\-\s().]*\d")
+SEARCH_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+# Sentiment scores beyond plus or minus this count as positive or negative
+SENTIMENT_THRESHOLD = 0.2
+# Local calendar day of a call as days since 1970-01-01, using the offset in force when it started
+LOCAL_DAY_SQL = "CAST(strftime('%s', start_time, 'unixepoch', 'localtime') AS INTEGER) / 86400"
+LOCAL_EPOCH = datetime(1970, 1, 1)
+
+
+def local_day(moment: datetime) -> int:
+    """The ``LOCAL_DAY_SQL`` day number of a naive local datetime"""
+    return (moment.date() - LOCAL_EPOCH.date()).days
+
+
+def local_midnight(day: int) -> datetime:
+    """Start of a local day number, as a naive local datetime"""
+    return LOCAL_EPOCH + timedelta(days=day)
+
+
+def phone_search_tokens(phone_number: str) -> str:
+    """Digits of a phone number plus its national, 7- and 4-digit suffixes
+
+    Indexed as separate tokens so "555-0123" or "0123" finds
+    "+1 (415) 555-0123" with a plain prefix query.
+    """
+    digits = re.sub(r"\D", "", phone_number or "")
+    return " ".join(dict.fromkeys([digits, digits[-10:], digits[-7:], digits[-4:]]))
+
+
+COLUMNS = [
+    "call_id", "assistant_id", "phone_number", "start_time", "end_time", "duration", "status",
+    "transcript", "sentiment_score", "lead_score", "cost", "recording_url", "campaign", "custom_data"
+]
+
+UPSERT_SQL = (
+    f"INSERT INTO calls ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    "ON CONFLICT (call_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:])
+)
+
+# Calls as they are placed: webhooks may already have moved the stored row on
+INSERT_NEW_SQL = (
+    f"INSERT INTO calls ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+    "ON CONFLICT (call_id) DO NOTHING"
+)
+
+_TERMINAL_SQL = ", ".join(f"'{status.value}'" for status in TERMINAL_CALL_STATUSES)
+# Polled status changes touch only these fields, and a finished call never goes back to in progress
+STATUS_UPDATE_SQL = (
+    "UPDATE calls SET status = ?, duration = COALESCE(NULLIF(?, 0), duration), "
+    "cost = COALESCE(NULLIF(?, 0), cost), end_time = COALESCE(?, end_time) "
+    f"WHERE call_id = ? AND (status NOT IN ({_TERMINAL_SQL}) OR ? IN ({_TERMINAL_SQL}))"
+)
+
+
+def build_search_query(text: str) -> str:
+    """Translate a search box string into an FTS5 MATCH expression
+
+    ``"quoted text"`` is a phrase, ``word*`` (and the last word typed) is a
+    prefix, and numbers are matched on their digits against the phone
+    column as well as the text. Every term is quoted, so user input can
+    never inject FTS5 syntax.
+    """
+    # Collapse phone numbers typed with punctuation or spaces into one digit run
+    text = "".join(
+        segment if segment.startswith('"') else PHONE_RUN_RE.sub(lambda run: re.sub(r"\D", "", run.group()), segment)
+        for segment in re.split(r'("[^"]*")', text)
+    )
+
+    terms = []
+    for match in SEARCH_TOKEN_RE.finditer(text):
+        phrase, chunk = match.groups()
+        if phrase is not None:
+            words = re.findall(r"\w+", phrase)
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+            continue
+
+        is_last = match.end() == len(text.rstrip())
+        is_prefix = chunk.endswith("*") or is_last
+        for word in re.findall(r"\w+", chunk):
+            if word.isdigit():
+                terms.append(f'(phone : "{word}"* OR "{word}"' + ("*)" if is_prefix else ")"))
+            else:
+                terms.append(f'"{word}"' + ("*" if is_prefix else ""))
+    return " AND ".join(terms)
+
+
+def record_to_row(record: CallRecord) -> Tuple:
+    custom_data = record.custom_data or {}
+    return (
+        record.call_id,
+        record.assistant_id,
+        record.phone_number,
+        record.start_time.timestamp(),
+        record.end_time.timestamp() if record.end_time else None,
+        record.duration,
+        record.status.value,
+        record.transcript,
+        record.sentiment_score,
+        record.lead_score,
+        record.cost,
+        record.recording_url,
+        campaign_name(custom_data),
+        json.dumps(custom_data, default=str),
+    )
+
+
+def row_to_record(row) -> CallRecord:
+    return CallRecord(
+        call_id=row["call_id"],
+        assistant_id=row["assistant_id"],
+        phone_number=row["phone_number"],
+        start_time=datetime.fromtimestamp(row["start_time"]),
+        end_time=datetime.fromtimestamp(row["end_time"]) if row["end_time"] is not None else None,
+        duration=row["duration"],
+        status=CallStatus(row["status"]),
+        transcript=row["transcript"],
+        sentiment_score=row["sentiment_score"],
+        lead_score=row["lead_score"],
+        cost=row["cost"],
+        recording_url=row["recording_url"],
+        custom_data=json.loads(row["custom_data"])
+    )
+
+
+class CallStore:
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = connect(path)
+        # Used by the full-text index triggers, so every writer must register it
+        self._conn.create_function("phone_search_tokens", 1, phone_search_tokens, deterministic=True)
+        self._conn.executescript(SCHEMA)
+        self._conn.executescript(VERSION_SCHEMA)
+        self._lock = threading.Lock()
+        self._ensure_search_index()
+        ensure_rollups(self._conn)
+
+    def _ensure_search_index(self):
+        """Create the full-text index, backfilling it for databases that predate it"""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'calls_fts'"
+        ).fetchone()
+        self._conn.executescript(SEARCH_SCHEMA)
+        if not exists:
+            self.rebuild_search_index()
+
+    def rebuild_search_index(self):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM calls_fts")
+                self._conn.execute(
+                    "INSERT INTO calls_fts (rowid, transcript, notes, campaign, phone) "
+                    f"SELECT c.rowid, {SEARCH_COLUMNS_SQL.format(p='c')} FROM calls AS c"
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def upsert(self, records: Iterable[CallRecord]) -> int:
+        """Insert or replace whole records, committing once per ``batch_size`` rows
+
+        Every column is overwritten, so only pass records that are at least
+        as new as the stored ones; see ``insert_new`` and ``update_statuses``.
+        """
+        written = 0
+        batch: List[Tuple] = []
+        for record in records:
+            batch.append(record_to_row(record))
+            if len(batch) >= self.batch_size:
+                written += self._write(batch)
+                batch = []
+        if batch:
+            written += self._write(batch)
+        return written
+
+    def insert_new(self, records: Iterable[CallRecord]) -> int:
+        """Insert calls not stored yet, leaving existing rows untouched; returns how many were new
+
+        For calls as they are placed, whose snapshot is older than whatever
+        the webhook receiver has already folded in.
+        """
+        rows = [record_to_row(record) for record in records]
+        return self._write(rows, INSERT_NEW_SQL) if rows else 0
+
+    def update_statuses(self, records: Iterable[CallRecord]) -> int:
+        """Write polled status, duration, cost and end time; returns the calls updated
+
+        Transcripts and scores are left alone, zero durations and costs
+        never erase known ones, and a call that has finished is never moved
+        back to an in-progress status.
+        """
+        rows = [
+            (
+                record.status.value, record.duration, record.cost,
+                record.end_time.timestamp() if record.end_time else None,
+                record.call_id, record.status.value,
+            )
+            for record in records
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                cursor = self._conn.executemany(STATUS_UPDATE_SQL, rows)
+                updated = cursor.rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return updated
+
+    def _write(self, rows: List[Tuple], sql: str = UPSERT_SQL) -> int:
+        """Run ``sql`` for every row in one transaction; returns the rows it actually wrote"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                # Summed over the rows and not counting trigger writes, so skipped conflicts count 0
+                written = self._conn.executemany(sql, rows).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return written
+
+    def update_scores(
+        self,
+        scores: List[Tuple[str, Optional[str], float, float, Dict[str, int]]],
+        keyword_hits: Iterable[Tuple[str, str, str, float, int]] = (),
+    ) -> int:
+        """Write transcript scores as ``(call_id, transcript, sentiment, lead_score, keyword_hits)``
+
+        Only these fields change, so status updates folded in concurrently
+        by the webhook receiver are never overwritten. A transcript of None
+        leaves the stored one alone, so a call still in progress only has its
+        scores written and its search index row is not rebuilt.
+        ``keyword_hits`` are added to the keyword rollups in the same
+        transaction (see ``add_keyword_hits``). Returns the calls updated.
+        """
+        score_rows, transcript_rows = [], []
+        for call_id, transcript, sentiment_score, lead_score, hits in scores:
+            row = (sentiment_score, lead_score, json.dumps(hits), call_id)
+            if transcript is None:
+                score_rows.append(row)
+            else:
+                transcript_rows.append((transcript, *row))
+        set_scores = "sentiment_score = ?, lead_score = ?, custom_data = json_set(custom_data, '$.keyword_hits', json(?))"
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                updated = 0
+                if score_rows:
+                    updated += self._conn.executemany(
+                        f"UPDATE calls SET {set_scores} WHERE call_id = ?", score_rows
+                    ).rowcount
+                if transcript_rows:
+                    updated += self._conn.executemany(
+                        f"UPDATE calls SET transcript = ?, {set_scores} WHERE call_id = ?", transcript_rows
+                    ).rowcount
+                add_keyword_hits(self._conn, keyword_hits)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return updated
+
+    def get_many(self, call_ids: Iterable[str]) -> Dict[str, CallRecord]:
+        call_ids = list(call_ids)
+        records = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(call_ids), 500):
+            chunk = call_ids[start:start + 500]
+            with self._lock:
+                records.update(self._select(chunk))
+        return records
+
+    def _select(self, call_ids: List[str]) -> Dict[str, CallRecord]:
+        rows = self._conn.execute(
+            f"SELECT * FROM calls WHERE call_id IN ({', '.join('?' for _ in call_ids)})", call_ids
+        ).fetchall()
+        return {row["call_id"]: row_to_record(row) for row in rows}
+
+    def get(self, call_id: str) -> Optional[CallRecord]:
+        return self.get_many([call_id]).get(call_id)
+
+    def apply_events(self, events: List[Dict[str, Any]]) -> int:
+        """Fold a batch of webhook events into the stored calls with one read and one write
+
+        The read and write share a transaction, so scores the transcript
+        pipeline writes in between can't be overwritten with stale values.
+        """
+        call_ids = list({event["call_id"] for event in events})
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                records = {}
+                for start in range(0, len(call_ids), 500):
+                    records.update(self._select(call_ids[start:start + 500]))
+                for event in events:
+                    records[event["call_id"]] = fold_event(records.get(event["call_id"]), event)
+                self._conn.executemany(UPSERT_SQL, [record_to_row(record) for record in records.values()])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(records)
+
+    @staticmethod
+    def _where(
+        assistant_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        campaign: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_duration: int = 0,
+        search: str = "",
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if assistant_ids is not None:
+            clauses.append(f"assistant_id IN ({', '.join('?' for _ in assistant_ids)})")
+            params.extend(assistant_ids)
+        if statuses is not None:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if campaign is not None:
+            clauses.append("campaign = ?")
+            params.append(campaign)
+        if start is not None:
+            clauses.append("start_time >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            clauses.append("start_time < ?")
+            params.append(end.timestamp())
+        if min_duration:
+            clauses.append("duration >= ?")
+            params.append(min_duration)
+        match = build_search_query(search) if search else ""
+        if match:
+            clauses.append("rowid IN (SELECT rowid FROM calls_fts WHERE calls_fts MATCH ?)")
+            params.append(match)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def page(
+        self,
+        limit: int = 50,
+        before: Optional[Tuple[float, str]] = None,
+        columnar: bool = False,
+        **filters,
+    ) -> Union[List[CallRecord], CallBuffer]:
+        """Newest calls first, ``limit`` at a time
+
+        Pass the ``(start_time, call_id)`` of the last record you got as
+        ``before`` to fetch the next page; unlike OFFSET this stays an index
+        seek however deep you page. With ``columnar`` the page comes back as
+        a ``CallBuffer`` instead of a list of records.
+        """
+        rows = self._page_rows(limit, before, filters)
+        return CallBuffer.from_rows(rows) if columnar else [row_to_record(row) for row in rows]
+
+    def _page_rows(self, limit: int, before: Optional[Tuple[float, str]], filters: Dict[str, Any]) -> List[Any]:
+        where, params = self._where(**filters)
+        if before is not None:
+            where += (" AND " if where else " WHERE ") + "(start_time, call_id) < (?, ?)"
+            params.extend(before)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT * FROM calls{where} ORDER BY start_time DESC, call_id DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+
+    def iter_pages(
+        self, chunk_size: int = 10000, columnar: bool = False, **filters
+    ) -> Iterator[Union[List[CallRecord], CallBuffer]]:
+        """Every matching call, newest first, ``chunk_size`` at a time
+
+        Keyset paging as in ``page``, with the cursor taken from the raw
+        rows so no call is skipped or repeated between chunks.
+        """
+        where, params = self._where(**filters)
+        keyset = (" AND " if where else " WHERE ") + "(start_time, call_id) < (?, ?)"
+        before = None
+        while True:
+            sql, sql_params = f"SELECT * FROM calls{where}", list(params)
+            if before is not None:
+                sql += keyset
+                sql_params.extend(before)
+            with self._lock:
+                rows = self._conn.execute(
+                    sql + " ORDER BY start_time DESC, call_id DESC LIMIT ?", sql_params + [chunk_size]
+                ).fetchall()
+            if not rows:
+                return
+            yield CallBuffer.from_rows(rows) if columnar else [row_to_record(row) for row in rows]
+            if len(rows) < chunk_size:
+                return
+            before = (rows[-1]["start_time"], rows[-1]["call_id"])
+
+    def query_page(
+        self,
+        page_size: int = 50,
+        before: Optional[Tuple[float, str]] = None,
+        columnar: bool = False,
+        **filters,
+    ) -> Tuple[Union[List[CallRecord], CallBuffer], Optional[Tuple[float, str]]]:
+        """One page of matching calls, newest first, and the cursor of the page after it
+
+        Pass the cursor back as ``before`` for the next page; it is None on
+        the last one. Cursors come from the raw rows, so ties on
+        ``start_time`` are broken by ``call_id`` and no call is skipped or
+        shown twice however the pages are stepped through.
+        """
+        rows = self._page_rows(page_size + 1, before, filters)
+        cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            cursor = (rows[-1]["start_time"], rows[-1]["call_id"])
+        return (CallBuffer.from_rows(rows) if columnar else [row_to_record(row) for row in rows]), cursor
+
+    def summary(self, **filters) -> Dict[str, Any]:
+        """Count and headline metrics for the matching calls in one aggregate query"""
+        where, params = self._where(**filters)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS total, AVG(duration) AS avg_duration, "
+                "SUM(status = 'completed') AS completed, SUM(cost) AS total_cost, "
+                f"AVG(lead_score) AS avg_lead_score FROM calls{where}",
+                params,
+            ).fetchone()
+        total = row["total"]
+        return {
+            "total": total,
+            "avg_duration": row["avg_duration"] or 0.0,
+            "success_rate": (row["completed"] or 0) / total * 100 if total else 0.0,
+            "total_cost": row["total_cost"] or 0.0,
+            "avg_lead_score": row["avg_lead_score"] or 0.0,
+        }
+
+    def daily_counts(self, since: datetime, until: datetime, assistant_id: Optional[str] = None) -> Dict[int, int]:
+        """Calls per local day (see ``local_day``) in ``[since, until)``"""
+        sql = (
+            f"SELECT {LOCAL_DAY_SQL} AS day, COUNT(*) AS calls "
+            "FROM calls WHERE start_time >= ? AND start_time < ?"
+        )
+        params = [since.timestamp(), until.timestamp()]
+        if assistant_id is not None:
+            sql += " AND assistant_id = ?"
+            params.append(assistant_id)
+        with self._lock:
+            rows = self._conn.execute(sql + " GROUP BY day", params).fetchall()
+        return {row["day"]: row["calls"] for row in rows}
+
+    def daily_sentiment(
+        self, since: datetime, until: datetime, threshold: float = SENTIMENT_THRESHOLD
+    ) -> Dict[int, Tuple[int, int, int]]:
+        """Positive, neutral and negative scored calls per local day in ``[since, until)``
+
+        Calls without a transcript were never scored, so they are left out
+        rather than counted as neutral.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {LOCAL_DAY_SQL} AS day, "
+                "SUM(sentiment_score > ?) AS positive, SUM(sentiment_score < ?) AS negative, COUNT(*) AS calls "
+                "FROM calls WHERE start_time >= ? AND start_time < ? AND transcript != '' GROUP BY day",
+                (threshold, -threshold, since.timestamp(), until.timestamp()),
+            ).fetchall()
+        return {
+            row["day"]: (row["positive"], row["calls"] - row["positive"] - row["negative"], row["negative"])
+            for row in rows
+        }
+
+    def data_version(self) -> int:
+        """Changes whenever any connection commits a write to the calls table"""
+        with self._lock:
+            return self._conn.execute("SELECT version FROM calls_version WHERE id = 0").fetchone()[0]
+
+    def recent(self, limit: int = 10, assistant_id: Optional[str] = None) -> List[CallRecord]:
+        return self.page(limit=limit, assistant_ids=[assistant_id] if assistant_id else None)
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM calls{where}", params).fetchone()[0]
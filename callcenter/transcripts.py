@@ -0,0 +1,378 @@
+"""Streaming transcript scoring: sentiment, keyword hits and lead score
+
+The webhook receiver hands ``transcript`` events (one final utterance each)
+to a ``TranscriptPipeline``. Utterances are routed to a worker by call id,
+so each call's state lives on exactly one worker thread and its utterances
+are applied in order. Every utterance updates the call's running totals in
+O(utterance length); nothing is re-scored when the next one arrives. Each
+worker writes the scores of the calls it touched back to the ``CallStore``
+once per batch, and a call's transcript once, when it ends or is evicted.
+
+Scoring is a fixed lexicon with negation and intensifier handling, so the
+same transcript always gets the same scores, offline. Only the customer's
+utterances are scored; the assistant's are kept for the transcript text.
+Keywords are matched with the call's assistant's automaton (see
+``callcenter.keywords``); hits are added to the keyword rollups in the same
+transaction as the scores, and matches in event categories are handed on
+as ``objection_raised`` / ``positive_sentiment`` events.
+"""
+import logging
+import math
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+from .keywords import DEFAULT_AUTOMATON, KEYWORD_EVENTS, KeywordAutomaton, KeywordTracker, tokenize
+from .store import CallStore
+
+logger = logging.getLogger(__name__)
+
+# Word valences from -1 (very negative) to 1 (very positive)
+SENTIMENT_LEXICON = {
+    "absolutely": 0.5, "amazing": 0.9, "appreciate": 0.6, "awesome": 0.8, "definitely": 0.4,
+    "excellent": 0.9, "fantastic": 0.9, "glad": 0.6, "good": 0.5, "great": 0.8, "happy": 0.7,
+    "helpful": 0.6, "interested": 0.5, "like": 0.3, "love": 0.8, "nice": 0.4, "perfect": 0.8,
+    "sure": 0.3, "thank": 0.4, "thanks": 0.4, "wonderful": 0.8, "yes": 0.2,
+    "angry": -0.8, "annoyed": -0.7, "annoying": -0.7, "awful": -0.9, "bad": -0.6, "busy": -0.2,
+    "confusing": -0.5, "disappointed": -0.7, "expensive": -0.5, "frustrated": -0.7,
+    "frustrating": -0.7, "hate": -0.8, "issue": -0.3, "no": -0.2, "poor": -0.6, "problem": -0.4,
+    "rude": -0.8, "scam": -1.0, "spam": -0.8, "stop": -0.4, "terrible": -0.9, "unhappy": -0.7,
+    "useless": -0.8, "waste": -0.7, "worried": -0.4, "worst": -1.0,
+}
+NEGATIONS = {
+    "not", "no", "never", "don't", "dont", "isn't", "wasn't", "can't", "cannot", "won't",
+    "didn't", "doesn't", "hardly",
+}
+INTENSIFIERS = {
+    "very": 1.5, "really": 1.4, "so": 1.3, "extremely": 1.8, "super": 1.5, "totally": 1.4,
+    "quite": 1.2, "slightly": 0.6, "somewhat": 0.7,
+}
+# A negation flips sentiment words up to this many tokens after it
+NEGATION_SCOPE = 3
+# Squashes a summed valence into (-1, 1); smaller values saturate sooner
+NORMALIZATION_ALPHA = 2.0
+
+# Keyword categories that move the lead score
+SIGNAL_WEIGHTS = {"buying_intent": 1.5, "objection": -1.0}
+# Repeating a signal stops raising the score after this many hits
+MAX_SIGNAL_HITS = 4
+
+CUSTOMER_ROLES = {"user", "customer"}
+# "AI: ..." / "User: ..." lines of an end-of-call report transcript
+TRANSCRIPT_LINE_RE = re.compile(r"^\s*(AI|Assistant|Bot|User|Customer)\s*:\s*(.*)$", re.IGNORECASE)
+
+
+def utterance_sentiment(tokens: List[str]) -> float:
+    """Lexicon sentiment of one utterance, from -1 to 1"""
+    total = 0.0
+    negated_until = -1
+    boost = 1.0
+    for index, token in enumerate(tokens):
+        valence = SENTIMENT_LEXICON.get(token)
+        if valence is not None:
+            if index <= negated_until:
+                # "not good" is mildly negative rather than the mirror of "good"
+                valence = -valence * 0.75
+            total += valence * boost
+        if token in NEGATIONS:
+            negated_until = index + NEGATION_SCOPE
+        boost = INTENSIFIERS.get(token, 1.0)
+    return total / math.sqrt(total * total + NORMALIZATION_ALPHA)
+
+
+@dataclass
+class TranscriptState:
+    """Running scores of one call, updated one utterance at a time"""
+    call_id: str
+    assistant_id: str = ""
+    automaton: KeywordAutomaton = DEFAULT_AUTOMATON
+    lines: List[str] = field(default_factory=list)
+    customer_utterances: int = 0
+    sentiment_total: float = 0.0
+    signals: Dict[str, int] = field(default_factory=dict)
+    keyword_hits: Dict[str, int] = field(default_factory=dict)
+    final_transcript: Optional[str] = None
+    updated_at: float = 0.0
+
+    def add(self, role: str, text: str) -> List[Tuple[str, str]]:
+        """Apply one utterance; returns its keyword matches as ``(category, phrase)``"""
+        role = role.lower()
+        self.lines.append(f"{'User' if role in CUSTOMER_ROLES else 'AI'}: {text}")
+        self.updated_at = time.monotonic()
+        if role not in CUSTOMER_ROLES:
+            return []
+        tokens = tokenize(text)
+        self.customer_utterances += 1
+        self.sentiment_total += utterance_sentiment(tokens)
+        matches = self.automaton.matches(tokens)
+        for category, phrase in matches:
+            self.signals[category] = self.signals.get(category, 0) + 1
+            self.keyword_hits[phrase] = self.keyword_hits.get(phrase, 0) + 1
+        return matches
+
+    @property
+    def sentiment_score(self) -> float:
+        """Mean customer sentiment so far"""
+        return self.sentiment_total / self.customer_utterances if self.customer_utterances else 0.0
+
+    @property
+    def lead_score(self) -> float:
+        """0-10, starting from 5 and moved by signals and sentiment"""
+        score = 5.0 + 2.5 * self.sentiment_score
+        for category, hits in self.signals.items():
+            score += SIGNAL_WEIGHTS.get(category, 0.0) * min(hits, MAX_SIGNAL_HITS)
+        return round(min(max(score, 0.0), 10.0), 1)
+
+    @property
+    def transcript(self) -> str:
+        return self.final_transcript if self.final_transcript is not None else "\n".join(self.lines)
+
+
+def split_transcript(transcript: str) -> List[Tuple[str, str]]:
+    """``(role, text)`` utterances of a whole "AI: ... / User: ..." transcript"""
+    utterances = []
+    for line in transcript.splitlines():
+        match = TRANSCRIPT_LINE_RE.match(line)
+        if match:
+            role = "user" if match.group(1).lower() in ("user", "customer") else "assistant"
+            utterances.append((role, match.group(2)))
+        elif line.strip() and utterances:
+            # Wrapped continuation of the previous utterance
+            role, text = utterances[-1]
+            utterances[-1] = (role, f"{text} {line.strip()}")
+    return utterances
+
+
+def score_transcript(call_id: str, transcript: str, automaton: KeywordAutomaton = DEFAULT_AUTOMATON) -> TranscriptState:
+    """Score a whole transcript with the same per-utterance steps as the stream"""
+    state = TranscriptState(call_id, automaton=automaton)
+    for role, text in split_transcript(transcript):
+        state.add(role, text)
+    state.final_transcript = transcript
+    return state
+
+
+def keyword_events(event: Dict[str, Any], text: str, matches: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Webhook-style events for one utterance's matches, one per event type"""
+    by_event: Dict[str, List[str]] = {}
+    for category, phrase in matches:
+        if category in KEYWORD_EVENTS:
+            by_event.setdefault(KEYWORD_EVENTS[category], []).append(phrase)
+    return [
+        {
+            "event_type": event_type,
+            "call_id": event["call_id"],
+            "assistant_id": event.get("assistant_id", ""),
+            "occurred_at": event.get("occurred_at") or time.time(),
+            "data": {"keywords": phrases, "utterance": text, "source": "keyword_tracker"},
+        }
+        for event_type, phrases in by_event.items()
+    ]
+
+
+class _Worker:
+    def __init__(self):
+        self.queue: deque = deque()
+        self.cond = threading.Condition()
+        self.states: Dict[str, TranscriptState] = {}
+        self.thread: Optional[threading.Thread] = None
+
+
+class TranscriptPipeline:
+    def __init__(
+        self,
+        call_store: CallStore,
+        workers: int = 2,
+        batch_size: int = 200,
+        flush_interval: float = 0.05,
+        idle_timeout: float = 2 * 3600,
+        keywords: Optional[KeywordTracker] = None,
+        on_events: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+    ):
+        self.call_store = call_store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Calls that never report an end are forgotten after this long
+        self.idle_timeout = idle_timeout
+        self.keywords = keywords or KeywordTracker()
+        # Receives each batch's keyword events once its scores are written
+        self.on_events = on_events
+        self.stats = {
+            "utterances": 0, "calls_finished": 0, "batches": 0, "writes": 0, "write_errors": 0,
+            "keyword_hits": 0, "keyword_events": 0,
+        }
+        self._workers = [_Worker() for _ in range(workers)]
+        self._stopping = False
+        self._stats_lock = threading.Lock()
+
+    def _worker_for(self, call_id: str) -> _Worker:
+        # crc32 rather than hash() so routing is the same in every process
+        return self._workers[zlib.crc32(call_id.encode()) % len(self._workers)]
+
+    def submit(self, events: Iterable[Dict[str, Any]]) -> int:
+        """Queue transcript and call-end events; returns how many were taken"""
+        taken = 0
+        for event in events:
+            if event["event_type"] not in ("transcript", "call_ended", "call_failed"):
+                continue
+            worker = self._worker_for(event["call_id"])
+            with worker.cond:
+                worker.queue.append(event)
+                worker.cond.notify()
+            taken += 1
+        return taken
+
+    @property
+    def pending(self) -> int:
+        return sum(len(worker.queue) for worker in self._workers)
+
+    def start(self) -> "TranscriptPipeline":
+        self._stopping = False
+        for index, worker in enumerate(self._workers):
+            if worker.thread is None:
+                worker.thread = threading.Thread(
+                    target=self._run, args=(worker,), name=f"transcript-worker-{index}", daemon=True
+                )
+                worker.thread.start()
+        return self
+
+    def stop(self, timeout: float = 10.0):
+        """Stop after scoring and writing everything already queued"""
+        self._stopping = True
+        for worker in self._workers:
+            with worker.cond:
+                worker.cond.notify_all()
+        for worker in self._workers:
+            if worker.thread is not None:
+                worker.thread.join(timeout)
+                worker.thread = None
+
+    def _new_state(self, event: Dict[str, Any]) -> TranscriptState:
+        """A call keeps the keyword list its assistant had when its first utterance arrived"""
+        assistant_id = event.get("assistant_id", "")
+        return TranscriptState(event["call_id"], assistant_id, self.keywords.automaton_for(assistant_id))
+
+    def _process(self, worker_events: List[Dict[str, Any]], states: Dict[str, TranscriptState]) -> int:
+        """Apply one batch to ``states`` and write the touched calls; returns calls written"""
+        touched: Dict[str, TranscriptState] = {}
+        finished = []
+        derived: List[Dict[str, Any]] = []
+        # (assistant_id, category, keyword, occurred_at, hits) for the keyword rollups
+        hits: List[Tuple[str, str, str, float, int]] = []
+
+        def track(state: TranscriptState, event: Dict[str, Any], role: str, text: str):
+            matches = state.add(role, text)
+            if matches:
+                occurred_at = event.get("occurred_at") or time.time()
+                hits.extend((state.assistant_id, category, phrase, occurred_at, 1) for category, phrase in matches)
+                derived.extend(keyword_events(event, text, matches))
+
+        for event in worker_events:
+            call_id, data = event["call_id"], event["data"]
+            state = states.get(call_id)
+            if event["event_type"] == "transcript":
+                if state is None:
+                    state = states[call_id] = self._new_state(event)
+                track(state, event, data.get("role", "user"), data.get("text", ""))
+                self._count("utterances")
+            elif state is not None:
+                # The end-of-call report's transcript is authoritative; the scores stay incremental
+                state.final_transcript = data.get("transcript", state.final_transcript)
+                finished.append(call_id)
+            elif data.get("transcript"):
+                # Nothing was streamed for this call, so score the report
+                state = states[call_id] = self._new_state(event)
+                for role, text in split_transcript(data["transcript"]):
+                    track(state, event, role, text)
+                state.final_transcript = data["transcript"]
+                finished.append(call_id)
+            else:
+                continue
+            touched[call_id] = state
+
+        written = self._write(list(touched.values()), hits, finished)
+        for call_id in finished:
+            states.pop(call_id, None)
+        self._count("calls_finished", len(finished))
+        if derived and self.on_events is not None:
+            try:
+                self.on_events(derived)
+                self._count("keyword_events", len(derived))
+            except Exception:
+                logger.exception("Recording %d keyword events failed", len(derived))
+        return written
+
+    def _write(
+        self,
+        states: List[TranscriptState],
+        hits: List[Tuple[str, str, str, float, int]],
+        finished: Iterable[str] = (),
+    ) -> int:
+        """Write scores, and the transcripts of the ``finished`` calls"""
+        if not states:
+            return 0
+        finished = set(finished)
+        try:
+            written = self.call_store.update_scores(
+                [
+                    (
+                        state.call_id, state.transcript if state.call_id in finished else None,
+                        state.sentiment_score, state.lead_score, state.keyword_hits,
+                    )
+                    for state in states
+                ],
+                keyword_hits=hits,
+            )
+        except Exception:
+            logger.exception("Writing scores for %d calls failed", len(states))
+            self._count("write_errors", len(states))
+            return 0
+        self._count("batches")
+        self._count("writes", written)
+        self._count("keyword_hits", len(hits))
+        return written
+
+    def _count(self, name: str, amount: int = 1):
+        # Workers share the stats
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def _evict_idle(self, states: Dict[str, TranscriptState]):
+        """Forget calls that never reported an end, writing the transcript streamed so far"""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [state for state in states.values() if state.updated_at < cutoff]
+        self._write(idle, [], [state.call_id for state in idle])
+        for state in idle:
+            del states[state.call_id]
+
+    def _next_batch(self, worker: _Worker) -> Tuple[List[Dict[str, Any]], bool]:
+        """Up to ``batch_size`` events, waiting ``flush_interval`` for a batch to fill"""
+        with worker.cond:
+            if not worker.queue and not self._stopping:
+                # Wake up now and then so idle calls get evicted
+                worker.cond.wait(60.0)
+            deadline = time.monotonic() + self.flush_interval
+            while len(worker.queue) < self.batch_size and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                worker.cond.wait(remaining)
+            batch = [worker.queue.popleft() for _ in range(min(self.batch_size, len(worker.queue)))]
+            return batch, self._stopping and not worker.queue
+
+    def _run(self, worker: _Worker):
+        while True:
+            batch, done = self._next_batch(worker)
+            if batch:
+                try:
+                    self._process(batch, worker.states)
+                except Exception:
+                    logger.exception("Scoring a batch of %d transcript events failed", len(batch))
+            else:
+                self._evict_idle(worker.states)
+            if done:
+                return
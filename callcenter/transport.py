@@ -0,0 +1,189 @@
+"""Process-wide pooled HTTP transport for the VAPI API
+
+Streamlit re-executes app.py on every interaction but keeps imported
+modules, so the transport returned by ``get_shared_transport()`` (and its
+open keep-alive connections) is reused across reruns and sessions.
+"""
+import bisect
+import random
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")]
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every request"""
+
+    def __init__(self, buckets_ms: List[float] = None):
+        self.buckets_ms = buckets_ms or LATENCY_BUCKETS_MS
+        self.counts = [0] * len(self.buckets_ms)
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False):
+        latency_ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if error:
+            self.errors += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bucket bound below which ``pct`` percent of requests fall"""
+        if not self.count:
+            return 0.0
+        threshold = self.count * pct / 100
+        running = 0
+        for bound, bucket_count in zip(self.buckets_ms, self.counts):
+            running += bucket_count
+            if running >= threshold:
+                return bound
+        return self.buckets_ms[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip(self.buckets_ms, self.counts)),
+        }
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent traffic so an outage can't trigger a retry storm
+
+    Every request deposits ``ratio`` tokens and every retry spends one;
+    ``min_tokens`` lets a quiet process still retry occasional blips.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class PooledTransport:
+    """A shared ``requests.Session`` with connection pooling, timeouts, retries and latency metrics"""
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 2,
+        backoff_factor: float = 0.25,
+        retry_budget: Optional[RetryBudget] = None,
+    ):
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_budget = retry_budget or RetryBudget()
+
+        self.session = requests.Session()
+        # pool_block keeps the process at pool_maxsize sockets per host instead of opening extras
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, endpoint: str, seconds: float, error: bool):
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = LatencyHistogram()
+            histogram.observe(seconds, error)
+
+    def _should_retry(self, method: str, response: Optional[requests.Response], exc: Optional[Exception]) -> bool:
+        if exc is not None:
+            # A failed connect never reached the server, so even a POST is safe to resend
+            return method in IDEMPOTENT_METHODS or isinstance(exc, requests.ConnectTimeout)
+        if response.status_code == 429:
+            return True
+        return method in IDEMPOTENT_METHODS and response.status_code in RETRYABLE_STATUS_CODES
+
+    def request(self, method: str, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+        """Send a request over the pooled session, retrying transient failures within the budget"""
+        method = method.upper()
+        endpoint = f"{method} {endpoint or url}"
+        kwargs.setdefault("timeout", self.timeout)
+        self.retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            response, exc = None, None
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                exc = error
+            failed = exc is not None or response.status_code >= 500
+            self._observe(endpoint, time.perf_counter() - start, failed)
+
+            if (
+                attempt < self.max_retries
+                and self._should_retry(method, response, exc)
+                and self.retry_budget.try_spend()
+            ):
+                # Full jitter backoff
+                time.sleep(random.uniform(0, self.backoff_factor * (2 ** attempt)))
+                attempt += 1
+                continue
+
+            if exc is not None:
+                raise exc
+            return response
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint latency summaries, keyed like ``"POST /call"``"""
+        with self._lock:
+            return {endpoint: histogram.summary() for endpoint, histogram in self._histograms.items()}
+
+    def close(self):
+        self.session.close()
+
+
+_shared_transport: Optional[PooledTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> PooledTransport:
+    """Return the process-wide transport, creating it on first use"""
+    global _shared_transport
+    if _shared_transport is None:
+        with _shared_transport_lock:
+            if _shared_transport is None:
+                _shared_transport = PooledTransport()
+    return _shared_transport
@@ -0,0 +1,201 @@
+"""VAPI REST API client"""
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from urllib.parse import quote
+
+import requests
+
+from .models import AssistantConfig, CallRecord, CallStatus
+from .phones import normalize_phone
+from .transport import PooledTransport, RETRYABLE_STATUS_CODES, get_shared_transport
+
+VAPI_BASE_URL = "https://api.vapi.ai/v1"
+DEFAULT_CALL_COST = 0.15
+
+# VAPI call lifecycle states mapped onto the dashboard's CallStatus
+VAPI_CALL_STATUSES = {
+    "queued": CallStatus.INITIATED,
+    "ringing": CallStatus.RINGING,
+    "in-progress": CallStatus.CONNECTED,
+    "forwarding": CallStatus.CONNECTED,
+    "ended": CallStatus.COMPLETED,
+}
+
+# endedReason values that mean the call never really happened
+VAPI_FAILED_REASONS = {
+    "customer-busy": CallStatus.BUSY,
+    "customer-did-not-answer": CallStatus.NO_ANSWER,
+    "pipeline-error": CallStatus.FAILED,
+    "twilio-failed-to-connect-call": CallStatus.FAILED,
+}
+
+
+def parse_call_status(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a VAPI call object into the dashboard's status dict"""
+    status = VAPI_CALL_STATUSES.get(body.get("status"), CallStatus.INITIATED)
+    if status == CallStatus.COMPLETED:
+        status = VAPI_FAILED_REASONS.get(body.get("endedReason"), status)
+
+    duration = body.get("duration")
+    if duration is None and body.get("startedAt") and body.get("endedAt"):
+        started = datetime.fromisoformat(body["startedAt"].replace("Z", "+00:00"))
+        ended = datetime.fromisoformat(body["endedAt"].replace("Z", "+00:00"))
+        duration = int((ended - started).total_seconds())
+
+    return {
+        "call_id": body.get("id"),
+        "status": status.value,
+        "duration": duration or 0,
+        "cost": body.get("cost", 0.0),
+        "updated_at": body.get("updatedAt", ""),
+        "ended": body.get("status") == "ended"
+    }
+
+
+class VAPIManager:
+    def __init__(self, api_key: str, base_url: str = VAPI_BASE_URL, transport: Optional[PooledTransport] = None):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        # Managers are cheap to rebuild on every rerun; the pooled transport is shared
+        self.transport = transport or get_shared_transport()
+
+    def _request(
+        self, method: str, path: str, payload: Optional[Dict[str, Any]] = None, endpoint: str = None
+    ) -> Dict[str, Any]:
+        """Send a request to the VAPI API and decode the JSON body
+
+        Failures are returned as ``{"error": ..., "retryable": bool}`` so callers
+        such as the bulk dialer can decide whether to try again. ``endpoint``
+        labels the latency histogram for paths that embed ids.
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        try:
+            response = self.transport.request(
+                method, f"{self.base_url}{path}", endpoint=endpoint or path, json=payload, headers=headers
+            )
+        except requests.RequestException as exc:
+            return {"error": f"Connection error: {exc}", "retryable": True}
+
+        if response.status_code >= 400:
+            return {
+                "error": f"HTTP {response.status_code}: {response.text[:200]}",
+                "status_code": response.status_code,
+                "retryable": response.status_code in RETRYABLE_STATUS_CODES,
+            }
+
+        try:
+            # List endpoints return a JSON array; everything else an object
+            return response.json() if response.content else {}
+        except ValueError:
+            return {"error": "Invalid JSON in VAPI response", "retryable": False}
+
+    def create_assistant(self, config: AssistantConfig) -> Dict[str, Any]:
+        """Create a new VAPI assistant"""
+        payload = {
+            "name": config.name,
+            "voice": config.voice,
+            "language": config.language,
+            "firstMessage": f"Hello! I'm {config.name}, how can I help you today?",
+            "systemPrompt": config.custom_prompt,
+            "model": {
+                "provider": "openai",
+                "model": "gpt-4",
+                "temperature": config.temperature
+            },
+            "transcriber": {
+                "provider": "deepgram",
+                "model": "nova-2",
+                "language": config.language
+            }
+        }
+
+        body = self._request("POST", "/assistant", payload)
+        if "error" in body:
+            return body
+
+        return {
+            "success": True,
+            "assistant_id": body.get("id", config.id),
+            "message": "Assistant created successfully"
+        }
+
+    def initiate_call(self, assistant_id: str, phone_number: str, custom_prompt: str = "") -> Dict[str, Any]:
+        """Initiate a call using VAPI
+
+        On success the result carries a ``call_record`` the caller can add to
+        its call history.
+        """
+        if not self.api_key:
+            return {"error": "VAPI API key not configured", "retryable": False}
+
+        e164, error = normalize_phone(phone_number)
+        if error:
+            return {"error": f"Invalid phone number {phone_number!r}: {error}", "retryable": False}
+        phone_number = e164
+
+        payload = {
+            "assistantId": assistant_id,
+            "customer": {"number": phone_number}
+        }
+        if custom_prompt:
+            payload["assistantOverrides"] = {"systemPrompt": custom_prompt}
+
+        body = self._request("POST", "/call", payload)
+        if "error" in body:
+            return body
+
+        call_id = body.get("id")
+        if not call_id:
+            return {"error": "VAPI response did not include a call id", "retryable": False}
+
+        call_record = CallRecord(
+            call_id=call_id,
+            assistant_id=assistant_id,
+            phone_number=phone_number,
+            start_time=datetime.now(),
+            status=CallStatus.INITIATED,
+            custom_data={"custom_prompt": custom_prompt}
+        )
+
+        return {
+            "success": True,
+            "call_id": call_id,
+            "status": body.get("status", "initiated"),
+            "estimated_cost": body.get("estimatedCost", DEFAULT_CALL_COST),
+            "call_record": call_record
+        }
+
+    def get_call_status(self, call_id: str) -> Dict[str, Any]:
+        """Get the status of a specific call"""
+        body = self._request("GET", f"/call/{call_id}", endpoint="/call/{id}")
+        if "error" in body:
+            return body
+
+        return {**parse_call_status(body), "call_id": call_id}
+
+    def list_calls(self, updated_since: str = "", limit: int = 1000) -> Dict[str, Any]:
+        """List calls updated at or after an ISO timestamp, oldest update first
+
+        The bound is inclusive so calls sharing the timestamp a previous page
+        ended on are not skipped; callers drop the ones they already have.
+
+        Returns ``{"calls": [...]}`` with each call normalized by
+        ``parse_call_status``.
+        """
+        params = [f"limit={limit}", "sortOrder=ASC"]
+        if updated_since:
+            params.append(f"updatedAtGe={quote(updated_since)}")
+        body = self._request("GET", f"/call?{'&'.join(params)}", endpoint="/call")
+        if isinstance(body, dict) and "error" in body:
+            return body
+
+        calls: List[Dict[str, Any]] = body if isinstance(body, list) else body.get("results", [])
+        return {"calls": [parse_call_status(call) for call in calls]}
+
+    def end_call(self, call_id: str) -> Dict[str, Any]:
+        """End an active call"""
+        body = self._request("DELETE", f"/call/{call_id}", endpoint="/call/{id}")
+        if "error" in body:
+            return body
+
+        return {"success": True, "message": "Call ended successfully"}
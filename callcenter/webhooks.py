@@ -0,0 +1,314 @@
+"""ASGI webhook receiver for VAPI call events
+
+Runs next to the Streamlit app and shares its SQLite database:
+
+    VAPI_WEBHOOK_SECRET=... uvicorn --factory callcenter.webhooks:create_app --port 8502
+
+Each assistant's ``webhook_url`` should point at ``/webhooks/<assistant_id>``.
+Requests must carry ``X-Vapi-Signature: sha256=<hex>``, the HMAC-SHA256 of
+the raw body keyed with the webhook secret, and events timestamped more than
+``max_age`` seconds from now are rejected so a captured request can't be
+replayed later. Accepted events are queued and written to the ``EventStore``
+(and folded into the ``CallStore``) in batches, so a burst of webhooks costs
+one transaction per batch rather than one per request. A request is only
+answered 202 once its batch is committed; if the write fails it gets a 503
+and VAPI delivers it again. Final ``transcript`` messages are also handed to the transcript
+pipeline, which keeps each call's sentiment and lead score up to date as
+the conversation goes and raises ``objection_raised`` / ``positive_sentiment``
+events when an assistant's tracked keywords are heard.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Any, Optional
+
+from .assistants import AssistantRegistry
+from .events import EventStore, WEBHOOK_EVENTS
+from .keywords import KeywordTracker
+from .store import CallStore
+from .transcripts import TranscriptPipeline
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = b"x-vapi-signature"
+MAX_BODY_BYTES = 1024 * 1024
+# How far an event's own timestamp may be from the receiver's clock
+DEFAULT_MAX_AGE = 300.0
+
+# VAPI server message types mapped onto the dashboard's webhook events
+VAPI_MESSAGE_EVENTS = {
+    "end-of-call-report": "call_ended",
+}
+# "ended" status updates are skipped: the end-of-call report follows with the details
+VAPI_STATUS_EVENTS = {
+    "in-progress": "call_started",
+}
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Signature header value for ``body``; the replay tool uses it too"""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: str, secret: str) -> bool:
+    return bool(secret) and hmac.compare_digest(sign(body, secret), signature)
+
+
+def normalize_event(assistant_id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Turn a webhook body into an event row, or None if it isn't one we track
+
+    Accepts the dashboard's own ``{"event", "call_id", "data"}`` shape as
+    well as VAPI server messages (``{"message": {"type", "call", ...}}``).
+    """
+    if "message" in body:
+        message = body["message"]
+        message_type = message.get("type")
+        event_type = VAPI_MESSAGE_EVENTS.get(message_type)
+        if message_type == "status-update":
+            event_type = VAPI_STATUS_EVENTS.get(message.get("status"))
+        call = message.get("call", {})
+        data = {
+            key: message[key]
+            for key in ("duration", "cost", "transcript", "endedReason")
+            if key in message
+        }
+        if "recordingUrl" in message:
+            data["recording_url"] = message["recordingUrl"]
+        if call.get("customer", {}).get("number"):
+            data["phone_number"] = call["customer"]["number"]
+        if message.get("endedReason", "").endswith("error"):
+            event_type = "call_failed"
+        if message_type == "transcript":
+            # Partial transcripts are superseded by the final one for the same utterance
+            event_type = "transcript" if message.get("transcriptType") == "final" else None
+            data = {"role": message.get("role", "user"), "text": message.get("transcript", "")}
+        call_id = call.get("id")
+        # VAPI timestamps are epoch milliseconds
+        occurred_at = message["timestamp"] / 1000 if message.get("timestamp") else time.time()
+    else:
+        event_type = body.get("event")
+        call_id = body.get("call_id")
+        data = body.get("data", {})
+        occurred_at = float(body.get("timestamp") or time.time())
+
+    if event_type not in WEBHOOK_EVENTS or not call_id:
+        return None
+    return {
+        "event_type": event_type,
+        "call_id": call_id,
+        "assistant_id": assistant_id,
+        "occurred_at": occurred_at,
+        "data": data,
+    }
+
+
+class WebhookApp:
+    """Minimal ASGI application: ``POST /webhooks/<assistant_id>`` and ``GET /healthz``"""
+
+    def __init__(
+        self,
+        store: EventStore,
+        secret: str,
+        assistant_secrets: Optional[Dict[str, str]] = None,
+        call_store: Optional[CallStore] = None,
+        pipeline: Optional[TranscriptPipeline] = None,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+    ):
+        self.store = store
+        self.call_store = call_store
+        self.pipeline = pipeline
+        if pipeline is not None and pipeline.on_events is None:
+            pipeline.on_events = self._persist_derived
+        self.secret = secret
+        self.assistant_secrets = assistant_secrets or {}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_age = max_age
+        self.stats = {
+            "accepted": 0, "rejected": 0, "stale": 0, "ignored": 0, "written": 0, "write_errors": 0, "fold_errors": 0
+        }
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._start_writer()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self._stop_writer()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _start_writer(self):
+        if self.pipeline is not None:
+            self.pipeline.start()
+        if self._writer_task is None:
+            self._queue = asyncio.Queue()
+            self._writer_task = asyncio.get_running_loop().create_task(self._writer())
+
+    async def _stop_writer(self):
+        if self._writer_task is not None:
+            await self._queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+        if self.pipeline is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.pipeline.stop)
+
+    async def _writer(self):
+        """Drain the queue into the store, one transaction per batch, then answer the batch's requests"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            batch: List[tuple] = []
+            stopping = item is None
+            if not stopping:
+                batch.append(item)
+            deadline = loop.time() + self.flush_interval
+            while not stopping and len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+            if batch:
+                events = [event for event, _ in batch]
+                try:
+                    self.stats["written"] += await loop.run_in_executor(None, self._persist, events)
+                except Exception as exc:
+                    logger.exception("Failed to write %d webhook events", len(events))
+                    self.stats["write_errors"] += len(events)
+                    outcome = exc
+                else:
+                    outcome = None
+                for _, future in batch:
+                    if not future.done():
+                        if outcome is None:
+                            future.set_result(True)
+                        else:
+                            future.set_exception(outcome)
+            if stopping:
+                return
+
+    def _persist(self, batch: List[Dict[str, Any]]) -> int:
+        """Append a batch to the event log, fold it into the call records and queue transcripts for scoring
+
+        Only the event log append can fail the batch: once it has committed, a
+        redelivery would log the events twice, and the log holds them anyway.
+        """
+        written = self.store.append(batch)
+        try:
+            if self.call_store is not None:
+                self.call_store.apply_events(batch)
+            if self.pipeline is not None:
+                self.pipeline.submit(batch)
+        except Exception:
+            logger.exception("Failed to fold %d logged webhook events", len(batch))
+            self.stats["fold_errors"] += len(batch)
+        return written
+
+    def _persist_derived(self, events: List[Dict[str, Any]]):
+        """Record events the pipeline derived from transcripts as if their webhooks had arrived"""
+        self.store.append(events)
+        if self.call_store is not None:
+            self.call_store.apply_events(events)
+
+    async def _http(self, scope, receive, send):
+        method, path = scope["method"], scope["path"]
+        if method == "GET" and path == "/healthz":
+            pending = self._queue.qsize() if self._queue is not None else 0
+            transcripts = self.pipeline.stats if self.pipeline is not None else {}
+            return await self._respond(
+                send, 200, {"status": "ok", "pending": pending, **self.stats, "transcripts": transcripts}
+            )
+
+        prefix = "/webhooks/"
+        if method != "POST" or not path.startswith(prefix) or len(path) == len(prefix):
+            return await self._respond(send, 404, {"error": "Not found"})
+        assistant_id = path[len(prefix):]
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) > MAX_BODY_BYTES:
+                return await self._respond(send, 413, {"error": "Payload too large"})
+
+        headers = dict(scope["headers"])
+        signature = headers.get(SIGNATURE_HEADER, b"").decode()
+        secret = self.assistant_secrets.get(assistant_id, self.secret)
+        if not verify_signature(body, signature, secret):
+            self.stats["rejected"] += 1
+            return await self._respond(send, 401, {"error": "Invalid signature"})
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return await self._respond(send, 400, {"error": "Invalid JSON"})
+        if not isinstance(payload, dict):
+            return await self._respond(send, 400, {"error": "Expected a JSON object"})
+        try:
+            event = normalize_event(assistant_id, payload)
+        except (AttributeError, TypeError, ValueError):
+            return await self._respond(send, 400, {"error": "Malformed event"})
+
+        if event is None:
+            self.stats["ignored"] += 1
+            return await self._respond(send, 202, {"status": "ignored"})
+
+        if self.max_age is not None and abs(time.time() - event["occurred_at"]) > self.max_age:
+            self.stats["stale"] += 1
+            return await self._respond(send, 401, {"error": "Stale timestamp"})
+
+        # Servers without lifespan support start the writer on first use
+        self._start_writer()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, future))
+        try:
+            await future
+        except Exception:
+            return await self._respond(send, 503, {"error": "Event could not be stored"})
+        self.stats["accepted"] += 1
+        return await self._respond(send, 202, {"status": "accepted"})
+
+    async def _respond(self, send, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def create_app() -> WebhookApp:
+    """Build the receiver from the environment (for ``uvicorn --factory``)"""
+    assistant_secrets = json.loads(os.environ.get("VAPI_WEBHOOK_SECRETS", "{}"))
+    max_age = float(os.environ.get("VAPI_WEBHOOK_MAX_AGE", DEFAULT_MAX_AGE))
+    call_store = CallStore()
+    return WebhookApp(
+        EventStore(), os.environ.get("VAPI_WEBHOOK_SECRET", ""), assistant_secrets,
+        call_store=call_store, pipeline=TranscriptPipeline(call_store, keywords=KeywordTracker(AssistantRegistry())),
+        max_age=max_age or None,
+    )
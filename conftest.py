@@ -0,0 +1 @@
+"""Lets ``pytest`` import the ``callcenter`` package from a checkout"""
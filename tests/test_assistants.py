@@ -0,0 +1,62 @@
+"""AssistantRegistry persistence and reloads"""
+import time
+
+import pytest
+
+from callcenter.assistants import AssistantRegistry, default_assistants
+from callcenter.events import EventStore
+from callcenter.keywords import KeywordTracker
+from callcenter.models import AssistantStatus
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "calls.db")
+
+
+@pytest.fixture
+def registry(db_path):
+    return AssistantRegistry(db_path, defaults=default_assistants(3))
+
+
+def test_writes_to_other_tables_do_not_reload(registry, db_path):
+    version = registry.version
+    assert registry.stats["reloads"] == 1
+    EventStore(db_path).append([
+        {"event_type": "call_started", "call_id": "call_1", "assistant_id": "vapi_assistant_01", "occurred_at": time.time()}
+    ])
+    assert registry.version == version
+    assert len(registry.configs) == 3
+    assert registry.stats["reloads"] == 1
+
+
+def test_edits_from_another_process_reload(registry, db_path):
+    version = registry.version
+    other = AssistantRegistry(db_path, defaults=default_assistants(3))
+    assert other.update("assistant_2", status=AssistantStatus.MAINTENANCE)["success"]
+    assert registry.version != version
+    assert registry.get("assistant_2").status == AssistantStatus.MAINTENANCE
+    assert list(registry.with_status(AssistantStatus.MAINTENANCE)) == ["assistant_2"]
+    assert registry.stats["reloads"] == 2
+
+
+def test_seeding_only_fills_an_empty_table(registry, db_path):
+    AssistantRegistry(db_path, defaults=default_assistants(5))
+    assert len(registry.configs) == 3
+
+
+def test_unknown_fields_and_assistants_are_rejected(registry):
+    assert not registry.update("assistant_1", id="other")["success"]
+    assert not registry.update("assistant_9", name="x")["success"]
+    assert registry.stats["reloads"] == 1
+
+
+def test_keyword_tracker_recompiles_only_on_edits(registry, db_path):
+    tracker = KeywordTracker(registry)
+    automaton = tracker.automaton_for("vapi_assistant_01")
+    EventStore(db_path).append([{"event_type": "call_started", "call_id": "call_1", "occurred_at": time.time()}])
+    assert tracker.automaton_for("vapi_assistant_01") is automaton
+
+    registry.update("assistant_1", keywords={"objection": ["no thanks"]})
+    assert tracker.automaton_for("vapi_assistant_01") is not automaton
+    assert tracker.automaton_for("vapi_assistant_01").matches(["no", "thanks"]) == [("objection", "no thanks")]
@@ -0,0 +1,164 @@
+"""CampaignQueue: weighted shares, budgets, starvation and call-long slots"""
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from callcenter.campaign_queue import CampaignQueue
+from callcenter.dialer import BulkDialer, DialJob, DialSettings
+from callcenter.vapi import DEFAULT_CALL_COST
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_slots_are_shared_by_priority_weight():
+    queue = CampaignQueue(capacity=1)
+    queue.register("urgent", "Urgent")
+    queue.register("low", "Low")
+    grants = Counter()
+    lock = threading.Lock()
+    done = threading.Event()
+    start = threading.Barrier(4)
+
+    def worker(name):
+        start.wait()
+        while not done.is_set():
+            if not queue.acquire(name, done):
+                return
+            with lock:
+                grants[name] += 1
+                if sum(grants.values()) >= 180:
+                    done.set()
+            # Hold the slot like a short call, so every worker is queued when it frees
+            time.sleep(0.002)
+            queue.release(name)
+
+    # Two workers each, so both campaigns always have a request waiting
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("urgent", "low") for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert 6 <= grants["urgent"] / grants["low"] <= 10
+
+
+def test_budget_stops_grants_and_actual_costs_replace_estimates():
+    queue = CampaignQueue(capacity=10)
+    queue.register("spring", budget=2.5 * DEFAULT_CALL_COST)
+    assert queue.acquire("spring")
+    queue.bind("spring", "call_1")
+    assert queue.acquire("spring")
+    queue.bind("spring", "call_2")
+    # Two estimates reserved: a third call could overrun the budget
+    assert not queue.acquire("spring")
+
+    queue.finish_call("call_1", cost=0.01)
+    queue.finish_call("call_2", cost=0.01)
+    [row] = queue.metrics()
+    assert row["spent"] == pytest.approx(0.02)
+    assert row["in_flight"] == 0
+    assert queue.acquire("spring")
+
+
+def test_starved_campaigns_are_served_ahead_of_weights():
+    clock = Clock()
+    queue = CampaignQueue(capacity=1, max_wait=120, clock=clock)
+    queue.register("urgent", "Urgent")
+    queue.register("low", "Low")
+    # Low has used its turn, so by weight urgent would go next eight times
+    assert queue.acquire("low")
+    queue.release("low")
+    assert queue.acquire("urgent")
+
+    order = []
+    low = threading.Thread(target=lambda: order.append("low") if queue.acquire("low") else None)
+    low.start()
+    assert wait_for(lambda: queue.snapshot()["queue_depth"] == 1)
+    clock.now += 60
+    urgent = threading.Thread(target=lambda: order.append("urgent") if queue.acquire("urgent") else None)
+    urgent.start()
+    assert wait_for(lambda: queue.snapshot()["queue_depth"] == 2)
+    clock.now += 61
+    queue.release("urgent")
+    assert wait_for(lambda: order == ["low"])
+    queue.release("low")
+    urgent.join(5)
+    low.join(5)
+    assert order == ["low", "urgent"]
+
+
+def test_slots_are_held_until_the_call_ends():
+    clock = Clock()
+    queue = CampaignQueue(capacity=1, call_timeout=600, clock=clock)
+    queue.register("spring")
+    assert queue.acquire("spring")
+    queue.bind("spring", "call_1")
+    stop = threading.Event()
+    stop.set()
+    assert not queue.acquire("spring", stop)
+    assert queue.snapshot()["in_flight"] == 1
+
+    queue.finish_call("call_1", cost=0.4)
+    assert queue.snapshot()["in_flight"] == 0
+    assert queue.metrics()[0]["spent"] == pytest.approx(0.4)
+
+    # An end seen before the bind settles the bind at once
+    queue.finish_call("call_2", cost=0.3)
+    assert queue.acquire("spring")
+    queue.bind("spring", "call_2")
+    assert queue.snapshot()["in_flight"] == 0
+
+    # A call whose end never arrives is charged its estimate after call_timeout
+    assert queue.acquire("spring")
+    queue.bind("spring", "call_3")
+    clock.now += 601
+    assert queue.snapshot()["in_flight"] == 0
+    assert queue.metrics()[0]["spent"] == pytest.approx(0.7 + DEFAULT_CALL_COST)
+
+
+class PlacingManager:
+    def __init__(self):
+        self.placed = []
+
+    def initiate_call(self, assistant_id, phone_number, custom_prompt=""):
+        self.placed.append(phone_number)
+        if phone_number.endswith("9"):
+            return {"error": "Invalid number", "retryable": False}
+        return {"success": True, "call_id": f"call_{phone_number[-1]}", "estimated_cost": 0.2}
+
+
+def test_dialer_keeps_the_slot_for_placed_calls_only():
+    queue = CampaignQueue(capacity=1)
+    queue.register("spring")
+    manager = PlacingManager()
+    settings = DialSettings(max_concurrent=2, call_delay=0, max_retries=0, weekend_calling=True,
+                            call_window_start=DialSettings().call_window_start.replace(hour=0),
+                            call_window_end=DialSettings().call_window_end.replace(hour=23, minute=59))
+    jobs = [DialJob("+14155550109", "assistant_1"), DialJob("+14155550101", "assistant_1"),
+            DialJob("+14155550102", "assistant_1")]
+    dialer = BulkDialer(manager, jobs, settings, queue=queue, campaign="spring").start()
+    # The failed placement gave its slot back; the first placed call holds it
+    assert wait_for(lambda: len(manager.placed) == 2)
+    time.sleep(0.1)
+    assert len(manager.placed) == 2
+    queue.finish_call("call_1", cost=0.05)
+    assert dialer.join(timeout=5)
+    assert manager.placed[-1] == "+14155550102"
+    queue.finish_call("call_2", cost=0.05)
+    assert queue.metrics()[0]["spent"] == pytest.approx(0.1)
@@ -0,0 +1,118 @@
+"""CallBuffer round trips and local-time conversion across DST changes"""
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from dateutil import tz
+
+from callcenter import columnar
+from callcenter.columnar import CallBuffer, to_local
+from callcenter.exports import export_frame
+from callcenter.models import CallRecord, CallStatus
+from callcenter.store import CallStore, local_day, local_midnight
+
+NEW_YORK = "America/New_York"
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    """Run as if the server were in New York, for both pandas and SQLite"""
+    monkeypatch.setenv("TZ", NEW_YORK)
+    time.tzset()
+    monkeypatch.setattr(columnar, "LOCAL_TZ", tz.gettz(NEW_YORK))
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def records():
+    start = datetime(2026, 3, 1, 9, 30, 15)
+    return [
+        CallRecord(
+            call_id="call_1", assistant_id="assistant_1", phone_number="+14155550101", start_time=start,
+            end_time=start + timedelta(minutes=3), duration=180, status=CallStatus.COMPLETED, transcript="Hello",
+            sentiment_score=0.5, lead_score=7.5, cost=0.42, recording_url="https://example.com/1.wav",
+            custom_data={"campaign": "spring", "notes": "Call back Friday"},
+        ),
+        # Still in progress, and a campaign of None is no campaign
+        CallRecord(
+            call_id="call_2", assistant_id="assistant_2", phone_number="+14155550102",
+            start_time=start + timedelta(hours=1), status=CallStatus.CONNECTED, custom_data={"campaign": None},
+        ),
+        CallRecord(
+            call_id="call_3", assistant_id="assistant_1", phone_number="+14155550101",
+            start_time=start + timedelta(hours=2), status=CallStatus.FAILED, custom_data={"campaign": "spring"},
+        ),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CallStore(str(tmp_path / "calls.db"))
+    store.upsert(records())
+    return store
+
+
+def test_rows_and_records_build_the_same_buffer(store):
+    expected = records()
+    # A campaign of None reads back as no campaign
+    expected[1].custom_data = {}
+    assert CallBuffer.from_records(records()).to_records() == expected
+    from_rows = store.query_page(10, columnar=True)[0]
+    assert sorted(from_rows.to_records(), key=lambda record: record.call_id) == expected
+
+
+def test_campaigns_of_none_stay_empty(store):
+    for buffer in (CallBuffer.from_records(records()), store.query_page(10, columnar=True)[0]):
+        assert sorted(buffer.strings("campaign")) == ["", "spring", "spring"]
+        assert "None" not in set(buffer.to_pandas()["campaign"])
+    assert store.get_many(["call_2"])["call_2"].custom_data.get("campaign") is None
+
+
+def test_custom_data_is_rebuilt_from_the_campaign_and_the_rest():
+    buffer = CallBuffer.from_records(records())
+    assert buffer.custom_data(0) == {"campaign": "spring", "notes": "Call back Friday"}
+    assert buffer.custom_data(2) == {"campaign": "spring"}
+    assert buffer.custom_field("notes") == ["Call back Friday", "", ""]
+    # Rows with nothing but a campaign don't keep a dict of their own
+    assert sorted(buffer._custom) == [0]
+
+
+def test_frames_carry_utc_times_and_nat_for_calls_in_progress():
+    frame = CallBuffer.from_records(records()).to_pandas()
+    assert str(frame["start_time"].dtype) == "datetime64[ns, UTC]"
+    assert frame["start_time"][0] == pd.Timestamp(records()[0].start_time.astimezone())
+    assert pd.isna(frame["end_time"][1])
+    assert CallBuffer.from_records(records())[1].end_time is None
+
+
+def test_local_times_follow_dst_row_by_row(new_york):
+    # 2026-03-08 02:00 EST is when New York springs forward
+    before = datetime(2026, 3, 8, 6, 30, tzinfo=tz.UTC)
+    after = datetime(2026, 3, 8, 7, 30, tzinfo=tz.UTC)
+    local = to_local(pd.Series(pd.to_datetime([before, after, None], utc=True)))
+    assert list(local[:2]) == [pd.Timestamp("2026-03-08 01:30"), pd.Timestamp("2026-03-08 03:30")]
+    assert pd.isna(local[2])
+
+    calls = CallBuffer.from_records([
+        CallRecord(call_id=f"call_{i}", assistant_id="assistant_1", phone_number="+14155550101",
+                   start_time=datetime.fromtimestamp(moment.timestamp()), status=CallStatus.COMPLETED)
+        for i, moment in enumerate((before, after))
+    ])
+    assert list(export_frame(calls)["Start Time"]) == [pd.Timestamp("2026-03-08 01:30"), pd.Timestamp("2026-03-08 03:30")]
+
+
+def test_daily_counts_bucket_by_the_local_day_of_each_call(new_york, tmp_path):
+    store = CallStore(str(tmp_path / "calls.db"))
+    # 23:30 local on either side of the change, so a single offset puts one of them on the wrong day
+    moments = [datetime(2026, 3, 7, 23, 30), datetime(2026, 3, 8, 23, 30), datetime(2026, 3, 9, 0, 30)]
+    store.upsert([
+        CallRecord(call_id=f"call_{i}", assistant_id="assistant_1", phone_number="+14155550101",
+                   start_time=moment, status=CallStatus.COMPLETED)
+        for i, moment in enumerate(moments)
+    ])
+    first = local_day(datetime(2026, 3, 7))
+    counts = store.daily_counts(local_midnight(first), local_midnight(first + 3))
+    assert counts == {first: 1, first + 1: 1, first + 2: 1}
+    assert local_midnight(first + 1) == datetime(2026, 3, 8)
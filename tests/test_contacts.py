@@ -0,0 +1,139 @@
+"""Chunked contact-list imports from CSV and Excel uploads"""
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from callcenter.contacts import ContactImport, ContactStore, read_upload
+
+ROWS = 23
+CHUNK_SIZE = 5
+
+
+def contact_rows():
+    """Header plus ``ROWS`` rows: every seventh number invalid, every fifth a repeat"""
+    rows = [["Name", "Phone Number", "Company"]]
+    for i in range(ROWS):
+        if i % 7 == 3:
+            phone = "not a number"
+        elif i % 5 == 4:
+            phone = f"415-555-{i - 1:04d}"
+        else:
+            phone = f"(415) 555-{i:04d}"
+        rows.append([f"Contact {i}", phone, f"Company {i % 3}"])
+    return rows
+
+
+def csv_upload() -> io.BytesIO:
+    return io.BytesIO("\n".join(",".join(row) for row in contact_rows()).encode())
+
+
+def xlsx_upload() -> io.BytesIO:
+    workbook = Workbook()
+    for row in contact_rows():
+        workbook.active.append(row)
+    upload = io.BytesIO()
+    workbook.save(upload)
+    upload.seek(0)
+    return upload
+
+
+UPLOADS = {"contacts.csv": csv_upload, "contacts.xlsx": xlsx_upload}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContactStore(str(tmp_path / "calls.db"))
+
+
+def run_import(store: ContactStore, filename: str, **kwargs) -> ContactImport:
+    contact_import = ContactImport(
+        store, UPLOADS[filename](), filename, "Phone Number", chunk_size=CHUNK_SIZE, **kwargs
+    ).start()
+    contact_import.join(10)
+    return contact_import
+
+
+@pytest.mark.parametrize("filename", list(UPLOADS))
+def test_upload_is_read_in_chunks(filename):
+    chunks = list(read_upload(UPLOADS[filename](), filename, CHUNK_SIZE))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 5, 3]
+    assert list(chunks[0].columns) == ["Name", "Phone Number", "Company"]
+    assert chunks[0]["Name"].tolist() == [f"Contact {i}" for i in range(5)]
+
+    skipped = list(read_upload(UPLOADS[filename](), filename, CHUNK_SIZE, skip_rows=7))
+    assert [len(chunk) for chunk in skipped] == [5, 5, 5, 1]
+    assert skipped[0]["Name"].iloc[0] == "Contact 7"
+
+
+@pytest.mark.parametrize("filename", list(UPLOADS))
+def test_import_validates_dedupes_and_records_errors(store, filename):
+    contact_import = run_import(store, filename)
+    progress = contact_import.snapshot()
+    assert progress["status"] == "completed"
+    assert progress["progress"] == 1.0
+
+    invalid = [i for i in range(ROWS) if i % 7 == 3]
+    repeats = [i for i in range(ROWS) if i % 5 == 4 and i % 7 != 3 and (i - 1) % 7 != 3]
+    assert progress["rows_read"] == ROWS
+    assert progress["invalid"] == len(invalid)
+    assert progress["duplicates"] == len(repeats)
+    assert progress["valid"] == ROWS - len(invalid) - len(repeats)
+
+    saved = store.get_list(contact_import.list_id)
+    assert (saved["status"], saved["rows_read"], saved["valid"]) == ("completed", ROWS, progress["valid"])
+    assert saved["columns"] == ["Name", "Phone Number", "Company"]
+    contacts = list(store.iter_contacts(contact_import.list_id, page_size=4))
+    assert len(contacts) == store.count(contact_import.list_id) == progress["valid"]
+    assert contacts[0] == {"Name": "Contact 0", "Phone Number": "+14155550000", "Company": "Company 0"}
+
+    # Row numbers count the header as row 1
+    errors = store.errors(contact_import.list_id)
+    assert errors["Row"].tolist() == [i + 2 for i in invalid]
+    assert set(errors["Value"]) == {"not a number"}
+
+
+def test_missing_phone_column_fails_the_import(store):
+    contact_import = ContactImport(store, csv_upload(), "contacts.csv", "Mobile", chunk_size=CHUNK_SIZE).start()
+    contact_import.join(10)
+    assert contact_import.status == "failed"
+    assert "Mobile" in contact_import.error
+    assert store.get_list(contact_import.list_id)["status"] == "failed"
+
+
+@pytest.mark.parametrize("filename", list(UPLOADS))
+def test_stopped_import_resumes_where_it_left_off(store, filename):
+    expected = run_import(store, filename)
+    expected_contacts = list(store.iter_contacts(expected.list_id))
+
+    contact_import = ContactImport(store, UPLOADS[filename](), filename, "Phone Number", chunk_size=CHUNK_SIZE)
+    add_chunk = store.add_chunk
+    written = []
+
+    def add_chunk_then_stop(*args, **kwargs):
+        inserted = add_chunk(*args, **kwargs)
+        written.append(inserted)
+        if len(written) == 2:
+            contact_import.stop()
+        return inserted
+
+    store.add_chunk = add_chunk_then_stop
+    contact_import.start().join(10)
+    assert contact_import.status == "stopped"
+    assert contact_import.stats["rows_read"] == 2 * CHUNK_SIZE
+    assert store.get_list(contact_import.list_id)["status"] == "stopped"
+
+    contact_import.resume().join(10)
+    assert contact_import.status == "completed"
+    assert len(written) == 5
+    assert contact_import.stats == expected.stats
+    assert list(store.iter_contacts(contact_import.list_id)) == expected_contacts
+    errors = store.errors(contact_import.list_id)
+    assert errors["Row"].tolist() == store.errors(expected.list_id)["Row"].tolist()
+
+
+def test_resume_only_continues_stopped_imports(store):
+    contact_import = run_import(store, "contacts.csv")
+    contact_import.resume().join(10)
+    assert contact_import.status == "completed"
+    assert contact_import.stats["rows_read"] == ROWS
@@ -0,0 +1,65 @@
+"""BulkDialer failures that never reach VAPI"""
+from datetime import datetime, time as dt_time
+
+import pytest
+
+from callcenter.dialer import BulkDialer, DialJob, DialSettings, validate_settings
+from callcenter.router import AssistantRouter
+
+SETTINGS = DialSettings(
+    max_concurrent=2, call_delay=0, weekend_calling=True,
+    call_window_start=dt_time(0, 0), call_window_end=dt_time(23, 59, 59)
+)
+
+
+class CountingManager:
+    def __init__(self):
+        self.calls = 0
+
+    def initiate_call(self, assistant_id, phone_number, custom_prompt=""):
+        self.calls += 1
+        return {"success": True, "call_id": f"call_{phone_number}", "estimated_cost": 0.1}
+
+
+def run(jobs, **kwargs):
+    results = []
+    manager = CountingManager()
+    dialer = BulkDialer(
+        manager, jobs, SETTINGS, total=len(jobs), on_result=lambda job, result: results.append((job, result)), **kwargs
+    ).start()
+    assert dialer.join(timeout=10)
+    return dialer, manager, results
+
+
+def test_unroutable_jobs_are_reported():
+    # No assistant registered with the router, so none is eligible
+    dialer, manager, results = run(
+        [DialJob("+14155550100", "assistant_1")], router=AssistantRouter(), assistant_ids=["assistant_1"]
+    )
+    assert manager.calls == 0
+    assert [result for _, result in results] == [{"error": "No eligible assistant", "retryable": False}]
+    snapshot = dialer.snapshot()
+    assert (snapshot["failed"], snapshot["completed"]) == (1, 1)
+
+
+def test_unknown_timezone_fails_only_its_job():
+    jobs = [DialJob("+14155550100", "assistant_1", timezone="Mars/Olympus"), DialJob("+14155550101", "assistant_1")]
+    dialer, manager, results = run(jobs)
+    assert manager.calls == 1
+    outcomes = {job.phone_number: result.get("error") for job, result in results}
+    assert outcomes == {"+14155550100": "Unknown timezone: Mars/Olympus", "+14155550101": None}
+    assert dialer.snapshot()["recent_errors"][0]["error"] == "Unknown timezone: Mars/Olympus"
+
+
+@pytest.mark.parametrize("start, end", [(dt_time(17, 0), dt_time(9, 0)), (dt_time(9, 0), dt_time(9, 0))])
+def test_bad_windows_are_rejected_on_submit(start, end):
+    settings = DialSettings(call_window_start=start, call_window_end=end)
+    with pytest.raises(ValueError):
+        validate_settings(settings)
+    with pytest.raises(ValueError):
+        BulkDialer(CountingManager(), [], settings)
+
+
+def test_valid_window_passes():
+    validate_settings(DialSettings())
+    assert BulkDialer(CountingManager(), [], DialSettings(), now=datetime.now).snapshot()["failed"] == 0
@@ -0,0 +1,123 @@
+"""ExportJobRunner: deduplication, data versions, restarts, pruning and failures"""
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from callcenter import export_jobs
+from callcenter.export_jobs import ExportJobRunner, request_key
+
+
+@pytest.fixture
+def data():
+    return {"version": 1, "rows": 3}
+
+
+def make_runner(tmp_path, data, **kwargs) -> ExportJobRunner:
+    runner = ExportJobRunner(str(tmp_path / "calls.db"), export_dir=str(tmp_path / "exports"), poll_interval=0.05, **kwargs)
+
+    def frames(params):
+        if params.get("fail"):
+            yield pd.DataFrame({"n": [1]})
+            raise RuntimeError("store went away")
+        yield pd.DataFrame({"n": range(data["rows"])})
+
+    runner.register("calls", frames, total=lambda params: data["rows"], version=lambda params: data["version"])
+    return runner
+
+
+def wait_for_job(runner: ExportJobRunner, job_id: str, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.job(job_id)
+        if job["status"] not in export_jobs.PENDING_STATUSES:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"{job_id} still {job['status']}")
+
+
+def test_request_keys_ignore_parameter_order_but_not_data_version():
+    assert request_key("calls", "CSV", {"a": 1, "b": 2}, 5) == request_key("calls", "CSV", {"b": 2, "a": 1}, 5)
+    assert request_key("calls", "CSV", {"a": 1}, 5) != request_key("calls", "CSV", {"a": 1}, 6)
+
+
+def test_identical_requests_share_a_job_until_the_data_changes(tmp_path, data):
+    runner = make_runner(tmp_path, data).start()
+    try:
+        first = runner.submit("calls", "CSV", {"range": "today"})
+        assert runner.submit("calls", "CSV", {"range": "today"})["job_id"] == first["job_id"]
+        job = wait_for_job(runner, first["job_id"])
+        assert (job["status"], job["rows"], job["progress"]) == ("completed", 3, 1.0)
+        assert runner.submit("calls", "CSV", {"range": "today"})["job_id"] == first["job_id"]
+        assert runner.stats["deduplicated"] == 2
+
+        # A call landed in the range: the finished file is stale
+        data["version"], data["rows"] = 2, 4
+        second = runner.submit("calls", "CSV", {"range": "today"})
+        assert second["job_id"] != first["job_id"]
+        assert wait_for_job(runner, second["job_id"])["rows"] == 4
+        assert runner.submit("calls", "CSV", {"range": "yesterday"})["job_id"] not in (first["job_id"], second["job_id"])
+    finally:
+        runner.stop()
+
+
+def test_a_missing_artifact_is_exported_again(tmp_path, data):
+    runner = make_runner(tmp_path, data).start()
+    try:
+        first = wait_for_job(runner, runner.submit("calls", "CSV", {})["job_id"])
+        os.remove(first["path"])
+        assert runner.artifact(first["job_id"]) is None
+        assert runner.submit("calls", "CSV", {})["job_id"] != first["job_id"]
+    finally:
+        runner.stop()
+
+
+def test_jobs_survive_a_restart(tmp_path, data):
+    runner = make_runner(tmp_path, data)
+    queued = runner.submit("calls", "CSV", {"range": "today"})
+    abandoned = runner.submit("calls", "CSV", {"range": "week"})
+    # The process that claimed this one died mid-export
+    runner._update(abandoned["job_id"], status="running", rows=1)
+    runner._conn.execute(
+        "UPDATE export_jobs SET updated_at = ? WHERE job_id = ?",
+        (time.time() - export_jobs.STALE_AFTER - 1, abandoned["job_id"]),
+    )
+
+    restarted = make_runner(tmp_path, data).start()
+    try:
+        assert restarted.submit("calls", "CSV", {"range": "today"})["job_id"] == queued["job_id"]
+        assert wait_for_job(restarted, queued["job_id"])["status"] == "completed"
+        assert wait_for_job(restarted, abandoned["job_id"])["rows"] == 3
+    finally:
+        restarted.stop()
+
+
+def test_failed_jobs_record_the_error_and_leave_no_partial_file(tmp_path, data):
+    runner = make_runner(tmp_path, data).start()
+    try:
+        job = wait_for_job(runner, runner.submit("calls", "CSV", {"fail": True})["job_id"])
+        assert (job["status"], job["error"]) == ("failed", "store went away")
+        assert runner.artifact(job["job_id"]) is None
+        assert os.listdir(runner.export_dir) == []
+        # A failed job is never reused
+        assert runner.submit("calls", "CSV", {"fail": True})["job_id"] != job["job_id"]
+        assert runner.stats["failed"] >= 1
+    finally:
+        runner.stop()
+    with pytest.raises(ValueError):
+        runner.submit("unknown", "CSV", {})
+    with pytest.raises(ValueError):
+        runner.submit("calls", "PDF", {})
+
+
+def test_old_jobs_and_their_files_are_pruned(tmp_path, data):
+    runner = make_runner(tmp_path, data, retention=0.0).start()
+    try:
+        job = wait_for_job(runner, runner.submit("calls", "CSV", {})["job_id"])
+    finally:
+        runner.stop()
+    runner._last_prune = 0.0
+    runner._prune()
+    assert runner.job(job["job_id"]) is None
+    assert not os.path.exists(job["path"])
@@ -0,0 +1,116 @@
+"""Incremental forecast refits against fitting the whole history at once"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from callcenter.forecast import MODELS, ArimaModel, ForecastEngine, ProphetModel, RegressionModel
+from callcenter.models import CallRecord, CallStatus
+from callcenter.store import CallStore, local_day
+
+FIRST_DAY = 19000
+
+
+def daily_volume(days: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    weekday = np.array([30, 34, 33, 31, 28, 12, 9])
+    t = np.arange(days)
+    return (weekday[(FIRST_DAY + t + 3) % 7] + 0.4 * t + rng.normal(0, 3, days)).round()
+
+
+def new_model(model_type: str, history: np.ndarray) -> RegressionModel:
+    if MODELS[model_type] is ProphetModel:
+        return ProphetModel(FIRST_DAY, len(history))
+    return MODELS[model_type](FIRST_DAY)
+
+
+def batch_fit(model_type: str, history: np.ndarray) -> RegressionModel:
+    model = new_model(model_type, history)
+    model.update(history)
+    return model
+
+
+def assert_same_fit(model: RegressionModel, reference: RegressionModel, history: np.ndarray):
+    assert model.rows == reference.rows
+    np.testing.assert_allclose(model.beta, reference.beta, rtol=1e-6, atol=1e-6)
+    np.testing.assert_allclose(model.sigma2, reference.sigma2, rtol=1e-6, atol=1e-6)
+    for got, expected in zip(model.predict(history, 14, 1.96), reference.predict(history, 14, 1.96)):
+        np.testing.assert_allclose(got, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("model_type", list(MODELS))
+def test_day_by_day_updates_match_batch_fit(model_type):
+    # 45..69 days keeps Prophet on the same single changepoint throughout
+    history = daily_volume(69)
+    model = new_model(model_type, history[:45])
+    for length in range(45, 70):
+        assert not model.needs_refit(history[:length])
+        model.update(history[:length])
+    assert_same_fit(model, batch_fit(model_type, history), history)
+
+
+@pytest.mark.parametrize("model_type", list(MODELS))
+def test_revised_days_are_replaced_not_added(model_type):
+    history = daily_volume(60)
+    model = batch_fit(model_type, history[:59])
+
+    revised = history.copy()
+    revised[57] += 11
+    revised[58] += 4
+    model.update(revised)
+    assert_same_fit(model, batch_fit(model_type, revised), revised)
+
+
+def test_unchanged_history_does_not_resolve():
+    history = daily_volume(30)
+    model = batch_fit("Seasonal", history)
+    inverse = model.inverse
+    model.update(history.copy())
+    assert model.inverse is inverse
+
+
+def test_arima_revision_reaches_every_lag_that_uses_the_day():
+    history = daily_volume(40)
+    model = batch_fit("ARIMA", history)
+    revised = history.copy()
+    revised[30] -= 9
+    model.update(revised)
+    reference = ArimaModel(FIRST_DAY)
+    reference.update(revised)
+    assert_same_fit(model, reference, revised)
+
+
+def calls_on(store: CallStore, day: datetime, count: int, prefix: str):
+    store.insert_new([
+        CallRecord(
+            call_id=f"{prefix}_{index}", assistant_id="assistant_1", phone_number="+14155550123",
+            start_time=day, status=CallStatus.COMPLETED, custom_data={}
+        )
+        for index in range(count)
+    ])
+
+
+def test_engine_picks_up_calls_stored_after_their_day_was_loaded(tmp_path):
+    store = CallStore(str(tmp_path / "calls.db"))
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    volume = daily_volume(30)
+    for offset, count in enumerate(volume):
+        calls_on(store, now - timedelta(days=30 - offset), int(count), f"day{offset}")
+
+    engine = ForecastEngine(store)
+    assert engine.forecast(days=7, model_type="Seasonal", now=now) is not None
+    first_day, history = engine._histories[None]
+    assert first_day == local_day(now) - 30
+    np.testing.assert_array_equal(history, volume)
+
+    # Yesterday's last calls land after the first forecast
+    calls_on(store, now - timedelta(days=1), 5, "late")
+    engine.forecast(days=7, model_type="Seasonal", now=now)
+    expected = volume.copy()
+    expected[-1] += 5
+    np.testing.assert_array_equal(engine._histories[None][1], expected)
+
+    model = engine._models[(None, "Seasonal")]
+    reference = MODELS["Seasonal"](first_day)
+    reference.update(expected)
+    assert_same_fit(model, reference, expected)
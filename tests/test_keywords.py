@@ -0,0 +1,87 @@
+"""Aho-Corasick keyword matching and per-assistant keyword lists"""
+import pytest
+
+from callcenter.assistants import AssistantRegistry, default_assistants
+from callcenter.keywords import (
+    DEFAULT_AUTOMATON, EMPTY_AUTOMATON, KeywordAutomaton, KeywordTracker, tokenize,
+)
+
+
+def match(automaton: KeywordAutomaton, text: str):
+    return automaton.matches(tokenize(text))
+
+
+def brute_force(keywords, tokens):
+    """Leftmost-longest, non-overlapping matches by trying every phrase at every position"""
+    phrases = {}
+    for category, listed in keywords.items():
+        for phrase in listed:
+            phrases.setdefault(tuple(tokenize(phrase)), (category, phrase))
+    found, index = [], 0
+    while index < len(tokens):
+        for length in range(len(tokens) - index, 0, -1):
+            hit = phrases.get(tuple(tokens[index:index + length]))
+            if hit is not None:
+                found.append(hit)
+                index += length
+                break
+        else:
+            index += 1
+    return found
+
+
+def test_longest_phrase_wins_at_the_same_start():
+    assert match(DEFAULT_AUTOMATON, "I'm not interested, thanks") == [("objection", "not interested")]
+    assert match(DEFAULT_AUTOMATON, "Yes, sign me up") == [("buying_intent", "sign me up")]
+
+
+def test_the_leftmost_of_overlapping_matches_wins():
+    automaton = KeywordAutomaton({"a": ["call back"], "b": ["back later"], "c": ["later"]})
+    # "call back" starts first, so "back later" is skipped but "later" after it is free
+    assert match(automaton, "call back later") == [("a", "call back"), ("c", "later")]
+
+
+def test_keywords_inside_longer_keywords_are_found_through_failure_links():
+    automaton = KeywordAutomaton({"x": ["a b c d"], "y": ["b c"], "z": ["c"]})
+    # "a b c d" fails at "e", and the failure link still reports "b c"
+    assert match(automaton, "a b c e") == [("y", "b c")]
+    assert match(automaton, "a b c d") == [("x", "a b c d")]
+    assert match(automaton, "c c") == [("z", "c"), ("z", "c")]
+
+
+def test_matches_agree_with_a_brute_force_scan():
+    keywords = {"one": ["a", "a b", "b c d"], "two": ["c", "d a b", "b"], "three": ["a b c d e"]}
+    automaton = KeywordAutomaton(keywords)
+    tokens = "a b c d a b c d e c a d a b b c d".split()
+    for start in range(len(tokens)):
+        for end in range(start, len(tokens) + 1):
+            assert automaton.matches(tokens[start:end]) == brute_force(keywords, tokens[start:end])
+
+
+def test_phrases_are_tokenized_and_deduplicated():
+    automaton = KeywordAutomaton({"first": ["Don’t call", ""], "second": ["don't CALL", "ok"]})
+    assert automaton.size == 2
+    assert match(automaton, "Please, don't call again") == [("first", "Don’t call")]
+    assert EMPTY_AUTOMATON.matches(tokenize("not interested")) == []
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return AssistantRegistry(str(tmp_path / "calls.db"), defaults=default_assistants(3))
+
+
+def test_tracker_compiles_each_distinct_list_once(registry):
+    registry.update_many(["assistant_1", "assistant_2"], keywords={"objection": ["no thanks"]})
+    registry.update("assistant_3", keyword_tracking=False)
+    tracker = KeywordTracker(registry)
+    first, second = tracker.automaton_for("vapi_assistant_01"), tracker.automaton_for("vapi_assistant_02")
+    assert first is second
+    assert first.matches(["no", "thanks"]) == [("objection", "no thanks")]
+    assert tracker.automaton_for("vapi_assistant_03") is EMPTY_AUTOMATON
+    assert tracker.automaton_for("unknown") is DEFAULT_AUTOMATON
+    assert KeywordTracker().automaton_for("vapi_assistant_01") is DEFAULT_AUTOMATON
+
+    # An edit to one assistant recompiles its list and keeps the other's automaton
+    registry.update("assistant_2", keywords={"objection": ["no thanks", "stop"]})
+    assert tracker.automaton_for("vapi_assistant_01") is first
+    assert tracker.automaton_for("vapi_assistant_02").matches(["stop"]) == [("objection", "stop")]
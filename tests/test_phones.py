@@ -0,0 +1,53 @@
+"""Batch phone normalization and its memo"""
+import pytest
+
+from callcenter import phones
+from callcenter.phones import normalize_batch, normalize_phone
+
+NUMBERS = [f"(415) 555-{i:04d}" for i in range(40)] + ["not a number", "", "+44 20 7946 0958"]
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    phones._memo.clear()
+    yield
+    phones._memo.clear()
+
+
+def test_parallel_results_match_in_process_and_are_memoized():
+    parallel = normalize_batch(NUMBERS, parallel_threshold=10, workers=2)
+    assert len(phones._memo) == len(NUMBERS)
+    phones._memo.clear()
+    serial = normalize_batch(NUMBERS, parallel_threshold=10 ** 9)
+    assert (parallel.numbers, parallel.errors) == (serial.numbers, serial.errors)
+    assert parallel.numbers[0] == "+14155550000"
+    assert parallel.errors[-3].startswith("Could not parse")
+    assert parallel.errors[-2] == "Missing phone number"
+    assert parallel.numbers[-1] == "+442079460958"
+
+
+def test_memoized_numbers_skip_the_pool(monkeypatch):
+    normalize_batch(NUMBERS, parallel_threshold=10, workers=2)
+
+    def no_pool(workers):
+        raise AssertionError("memoized numbers were parsed again")
+
+    monkeypatch.setattr(phones, "_process_pool", no_pool)
+    batch = normalize_batch(NUMBERS * 2, parallel_threshold=10, workers=2)
+    assert batch.valid_count == 2 * (len(NUMBERS) - 2)
+    # Single lookups share the memo too
+    assert normalize_phone("(415) 555-0007") == ("+14155550007", None)
+
+
+def test_pool_uses_the_requested_worker_count():
+    assert phones._process_pool(2)._max_workers == 2
+    assert phones._process_pool(3)._max_workers == 3
+    assert phones._process_pool(2) is phones._process_pool(2)
+
+
+def test_memo_evicts_least_recently_used():
+    memo = phones._ResultMemo(maxsize=2)
+    memo.put_many([(("1", "US"), ("a", None)), (("2", "US"), ("b", None))])
+    memo.get_many([("1", "US")])
+    memo.put_many([(("3", "US"), ("c", None))])
+    assert memo.get_many([("1", "US"), ("2", "US"), ("3", "US")]) == [("a", None), None, ("c", None)]
@@ -0,0 +1,166 @@
+"""Rollup triggers against aggregating the calls table from scratch"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from callcenter.db import connect
+from callcenter.models import TERMINAL_CALL_STATUSES, CallRecord, CallStatus
+from callcenter.rollups import GRANULARITIES, MEASURES, RollupStore, add_keyword_hits
+from callcenter.store import CallStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "calls.db")
+
+
+@pytest.fixture
+def store(db_path):
+    return CallStore(db_path)
+
+
+def call(call_id: str, start_time: datetime, assistant_id: str = "assistant_1", campaign: str = "spring", **fields):
+    return CallRecord(
+        call_id=call_id, assistant_id=assistant_id, phone_number="+14155550123",
+        start_time=start_time, custom_data={"campaign": campaign} if campaign else {}, **fields
+    )
+
+
+def rollup_rows(conn):
+    """Every non-empty rollup bucket, measures rounded against float drift"""
+    rows = conn.execute(
+        f"SELECT granularity, dimension, key, bucket, {', '.join(MEASURES)} FROM call_rollups WHERE calls != 0"
+    ).fetchall()
+    return {tuple(row[:4]): tuple(round(value, 6) for value in row[4:]) for row in rows}
+
+
+def expected_rows(conn):
+    """The same buckets aggregated straight from the calls"""
+    expected = {}
+    calls = conn.execute("SELECT * FROM calls").fetchall()
+    for row in calls:
+        values = (
+            1,
+            int(row["status"] == "completed"),
+            int(row["status"] == "failed"),
+            int(row["status"] in {status.value for status in TERMINAL_CALL_STATUSES}),
+            row["duration"],
+            row["cost"],
+            int(row["lead_score"] >= 7),
+            row["sentiment_score"],
+        )
+        for granularity, size in GRANULARITIES.items():
+            for dimension, column in (("assistant", "assistant_id"), ("campaign", "campaign")):
+                if not row[column]:
+                    continue
+                key = (granularity, dimension, row[column], int(row["start_time"] // size * size))
+                totals = expected.get(key, (0,) * len(values))
+                expected[key] = tuple(total + value for total, value in zip(totals, values))
+    return {key: tuple(round(value, 6) for value in totals) for key, totals in expected.items()}
+
+
+def test_progressing_calls_are_counted_once(store, db_path):
+    now = datetime.now() - timedelta(minutes=30)
+    store.insert_new([call(f"call_{i}", now + timedelta(seconds=40 * i)) for i in range(6)])
+    store.update_statuses([
+        call("call_0", now, status=CallStatus.CONNECTED),
+        call("call_1", now, status=CallStatus.COMPLETED, duration=120, cost=0.6),
+        call("call_2", now, status=CallStatus.FAILED),
+    ])
+    store.apply_events([{
+        "event_type": "call_ended", "call_id": "call_3", "assistant_id": "assistant_1",
+        "occurred_at": time.time(), "data": {"duration": 80, "cost": 0.4},
+    }])
+    store.update_scores([("call_1", None, 0.7, 8.5, {}), ("call_3", "User: sounds good", -0.5, 3.0, {})])
+    # A late snapshot of a finished call must not be counted again
+    store.upsert([call("call_1", now + timedelta(seconds=40), status=CallStatus.COMPLETED, duration=120,
+                       cost=0.6, sentiment_score=0.7, lead_score=8.5)])
+
+    conn = connect(db_path)
+    assert rollup_rows(conn) == expected_rows(conn)
+    totals = RollupStore(db_path).totals("assistant", now - timedelta(minutes=1))
+    assert totals.loc["assistant_1", "calls"] == 6
+    assert totals.loc["assistant_1", "completed"] == 2
+    assert totals.loc["assistant_1", "finished"] == 3
+    assert totals.loc["assistant_1", "leads"] == 1
+
+
+def test_calls_moving_between_buckets(store, db_path):
+    start = datetime.now().replace(minute=59, second=50, microsecond=0) - timedelta(hours=3)
+    store.upsert([call("call_1", start, status=CallStatus.COMPLETED, duration=60, cost=0.3)])
+    store.upsert([call("call_2", start, assistant_id="assistant_2", campaign="")])
+
+    # Across a minute, hour and day boundary, to another assistant and campaign, then out of any campaign
+    store.upsert([call("call_1", start + timedelta(seconds=20), status=CallStatus.COMPLETED, duration=60, cost=0.3)])
+    store.upsert([call("call_1", start + timedelta(days=1), assistant_id="assistant_2", campaign="autumn",
+                       status=CallStatus.COMPLETED, duration=60, cost=0.3)])
+    store.upsert([call("call_2", start, assistant_id="assistant_1", campaign="autumn")])
+    store.upsert([call("call_2", start, assistant_id="assistant_1", campaign="")])
+
+    conn = connect(db_path)
+    assert rollup_rows(conn) == expected_rows(conn)
+    campaigns = {key for (_, dimension, key, _) in rollup_rows(conn) if dimension == "campaign"}
+    assert campaigns == {"autumn"}
+
+
+def test_deletes_remove_the_call(store, db_path):
+    now = datetime.now() - timedelta(minutes=10)
+    store.upsert([
+        call("call_1", now, status=CallStatus.COMPLETED, duration=30, cost=0.1, lead_score=9.0),
+        call("call_2", now, status=CallStatus.FAILED),
+    ])
+    conn = connect(db_path)
+    conn.execute("DELETE FROM calls WHERE call_id = 'call_1'")
+    assert rollup_rows(conn) == expected_rows(conn)
+    conn.execute("DELETE FROM calls")
+    assert rollup_rows(conn) == {}
+
+
+def test_backfill_matches_the_triggers(store, db_path):
+    now = datetime.now() - timedelta(hours=5)
+    store.upsert([
+        call(f"call_{i}", now + timedelta(minutes=7 * i), assistant_id=f"assistant_{i % 3}",
+             campaign=["spring", "autumn", ""][i % 3], status=CallStatus.COMPLETED if i % 2 else CallStatus.FAILED,
+             duration=10 * i, cost=0.05 * i, lead_score=float(i % 10), sentiment_score=(i % 5 - 2) / 2)
+        for i in range(40)
+    ])
+    conn = connect(db_path)
+    from_triggers = rollup_rows(conn)
+    conn.execute("DROP TABLE call_rollups")
+
+    CallStore(db_path)
+    assert rollup_rows(conn) == from_triggers == expected_rows(conn)
+
+
+def test_prune_keeps_each_granularity_for_its_retention(store, db_path):
+    now = time.time()
+    ages = {"recent": timedelta(hours=1), "old": timedelta(days=3), "ancient": timedelta(days=150)}
+    store.upsert([call(name, datetime.fromtimestamp(now) - age) for name, age in ages.items()])
+    conn = connect(db_path)
+    conn.execute("BEGIN")
+    add_keyword_hits(conn, [
+        ("assistant_1", "buying_signals", "price", now - age.total_seconds(), 1) for age in ages.values()
+    ])
+    conn.execute("COMMIT")
+
+    RollupStore(db_path).prune(now)
+
+    def oldest(table, granularity):
+        return conn.execute(f"SELECT MIN(bucket) FROM {table} WHERE granularity = ?", (granularity,)).fetchone()[0]
+
+    assert oldest("call_rollups", "minute") >= now - timedelta(days=2).total_seconds()
+    assert oldest("call_rollups", "hour") >= now - timedelta(days=100).total_seconds()
+    assert oldest("call_rollups", "day") <= now - timedelta(days=150).total_seconds()
+    assert conn.execute(
+        "SELECT COUNT(*) FROM call_rollups WHERE granularity = 'hour' AND dimension = 'assistant'"
+    ).fetchone()[0] == 2
+    assert oldest("keyword_rollups", "hour") >= now - timedelta(days=100).total_seconds()
+    assert conn.execute("SELECT COUNT(*) FROM keyword_rollups WHERE granularity = 'day'").fetchone()[0] == 3
+
+
+def test_reads_pick_the_finest_retained_granularity():
+    now = datetime(2026, 6, 1, 12)
+    assert RollupStore.granularity_for(now - timedelta(hours=6), now) == "minute"
+    assert RollupStore.granularity_for(now - timedelta(days=30), now) == "hour"
+    assert RollupStore.granularity_for(now - timedelta(days=200), now) == "day"
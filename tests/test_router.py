@@ -0,0 +1,109 @@
+"""Least-loaded routing, per-assistant limits and slot release"""
+import threading
+import time
+
+import pytest
+
+from callcenter.events import CallEndFollower, EventStore
+from callcenter.models import AssistantConfig, AssistantStatus
+from callcenter.router import AssistantRouter
+
+
+def config(assistant_id: str, limit: int = 2, status=AssistantStatus.ACTIVE, success_rate=50.0, max_duration=300):
+    return AssistantConfig(
+        id=assistant_id, name=assistant_id, description="", phone_number="", voice="", language="en",
+        max_duration=max_duration, background_sound="", temperature=0.7, response_speed="normal", custom_prompt="",
+        webhook_url="", sheet_id="", status=status, specialization="Sales", cost_per_minute=0.1,
+        success_rate=success_rate, total_calls=0, total_revenue=0.0, max_concurrent_calls=limit
+    )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def router(clock):
+    router = AssistantRouter(clock=clock)
+    router.update_assistants([config("a", limit=2), config("b", limit=4), config("c", status=AssistantStatus.MAINTENANCE)])
+    return router
+
+
+def test_routes_to_the_least_utilized_assistant(router):
+    routed = [router.route() for _ in range(6)]
+    # b has twice a's limit, so it takes two calls for each of a's
+    assert sorted(routed) == ["a", "a", "b", "b", "b", "b"]
+    assert {row["assistant_id"]: row["in_flight"] for row in router.load()} == {"a": 2, "b": 4}
+
+
+def test_unavailable_and_unknown_assistants_are_never_routed(router):
+    assert router.route(["c"]) is None
+    assert router.route(["unknown"]) is None
+    assert router.status("c") == AssistantStatus.MAINTENANCE
+
+
+def test_capacity_limit_blocks_until_a_slot_frees(router):
+    assert [router.route(["a"]) for _ in range(2)] == ["a", "a"]
+    assert router.route(["a"], timeout=0.05) is None
+    assert router.status("a") == AssistantStatus.BUSY
+
+    routed = []
+    waiter = threading.Thread(target=lambda: routed.append(router.route(["a"], timeout=5)))
+    waiter.start()
+    time.sleep(0.1)
+    router.release("a")
+    waiter.join(5)
+    assert routed == ["a"]
+
+
+def test_preference_breaks_ties_toward_better_assistants(clock):
+    router = AssistantRouter(success_weight=1.0, clock=clock)
+    router.update_assistants([config("weak", success_rate=20.0), config("strong", success_rate=80.0)])
+    assert router.route() == "strong"
+
+
+def test_bound_slots_free_when_the_call_ends(router):
+    router.route(["a"])
+    router.bind("call_1", "a")
+    router.finish_call("call_1")
+    router.finish_call("call_1")
+    assert router.status("a") == AssistantStatus.IDLE
+
+
+def test_bound_slots_expire_after_max_duration(router, clock):
+    for call_id in ("call_1", "call_2"):
+        router.bind(call_id, router.route(["a"]))
+    assert router.route(["a"], timeout=0.01) is None
+    clock.now += 300 + 121
+    assert router.route(["a"], timeout=0.01) == "a"
+
+
+def test_call_end_events_release_slots_without_a_page(router, tmp_path):
+    events = EventStore(str(tmp_path / "calls.db"))
+    follower = CallEndFollower(
+        events, [lambda event: router.finish_call(event["call_id"])], poll_interval=0.01, batch_size=2
+    ).start()
+    try:
+        for call_id in ("call_1", "call_2"):
+            router.bind(call_id, router.route(["a"]))
+        events.append([
+            {"event_type": "transcript", "call_id": "call_1", "data": {"text": "hi"}},
+            {"event_type": "call_ended", "call_id": "call_1", "data": {}},
+            {"event_type": "call_failed", "call_id": "call_2", "data": {}},
+        ])
+        deadline = time.monotonic() + 5
+        while router.status("a") != AssistantStatus.IDLE and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert router.status("a") == AssistantStatus.IDLE
+        assert follower.cursor == events.last_seq()
+    finally:
+        follower.stop()
@@ -0,0 +1,124 @@
+"""Scheduled calls: claiming, settling and bounded dispatch"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from callcenter.dialer import DialSettings
+from callcenter.scheduler import ALL_DAY, CallScheduler, ScheduledDialer
+
+SETTINGS = DialSettings(
+    max_concurrent=2, call_delay=0, max_retries=0,
+    call_window_start=ALL_DAY[0], call_window_end=ALL_DAY[1], weekend_calling=True
+)
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = CallScheduler(str(tmp_path / "calls.db"), poll_interval=0.1)
+    yield scheduler
+    scheduler.stop()
+
+
+def due_now(count: int, repeat: str = "Once"):
+    at = datetime.utcnow() - timedelta(minutes=1)
+    return [
+        {"phone_number": f"+1415555{i:04d}", "assistant_id": "assistant_1", "at": at, "repeat": repeat}
+        for i in range(count)
+    ]
+
+
+def statuses(scheduler: CallScheduler):
+    rows = scheduler._conn.execute("SELECT status, COUNT(*) FROM scheduled_calls GROUP BY status").fetchall()
+    return {status: count for status, count in rows}
+
+
+def test_calls_stay_claimed_until_finished(scheduler):
+    scheduler.schedule_many(due_now(3))
+    jobs = scheduler.pop_due()
+    assert len(jobs) == 3
+    assert scheduler.pop_due() == []
+    assert statuses(scheduler) == {"claimed": 3}
+
+    assert scheduler.finish(jobs[0], placed=True)
+    assert scheduler.finish(jobs[1], placed=False)
+    assert statuses(scheduler) == {"claimed": 1, "dispatched": 1, "failed": 1}
+    # Settling twice is a no-op
+    assert not scheduler.finish(jobs[0], placed=True)
+
+
+def test_recurring_call_moves_on_when_finished(scheduler):
+    scheduler.schedule_many(due_now(1, repeat="Daily"))
+    [job] = scheduler.pop_due()
+    assert scheduler.next_due() is None
+    scheduler.finish(job, placed=True)
+    [upcoming] = scheduler.upcoming()
+    assert upcoming["occurrence"] == 1
+    assert upcoming["due_at"] > datetime.now()
+
+
+def test_claims_of_a_crashed_process_are_released(scheduler, tmp_path):
+    scheduler.schedule_many(due_now(2))
+    assert len(scheduler.pop_due()) == 2
+
+    restarted = CallScheduler(str(tmp_path / "calls.db"), claim_timeout=60)
+    assert restarted.pop_due() == []
+    jobs = restarted.pop_due(now=time.time() + 61)
+    assert len(jobs) == 2
+    assert restarted.stats["reclaimed"] == 2
+    for job in jobs:
+        restarted.finish(job, placed=True)
+    assert statuses(restarted) == {"dispatched": 2}
+
+
+class BlockingManager:
+    """Holds every call until released, tracking how many are open at once"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.open = 0
+        self.peak = 0
+        self.placed = 0
+
+    def initiate_call(self, assistant_id, phone_number, custom_prompt=""):
+        with self.lock:
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+        self.release.wait(10)
+        with self.lock:
+            self.open -= 1
+            self.placed += 1
+            if phone_number.endswith("3"):
+                return {"error": "Invalid number", "retryable": False}
+        return {"success": True, "call_id": f"call_{phone_number}", "estimated_cost": 0.1}
+
+
+def wait_for(condition, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_scheduled_dialer_claims_only_free_slots(scheduler):
+    scheduler.schedule_many(due_now(10))
+    manager = BlockingManager()
+    dialer = ScheduledDialer(manager, scheduler, settings=SETTINGS).start()
+    try:
+        assert wait_for(lambda: manager.open == 2)
+        time.sleep(0.3)
+        # The rest of the backlog waits on disk
+        assert statuses(scheduler) == {"claimed": 2, "pending": 8}
+
+        manager.release.set()
+        assert wait_for(lambda: statuses(scheduler) == {"dispatched": 9, "failed": 1})
+        assert manager.peak == 2
+        assert scheduler.stats["claimed"] == 10
+        assert len(dialer.dialer._workers) == SETTINGS.max_concurrent
+        assert dialer.dialer.is_running
+    finally:
+        dialer.stop()
@@ -0,0 +1,115 @@
+"""Call log search: query translation and the full-text index triggers"""
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from callcenter.db import connect
+from callcenter.models import CallRecord, CallStatus
+from callcenter.store import CallStore, build_search_query
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("refund", '"refund"*'),
+    ("refund policy", '"refund" AND "policy"*'),
+    ("refund* policy", '"refund"* AND "policy"*'),
+    ('"call me back" later', '"call me back" AND "later"*'),
+    ('later "call me back"', '"later" AND "call me back"'),
+    ("0123", '(phone : "0123"* OR "0123"*)'),
+    ("(415) 555-0123", '(phone : "4155550123"* OR "4155550123"*)'),
+    ("+1 415 555 0123 refund", '(phone : "14155550123"* OR "14155550123") AND "refund"*'),
+])
+def test_search_terms(text, expected):
+    assert build_search_query(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    'refund OR 1',
+    'NEAR(refund policy)',
+    'transcript : refund',
+    '"unbalanced phrase',
+    'refund^ -policy {notes}',
+])
+def test_fts_syntax_in_input_is_quoted(text, store):
+    query = build_search_query(text)
+    # Outside the quoted terms only the operators the translation adds are left
+    bare = re.sub(r'"[^"]*"', "", query)
+    assert set(re.findall(r"[^\s*()]+", bare)) <= {"AND", "OR", "phone", ":"}
+    # Whatever was typed, the expression is valid FTS5
+    store.page(search=text)
+
+
+@pytest.mark.parametrize("text", ["", "   ", '""', "*", "--"])
+def test_input_without_words_matches_nothing_to_search(text):
+    assert build_search_query(text) == ""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "calls.db")
+
+
+@pytest.fixture
+def store(db_path):
+    return CallStore(db_path)
+
+
+def call(call_id: str, transcript: str = "", phone_number: str = "+14155550123", **custom_data) -> CallRecord:
+    return CallRecord(
+        call_id=call_id, assistant_id="assistant_1", phone_number=phone_number,
+        start_time=datetime.now() - timedelta(minutes=5), status=CallStatus.COMPLETED,
+        transcript=transcript, custom_data=custom_data
+    )
+
+
+def found(store: CallStore, text: str):
+    return sorted(record.call_id for record in store.page(search=text))
+
+
+def test_search_finds_each_indexed_column(store):
+    store.upsert([
+        call("call_1", "User: what is your refund policy"),
+        call("call_2", phone_number="+1 (212) 555-0199", notes="asked about pricing"),
+        call("call_3", campaign="spring renewal"),
+    ])
+    assert found(store, "refund") == ["call_1"]
+    assert found(store, "pricing") == ["call_2"]
+    assert found(store, "555-0199") == ["call_2"]
+    assert found(store, "0199") == ["call_2"]
+    assert found(store, "renew") == ["call_3"]
+    assert found(store, '"refund policy"') == ["call_1"]
+    assert found(store, '"policy refund"') == []
+
+
+def test_index_follows_updates(store):
+    store.upsert([call("call_1", "User: I want a refund", notes="angry")])
+    store.upsert([call("call_1", "User: book me a demo", notes="calm")])
+    assert found(store, "refund") == []
+    assert found(store, "angry") == []
+    assert found(store, "demo") == ["call_1"]
+    assert found(store, "calm") == ["call_1"]
+
+    # Score writes leave the indexed values alone and keep the row searchable
+    store.update_scores([("call_1", None, 0.4, 6.0, {"demo": 1})])
+    assert found(store, "demo") == ["call_1"]
+
+    store.update_scores([("call_1", "User: cancel my plan", 0.1, 2.0, {})])
+    assert found(store, "demo") == []
+    assert found(store, "cancel") == ["call_1"]
+
+
+def test_index_follows_deletes(store, db_path):
+    store.upsert([call("call_1", "User: refund please"), call("call_2", "User: refund now")])
+    conn = connect(db_path)
+    conn.execute("DELETE FROM calls WHERE call_id = 'call_1'")
+    assert found(store, "refund") == ["call_2"]
+    fts_rows = conn.execute("SELECT COUNT(*) FROM calls_fts").fetchone()[0]
+    assert fts_rows == 1
+
+
+def test_rebuild_matches_the_triggers(store):
+    store.upsert([call("call_1", "User: refund please", notes="vip"), call("call_2", campaign="spring")])
+    store.upsert([call("call_1", "User: book a demo", notes="vip")])
+    before = {text: found(store, text) for text in ("refund", "demo", "vip", "spring", "0123")}
+    store.rebuild_search_index()
+    assert {text: found(store, text) for text in before} == before
@@ -0,0 +1,121 @@
+"""SheetWriter outbox: batching, retries and dead letters"""
+import time
+from datetime import datetime
+
+import pytest
+import requests
+
+from callcenter.models import CallRecord, CallStatus
+from callcenter.sheet_writer import SheetWriter
+
+
+def http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+class FakeSheetsBackend:
+    """Appends to in-memory sheets, failing sheets listed in ``errors``"""
+
+    def __init__(self):
+        self.sheets = {}
+        self.errors = {}
+
+    def append_rows(self, sheet_id: str, rows):
+        if sheet_id in self.errors:
+            raise self.errors[sheet_id]
+        self.sheets.setdefault(sheet_id, []).extend(rows)
+
+
+def records(count: int, start: int = 0):
+    return [
+        CallRecord(
+            call_id=f"call_{i}", assistant_id="assistant_1", phone_number="+14155550123",
+            start_time=datetime.now(), status=CallStatus.COMPLETED, duration=60
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def backend():
+    return FakeSheetsBackend()
+
+
+@pytest.fixture
+def writer(backend, tmp_path):
+    return SheetWriter(backend, path=str(tmp_path / "calls.db"), max_pending=5)
+
+
+def test_rows_are_batched_per_sheet_and_deduplicated(writer, backend):
+    assert writer.submit("sheet_1", records(3)) == 3
+    assert writer.submit("sheet_1", records(3)) == 0
+    assert writer.submit("sheet_2", records(1)) == 1
+    assert writer.flush() == 4
+    assert [row[0] for row in backend.sheets["sheet_1"]] == ["call_0", "call_1", "call_2"]
+    assert writer.pending == 0
+    assert writer.stats["batches"] == 2
+
+
+def test_permission_errors_are_dead_lettered(writer, backend):
+    backend.errors["sheet_1"] = http_error(403)
+    writer.submit("sheet_1", records(3))
+    writer.submit("sheet_2", records(1))
+
+    assert writer.flush() == 1
+    assert writer.pending == 0
+    assert "sheet_1" not in writer._backoff
+    letters = writer.dead_letters()
+    assert sorted(letter["call_id"] for letter in letters) == ["call_0", "call_1", "call_2"]
+    assert all("403" in letter["error"] for letter in letters)
+    # The outbox has room again
+    assert writer.submit("sheet_2", records(5, start=10), timeout=0) == 5
+
+    del backend.errors["sheet_1"]
+    assert writer.requeue_dead_letters("sheet_1") == 3
+    assert writer.dead_letters() == []
+    writer.flush()
+    assert len(backend.sheets["sheet_1"]) == 3
+
+
+def test_quota_errors_back_off_and_stay_queued(writer, backend):
+    backend.errors["sheet_1"] = http_error(429)
+    writer.submit("sheet_1", records(2))
+    assert writer.flush() == 0
+    assert writer.pending == 2
+    assert writer.dead_letters() == []
+    assert writer._backoff["sheet_1"][0] == 1
+
+    del backend.errors["sheet_1"]
+    # Still backing off
+    assert writer.flush() == 0
+    writer._backoff["sheet_1"] = (1, 0.0)
+    assert writer.flush() == 2
+
+
+def test_submit_never_waits_on_a_full_outbox_without_a_timeout(writer):
+    writer.submit("sheet_1", records(5))
+    started = time.monotonic()
+    assert writer.submit("sheet_1", records(2, start=5), timeout=0) == 0
+    assert time.monotonic() - started < 0.5
+    assert writer.pending == 5
+    assert [letter["error"] for letter in writer.dead_letters()] == ["Sheet outbox full"] * 2
+
+
+def test_background_flusher_drains_while_a_sheet_is_dead(backend, tmp_path):
+    backend.errors["sheet_1"] = http_error(404)
+    writer = SheetWriter(backend, path=str(tmp_path / "calls.db"), batch_size=2, flush_interval=0.05, max_pending=4)
+    writer.start()
+    try:
+        for start in range(0, 12, 2):
+            assert writer.submit("sheet_1", records(2, start=start), timeout=2) == 2
+        writer.submit("sheet_2", records(1), timeout=2)
+        deadline = time.monotonic() + 5
+        while writer.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert writer.pending == 0
+        assert len(writer.dead_letters(sheet_id="sheet_1")) == 12
+        assert len(backend.sheets["sheet_2"]) == 1
+    finally:
+        writer.stop()
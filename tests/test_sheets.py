@@ -0,0 +1,200 @@
+"""SheetCache and GoogleSheetsManager against an in-memory Sheets backend"""
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from callcenter.models import AssistantConfig, AssistantStatus, CallRecord, CallStatus
+from callcenter.sheets import CALL_LOG_COLUMNS, GoogleSheetsManager, SheetCache, record_to_sheet_row
+
+
+class FakeSheetsBackend:
+    """Sheets as lists of string rows, with a revision bumped on every change"""
+
+    def __init__(self):
+        self.sheets = {}
+        self.revisions = {}
+        self.calls = []
+        self.fail = False
+        self.delay = 0.0
+
+    def _bump(self, sheet_id: str):
+        self.revisions[sheet_id] = self.revisions.get(sheet_id, 0) + 1
+
+    def revision(self, sheet_id: str) -> str:
+        self.calls.append(("revision", sheet_id))
+        if self.fail:
+            raise ConnectionError("Sheets unavailable")
+        return str(self.revisions.get(sheet_id, 0))
+
+    def read_rows(self, sheet_id: str, first_row: int):
+        self.calls.append(("read_rows", sheet_id, first_row))
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("Sheets unavailable")
+        return [list(row) for row in self.sheets.get(sheet_id, [])[first_row - 1:]]
+
+    def append_rows(self, sheet_id: str, rows):
+        sheet = self.sheets.setdefault(sheet_id, [])
+        if not sheet:
+            sheet.append(list(CALL_LOG_COLUMNS))
+        sheet.extend([str(value) for value in row] for row in rows)
+        self._bump(sheet_id)
+
+    def edit(self, sheet_id: str, row: int, column: int, value: str):
+        self.sheets[sheet_id][row - 1][column] = value
+        self._bump(sheet_id)
+
+    def reads(self):
+        return [call for call in self.calls if call[0] == "read_rows"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def call_row(index: int, status: CallStatus = CallStatus.COMPLETED, lead_score: float = 8.0):
+    record = CallRecord(
+        call_id=f"call_{index}", assistant_id="assistant_1", phone_number="+14155550123",
+        start_time=datetime.now(), status=status, duration=120, cost=0.5, lead_score=lead_score,
+        sentiment_score=0.6, custom_data={"campaign": "spring"}
+    )
+    return record_to_sheet_row(record, agent="Sales")
+
+
+@pytest.fixture
+def backend():
+    backend = FakeSheetsBackend()
+    backend.append_rows("sheet_1", [call_row(i) for i in range(3)])
+    return backend
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(backend, clock):
+    return SheetCache(backend, ttl=30, full_refresh_interval=900, clock=clock)
+
+
+def test_reads_are_served_from_memory_within_ttl(cache, backend, clock):
+    frame, version = cache.get("sheet_1")
+    assert list(frame["Call ID"]) == ["call_0", "call_1", "call_2"]
+    assert frame["Duration"].dtype.kind in "if"
+
+    clock.now += 29
+    assert cache.get("sheet_1") == (frame, version)
+    assert len(backend.calls) == 2
+    assert cache.stats["hits"] == 1
+
+
+def test_unchanged_revision_skips_the_read(cache, backend, clock):
+    _, version = cache.get("sheet_1")
+    clock.now += 31
+    assert cache.get("sheet_1")[1] == version
+    assert len(backend.reads()) == 1
+    assert cache.stats["revision_checks"] == 1
+
+
+def test_appended_rows_are_read_incrementally(cache, backend, clock):
+    _, version = cache.get("sheet_1")
+    backend.append_rows("sheet_1", [call_row(3), call_row(4)])
+    clock.now += 31
+
+    frame, new_version = cache.get("sheet_1")
+    assert new_version != version
+    assert list(frame["Call ID"]) == [f"call_{i}" for i in range(5)]
+    # Header plus three rows were cached, so the read starts at the last known row
+    assert backend.reads()[-1] == ("read_rows", "sheet_1", 4)
+    assert cache.stats["incremental_reads"] == 1
+    assert cache.stats["full_reads"] == 1
+
+
+def test_edits_above_the_end_reload_the_sheet(cache, backend, clock):
+    cache.get("sheet_1")
+    backend.edit("sheet_1", 4, 4, "Failed")
+    clock.now += 31
+    frame, _ = cache.get("sheet_1")
+    assert list(frame["Status"]) == ["Completed", "Completed", "Failed"]
+    assert cache.stats["full_reads"] == 2
+
+    backend.edit("sheet_1", 2, 4, "Busy")
+    clock.now += 31
+    frame, _ = cache.get("sheet_1")
+    assert frame["Status"].iloc[0] == "Busy"
+    assert cache.stats["full_reads"] == 3
+
+
+def test_full_refresh_interval_forces_a_reload(cache, backend, clock):
+    cache.get("sheet_1")
+    clock.now += 901
+    cache.get("sheet_1")
+    assert cache.stats["full_reads"] == 2
+    assert cache.stats["revision_checks"] == 0
+
+
+def test_failures_serve_the_cached_copy(cache, backend, clock):
+    frame, version = cache.get("sheet_1")
+    backend.fail = True
+    clock.now += 31
+    assert cache.get("sheet_1") == (frame, version)
+    assert cache.stats["errors"] == 1
+    with pytest.raises(ConnectionError):
+        cache.get("sheet_2")
+
+
+def test_concurrent_readers_share_one_fetch(cache, backend):
+    backend.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("sheet_1")[1])) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 1
+    assert len(backend.reads()) == 1
+
+
+def assistant_config() -> AssistantConfig:
+    return AssistantConfig(
+        id="assistant_1", name="Sales", description="", phone_number="", voice="", language="en",
+        max_duration=600, background_sound="", temperature=0.7, response_speed="normal", custom_prompt="",
+        webhook_url="", sheet_id="sheet_1", status=AssistantStatus.ACTIVE, specialization="Sales",
+        cost_per_minute=0.1, success_rate=50.0, total_calls=0, total_revenue=1000.0
+    )
+
+
+def test_manager_computes_metrics_once_per_sheet_version(backend):
+    backend.append_rows("sheet_1", [call_row(3, CallStatus.FAILED, lead_score=2.0)])
+    manager = GoogleSheetsManager("", backend=backend, ttl=0)
+    config = assistant_config()
+
+    metrics, call_log = manager.get_sheet_data("sheet_1", config)
+    assert len(call_log) == 4
+    assert metrics["calls_today"] == 4
+    assert metrics["success_rate"] == 75.0
+    assert metrics["leads_generated"] == 3
+    assert metrics["sentiment_positive"] == 100.0
+    assert metrics["total_revenue"] == 1000.0
+
+    assert manager.get_sheet_data("sheet_1", config)[0] is metrics
+    backend.append_rows("sheet_1", [call_row(4)])
+    metrics, call_log = manager.get_sheet_data("sheet_1", config)
+    assert len(call_log) == 5
+    assert metrics["calls_today"] == 5
+
+
+def test_manager_falls_back_to_simulated_data(backend):
+    backend.fail = True
+    manager = GoogleSheetsManager("", backend=backend)
+    metrics, call_log = manager.get_sheet_data("sheet_1", assistant_config())
+    assert len(call_log) == 50
+    assert set(CALL_LOG_COLUMNS) <= set(call_log.columns)
+    assert metrics["peak_hours"] == [9, 10, 11, 14, 15, 16]
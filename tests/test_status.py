@@ -0,0 +1,77 @@
+"""CallStatusPoller: inclusive paging, the bounded cache and background passes"""
+import time
+
+from callcenter.status import CallStatusPoller
+
+
+def status(call_id: str, updated_at: str, state: str = "in-progress", ended: bool = False):
+    return {"call_id": call_id, "status": state, "duration": 0, "cost": 0.0, "updated_at": updated_at, "ended": ended}
+
+
+class FakeVAPIManager:
+    """Serves ``calls`` like VAPI's list endpoint: updated at or after the bound, oldest first"""
+
+    def __init__(self, calls=()):
+        self.calls = list(calls)
+        self.requests = []
+
+    def list_calls(self, updated_since: str = "", limit: int = 1000):
+        self.requests.append(updated_since)
+        matching = sorted((call for call in self.calls if call["updated_at"] >= updated_since), key=lambda call: call["updated_at"])
+        return {"calls": matching[:limit]}
+
+
+def test_calls_tied_at_a_page_boundary_are_not_skipped():
+    # Five calls placed by one bulk campaign share an update time that straddles the page edge
+    calls = [status(f"call_{i}", "2026-01-01T10:00:00.000Z") for i in range(5)] + [
+        status("call_5", "2026-01-01T10:00:01.000Z")
+    ]
+    manager = FakeVAPIManager(calls)
+    poller = CallStatusPoller(manager, page_size=3)
+    poller._updated_since = "2026-01-01T09:00:00.000Z"
+
+    result = poller.refresh()
+    changes, cursor = poller.changes_since(0)
+    assert sorted(change["call_id"] for change in changes) == [f"call_{i}" for i in range(6)]
+    assert result["changed"] == 6
+
+    # Nothing new: the boundary call comes back from the inclusive bound but isn't counted again
+    assert poller.refresh()["changed"] == 0
+    assert poller.changes_since(cursor) == ([], cursor)
+
+
+def test_more_ties_than_a_page_are_read_by_widening_the_page():
+    manager = FakeVAPIManager([status(f"call_{i}", "2026-01-01T10:00:00.000Z") for i in range(4)])
+    poller = CallStatusPoller(manager, page_size=2, max_pages=10)
+    poller._updated_since = "2026-01-01T09:00:00.000Z"
+    assert poller.refresh()["changed"] == 4
+    assert len(manager.requests) == 3
+
+
+def test_the_cache_keeps_only_the_most_recently_changed_calls():
+    manager = FakeVAPIManager([status(f"call_{i}", f"2026-01-01T10:00:{i:02d}.000Z") for i in range(10)])
+    poller = CallStatusPoller(manager, max_tracked=4)
+    poller._updated_since = "2026-01-01T09:00:00.000Z"
+    poller.refresh()
+    assert sorted(poller._statuses) == ["call_6", "call_7", "call_8", "call_9"]
+    assert list(poller._changes) == ["call_6", "call_7", "call_8", "call_9"]
+    changes, _ = poller.changes_since(0)
+    assert [change["call_id"] for change in changes] == ["call_6", "call_7", "call_8", "call_9"]
+
+
+def test_background_passes_run_only_while_someone_reads():
+    manager = FakeVAPIManager([status("call_1", "2026-01-01T10:00:00.000Z")])
+    poller = CallStatusPoller(manager)
+    poller._updated_since = "2026-01-01T09:00:00.000Z"
+    poller.start(interval=0.01, idle_timeout=60)
+    try:
+        time.sleep(0.1)
+        assert manager.requests == []
+
+        poller.changes_since(0)
+        deadline = time.monotonic() + 5
+        while not poller.changes_since(0)[0] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [change["call_id"] for change in poller.changes_since(0)[0]] == ["call_1"]
+    finally:
+        poller.stop()
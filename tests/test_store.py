@@ -0,0 +1,150 @@
+"""CallStore writes racing the webhook receiver and the transcript pipeline"""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from callcenter.dialer import BulkDialer, DialJob, DialSettings
+from callcenter.models import CallRecord, CallStatus
+from callcenter.rollups import RollupStore
+from callcenter.sheet_writer import SheetWriter
+from callcenter.store import CallStore
+from callcenter.transcripts import TranscriptPipeline
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "calls.db")
+
+
+@pytest.fixture
+def store(db_path):
+    return CallStore(db_path)
+
+
+def placed(call_id: str, start_time: datetime) -> CallRecord:
+    """The record a dialer holds right after VAPI accepted the call"""
+    return CallRecord(
+        call_id=call_id, assistant_id="assistant_1", phone_number="+14155550123",
+        start_time=start_time, status=CallStatus.INITIATED, custom_data={"campaign": "spring"}
+    )
+
+
+def ended(call_id: str, occurred_at: float) -> dict:
+    return {
+        "event_type": "call_ended", "call_id": call_id, "assistant_id": "assistant_1", "occurred_at": occurred_at,
+        "data": {"duration": 95, "cost": 0.42, "transcript": "User: sounds great"},
+    }
+
+
+def completed_calls(db_path: str) -> float:
+    totals = RollupStore(db_path).totals("assistant", datetime.now() - timedelta(hours=1))
+    return float(totals["completed"].sum())
+
+
+def test_late_placement_snapshot_keeps_finished_call(store, db_path):
+    start = datetime.now() - timedelta(minutes=5)
+    assert store.insert_new([placed("call_1", start)]) == 1
+    store.apply_events([ended("call_1", time.time())])
+    store.update_scores([("call_1", "User: sounds great", 0.6, 8.0, {"sounds great": 1})])
+
+    # The dialer's records are only drained on a later rerun
+    assert store.insert_new([placed("call_1", start)]) == 0
+    call = store.get("call_1")
+    assert call.status == CallStatus.COMPLETED
+    assert (call.duration, call.cost, call.lead_score) == (95, 0.42, 8.0)
+    assert call.end_time is not None
+    assert call.custom_data["keyword_hits"] == {"sounds great": 1}
+    assert completed_calls(db_path) == 1
+
+
+def test_webhook_before_placement_is_kept(store):
+    store.apply_events([ended("call_1", time.time())])
+    store.insert_new([placed("call_1", datetime.now() - timedelta(minutes=5))])
+    assert store.get("call_1").status == CallStatus.COMPLETED
+
+
+def test_status_updates_never_reopen_finished_calls(store, db_path):
+    store.insert_new([placed("call_1", datetime.now() - timedelta(minutes=5))])
+    store.apply_events([ended("call_1", time.time())])
+
+    stale = placed("call_1", datetime.now())
+    stale.status = CallStatus.CONNECTED
+    assert store.update_statuses([stale]) == 0
+    assert store.get("call_1").status == CallStatus.COMPLETED
+
+    # A later terminal status applies, but its zero duration and cost don't erase the known ones
+    stale.status = CallStatus.FAILED
+    assert store.update_statuses([stale]) == 1
+    call = store.get("call_1")
+    assert call.status == CallStatus.FAILED
+    assert (call.duration, call.cost, call.transcript) == (95, 0.42, "User: sounds great")
+    assert completed_calls(db_path) == 0
+
+
+def test_status_updates_advance_calls_in_progress(store):
+    store.insert_new([placed("call_1", datetime.now() - timedelta(minutes=5))])
+    update = placed("call_1", datetime.now())
+    update.status, update.duration, update.cost, update.end_time = CallStatus.COMPLETED, 60, 0.3, datetime.now()
+    assert store.update_statuses([update]) == 1
+    call = store.get("call_1")
+    assert (call.status, call.duration, call.cost) == (CallStatus.COMPLETED, 60, 0.3)
+    assert call.end_time is not None
+
+
+def test_status_sync_after_scoring_keeps_scores(store):
+    session_call = placed("call_1", datetime.now() - timedelta(minutes=5))
+    store.insert_new([session_call])
+    pipeline = TranscriptPipeline(store, workers=1).start()
+    pipeline.submit([ended("call_1", time.time())])
+    pipeline.stop()
+    scored = store.get("call_1")
+    assert scored.transcript == "User: sounds great"
+    assert scored.custom_data["keyword_hits"] == {"sounds great": 1}
+
+    # The session's copy never saw the transcript; syncing its status mustn't erase it
+    session_call.status, session_call.duration, session_call.cost = CallStatus.COMPLETED, 95, 0.42
+    session_call.end_time = datetime.now()
+    assert store.update_statuses([session_call]) == 1
+    call = store.get("call_1")
+    assert call.status == CallStatus.COMPLETED
+    assert call.transcript == "User: sounds great"
+    assert (call.sentiment_score, call.lead_score) == (scored.sentiment_score, scored.lead_score)
+    assert call.lead_score > 5
+    assert call.custom_data["keyword_hits"] == {"sounds great": 1}
+
+
+class PlacingManager:
+    def initiate_call(self, assistant_id, phone_number, custom_prompt=""):
+        record = placed(f"call_{phone_number[-1]}", datetime.now())
+        return {"success": True, "call_id": record.call_id, "estimated_cost": 0.1, "call_record": record}
+
+
+def test_bulk_dialer_stores_calls_as_it_places_them(store):
+    settings = DialSettings(
+        max_concurrent=2, call_delay=0, weekend_calling=True,
+        call_window_start=datetime.min.time(), call_window_end=datetime.max.time()
+    )
+    jobs = [DialJob(f"+1415555012{i}", "assistant_1", contact={"name": f"contact {i}"}) for i in range(3)]
+    dialer = BulkDialer(PlacingManager(), jobs, settings, call_store=store).start()
+    assert dialer.join(timeout=10)
+    stored = store.get_many([f"call_{i}" for i in range(3)])
+    assert len(stored) == 3
+    assert stored["call_2"].custom_data["name"] == "contact 2"
+
+
+def test_data_version_tracks_only_call_writes(store, db_path):
+    version = store.data_version()
+    store.insert_new([placed("call_1", datetime.now())])
+    assert store.data_version() > version
+
+    # Another process writing to the calls table
+    version = store.data_version()
+    CallStore(db_path).apply_events([ended("call_1", time.time())])
+    assert store.data_version() > version
+
+    # Commits to the other tables sharing the file leave it alone
+    version = store.data_version()
+    SheetWriter(object(), path=db_path).submit("sheet_1", [placed("call_2", datetime.now())])
+    assert store.insert_new([placed("call_1", datetime.now())]) == 0
+    assert store.data_version() == version
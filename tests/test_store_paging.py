@@ -0,0 +1,70 @@
+"""Keyset paging through the call store"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from callcenter.models import CallRecord, CallStatus
+from callcenter.store import CallStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CallStore(str(tmp_path / "calls.db"))
+    now = datetime.now().replace(microsecond=0)
+    # Calls placed by a bulk campaign share start times, so paging has to break ties
+    store.upsert([
+        CallRecord(
+            call_id=f"call_{i:02d}", assistant_id="assistant_1" if i % 2 else "assistant_2",
+            phone_number="+14155550123", start_time=now - timedelta(minutes=i // 4),
+            status=CallStatus.COMPLETED, duration=60
+        )
+        for i in range(23)
+    ])
+    return store
+
+
+def walk(store: CallStore, page_size: int, **filters):
+    pages, cursor = [], None
+    while True:
+        page, cursor = store.query_page(page_size, before=cursor, **filters)
+        pages.append([call.call_id for call in page])
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_every_call_once(store):
+    pages = walk(store, 5)
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    seen = [call_id for page in pages for call_id in page]
+    assert sorted(seen) == [f"call_{i:02d}" for i in range(23)]
+    assert seen == [call.call_id for call in store.page(limit=100)]
+
+
+def test_an_exactly_full_last_page_has_no_cursor(store):
+    pages = walk(store, 23)
+    assert [len(page) for page in pages] == [23]
+
+
+def test_paging_applies_filters(store):
+    pages = walk(store, 4, assistant_ids=["assistant_1"])
+    seen = [call_id for page in pages for call_id in page]
+    assert sorted(seen) == [f"call_{i:02d}" for i in range(1, 23, 2)]
+
+
+def test_calls_arriving_while_paging_do_not_shift_later_pages(store):
+    first, cursor = store.query_page(5)
+    store.upsert([
+        CallRecord(
+            call_id="call_new", assistant_id="assistant_1", phone_number="+14155550123",
+            start_time=datetime.now() + timedelta(minutes=1), status=CallStatus.INITIATED
+        )
+    ])
+    second, _ = store.query_page(5, before=cursor)
+    assert not {call.call_id for call in first} & {call.call_id for call in second}
+    assert second[0].call_id == [call.call_id for call in store.page(limit=100)][6]
+
+
+def test_columnar_pages(store):
+    page, cursor = store.query_page(10, columnar=True)
+    assert len(page) == 10
+    assert cursor is not None
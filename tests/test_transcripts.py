@@ -0,0 +1,131 @@
+"""TranscriptPipeline: streamed scores match a full rescore of the same transcript"""
+import time
+from datetime import datetime
+
+import pytest
+
+from callcenter.models import CallRecord, CallStatus
+from callcenter.store import CallStore
+from callcenter.transcripts import TranscriptPipeline, score_transcript, split_transcript
+
+CONVERSATIONS = {
+    "call_1": [
+        ("assistant", "Hi, this is Sam from Acme. Do you have a minute?"),
+        ("user", "Sure, I'm interested but it sounds too expensive"),
+        ("assistant", "We have a free trial."),
+        ("user", "That's great, really helpful. How much after the trial?"),
+        ("user", "Okay, sign me up"),
+    ],
+    "call_2": [
+        ("assistant", "Hello!"),
+        ("user", "Not interested. Please remove me, this is not good"),
+        ("user", "I'm really frustrated, stop calling"),
+    ],
+    "call_3": [("user", "thank you, that sounds good")] * 6,
+}
+
+
+def transcript_of(utterances) -> str:
+    return "\n".join(f"{'User' if role == 'user' else 'AI'}: {text}" for role, text in utterances)
+
+
+def event(event_type: str, call_id: str, **data):
+    return {"event_type": event_type, "call_id": call_id, "assistant_id": "assistant_1", "occurred_at": time.time(), "data": data}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CallStore(str(tmp_path / "calls.db"))
+    store.upsert([
+        CallRecord(call_id=call_id, assistant_id="assistant_1", phone_number="+14155550123",
+                   start_time=datetime.now(), status=CallStatus.CONNECTED)
+        for call_id in list(CONVERSATIONS) + ["call_4"]
+    ])
+    return store
+
+
+def test_streamed_scores_match_a_full_rescore(store):
+    # Small batches, so every call's scores are written several times before it ends
+    pipeline = TranscriptPipeline(store, workers=2, batch_size=2, flush_interval=0.01).start()
+    try:
+        longest = max(len(utterances) for utterances in CONVERSATIONS.values())
+        for turn in range(longest):
+            pipeline.submit([
+                event("transcript", call_id, role=utterances[turn][0], text=utterances[turn][1])
+                for call_id, utterances in CONVERSATIONS.items() if turn < len(utterances)
+            ])
+            time.sleep(0.02)
+        pipeline.submit([event("call_ended", call_id) for call_id in CONVERSATIONS])
+    finally:
+        pipeline.stop()
+
+    assert pipeline.stats["batches"] > len(CONVERSATIONS)
+    assert pipeline.stats["calls_finished"] == len(CONVERSATIONS)
+    stored = store.get_many(CONVERSATIONS)
+    for call_id, utterances in CONVERSATIONS.items():
+        rescored = score_transcript(call_id, transcript_of(utterances))
+        call = stored[call_id]
+        assert call.transcript == transcript_of(utterances)
+        assert call.sentiment_score == pytest.approx(rescored.sentiment_score)
+        assert call.lead_score == rescored.lead_score
+        assert call.custom_data["keyword_hits"] == rescored.keyword_hits
+
+
+def test_a_report_without_streamed_utterances_is_scored_whole(store):
+    transcript = transcript_of(CONVERSATIONS["call_1"])
+    pipeline = TranscriptPipeline(store, workers=1).start()
+    try:
+        pipeline.submit([event("call_ended", "call_4", transcript=transcript)])
+    finally:
+        pipeline.stop()
+    call = store.get_many(["call_4"])["call_4"]
+    rescored = score_transcript("call_4", transcript)
+    assert (call.transcript, call.lead_score) == (transcript, rescored.lead_score)
+    assert call.sentiment_score == pytest.approx(rescored.sentiment_score)
+
+
+def test_scores_depend_on_the_customer_only():
+    state = score_transcript("call_1", transcript_of(CONVERSATIONS["call_1"]))
+    assert state.customer_utterances == 3
+    # The assistant's "free trial" is not a buying signal
+    assert state.signals == {"buying_intent": 3, "objection": 1, "positive": 1}
+    assert 0 < state.sentiment_score < 1
+    assert 0 <= state.lead_score <= 10
+    negative = score_transcript("call_2", transcript_of(CONVERSATIONS["call_2"]))
+    assert negative.sentiment_score < 0 < state.sentiment_score
+    assert negative.lead_score < state.lead_score
+    # Repeated signals stop counting after MAX_SIGNAL_HITS
+    assert score_transcript("call_3", transcript_of(CONVERSATIONS["call_3"])).lead_score <= 10
+
+
+def test_wrapped_lines_join_the_previous_utterance():
+    assert split_transcript("AI: Hello\nthere\nUser: hi\n\nCustomer: bye") == [
+        ("assistant", "Hello there"), ("user", "hi"), ("user", "bye"),
+    ]
+
+
+def test_score_writes_leave_the_transcript_and_search_index_alone(store):
+    statements = []
+    store._conn.set_trace_callback(statements.append)
+    store.update_scores([("call_1", None, 0.4, 6.5, {"demo": 1})])
+    assert not [statement for statement in statements if "calls_fts" in statement]
+    call = store.get_many(["call_1"])["call_1"]
+    assert (call.transcript, call.lead_score, call.custom_data["keyword_hits"]) == ("", 6.5, {"demo": 1})
+
+    store.update_scores([("call_1", "User: book a demo", 0.4, 6.5, {"demo": 1})])
+    assert [statement for statement in statements if "calls_fts" in statement]
+    store._conn.set_trace_callback(None)
+    assert [call.call_id for call in store.page(search="demo")] == ["call_1"]
+
+
+def test_transcripts_are_written_when_calls_end_or_go_idle(store):
+    pipeline = TranscriptPipeline(store, workers=1, flush_interval=0.01)
+    worker = pipeline._workers[0]
+    pipeline._process([event("transcript", "call_1", role="user", text="sounds great")], worker.states)
+    call = store.get_many(["call_1"])["call_1"]
+    assert call.transcript == "" and call.lead_score > 5
+
+    pipeline.idle_timeout = 0
+    pipeline._evict_idle(worker.states)
+    assert worker.states == {}
+    assert store.get_many(["call_1"])["call_1"].transcript == "User: sounds great"
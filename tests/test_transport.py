@@ -0,0 +1,205 @@
+"""PooledTransport, VAPIManager and BulkDialer against a local fake VAPI server"""
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from callcenter import transport
+from callcenter.dialer import BulkDialer, DialJob, DialSettings
+from callcenter.transport import PooledTransport, RetryBudget
+from callcenter.vapi import VAPIManager
+
+
+class FakeVAPI(ThreadingHTTPServer):
+    """Answers with scripted ``(status, body)`` responses, then 200s, recording every request"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeVAPIHandler)
+        self.script = []
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def next_response(self, method: str, path: str, client_port: int):
+        with self.lock:
+            self.requests.append((method, path, client_port))
+            return self.script.pop(0) if self.script else (200, {"id": f"call_{len(self.requests)}"})
+
+
+class FakeVAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        status, body = self.server.next_response(self.command, self.path, self.client_address[1])
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    fake = FakeVAPI()
+    thread = threading.Thread(target=fake.serve_forever, daemon=True)
+    thread.start()
+    yield fake
+    fake.shutdown()
+    fake.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays requested by the transport, without actually sleeping"""
+    delays = []
+    monkeypatch.setattr(transport.time, "sleep", delays.append)
+    return delays
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    pooled = PooledTransport()
+    for _ in range(20):
+        assert pooled.request("GET", f"{server.url}/call", endpoint="/call").status_code == 200
+    assert len({port for _, _, port in server.requests}) == 1
+    assert pooled.latency_stats()["GET /call"]["count"] == 20
+
+
+def test_concurrent_requests_stay_within_pool_size(server):
+    pooled = PooledTransport(pool_maxsize=2)
+    threads = [
+        threading.Thread(target=lambda: [pooled.request("GET", f"{server.url}/call") for _ in range(5)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(server.requests) == 40
+    assert len({port for _, _, port in server.requests}) <= 2
+
+
+def test_idempotent_request_retried_through_transient_errors(server, sleeps):
+    server.script = [(503, {}), (502, {})]
+    response = PooledTransport(max_retries=2).request("GET", f"{server.url}/call/abc")
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_post_not_retried_on_server_error(server, sleeps):
+    server.script = [(503, {})]
+    response = PooledTransport().request("POST", f"{server.url}/call", json={})
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+    assert sleeps == []
+
+
+def test_post_retried_when_rate_limited(server, sleeps):
+    server.script = [(429, {})]
+    response = PooledTransport().request("POST", f"{server.url}/call", json={})
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+
+
+def test_backoff_is_full_jitter_exponential(server, sleeps, monkeypatch):
+    # Jitter at its upper bound exposes the exponential schedule
+    monkeypatch.setattr(transport.random, "uniform", lambda low, high: high)
+    server.script = [(503, {})] * 3
+    PooledTransport(max_retries=3, backoff_factor=0.25).request("GET", f"{server.url}/call")
+    assert sleeps == [0.25, 0.5, 1.0]
+
+
+def test_retry_budget_caps_retries(server, sleeps):
+    budget = RetryBudget(ratio=0.0, min_tokens=1.0)
+    pooled = PooledTransport(max_retries=2, retry_budget=budget)
+    server.script = [(503, {})] * 10
+    assert pooled.request("GET", f"{server.url}/call").status_code == 503
+    # The single token paid for one retry; the next request gets none
+    assert len(server.requests) == 2
+    assert pooled.request("GET", f"{server.url}/call").status_code == 503
+    assert len(server.requests) == 3
+    assert budget.tokens < 1
+
+
+def test_retry_budget_refills_with_traffic():
+    budget = RetryBudget(ratio=0.5, min_tokens=0.0, max_tokens=1.0)
+    assert not budget.try_spend()
+    budget.deposit()
+    budget.deposit()
+    budget.deposit()
+    assert budget.tokens == 1.0
+    assert budget.try_spend()
+
+
+def test_connection_errors_raise_after_retries(sleeps):
+    closed = ThreadingHTTPServer(("127.0.0.1", 0), FakeVAPIHandler)
+    url = f"http://127.0.0.1:{closed.server_address[1]}/call"
+    closed.server_close()
+    with pytest.raises(requests.ConnectionError):
+        PooledTransport(max_retries=2).request("GET", url)
+    assert len(sleeps) == 2
+
+
+def test_initiate_call_returns_record(server):
+    manager = VAPIManager("key", base_url=server.url, transport=PooledTransport())
+    result = manager.initiate_call("assistant_1", "+14155550123")
+    assert result["success"]
+    assert result["call_record"].call_id == result["call_id"]
+    assert server.requests[0][:2] == ("POST", "/call")
+
+
+def test_initiate_call_client_error_is_not_retryable(server):
+    server.script = [(400, {"message": "bad number"})]
+    result = VAPIManager("key", base_url=server.url, transport=PooledTransport()).initiate_call(
+        "assistant_1", "+14155550123"
+    )
+    assert "error" in result
+    assert not result["retryable"]
+
+
+class ExplodingManager:
+    """Raises for one number and places every other call"""
+
+    def __init__(self, bad_number: str):
+        self.bad_number = bad_number
+
+    def initiate_call(self, assistant_id, phone_number, custom_prompt=""):
+        if phone_number == self.bad_number:
+            raise RuntimeError("boom")
+        return {"success": True, "call_id": phone_number, "estimated_cost": 0.1}
+
+
+def test_bulk_dialer_worker_survives_unexpected_errors():
+    jobs = [DialJob(f"+1415555012{i}", "assistant_1") for i in range(4)]
+    settings = DialSettings(
+        max_concurrent=1, call_delay=0, weekend_calling=True,
+        call_window_start=datetime.min.time(), call_window_end=datetime.max.time()
+    )
+    results = []
+    dialer = BulkDialer(
+        ExplodingManager(jobs[1].phone_number), jobs, settings,
+        on_result=lambda job, result: results.append(result)
+    ).start()
+    assert dialer.join(timeout=10)
+    snapshot = dialer.snapshot()
+    assert snapshot["successful"] == 3
+    assert snapshot["failed"] == 1
+    assert "boom" in snapshot["recent_errors"][0]["error"]
+    assert len(results) == 4
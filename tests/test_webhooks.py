@@ -0,0 +1,166 @@
+"""Webhook receiver: signatures, replay window, payload normalization and acknowledged writes"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from callcenter.events import EventStore
+from callcenter.webhooks import WebhookApp, normalize_event, sign, verify_signature
+
+SECRET = "webhook-secret"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EventStore(str(tmp_path / "calls.db"))
+
+
+def call(app: WebhookApp, path: str, body: bytes, signature: str = None, method: str = "POST"):
+    """Send one request through the ASGI app and return (status, json body)"""
+    headers = [] if signature is None else [(b"x-vapi-signature", signature.encode())]
+    scope = {"type": "http", "method": method, "path": path, "headers": headers}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        try:
+            await app(scope, receive, send)
+        finally:
+            await app._stop_writer()
+
+    asyncio.run(run())
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+def post(app: WebhookApp, payload, assistant_id: str = "assistant_1", secret: str = SECRET):
+    body = json.dumps(payload).encode()
+    return call(app, f"/webhooks/{assistant_id}", body, sign(body, secret))
+
+
+def test_signatures_are_checked_against_the_assistant_secret(store):
+    app = WebhookApp(store, SECRET, assistant_secrets={"assistant_2": "other-secret"})
+    payload = {"event": "call_started", "call_id": "call_1"}
+    assert post(app, payload)[0] == 202
+    assert post(app, payload, secret="wrong")[0] == 401
+    assert post(app, payload, assistant_id="assistant_2")[0] == 401
+    assert post(app, payload, assistant_id="assistant_2", secret="other-secret")[0] == 202
+    assert call(app, "/webhooks/assistant_1", b"{}")[0] == 401
+    assert app.stats["rejected"] == 3
+    assert [event["call_id"] for event in store.read_since(0)] == ["call_1", "call_1"]
+    # An empty secret never verifies
+    assert not verify_signature(b"{}", sign(b"{}", ""), "")
+
+
+def test_stale_and_future_timestamps_are_rejected(store):
+    app = WebhookApp(store, SECRET, max_age=300)
+    assert post(app, {"event": "call_started", "call_id": "call_1", "timestamp": time.time() - 600}) == (
+        401, {"error": "Stale timestamp"}
+    )
+    message = {"type": "status-update", "status": "in-progress", "call": {"id": "call_2"},
+               "timestamp": (time.time() + 600) * 1000}
+    assert post(app, {"message": message})[0] == 401
+    assert post(app, {"event": "call_started", "call_id": "call_3", "timestamp": time.time() - 60})[0] == 202
+    assert app.stats["stale"] == 2
+    assert [event["call_id"] for event in store.read_since(0)] == ["call_3"]
+
+    unchecked = WebhookApp(store, SECRET, max_age=None)
+    assert post(unchecked, {"event": "call_started", "call_id": "call_4", "timestamp": 1})[0] == 202
+
+
+def test_bodies_that_are_not_event_objects_are_bad_requests(store):
+    app = WebhookApp(store, SECRET)
+    assert post(app, "message") == (400, {"error": "Expected a JSON object"})
+    assert post(app, [1, 2]) == (400, {"error": "Expected a JSON object"})
+    assert post(app, {"message": "call ended"}) == (400, {"error": "Malformed event"})
+    assert post(app, {"event": "call_started", "call_id": "call_1", "timestamp": "yesterday"})[0] == 400
+    body = b"{not json"
+    assert call(app, "/webhooks/assistant_1", body, sign(body, SECRET)) == (400, {"error": "Invalid JSON"})
+    assert post(app, {"event": "unknown_event", "call_id": "call_1"}) == (202, {"status": "ignored"})
+    assert store.read_since(0) == []
+
+
+def test_vapi_server_messages_are_normalized():
+    timestamp = 1767261600000
+    report = normalize_event("assistant_1", {"message": {
+        "type": "end-of-call-report", "timestamp": timestamp, "duration": 42, "cost": 0.31,
+        "transcript": "Hi", "recordingUrl": "https://example.com/rec.wav", "endedReason": "customer-ended-call",
+        "call": {"id": "call_1", "customer": {"number": "+14155550123"}},
+    }})
+    assert report == {
+        "event_type": "call_ended", "call_id": "call_1", "assistant_id": "assistant_1",
+        "occurred_at": timestamp / 1000,
+        "data": {"duration": 42, "cost": 0.31, "transcript": "Hi", "endedReason": "customer-ended-call",
+                 "recording_url": "https://example.com/rec.wav", "phone_number": "+14155550123"},
+    }
+
+    failed = normalize_event("assistant_1", {"message": {
+        "type": "end-of-call-report", "endedReason": "pipeline-error", "call": {"id": "call_2"}}})
+    assert failed["event_type"] == "call_failed"
+
+    started = normalize_event("assistant_1", {"message": {"type": "status-update", "status": "in-progress", "call": {"id": "call_3"}}})
+    assert started["event_type"] == "call_started"
+    ended = {"type": "status-update", "status": "ended", "call": {"id": "call_3"}}
+    assert normalize_event("assistant_1", {"message": ended}) is None
+
+    final = normalize_event("assistant_1", {"message": {
+        "type": "transcript", "transcriptType": "final", "role": "user", "transcript": "too expensive",
+        "call": {"id": "call_4"}}})
+    assert (final["event_type"], final["data"]) == ("transcript", {"role": "user", "text": "too expensive"})
+    partial = {"type": "transcript", "transcriptType": "partial", "transcript": "too", "call": {"id": "call_4"}}
+    assert normalize_event("assistant_1", {"message": partial}) is None
+    assert normalize_event("assistant_1", {"message": {"type": "end-of-call-report", "call": {}}}) is None
+
+
+class FailingStore:
+    def append(self, events):
+        raise OSError("disk full")
+
+
+def test_events_are_acknowledged_only_once_written(store):
+    app = WebhookApp(FailingStore(), SECRET)
+    assert post(app, {"event": "call_started", "call_id": "call_1"}) == (503, {"error": "Event could not be stored"})
+    assert app.stats["accepted"] == 0
+    assert app.stats["write_errors"] == 1
+
+    app = WebhookApp(store, SECRET)
+    assert post(app, {"event": "call_started", "call_id": "call_1"}) == (202, {"status": "accepted"})
+    # The response went out after the commit, so the event is already readable
+    assert [event["call_id"] for event in store.read_since(0)] == ["call_1"]
+    assert app.stats["written"] == 1
+
+
+def test_concurrent_requests_share_one_batch(store):
+    app = WebhookApp(store, SECRET, flush_interval=0.2)
+    appends = []
+    append = store.append
+    store.append = lambda events: appends.append(len(events)) or append(events)
+    statuses = []
+
+    async def run():
+        async def one(index):
+            body = json.dumps({"event": "call_started", "call_id": f"call_{index}"}).encode()
+            sent = []
+
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "POST", "path": "/webhooks/assistant_1",
+                     "headers": [(b"x-vapi-signature", sign(body, SECRET).encode())]}
+            await app(scope, receive, send)
+            statuses.append(sent[0]["status"])
+
+        await asyncio.gather(*(one(index) for index in range(20)))
+        await app._stop_writer()
+
+    asyncio.run(run())
+    assert statuses == [202] * 20
+    assert appends == [20]
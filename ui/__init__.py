@@ -0,0 +1,7 @@
+"""Streamlit pages and the session-facing data layer for the dashboard
+
+``app.py`` is only the shell: it renders the header and sidebar and hands
+the selected page to ``st.navigation``. Each page under ``ui/pages`` is
+compiled and executed only when it is selected, and every page reads from
+the process-wide services in ``ui.data`` rather than building its own.
+"""
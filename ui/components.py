@@ -0,0 +1,132 @@
+"""Widgets shared by more than one page"""
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import pandas as pd
+import streamlit as st
+
+from callcenter.contacts import ContactImport, preview_upload
+from callcenter.export_jobs import PENDING_STATUSES
+from ui.data import get_contact_store, get_export_runner
+
+PHONE_REGIONS = ["US", "CA", "GB", "AU", "IN", "DE", "FR", "ES", "MX", "BR"]
+# st.download_button can't stream: a clicked file is read whole into the server's
+# memory and sent in one message, so larger artifacts are not offered through it
+MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
+
+def change_from_last_month(current: float, previous: float) -> str:
+    if not previous:
+        return "No data for last month"
+    return f"{(current - previous) / previous * 100:+.1f}% from last month"
+
+def contact_import_panel(uploaded_file, key: str) -> Optional[Dict[str, Any]]:
+    """Preview an upload, stream it into the contact store and show import progress
+
+    Returns the import's snapshot once one has been started for this file.
+    """
+    imports = st.session_state.contact_imports
+    import_key = (key, uploaded_file.file_id)
+    contact_import = imports.get(import_key)
+
+    if contact_import is None:
+        preview = preview_upload(uploaded_file, uploaded_file.name)
+        st.dataframe(preview)
+        columns = list(preview.columns)
+        phone_columns = [col for col in columns if 'phone' in str(col).lower()]
+        col_phone, col_region = st.columns(2)
+        with col_phone:
+            phone_column = st.selectbox(
+                "Phone Number Column", columns,
+                index=columns.index(phone_columns[0]) if phone_columns else 0,
+                key=f"{key}_phone_column"
+            )
+        with col_region:
+            region = st.selectbox("Default Country", PHONE_REGIONS, key=f"{key}_region")
+        if st.button("📥 Import Contacts", key=f"{key}_import", disabled=not columns):
+            imports[import_key] = ContactImport(
+                get_contact_store(), uploaded_file, uploaded_file.name, phone_column, region=region
+            ).start()
+            st.rerun()
+        return None
+
+    progress = contact_import.snapshot()
+    if progress['status'] == 'importing':
+        st.progress(progress['progress'])
+        st.text(f"Importing... {progress['rows_read']:,} rows read")
+        col_refresh, col_stop = st.columns(2)
+        col_refresh.button("🔄 Refresh Import", key=f"{key}_refresh")
+        if col_stop.button("⏹️ Stop Import", key=f"{key}_stop"):
+            contact_import.stop()
+            contact_import.join()
+            st.rerun()
+    elif progress['status'] == 'stopped':
+        st.warning(f"⏸️ Import stopped after {progress['rows_read']:,} rows")
+        if st.button("▶️ Resume Import", key=f"{key}_resume"):
+            contact_import.resume()
+            st.rerun()
+    elif progress['status'] == 'failed':
+        st.error(f"❌ Import failed: {progress['error']}")
+    else:
+        st.dataframe(get_contact_store().preview(progress['list_id']))
+
+    col_valid, col_dupes, col_invalid = st.columns(3)
+    col_valid.metric("Valid Contacts", f"{progress['valid']:,}")
+    col_dupes.metric("Duplicates Skipped", f"{progress['duplicates']:,}")
+    col_invalid.metric("Invalid Numbers", f"{progress['invalid']:,}")
+    if progress['invalid']:
+        with st.expander(f"❌ Row Errors ({progress['invalid']:,})"):
+            if progress['status'] == 'importing':
+                st.dataframe(pd.DataFrame(progress['recent_errors']), use_container_width=True)
+            else:
+                st.dataframe(get_contact_store().errors(progress['list_id']), use_container_width=True)
+    return progress
+
+def export_job_panel(job_id: str, key: str):
+    """Progress of a background export, then its download button
+
+    Polls once a second while the job is queued or running, and reruns the
+    page once it finishes so the polling stops.
+    """
+    job = get_export_runner().job(job_id)
+    if job is None:
+        # Pruned after the retention period
+        return
+    pending = job['status'] in PENDING_STATUSES
+
+    @st.fragment(run_every=1.0 if pending else None)
+    def export_job_status():
+        job = get_export_runner().job(job_id)
+        if job['status'] in PENDING_STATUSES:
+            label = f"{job['status'].title()}: {job['rows']:,} rows written"
+            if job['progress'] is not None:
+                st.progress(job['progress'], text=label)
+            else:
+                st.caption(label)
+        elif pending:
+            st.rerun()
+        elif job['status'] == 'completed':
+            path = get_export_runner().artifact(job_id)
+            if path is None:
+                st.warning("⚠️ The export file is no longer on disk; run the export again")
+                return
+            size = Path(path).stat().st_size
+            st.success(f"✅ Export ready: {job['rows']:,} rows ({size / 1024 / 1024:,.1f} MB)")
+            if size > MAX_DOWNLOAD_BYTES:
+                st.warning(
+                    f"⚠️ Too large to download in the browser (limit {MAX_DOWNLOAD_BYTES // 1024 // 1024} MB). "
+                    f"Narrow the date range or filters, or copy the file from the server: {path}"
+                )
+                return
+            st.download_button(
+                f"📥 Download {job['file_name']}",
+                # The file is only read when the button is clicked
+                data=lambda: Path(path).read_bytes(),
+                file_name=job['file_name'],
+                mime=job['mime'],
+                on_click="ignore",
+                key=f"{key}_download"
+            )
+        else:
+            st.error(f"❌ Export failed: {job['error']}")
+
+    export_job_status()
@@ -0,0 +1,373 @@
+"""Process-wide services and cached reads shared by every page
+
+Stores, engines and background workers are created once per process with
+``st.cache_resource``; derived frames that several pages show are cached
+with ``st.cache_data`` keyed on the data they were computed from, so moving
+between pages or rerunning a fragment never recomputes them.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+
+import pandas as pd
+import streamlit as st
+
+from callcenter.models import (
+    CallStatus, CallRecord, AssistantConfig, TERMINAL_CALL_STATUSES, sentiment_label
+)
+from callcenter.vapi import VAPIManager
+from callcenter.status import CallStatusPoller
+from callcenter.events import CallEndFollower, EventStore, apply_events, fold_event
+from callcenter.store import CallStore
+from callcenter.columnar import CallBuffer, to_local
+from callcenter.analytics import AnalyticsEngine
+from callcenter.exports import iter_call_frames, iter_export_frames
+from callcenter.export_jobs import ExportJobRunner
+from callcenter.rollups import RollupStore
+from callcenter.sheets import GoogleSheetsManager
+from callcenter.sheet_writer import SheetWriter
+from callcenter.contacts import ContactStore
+from callcenter.scheduler import CallScheduler, ScheduledDialer
+from callcenter.campaign_queue import CampaignQueue
+from callcenter.router import AssistantRouter
+from callcenter.assistants import AssistantRegistry, config_to_json
+
+# Calls in these states are shown as live on the monitoring pages
+LIVE_CALL_STATUSES = [CallStatus.INITIATED, CallStatus.RINGING, CallStatus.CONNECTED]
+LIVE_CALLS_LIMIT = 50
+
+
+@st.cache_resource
+def get_assistant_registry() -> AssistantRegistry:
+    """Assistant configurations shared by every session, reloaded only after an edit"""
+    return AssistantRegistry()
+
+@st.cache_resource
+def get_event_store() -> EventStore:
+    """Webhook event log shared with the webhook receiver process"""
+    return EventStore()
+
+@st.cache_resource
+def get_call_store() -> CallStore:
+    """Persistent call history shared by every session"""
+    return CallStore()
+
+@st.cache_resource
+def get_analytics_engine() -> AnalyticsEngine:
+    """Performance analytics shared by every page and session"""
+    return AnalyticsEngine(get_call_store(), RollupStore())
+
+@st.cache_resource
+def get_sheets_manager(credentials_json: str) -> GoogleSheetsManager:
+    """Sheet cache shared by every session using the same credentials"""
+    return GoogleSheetsManager(credentials_json)
+
+@st.cache_resource
+def get_sheet_writer(credentials_json: str) -> Optional[SheetWriter]:
+    """Background writer of call outcomes to each assistant's sheet"""
+    backend = get_sheets_manager(credentials_json).backend
+    if backend is None:
+        return None
+    writer = SheetWriter(backend)
+    writer.start()
+    return writer
+
+@st.cache_resource
+def get_contact_store() -> ContactStore:
+    """Imported contact lists shared by every session"""
+    return ContactStore()
+
+@st.cache_resource
+def get_campaign_queue() -> CampaignQueue:
+    """Call capacity shared by every running campaign"""
+    return CampaignQueue()
+
+@st.cache_resource
+def get_assistant_router() -> AssistantRouter:
+    """In-flight calls per assistant, shared by every session and campaign"""
+    return AssistantRouter()
+
+@st.cache_resource
+def get_call_end_follower() -> CallEndFollower:
+    """Frees router and campaign queue slots as calls end, in the background rather than on reruns"""
+    router, queue = get_assistant_router(), get_campaign_queue()
+    return CallEndFollower(get_event_store(), [
+        lambda event: router.finish_call(event['call_id']),
+        lambda event: queue.finish_call(event['call_id'], event['data'].get('cost')),
+    ]).start()
+
+@st.cache_resource
+def get_call_scheduler() -> CallScheduler:
+    """Persistent queue of scheduled and recurring calls"""
+    return CallScheduler()
+
+@st.cache_resource
+def get_scheduled_dialer(api_key: str) -> ScheduledDialer:
+    """Places scheduled calls as they fall due"""
+    return ScheduledDialer(
+        VAPIManager(api_key), get_call_scheduler(), queue=get_campaign_queue(), call_store=get_call_store()
+    ).start()
+
+@st.cache_resource
+def get_status_poller(api_key: str) -> CallStatusPoller:
+    """One status poller per API key, shared by every session and refreshed in the background"""
+    return CallStatusPoller(VAPIManager(api_key)).start()
+
+@st.cache_resource
+def get_export_runner() -> ExportJobRunner:
+    """Background export jobs shared by every session, deduplicated per request"""
+    registry = get_assistant_registry()
+    call_store = get_call_store()
+    analytics = get_analytics_engine()
+    runner = ExportJobRunner()
+
+    def assistant_metrics(params: Dict[str, Any]) -> pd.DataFrame:
+        metrics = analytics.calculate_performance_metrics(registry.configs)
+        return metrics[metrics['Assistant ID'].isin(params['assistant_ids'])]
+
+    runner.register(
+        'calls',
+        lambda params: iter_export_frames(
+            call_store, assistant_names=params['assistant_names'], include=params['include'],
+            **call_filters(params['filters'])
+        ),
+        total=lambda params: call_store.count(**call_filters(params['filters'])),
+        version=lambda params: call_store.data_version()
+    )
+    runner.register(
+        'call_logs',
+        lambda params: iter_call_frames(
+            call_store, lambda calls: call_log_frame(calls, params['assistant_names']),
+            chunk_size=10000, **call_filters(params['filters'])
+        ),
+        total=lambda params: call_store.count(**call_filters(params['filters'])),
+        version=lambda params: call_store.data_version()
+    )
+    metrics_version = lambda params: [registry.version, call_store.data_version()]
+    runner.register('performance_metrics', lambda params: [assistant_metrics(params)], version=metrics_version)
+    runner.register('financial_data', lambda params: [assistant_metrics(params)[
+        ['Assistant ID', 'Assistant Name', 'Monthly Calls', 'Cost per Call', 'Revenue Generated']
+    ]], version=metrics_version)
+    runner.register('configuration_backup', lambda params: [pd.DataFrame([
+        json.loads(config_to_json(config)) for config in registry.configs.values()
+        if config.id in params['assistant_ids']
+    ])], version=lambda params: registry.version)
+    return runner.start()
+
+def call_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """CallStore filters back from an export job's JSON parameters"""
+    return {
+        name: datetime.fromisoformat(value) if name in ('start', 'end') and value is not None else value
+        for name, value in filters.items()
+    }
+
+def get_vapi_manager() -> VAPIManager:
+    """VAPI client for this session's API key"""
+    return VAPIManager(st.session_state.vapi_api_key)
+
+def selected_assistant_config() -> AssistantConfig:
+    """The assistant picked in the sidebar, or the first one if it no longer exists"""
+    configs = get_assistant_registry().configs
+    return configs.get(st.session_state.current_assistant) or next(iter(configs.values()))
+
+# Initialize session state with enhanced data
+def initialize_session_state():
+    if 'current_assistant' not in st.session_state:
+        st.session_state.current_assistant = "assistant_1"
+    if 'vapi_api_key' not in st.session_state:
+        st.session_state.vapi_api_key = ""
+    if 'google_credentials' not in st.session_state:
+        st.session_state.google_credentials = ""
+    if 'real_time_monitoring' not in st.session_state:
+        st.session_state.real_time_monitoring = False
+    if 'notification_settings' not in st.session_state:
+        st.session_state.notification_settings = {
+            'email_alerts': False,
+            'sms_alerts': False,
+            'webhook_alerts': True,
+            'alert_threshold': 80
+        }
+    if 'user_preferences' not in st.session_state:
+        st.session_state.user_preferences = {
+            'theme': 'light',
+            'auto_refresh': False,
+            'refresh_interval': 30,
+            'default_view': 'dashboard'
+        }
+    if 'active_calls' not in st.session_state:
+        st.session_state.active_calls = {}
+    if 'bulk_campaigns' not in st.session_state:
+        st.session_state.bulk_campaigns = {}
+    if 'contact_imports' not in st.session_state:
+        st.session_state.contact_imports = {}
+    if 'status_cursor' not in st.session_state:
+        st.session_state.status_cursor = 0
+    if 'event_cursor' not in st.session_state:
+        # New sessions start with the recent backlog rather than the full event log
+        st.session_state.event_cursor = max(0, get_event_store().last_seq() - 1000)
+    if 'system_health' not in st.session_state:
+        st.session_state.system_health = {
+            'api_status': 'healthy',
+            'database_status': 'healthy',
+            'webhook_status': 'healthy',
+            'last_check': datetime.now()
+        }
+
+def track_calls(call_records: List[CallRecord]):
+    """Persist freshly initiated calls and add them to the session's active calls
+
+    Calls already stored are left as they are: webhooks may have finished
+    them before a background dialer's records were drained.
+    """
+    get_call_store().insert_new(call_records)
+    for call_record in call_records:
+        st.session_state.active_calls[call_record.call_id] = call_record
+
+def write_back_outcomes(call_records: List[CallRecord]):
+    """Queue finished calls for write-back to their assistant's Google Sheet"""
+    writer = get_sheet_writer(st.session_state.google_credentials)
+    if writer is None:
+        return
+    registry = get_assistant_registry()
+    by_sheet = {}
+    for record in call_records:
+        config = registry.by_id(record.assistant_id)
+        if config is not None and config.sheet_id and record.status in TERMINAL_CALL_STATUSES:
+            by_sheet.setdefault((config.sheet_id, config.name), []).append(record)
+    for (sheet_id, agent), records in by_sheet.items():
+        # Never wait on a full outbox from the script thread
+        writer.submit(sheet_id, records, agent, timeout=0)
+
+def apply_background_updates():
+    """Fold in what background dialers and the webhook receiver produced since the last rerun"""
+    registry = get_assistant_registry()
+    # Started by the first rerun, before any campaign can hold a slot
+    get_call_end_follower()
+    # Limits and eligibility follow assistant edits from any session
+    get_assistant_router().update_assistants(registry.configs.values(), version=registry.version)
+
+    # Pick up calls placed by background bulk campaigns since the last rerun
+    for bulk_dialer in st.session_state.bulk_campaigns.values():
+        track_calls(bulk_dialer.drain_records())
+    if st.session_state.vapi_api_key:
+        track_calls(get_scheduled_dialer(st.session_state.vapi_api_key).drain_records())
+
+    # Apply webhook events pushed since the last rerun
+    new_events = get_event_store().read_since(st.session_state.event_cursor)
+    last_event_seq = apply_events(new_events, st.session_state.active_calls)
+    if last_event_seq is not None:
+        st.session_state.event_cursor = last_event_seq
+
+    # The receiver may not have folded these into the call store yet, so fold them here too
+    ended_events = [event for event in new_events if event['event_type'] in ('call_ended', 'call_failed')]
+    if ended_events and st.session_state.google_credentials:
+        stored_calls = get_call_store().get_many({event['call_id'] for event in ended_events})
+        write_back_outcomes([fold_event(stored_calls.get(event['call_id']), event) for event in ended_events])
+
+def sync_active_calls():
+    """Apply the status changes the shared background poller has seen for this session's active calls"""
+    if not st.session_state.vapi_api_key or not st.session_state.active_calls:
+        return
+
+    poller = get_status_poller(st.session_state.vapi_api_key)
+    changes, st.session_state.status_cursor = poller.changes_since(
+        st.session_state.status_cursor, st.session_state.active_calls.keys()
+    )
+
+    changed_calls = []
+    for status in changes:
+        call = st.session_state.active_calls[status['call_id']]
+        call.status = CallStatus(status['status'])
+        call.duration = status['duration']
+        call.cost = status['cost']
+        if status['ended']:
+            call.end_time = datetime.now()
+            del st.session_state.active_calls[call.call_id]
+            get_assistant_router().finish_call(call.call_id)
+            get_campaign_queue().finish_call(call.call_id, call.cost or None)
+        changed_calls.append(call)
+    get_call_store().update_statuses(changed_calls)
+    write_back_outcomes(changed_calls)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _performance_metrics(registry_version: int, calls_version: int) -> pd.DataFrame:
+    return get_analytics_engine().calculate_performance_metrics(get_assistant_registry().configs)
+
+def performance_metrics() -> pd.DataFrame:
+    """Per-assistant performance table, computed once per change to the assistants or calls
+
+    The 60 second TTL lets the rolling windows slide when nothing is written.
+    """
+    return _performance_metrics(get_assistant_registry().version, get_call_store().data_version())
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _sentiment_trend(calls_version: int, days: int) -> pd.DataFrame:
+    return get_analytics_engine().sentiment_trend(days=days)
+
+def sentiment_trend(days: int = 7) -> pd.DataFrame:
+    """Daily sentiment shares from the scored calls, recomputed once per write"""
+    return _sentiment_trend(get_call_store().data_version(), days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _keyword_hits(calls_version: int, assistant_id: str, days: int) -> pd.DataFrame:
+    return get_analytics_engine().keyword_hits([assistant_id], days=days)
+
+def keyword_hits(assistant_id: str, days: int = 7) -> pd.DataFrame:
+    """An assistant's most heard tracked keywords, recomputed once per write"""
+    return _keyword_hits(get_call_store().data_version(), assistant_id, days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _calls_today(calls_version: int, today: datetime) -> int:
+    return get_call_store().count(start=today)
+
+def calls_today() -> int:
+    """Calls started since local midnight, counted once per write"""
+    return _calls_today(get_call_store().data_version(), datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _live_activity(calls_version: int, minute: datetime) -> Dict[str, Any]:
+    live_calls = get_call_store().page(
+        limit=LIVE_CALLS_LIMIT,
+        columnar=True,
+        statuses=[status.value for status in LIVE_CALL_STATUSES],
+        start=minute - timedelta(hours=2)
+    )
+    return {
+        'active_calls': live_calls,
+        'trend': get_analytics_engine().minute_trend(minutes=60, now=minute),
+    }
+
+def live_activity() -> Dict[str, Any]:
+    """Calls in progress and the last hour per minute, for the auto-refreshing views
+
+    Keyed on the call store's version, so however many viewers poll, the
+    queries run once per write (or once a minute when idle) and every other
+    refresh is a cache hit.
+    """
+    return _live_activity(get_call_store().data_version(), datetime.now().replace(second=0, microsecond=0))
+
+def call_log_frame(calls: CallBuffer, assistant_names: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """Call Logs table rows for a page of stored calls, built column by column"""
+    columns = calls.to_pandas()
+    if assistant_names is None:
+        assistant_names = {config.id: config.name for config in get_assistant_registry().configs.values()}
+    local_start = to_local(columns['start_time'])
+    return pd.DataFrame({
+        'Call ID': columns['call_id'],
+        'Date': local_start.dt.date,
+        'Time': local_start.dt.time,
+        'Assistant': columns['assistant_id'].map(lambda assistant_id: assistant_names.get(assistant_id, assistant_id)),
+        'Phone Number': columns['phone_number'],
+        'Duration': columns['duration'],
+        'Status': calls.status_labels(),
+        'Sentiment': [sentiment_label(score) for score in columns['sentiment_score']],
+        'Lead Score': columns['lead_score'].round(1),
+        'Cost': columns['cost'].round(2),
+        'Campaign': columns['campaign'],
+        'Notes': calls.custom_field('notes')
+    })
+
+@st.cache_data(ttl=15, show_spinner=False)
+def cached_call_log_summary(**filters) -> Dict[str, Any]:
+    """Call Logs summary, reused while the user pages through the same filters"""
+    return get_call_store().summary(**filters)
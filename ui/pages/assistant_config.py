@@ -0,0 +1,226 @@
+"""Assistant Config: edit and save the selected assistant's settings"""
+import streamlit as st
+from datetime import datetime
+import time
+
+from callcenter.assistants import VOICES, LANGUAGES, BACKGROUND_SOUNDS
+from callcenter.keywords import DEFAULT_KEYWORDS
+from ui.data import get_assistant_registry, selected_assistant_config
+
+assistant_registry = get_assistant_registry()
+current_config = selected_assistant_config()
+
+st.title(f"⚙️ Assistant Configuration - {current_config.name}")
+
+# Configuration Tabs
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["🎤 Voice & Language", "🧠 AI Settings", "📞 Call Settings", "🔗 Integrations", "📊 Analytics"])
+
+with tab1:
+    st.subheader("🎤 Voice & Language Configuration")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        new_voice = st.selectbox("Voice Selection", VOICES, index=VOICES.index(current_config.voice))
+        new_language = st.selectbox("Language", LANGUAGES, index=LANGUAGES.index(current_config.language))
+        speech_speed = st.slider("Speech Speed", 0.5, 2.0, 1.0, 0.1)
+        voice_stability = st.slider("Voice Stability", 0.0, 1.0, 0.75, 0.05)
+    
+    with col2:
+        new_background = st.selectbox("Background Sound", BACKGROUND_SOUNDS, 
+                                    index=BACKGROUND_SOUNDS.index(current_config.background_sound))
+        volume_level = st.slider("Volume Level", 0.1, 1.0, 0.8, 0.1)
+        noise_suppression = st.checkbox("Noise Suppression", value=True)
+        echo_cancellation = st.checkbox("Echo Cancellation", value=True)
+    
+    # Voice Preview
+    if st.button("🎵 Preview Voice"):
+        st.audio("data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PwtmMcBjiR1/LMeSwFJHfH8N2QQAoUXrTp66hVFApGn+DyvmwhBSuBzvLZiTYIG2m98OScTgwOUarm7blmGgU7k9n1unEiBC13yO/eizEIHWq+8+OWT")
+        st.success("Voice preview played!")
+
+with tab2:
+    st.subheader("🧠 AI Model Configuration")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        ai_model = st.selectbox("AI Model", ["GPT-4", "GPT-3.5-Turbo", "Claude-3", "Gemini-Pro"])
+        temperature = st.slider("Temperature", 0.0, 1.0, current_config.temperature, 0.1)
+        max_tokens = st.slider("Max Tokens", 100, 4000, 1000)
+        top_p = st.slider("Top P", 0.0, 1.0, 0.9, 0.1)
+    
+    with col2:
+        response_speed = st.selectbox("Response Speed", ["slow", "normal", "fast"], 
+                                    index=["slow", "normal", "fast"].index(current_config.response_speed))
+        context_window = st.slider("Context Window", 1000, 8000, 4000)
+        memory_enabled = st.checkbox("Conversation Memory", value=True)
+        learning_enabled = st.checkbox("Adaptive Learning", value=False)
+    
+    # Custom Prompt Configuration
+    st.subheader("📝 Custom Prompt Templates")
+    
+    prompt_categories = {
+        "Greeting": "Hello! I'm your AI assistant. How can I help you today?",
+        "Closing": "Thank you for your time. Have a great day!",
+        "Objection Handling": "I understand your concern. Let me address that...",
+        "Information Gathering": "To better assist you, could you please tell me...",
+        "Appointment Scheduling": "I'd be happy to schedule an appointment for you..."
+    }
+    
+    selected_category = st.selectbox("Prompt Category", list(prompt_categories.keys()))
+    custom_prompt = st.text_area("Custom Prompt", 
+                               value=prompt_categories[selected_category], 
+                               height=150)
+    
+    if st.button("💾 Save Prompt Template"):
+        st.success("Prompt template saved successfully!")
+
+with tab3:
+    st.subheader("📞 Call Management Settings")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        new_max_duration = st.slider("Max Call Duration (seconds)", 60, 1800, current_config.max_duration)
+        call_timeout = st.slider("Call Timeout (seconds)", 10, 60, 30)
+        retry_attempts = st.slider("Retry Attempts", 0, 5, 2)
+        call_recording = st.checkbox("Enable Call Recording", value=True)
+    
+    with col2:
+        caller_id = st.text_input("Caller ID", value=current_config.phone_number)
+        time_zone = st.selectbox("Time Zone", ["UTC", "EST", "PST", "CST", "MST"])
+        business_hours_start = st.time_input("Business Hours Start", value=datetime.strptime("09:00", "%H:%M").time())
+        business_hours_end = st.time_input("Business Hours End", value=datetime.strptime("17:00", "%H:%M").time())
+    
+    # Call Flow Configuration
+    st.subheader("🔄 Call Flow Settings")
+    
+    call_flow_steps = [
+        "Initial Greeting",
+        "Purpose Identification", 
+        "Information Gathering",
+        "Solution Presentation",
+        "Objection Handling",
+        "Closing/Next Steps"
+    ]
+    
+    for i, step in enumerate(call_flow_steps):
+        with st.expander(f"Step {i+1}: {step}"):
+            step_enabled = st.checkbox(f"Enable {step}", value=True, key=f"step_{i}")
+            step_timeout = st.slider(f"Max Duration for {step} (seconds)", 30, 300, 60, key=f"timeout_{i}")
+            step_prompt = st.text_area(f"Prompt for {step}", height=100, key=f"prompt_{i}")
+
+with tab4:
+    st.subheader("🔗 Integration Settings")
+    
+    # CRM Integration
+    st.markdown("### 🏢 CRM Integration")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        crm_provider = st.selectbox("CRM Provider", ["Salesforce", "HubSpot", "Pipedrive", "Zoho", "Custom"])
+        crm_api_key = st.text_input("CRM API Key", type="password")
+        crm_endpoint = st.text_input("CRM Endpoint URL")
+    
+    with col2:
+        sync_frequency = st.selectbox("Sync Frequency", ["Real-time", "Every 5 minutes", "Hourly", "Daily"])
+        lead_scoring = st.checkbox("Enable Lead Scoring", value=True)
+        auto_create_contacts = st.checkbox("Auto-create Contacts", value=True)
+    
+    # Webhook Configuration
+    st.markdown("### 🔗 Webhook Configuration")
+    
+    webhook_events = [
+        "call_started", "call_ended", "call_failed", "lead_qualified", 
+        "appointment_scheduled", "objection_raised", "positive_sentiment"
+    ]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        webhook_url = st.text_input("Webhook URL", value=current_config.webhook_url)
+        webhook_secret = st.text_input("Webhook Secret", type="password")
+        st.caption(f"Built-in receiver path: /webhooks/{current_config.id} (signed with X-Vapi-Signature)")
+    
+    with col2:
+        selected_events = st.multiselect("Webhook Events", webhook_events, default=webhook_events[:3])
+        webhook_timeout = st.slider("Webhook Timeout (seconds)", 5, 30, 10)
+    
+    # Test Integration
+    if st.button("🧪 Test Integrations"):
+        with st.spinner("Testing integrations..."):
+            time.sleep(2)
+            st.success("✅ All integrations tested successfully!")
+
+with tab5:
+    st.subheader("📊 Analytics & Reporting")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Analytics Settings
+        st.markdown("### 📈 Analytics Configuration")
+        
+        analytics_enabled = st.checkbox("Enable Analytics", value=True)
+        sentiment_analysis = st.checkbox("Sentiment Analysis", value=True)
+        keyword_tracking = st.checkbox("Keyword Tracking", value=current_config.keyword_tracking)
+        conversation_scoring = st.checkbox("Conversation Scoring", value=True)
+
+        # Tracked Keywords
+        st.markdown("### 🔑 Tracked Keywords")
+        st.caption("Objection keywords raise objection_raised and positive ones positive_sentiment")
+        current_keywords = current_config.keywords if current_config.keywords is not None else DEFAULT_KEYWORDS
+        tracked_keywords = {}
+        for category, phrases in current_keywords.items():
+            keyword_text = st.text_area(
+                f"{category.replace('_', ' ').title()} Keywords",
+                value="\n".join(phrases),
+                height=100,
+                disabled=not keyword_tracking,
+                help="One keyword or phrase per line",
+                key=f"keywords_{current_config.id}_{category}"
+            )
+            tracked_keywords[category] = [line.strip() for line in keyword_text.splitlines() if line.strip()]
+        
+        # Custom Metrics
+        st.markdown("### 🎯 Custom Metrics")
+        custom_metrics = st.text_area("Custom Metrics (JSON format)", 
+                                    value='{"lead_quality": "high", "follow_up_required": true}',
+                                    height=100)
+    
+    with col2:
+        # Reporting Settings
+        st.markdown("### 📋 Reporting Configuration")
+        
+        daily_reports = st.checkbox("Daily Reports", value=True)
+        weekly_reports = st.checkbox("Weekly Reports", value=True)
+        monthly_reports = st.checkbox("Monthly Reports", value=True)
+        
+        report_recipients = st.text_area("Report Recipients (emails)", 
+                                       placeholder="admin@company.com\nmanager@company.com")
+        
+        # Data Retention
+        st.markdown("### 🗄️ Data Retention")
+        call_data_retention = st.slider("Call Data Retention (days)", 30, 365, 90)
+        analytics_retention = st.slider("Analytics Retention (days)", 30, 730, 180)
+
+# Save Configuration
+if st.button("💾 Save All Configuration", type="primary", use_container_width=True):
+    result = assistant_registry.update(
+        assistant_registry.key_for_id(current_config.id),
+        voice=new_voice,
+        language=new_language,
+        background_sound=new_background,
+        temperature=temperature,
+        response_speed=response_speed,
+        max_duration=new_max_duration,
+        phone_number=caller_id,
+        webhook_url=webhook_url,
+        keyword_tracking=keyword_tracking,
+        # Assistants left on the defaults pick up future changes to them
+        keywords=None if tracked_keywords == DEFAULT_KEYWORDS else tracked_keywords
+    )
+    if result['success']:
+        st.success("✅ Configuration saved successfully!")
+    else:
+        st.error(f"❌ {result['error']}")
@@ -0,0 +1,346 @@
+"""Bulk Operations: bulk calling, configuration updates, exports and maintenance"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+from callcenter.models import AssistantStatus
+from callcenter.dialer import BulkDialer, DialSettings, jobs_from_contacts, validate_settings
+from callcenter.assistants import VOICES, LANGUAGES, BACKGROUND_SOUNDS
+from callcenter.exports import EXPORT_FORMATS
+from ui.data import (
+    get_assistant_registry, get_call_store, get_contact_store, get_campaign_queue, get_assistant_router,
+    get_export_runner, get_vapi_manager, selected_assistant_config
+)
+from ui.components import contact_import_panel, export_job_panel
+
+assistant_registry = get_assistant_registry()
+assistant_configs = assistant_registry.configs
+current_config = selected_assistant_config()
+vapi_manager = get_vapi_manager()
+
+st.title("🎛️ Bulk Operations Center")
+
+# Operation Type Selection
+operation_type = st.selectbox(
+    "Select Bulk Operation",
+    ["📞 Bulk Calling", "⚙️ Configuration Update", "📊 Data Export", "🔄 System Maintenance", "📋 Campaign Management"]
+)
+
+if operation_type == "📞 Bulk Calling":
+    st.subheader("📞 Bulk Calling Operations")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # File Upload
+        uploaded_file = st.file_uploader("Upload Contact List (CSV/Excel)", type=['csv', 'xlsx'])
+        contact_import = contact_import_panel(uploaded_file, "bulk_calling") if uploaded_file else None
+
+        if contact_import and contact_import['status'] == 'completed':
+
+            # Bulk Call Configuration
+            st.subheader("🔧 Bulk Call Configuration")
+            
+            col_a, col_b, col_c = st.columns(3)
+            
+            with col_a:
+                selected_assistants = st.multiselect(
+                    "Select Assistants",
+                    [config.name for config in assistant_configs.values()],
+                    default=[current_config.name]
+                )
+            
+            with col_b:
+                call_delay = st.slider("Delay Between Calls (seconds)", 5, 300, 30)
+                max_concurrent = st.slider("Max Concurrent Calls", 1, 10, 3)
+            
+            with col_c:
+                campaign_name = st.text_input("Campaign Name", value=f"Campaign_{datetime.now().strftime('%Y%m%d_%H%M')}")
+                priority_level = st.selectbox("Priority Level", ["Low", "Normal", "High", "Urgent"], index=1)
+                campaign_budget = st.number_input("Budget ($, 0 = unlimited)", min_value=0.0, value=0.0, step=50.0)
+            
+            # Advanced Settings
+            with st.expander("🔧 Advanced Settings"):
+                col_x, col_y = st.columns(2)
+                
+                with col_x:
+                    retry_failed = st.checkbox("Retry Failed Calls", value=True)
+                    max_retries = st.slider("Max Retries", 1, 5, 2)
+                    time_zone_handling = st.selectbox("Time Zone Handling", ["Respect Local Time", "Use System Time"])
+                
+                with col_y:
+                    call_window_start = st.time_input("Call Window Start", value=datetime.strptime("09:00", "%H:%M").time())
+                    call_window_end = st.time_input("Call Window End", value=datetime.strptime("17:00", "%H:%M").time())
+                    weekend_calling = st.checkbox("Allow Weekend Calling", value=False)
+            
+            contact_list = get_contact_store().get_list(contact_import['list_id'])
+
+            # Bulk Call Execution
+            if st.button("🚀 Start Bulk Calling Campaign", type="primary"):
+                if not st.session_state.vapi_api_key:
+                    st.warning("⚠️ Please configure VAPI API key")
+                elif not selected_assistants:
+                    st.warning("⚠️ Please select at least one assistant")
+                elif campaign_name in st.session_state.bulk_campaigns and st.session_state.bulk_campaigns[campaign_name].is_running:
+                    st.warning(f"⚠️ Campaign '{campaign_name}' is already running")
+                else:
+                    assistant_ids = [config.id for config in assistant_configs.values() if config.name in selected_assistants]
+                    dial_settings = DialSettings(
+                        max_concurrent=max_concurrent,
+                        call_delay=call_delay,
+                        max_retries=max_retries if retry_failed else 0,
+                        call_window_start=call_window_start,
+                        call_window_end=call_window_end,
+                        weekend_calling=weekend_calling
+                    )
+                    dial_jobs = jobs_from_contacts(
+                        get_contact_store().iter_contacts(contact_import['list_id']),
+                        contact_list['phone_column'], assistant_ids,
+                        contact_fields={'campaign': campaign_name},
+                        respect_local_time=time_zone_handling == "Respect Local Time"
+                    )
+                    try:
+                        validate_settings(dial_settings)
+                    except ValueError as error:
+                        st.error(f"❌ {error}")
+                    else:
+                        get_campaign_queue().register(campaign_name, priority_level, campaign_budget or None)
+                        st.session_state.bulk_campaigns[campaign_name] = BulkDialer(
+                            vapi_manager, dial_jobs, dial_settings, total=contact_import['valid'],
+                            queue=get_campaign_queue(), campaign=campaign_name,
+                            router=get_assistant_router(), assistant_ids=assistant_ids,
+                            call_store=get_call_store()
+                        ).start()
+                        st.success(f"✅ Bulk calling campaign '{campaign_name}' initiated!")
+            
+            # Progress tracking
+            if campaign_name in st.session_state.bulk_campaigns:
+                progress = st.session_state.bulk_campaigns[campaign_name].snapshot()
+                st.subheader("📊 Campaign Progress")
+                
+                progress_col1, progress_col2, progress_col3 = st.columns(3)
+                
+                with progress_col1:
+                    st.progress(progress['completed'] / progress['total'] if progress['total'] else 0)
+                    st.text(f"Called {progress['completed']} of {progress['total']} contacts")
+                    st.button("🔄 Refresh Progress")
+                
+                with progress_col2:
+                    st.metric("Calls Completed", progress['completed'])
+                    st.metric("Successful Calls", progress['successful'])
+                
+                with progress_col3:
+                    st.metric("Pending Retries", progress['pending_retries'])
+                    st.metric("Current Cost", f"${progress['cost']:.2f}")
+                
+                if progress['recent_errors']:
+                    with st.expander(f"❌ Failed Calls ({progress['failed']})"):
+                        st.dataframe(pd.DataFrame(progress['recent_errors']), use_container_width=True)
+                
+                if progress['budget_exhausted']:
+                    st.warning(f"💸 Campaign '{campaign_name}' stopped: budget of ${campaign_budget:.2f} reached")
+                elif progress['running']:
+                    if st.button("⏹️ Stop Campaign"):
+                        st.session_state.bulk_campaigns[campaign_name].stop()
+                        st.info(f"Campaign '{campaign_name}' will stop after in-flight calls finish")
+                elif not progress['stopped']:
+                    st.success("🎉 Bulk calling campaign completed successfully!")
+    
+    with col2:
+        # Campaign Statistics
+        st.subheader("📊 Campaign Statistics")
+        
+        if contact_import and contact_import['status'] == 'completed':
+            total_contacts = contact_import['valid']
+            estimated_duration = total_contacts * call_delay / 60
+            estimated_cost = total_contacts * 0.15
+            
+            st.metric("Total Contacts", total_contacts)
+            st.metric("Estimated Duration", f"{estimated_duration:.0f} minutes")
+            st.metric("Estimated Cost", f"${estimated_cost:.2f}")
+            st.metric("Selected Assistants", len(selected_assistants))
+        
+        # Active Campaigns
+        st.subheader("🔄 Active Campaigns")
+        
+        active_campaigns = [
+            {
+                "name": name,
+                "progress": int(100 * snapshot['completed'] / snapshot['total']) if snapshot['total'] else 0,
+                "status": "Running" if snapshot['running'] else "Stopped" if snapshot['stopped'] else "Completed"
+            }
+            for name, snapshot in (
+                (name, dialer.snapshot()) for name, dialer in st.session_state.bulk_campaigns.items()
+            )
+        ] + [
+            {"name": "Holiday Promotion", "progress": 75, "status": "Running"},
+            {"name": "Lead Follow-up", "progress": 45, "status": "Running"},
+            {"name": "Survey Campaign", "progress": 100, "status": "Completed"}
+        ]
+        
+        for campaign in active_campaigns:
+            with st.container():
+                st.write(f"**{campaign['name']}**")
+                st.progress(campaign['progress'] / 100)
+                st.caption(f"Status: {campaign['status']} ({campaign['progress']}%)")
+
+elif operation_type == "⚙️ Configuration Update":
+    st.subheader("⚙️ Bulk Configuration Updates")
+    
+    # Configuration Type
+    config_type = st.selectbox(
+        "Configuration Type",
+        ["Voice Settings", "AI Parameters", "Call Settings", "Integration Settings", "Analytics Settings"]
+    )
+    
+    # Assistant Selection
+    st.subheader("🎯 Assistant Selection")
+    
+    selection_method = st.radio(
+        "Selection Method",
+        ["Select All", "Select by Status", "Select by Specialization", "Custom Selection"]
+    )
+    
+    if selection_method == "Select All":
+        selected_configs = list(assistant_configs.keys())
+    elif selection_method == "Select by Status":
+        status_filter = st.multiselect("Select Status", [status.value for status in AssistantStatus])
+        selected_configs = list(assistant_registry.with_status(*[AssistantStatus(status) for status in status_filter]))
+    elif selection_method == "Select by Specialization":
+        spec_filter = st.multiselect("Select Specialization", assistant_registry.specializations())
+        selected_configs = list(assistant_registry.with_specialization(*spec_filter))
+    else:
+        selected_configs = st.multiselect("Select Assistants", list(assistant_configs.keys()), 
+                                        format_func=lambda x: assistant_configs[x].name)
+    
+    st.info(f"Selected {len(selected_configs)} assistants for configuration update")
+    
+    # Only fields stored on the assistant config are persisted
+    config_changes = {}
+    
+    # Configuration Updates
+    if config_type == "Voice Settings":
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            update_voice = st.checkbox("Update Voice")
+            if update_voice:
+                config_changes['voice'] = st.selectbox("New Voice", VOICES)
+            
+            update_language = st.checkbox("Update Language")
+            if update_language:
+                config_changes['language'] = st.selectbox("New Language", LANGUAGES)
+        
+        with col2:
+            update_background = st.checkbox("Update Background Sound")
+            if update_background:
+                config_changes['background_sound'] = st.selectbox("New Background Sound", BACKGROUND_SOUNDS)
+            
+            update_speed = st.checkbox("Update Speech Speed")
+            if update_speed:
+                new_speed = st.slider("New Speech Speed", 0.5, 2.0, 1.0, 0.1)
+    
+    elif config_type == "AI Parameters":
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            update_temperature = st.checkbox("Update Temperature")
+            if update_temperature:
+                config_changes['temperature'] = st.slider("New Temperature", 0.0, 1.0, 0.7, 0.1)
+            
+            update_model = st.checkbox("Update AI Model")
+            if update_model:
+                new_model = st.selectbox("New AI Model", ["GPT-4", "GPT-3.5-Turbo", "Claude-3"])
+        
+        with col2:
+            update_response_speed = st.checkbox("Update Response Speed")
+            if update_response_speed:
+                config_changes['response_speed'] = st.selectbox("New Response Speed", ["slow", "normal", "fast"])
+            
+            update_context = st.checkbox("Update Context Window")
+            if update_context:
+                new_context = st.slider("New Context Window", 1000, 8000, 4000)
+    
+    # Apply Updates
+    if st.button("🔄 Apply Configuration Updates", type="primary"):
+        if selected_configs and config_changes:
+            result = assistant_registry.update_many(selected_configs, **config_changes)
+            if result['success']:
+                st.success(f"✅ Configuration updated for {result['updated']} assistants!")
+            else:
+                st.error(f"❌ {result['error']}")
+        elif selected_configs:
+            st.warning("⚠️ Please choose at least one setting to update")
+        else:
+            st.warning("⚠️ Please select at least one assistant")
+
+elif operation_type == "📊 Data Export":
+    st.subheader("📊 Bulk Data Export")
+    
+    # Export Configuration
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        export_type = st.selectbox(
+            "Export Type",
+            ["Call Logs", "Performance Metrics", "Financial Data", "Configuration Backup", "Complete Dataset"]
+        )
+        
+        date_range = st.date_input(
+            "Date Range",
+            value=[datetime.now().date() - timedelta(days=30), datetime.now().date()],
+            max_value=datetime.now().date()
+        )
+    
+    with col2:
+        export_format = st.selectbox("Export Format", list(EXPORT_FORMATS))
+        
+        include_filters = st.multiselect(
+            "Include Data",
+            ["Call Transcripts", "Sentiment Analysis", "Lead Scores", "Cost Analysis", "Performance Metrics"]
+        )
+    
+    # Assistant Selection for Export
+    export_assistants = st.multiselect(
+        "Select Assistants for Export",
+        [config.name for config in assistant_configs.values()],
+        default=[config.name for config in assistant_configs.values()]
+    )
+    export_ids = [config.id for config in assistant_configs.values() if config.name in export_assistants]
+    
+    # Exports run as background jobs; asking again for the same export reuses its file
+    if st.button("📥 Generate Export", type="primary"):
+        if export_type in ("Call Logs", "Complete Dataset"):
+            export_start = date_range[0] if date_range else datetime.now().date()
+            export_end = date_range[-1] if date_range else export_start
+            job = get_export_runner().submit('calls', export_format, {
+                'assistant_names': {config.id: config.name for config in assistant_configs.values()},
+                'include': None if export_type == "Complete Dataset" else include_filters,
+                'filters': {
+                    'assistant_ids': None if len(export_ids) == len(assistant_configs) else export_ids,
+                    'start': datetime.combine(export_start, datetime.min.time()).isoformat(),
+                    'end': datetime.combine(export_end + timedelta(days=1), datetime.min.time()).isoformat()
+                }
+            }, name="vapi_export")
+        else:
+            job = get_export_runner().submit(
+                export_type.lower().replace(" ", "_"), export_format, {'assistant_ids': export_ids}, name="vapi_export"
+            )
+        st.session_state.bulk_export_job = job['job_id']
+    
+    if st.session_state.get('bulk_export_job'):
+        export_job_panel(st.session_state.bulk_export_job, key="bulk_export")
+    
+    # Recent exports from every session, still downloadable by their job id
+    recent_jobs = get_export_runner().jobs(limit=10)
+    if recent_jobs:
+        with st.expander("🗂️ Recent Exports"):
+            st.dataframe(pd.DataFrame([
+                {
+                    'File': job['file_name'],
+                    'Status': job['status'].title(),
+                    'Rows': job['rows'],
+                    'Requested': datetime.fromtimestamp(job['created_at']).strftime('%Y-%m-%d %H:%M:%S')
+                }
+                for job in recent_jobs
+            ]), use_container_width=True, hide_index=True)
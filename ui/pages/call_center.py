@@ -0,0 +1,243 @@
+"""Call Center: single, batch and scheduled calls for the selected assistant"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from callcenter.models import CallStatus
+from callcenter.dialer import BulkDialer, DialSettings, jobs_from_contacts
+from callcenter.phones import normalize_phone
+from ui.data import (
+    get_assistant_registry, get_call_store, get_contact_store, get_assistant_router,
+    get_call_scheduler, get_sheets_manager, get_vapi_manager, selected_assistant_config, track_calls,
+    sync_active_calls
+)
+from ui.components import contact_import_panel
+
+assistant_registry = get_assistant_registry()
+current_config = selected_assistant_config()
+vapi_manager = get_vapi_manager()
+sheets_manager = get_sheets_manager(st.session_state.google_credentials)
+
+st.title(f"📞 Call Center - {current_config.name}")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    # Enhanced Assistant Information
+    st.markdown(f"""
+    <div class="assistant-card">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div>
+                <h3>{current_config.name}</h3>
+                <p><strong>Specialization:</strong> {current_config.specialization}</p>
+                <p><strong>ID:</strong> {current_config.id}</p>
+                <p><strong>Phone:</strong> {current_config.phone_number}</p>
+                <p><strong>Voice:</strong> {current_config.voice} | <strong>Language:</strong> {current_config.language}</p>
+            </div>
+            <div>
+                <span class="status-{current_config.status.value}">{current_config.status.value.upper()}</span>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Enhanced Call Interface
+    st.subheader("📞 Call Management")
+    
+    # Call Configuration Tabs
+    tab1, tab2, tab3 = st.tabs(["📞 Single Call", "📋 Batch Calls", "🔄 Scheduled Calls"])
+    
+    with tab1:
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            target_phone = st.text_input("Target Phone Number", placeholder="+1-555-0123")
+        with col_b:
+            call_type = st.selectbox("Call Type", ["Outbound Sales", "Follow-up", "Survey", "Support", "Appointment"])
+        with col_c:
+            priority = st.selectbox("Priority", ["Low", "Normal", "High", "Urgent"])
+        
+        custom_prompt = st.text_area("Custom Prompt Override", 
+                                   placeholder="Enter custom instructions for this call...",
+                                   value=current_config.custom_prompt)
+        
+        col_x, col_y, col_z = st.columns(3)
+        with col_x:
+            max_duration = st.slider("Max Duration (seconds)", 60, 600, current_config.max_duration)
+        with col_y:
+            callback_url = st.text_input("Callback URL", placeholder="https://your-webhook.com/callback")
+        with col_z:
+            record_call = st.checkbox("Record Call", value=True)
+            auto_route = st.checkbox("🔀 Route to Least-Loaded Assistant", value=False)
+        
+        if st.button("🚀 Initiate Call", type="primary", use_container_width=True):
+            router = get_assistant_router()
+            routed_id = None
+            if target_phone and st.session_state.vapi_api_key:
+                routed_id = router.route(None if auto_route else [current_config.id], timeout=0)
+            if routed_id is None and target_phone and st.session_state.vapi_api_key:
+                st.warning("⚠️ No assistant has a free call slot right now")
+            elif routed_id is not None:
+                with st.spinner("Initiating call..."):
+                    result = vapi_manager.initiate_call(routed_id, target_phone, custom_prompt)
+                    if "success" in result:
+                        router.bind(result['call_id'], routed_id)
+                        track_calls([result['call_record']])
+                        st.success(f"✅ Call initiated successfully!")
+                        if routed_id != current_config.id:
+                            routed_name = assistant_registry.by_id(routed_id).name
+                            st.info(f"🔀 Routed to {routed_name}")
+                        st.info(f"📞 Call ID: {result['call_id']}")
+                        st.info(f"💰 Estimated Cost: ${result['estimated_cost']:.2f}")
+                    else:
+                        router.release(routed_id)
+                        st.error(f"❌ Call failed: {result.get('error', 'Unknown error')}")
+            else:
+                st.warning("⚠️ Please enter phone number and configure VAPI API key")
+    
+    with tab2:
+        st.subheader("📋 Batch Call Operations")
+        
+        uploaded_file = st.file_uploader("Upload Phone Numbers (CSV)", type=['csv'])
+        batch_import = contact_import_panel(uploaded_file, "batch_calls") if uploaded_file else None
+        if batch_import and batch_import['status'] == 'completed':
+            col_batch1, col_batch2 = st.columns(2)
+            with col_batch1:
+                batch_delay = st.slider("Delay Between Calls (seconds)", 5, 300, 30)
+            with col_batch2:
+                batch_size = st.slider("Batch Size", 1, 50, 10)
+
+            batch_name = f"Batch_{current_config.id}_{batch_import['list_id']}"
+            if st.button("🚀 Start Batch Calling"):
+                if not st.session_state.vapi_api_key:
+                    st.warning("⚠️ Please configure VAPI API key")
+                elif batch_name in st.session_state.bulk_campaigns and st.session_state.bulk_campaigns[batch_name].is_running:
+                    st.warning("⚠️ This batch is already running")
+                else:
+                    contact_list = get_contact_store().get_list(batch_import['list_id'])
+                    st.session_state.bulk_campaigns[batch_name] = BulkDialer(
+                        vapi_manager,
+                        jobs_from_contacts(
+                            get_contact_store().iter_contacts(batch_import['list_id']),
+                            contact_list['phone_column'], [current_config.id]
+                        ),
+                        DialSettings(max_concurrent=batch_size, call_delay=batch_delay),
+                        total=batch_import['valid'],
+                        router=get_assistant_router(), assistant_ids=[current_config.id],
+                        call_store=get_call_store()
+                    ).start()
+                    st.success(f"✅ Batch calling initiated for {batch_import['valid']:,} numbers")
+
+            if batch_name in st.session_state.bulk_campaigns:
+                batch_progress = st.session_state.bulk_campaigns[batch_name].snapshot()
+                st.progress(batch_progress['completed'] / batch_progress['total'] if batch_progress['total'] else 0)
+                st.text(f"Called {batch_progress['completed']} of {batch_progress['total']} numbers")
+                if not batch_progress['running'] and not batch_progress['stopped']:
+                    st.success("🎉 Batch calling completed!")
+    
+    with tab3:
+        st.subheader("🔄 Scheduled Call Management")
+        
+        col_sched1, col_sched2 = st.columns(2)
+        with col_sched1:
+            schedule_date = st.date_input("Schedule Date")
+            schedule_time = st.time_input("Schedule Time")
+        with col_sched2:
+            repeat_frequency = st.selectbox("Repeat", ["Once", "Daily", "Weekly", "Monthly"])
+            timezone = st.selectbox("Timezone", ["UTC", "EST", "PST", "CST", "MST"])
+        
+        scheduled_phone = st.text_input("Phone Number for Scheduled Call")
+        scheduled_prompt = st.text_area("Scheduled Call Prompt")
+        
+        if st.button("📅 Schedule Call"):
+            scheduled_number, phone_error = normalize_phone(scheduled_phone)
+            if phone_error:
+                st.warning(f"⚠️ {phone_error}")
+            else:
+                result = get_call_scheduler().schedule(
+                    scheduled_number, current_config.id, datetime.combine(schedule_date, schedule_time),
+                    timezone=timezone, repeat=repeat_frequency, custom_prompt=scheduled_prompt
+                )
+                if "success" in result:
+                    st.success(f"✅ Call scheduled for {result['due_at'].strftime('%Y-%m-%d %H:%M')} ({repeat_frequency})")
+                else:
+                    st.error(f"❌ {result['error']}")
+                if not st.session_state.vapi_api_key:
+                    st.info("Scheduled calls are placed once a VAPI API key is configured")
+
+        upcoming_calls = get_call_scheduler().upcoming(limit=10, assistant_id=current_config.id)
+        if upcoming_calls:
+            st.write("**Upcoming Scheduled Calls**")
+            st.dataframe(pd.DataFrame([
+                {
+                    'Due': call['due_at'],
+                    'Phone Number': call['phone_number'],
+                    'Timezone': call['timezone'],
+                    'Repeat': call['repeat'],
+                    'Occurrence': call['occurrence'] + 1
+                }
+                for call in upcoming_calls
+            ]), use_container_width=True)
+
+with col2:
+    # Enhanced Quick Stats and Controls
+    st.subheader("📊 Real-time Stats")
+    
+    metrics_data, _ = sheets_manager.get_sheet_data(current_config.sheet_id, current_config)
+    
+    # Performance Metrics
+    st.metric("Calls Today", metrics_data['calls_today'], delta=f"+{metrics_data['calls_today'] - metrics_data.get('calls_yesterday', metrics_data['calls_today'] - 5)}")
+    st.metric("Success Rate", f"{metrics_data['success_rate']:.1f}%", delta=f"+{metrics_data['success_rate'] - 75:.1f}%")
+    st.metric("Avg Duration", f"{metrics_data['avg_duration']}s", delta=f"+{metrics_data['avg_duration'] - 180}s")
+    st.metric("Revenue Today", f"${metrics_data.get('revenue_today', 1250):.0f}", delta=f"+${metrics_data.get('revenue_today', 1250) - 1100:.0f}")
+    
+    # Quick Actions
+    st.subheader("⚡ Quick Actions")
+    
+    if st.button("⏸️ Pause Assistant", use_container_width=True):
+        st.info("Assistant paused")
+    
+    if st.button("🔄 Restart Assistant", use_container_width=True):
+        st.info("Assistant restarted")
+    
+    if st.button("📊 Generate Report", use_container_width=True):
+        st.info("Report generated")
+    
+    # Active Calls Monitor
+    st.subheader("📞 Active Calls")
+    
+    sync_active_calls()
+    assistant_load = next(
+        (row for row in get_assistant_router().load() if row['assistant_id'] == current_config.id), None
+    )
+    if assistant_load is not None:
+        st.caption(
+            f"Call slots in use: {assistant_load['in_flight']}/{assistant_load['limit']} "
+            f"({get_assistant_router().status(current_config.id).value})"
+        )
+    
+    if st.session_state.active_calls:
+        for call_id, call in st.session_state.active_calls.items():
+            if call.assistant_id == current_config.id:
+                duration = int((datetime.now() - call.start_time).total_seconds())
+                st.markdown(f"""
+                <div class="call-log-row">
+                    <strong>📞 {call.phone_number}</strong><br>
+                    Duration: {duration}s<br>
+                    Status: {call.status.value}
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("No active calls")
+    
+    # Recent Call History
+    st.subheader("🕒 Recent Calls")
+    
+    recent_calls = get_call_store().recent(limit=10, assistant_id=current_config.id)
+    for call in recent_calls:
+        status_icon = "✅" if call.status == CallStatus.COMPLETED else "❌" if call.status == CallStatus.FAILED else "🔄"
+        st.markdown(f"""
+        <div class="call-log-row">
+            {status_icon} <strong>{call.phone_number}</strong><br>
+            <small>{call.start_time.strftime('%H:%M:%S')} - {call.status.value}</small>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,162 @@
+"""Call Logs: filtered, paginated call history with export"""
+import streamlit as st
+from datetime import datetime, timedelta
+
+from callcenter.models import CALL_STATUS_LABELS, TERMINAL_CALL_STATUSES
+from callcenter.exports import EXPORT_FORMATS
+from ui.data import (
+    get_assistant_registry, get_call_store, get_export_runner, call_log_frame, cached_call_log_summary
+)
+from ui.components import export_job_panel
+
+assistant_registry = get_assistant_registry()
+assistant_configs = assistant_registry.configs
+
+st.title("📋 Comprehensive Call Logs")
+
+@st.fragment
+def call_log_browser():
+    """Filters, table and export; their widgets rerun only this fragment"""
+    # Advanced Filtering
+    st.subheader("🔍 Advanced Filters")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        date_filter = st.date_input(
+            "Date Range",
+            value=[datetime.now().date() - timedelta(days=7), datetime.now().date()]
+        )
+
+    with col2:
+        assistant_filter = st.multiselect(
+            "Assistants",
+            [config.name for config in assistant_configs.values()],
+            default=[config.name for config in assistant_configs.values()]
+        )
+
+    with col3:
+        status_filter = st.multiselect(
+            "Call Status",
+            list(CALL_STATUS_LABELS.values()),
+            default=[CALL_STATUS_LABELS[status] for status in TERMINAL_CALL_STATUSES]
+        )
+
+    with col4:
+        duration_filter = st.slider("Min Duration (seconds)", 0, 600, 0)
+
+    # Filters are pushed down to the call store's indexes
+    date_start = date_filter[0] if date_filter else datetime.now().date()
+    date_end = date_filter[-1] if date_filter else date_start
+    log_filters = {
+        'start': datetime.combine(date_start, datetime.min.time()),
+        'end': datetime.combine(date_end + timedelta(days=1), datetime.min.time()),
+        # Selecting every assistant is the same as not filtering, and cheaper to query
+        'assistant_ids': None if len(assistant_filter) == len(assistant_configs) else [
+            config.id for config in assistant_configs.values() if config.name in assistant_filter
+        ],
+        'statuses': [status.value for status, label in CALL_STATUS_LABELS.items() if label in status_filter],
+        'min_duration': duration_filter
+    }
+    call_store = get_call_store()
+    log_summary = cached_call_log_summary(**log_filters)
+
+    # Summary Statistics
+    st.subheader("📊 Call Log Summary")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric("Total Calls", log_summary['total'])
+    with col2:
+        st.metric("Avg Duration", f"{log_summary['avg_duration']:.0f}s")
+    with col3:
+        st.metric("Success Rate", f"{log_summary['success_rate']:.1f}%")
+    with col4:
+        st.metric("Total Cost", f"${log_summary['total_cost']:.2f}")
+    with col5:
+        st.metric("Avg Lead Score", f"{log_summary['avg_lead_score']:.1f}")
+
+    # Call Logs Table with Enhanced Features
+    st.subheader("📋 Detailed Call Logs")
+
+    # Search functionality
+    search_term = st.text_input(
+        "🔍 Search calls",
+        placeholder='Search transcripts, notes, campaigns or phone numbers ("quoted phrase", prefix*)...'
+    )
+
+    if search_term:
+        log_filters['search'] = search_term
+        total_matches = cached_call_log_summary(**log_filters)['total']
+    else:
+        total_matches = log_summary['total']
+
+    # Pagination
+    page_size = st.selectbox("Rows per page", [25, 50, 100, 200], index=1)
+    total_pages = (total_matches - 1) // page_size + 1 if total_matches > 0 else 1
+
+    # Keyset cursors of the pages visited so far; changing the filters starts again at page 1
+    cursor_key = (repr(sorted(log_filters.items())), page_size)
+    if st.session_state.get('call_log_cursor_key') != cursor_key:
+        st.session_state.call_log_cursor_key = cursor_key
+        st.session_state.call_log_cursors = [None]
+    cursors = st.session_state.call_log_cursors
+
+    # Display paginated results
+    if total_matches > 0:
+        calls_page, next_cursor = call_store.query_page(page_size, before=cursors[-1], columnar=True, **log_filters)
+        current_page = len(cursors)
+        start_idx = (current_page - 1) * page_size
+        st.dataframe(
+            call_log_frame(calls_page),
+            use_container_width=True,
+            hide_index=True
+        )
+
+        col_prev, col_caption, col_next = st.columns([1, 4, 1])
+        with col_prev:
+            if st.button("◀ Previous", key="call_log_prev", disabled=current_page == 1):
+                cursors.pop()
+                st.rerun(scope="fragment")
+        with col_caption:
+            st.caption(
+                f"Showing {start_idx + 1}-{start_idx + len(calls_page)} of {total_matches} calls "
+                f"(page {current_page} of {max(total_pages, current_page)})"
+            )
+        with col_next:
+            if st.button("Next ▶", key="call_log_next", disabled=next_cursor is None):
+                cursors.append(next_cursor)
+                st.rerun(scope="fragment")
+    else:
+        st.info("No calls found matching the current filters.")
+
+    # Export Options
+    st.subheader("📤 Export Options")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        log_export_format = st.selectbox("Export Format", list(EXPORT_FORMATS), label_visibility="collapsed")
+        if st.button("📊 Export Calls"):
+            # Written in the background a page of calls at a time; the same export requested again is reused
+            st.session_state.call_log_export_job = get_export_runner().submit('call_logs', log_export_format, {
+                'assistant_names': {config.id: config.name for config in assistant_configs.values()},
+                'filters': {
+                    name: value.isoformat() if isinstance(value, datetime) else value
+                    for name, value in log_filters.items()
+                }
+            }, name="call_logs")['job_id']
+        if st.session_state.get('call_log_export_job'):
+            export_job_panel(st.session_state.call_log_export_job, key="call_log_export")
+
+    with col2:
+        if st.button("📈 Generate Report"):
+            st.info("Detailed report generation initiated...")
+
+    with col3:
+        if st.button("📧 Email Report"):
+            st.info("Report will be emailed to configured recipients...")
+
+call_log_browser()
+
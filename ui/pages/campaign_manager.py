@@ -0,0 +1,178 @@
+"""Campaign Manager: campaign overview and the shared dispatch queue"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+from ui.data import get_assistant_registry, get_campaign_queue
+
+assistant_registry = get_assistant_registry()
+assistant_configs = assistant_registry.configs
+
+st.title("🎯 Campaign Management Center")
+
+# Campaign Overview
+st.subheader("📊 Campaign Overview")
+
+# Sample campaign data
+campaigns = [
+    {
+        "name": "Holiday Promotion 2024",
+        "status": "Active",
+        "start_date": "2024-12-01",
+        "end_date": "2024-12-31",
+        "target_calls": 5000,
+        "completed_calls": 3750,
+        "success_rate": 78.5,
+        "budget": 2500,
+        "spent": 1875,
+        "assistants": ["Assistant 1", "Assistant 5", "Assistant 12"]
+    },
+    {
+        "name": "Lead Follow-up Q4",
+        "status": "Active", 
+        "start_date": "2024-10-01",
+        "end_date": "2024-12-31",
+        "target_calls": 2000,
+        "completed_calls": 1200,
+        "success_rate": 82.3,
+        "budget": 1000,
+        "spent": 600,
+        "assistants": ["Assistant 3", "Assistant 8"]
+    },
+    {
+        "name": "Customer Survey",
+        "status": "Completed",
+        "start_date": "2024-11-01", 
+        "end_date": "2024-11-30",
+        "target_calls": 1500,
+        "completed_calls": 1500,
+        "success_rate": 91.2,
+        "budget": 750,
+        "spent": 720,
+        "assistants": ["Assistant 15", "Assistant 20"]
+    }
+]
+
+# Campaign Cards
+for campaign in campaigns:
+    with st.container():
+        col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+        
+        with col1:
+            status_color = {"Active": "🟢", "Completed": "🔵", "Paused": "🟡", "Failed": "🔴"}[campaign["status"]]
+            st.markdown(f"""
+            <div class="assistant-card">
+                <h4>{status_color} {campaign['name']}</h4>
+                <p><strong>Period:</strong> {campaign['start_date']} to {campaign['end_date']}</p>
+                <p><strong>Assistants:</strong> {', '.join(campaign['assistants'])}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            progress = campaign['completed_calls'] / campaign['target_calls']
+            st.metric("Progress", f"{progress:.1%}")
+            st.progress(progress)
+        
+        with col3:
+            st.metric("Success Rate", f"{campaign['success_rate']:.1f}%")
+            st.metric("Budget Used", f"${campaign['spent']:.0f}/${campaign['budget']:.0f}")
+        
+        with col4:
+            if campaign['status'] == 'Active':
+                if st.button(f"⏸️ Pause", key=f"pause_{campaign['name']}"):
+                    st.success(f"Campaign '{campaign['name']}' paused")
+                if st.button(f"📊 Details", key=f"details_{campaign['name']}"):
+                    st.info(f"Showing details for '{campaign['name']}'")
+            else:
+                if st.button(f"📈 Report", key=f"report_{campaign['name']}"):
+                    st.info(f"Generating report for '{campaign['name']}'")
+
+# Shared dispatch capacity across running campaigns
+@st.fragment
+def dispatch_queue():
+    """Capacity control and live queue metrics, rerun on their own"""
+    st.subheader("🚦 Dispatch Queue")
+
+    campaign_queue = get_campaign_queue()
+    queue_col1, queue_col2, queue_col3 = st.columns(3)
+    with queue_col1:
+        queue_capacity = st.slider("Concurrent Call Capacity", 1, 50, campaign_queue.capacity)
+        if queue_capacity != campaign_queue.capacity:
+            campaign_queue.set_capacity(queue_capacity)
+    queue_state = campaign_queue.snapshot()
+    queue_col2.metric("Calls In Flight", f"{queue_state['in_flight']}/{queue_state['capacity']}")
+    queue_col3.metric("Waiting for a Slot", queue_state['queue_depth'])
+
+    queue_metrics = campaign_queue.metrics()
+    if queue_metrics:
+        st.dataframe(pd.DataFrame([
+            {
+                'Campaign': row['campaign'],
+                'Priority': row['priority'],
+                'Queue Depth': row['queue_depth'],
+                'In Flight': row['in_flight'],
+                'Dispatched': row['dispatched'],
+                'Throughput Share': f"{row['share']:.1f}%",
+                'Avg Wait (s)': round(row['avg_wait'], 2),
+                'P95 Wait (s)': round(row['p95_wait'], 2),
+                'Budget Used': f"${row['spent']:.2f}" + (f"/${row['budget']:.0f}" if row['budget'] else "")
+            }
+            for row in queue_metrics
+        ]), use_container_width=True)
+    else:
+        st.info("No campaigns are dispatching calls")
+
+dispatch_queue()
+
+# Create New Campaign
+st.subheader("➕ Create New Campaign")
+
+with st.expander("🆕 New Campaign Configuration"):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        campaign_name = st.text_input("Campaign Name")
+        campaign_type = st.selectbox("Campaign Type", 
+                                   ["Sales Outreach", "Lead Follow-up", "Customer Survey", 
+                                    "Appointment Scheduling", "Product Launch", "Event Promotion"])
+        
+        start_date = st.date_input("Start Date", value=datetime.now().date())
+        end_date = st.date_input("End Date", value=datetime.now().date() + timedelta(days=30))
+    
+    with col2:
+        target_calls = st.number_input("Target Calls", min_value=1, value=1000)
+        budget = st.number_input("Budget ($)", min_value=0.0, value=500.0)
+        
+        selected_assistants = st.multiselect(
+            "Select Assistants",
+            [config.name for config in assistant_configs.values()]
+        )
+    
+    # Campaign Script
+    st.subheader("📝 Campaign Script")
+    campaign_script = st.text_area(
+        "Campaign Script/Prompt",
+        height=150,
+        placeholder="Enter the script or prompt that assistants will use for this campaign..."
+    )
+    
+    # Advanced Settings
+    with st.expander("⚙️ Advanced Campaign Settings"):
+        col_a, col_b = st.columns(2)
+        
+        with col_a:
+            call_window_start = st.time_input("Call Window Start", value=datetime.strptime("09:00", "%H:%M").time())
+            call_window_end = st.time_input("Call Window End", value=datetime.strptime("17:00", "%H:%M").time())
+            max_attempts = st.slider("Max Call Attempts", 1, 5, 3)
+        
+        with col_b:
+            time_zone = st.selectbox("Time Zone", ["UTC", "EST", "PST", "CST", "MST"])
+            priority = st.selectbox("Campaign Priority", ["Low", "Normal", "High", "Urgent"])
+            auto_retry = st.checkbox("Auto-retry Failed Calls", value=True)
+    
+    if st.button("🚀 Create Campaign", type="primary"):
+        if campaign_name and selected_assistants:
+            st.success(f"✅ Campaign '{campaign_name}' created successfully!")
+            st.info("Campaign will start at the specified date and time.")
+        else:
+            st.warning("⚠️ Please fill in all required fields")
@@ -0,0 +1,143 @@
+"""Dashboard: headline KPIs and fleet performance charts"""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from callcenter.models import AssistantStatus
+from ui.data import get_analytics_engine, get_assistant_registry, performance_metrics
+from ui.components import change_from_last_month
+
+analytics_engine = get_analytics_engine()
+assistant_registry = get_assistant_registry()
+assistant_configs = assistant_registry.configs
+
+st.title("🏠 Executive Dashboard")
+
+# Key Performance Indicators
+st.subheader("📊 Key Performance Indicators")
+
+kpis, previous_kpis = analytics_engine.kpis(days=30)
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.markdown(f"""
+    <div class="metrics-card">
+        <h3>{kpis['calls']:,}</h3>
+        <p>Total Calls (30d)</p>
+        <small>{change_from_last_month(kpis['calls'], previous_kpis['calls'])}</small>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown(f"""
+    <div class="metrics-card">
+        <h3>{kpis['success_rate']:.1f}%</h3>
+        <p>Avg Success Rate</p>
+        <small>{change_from_last_month(kpis['success_rate'], previous_kpis['success_rate'])}</small>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col3:
+    total_revenue = sum(config.total_revenue for config in assistant_configs.values())
+    st.markdown(f"""
+    <div class="metrics-card">
+        <h3>${total_revenue:,.0f}</h3>
+        <p>Total Revenue</p>
+        <small>+18% from last month</small>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col4:
+    active_count = assistant_registry.status_counts().get(AssistantStatus.ACTIVE, 0)
+    st.markdown(f"""
+    <div class="metrics-card">
+        <h3>{active_count}/{len(assistant_configs)}</h3>
+        <p>Active Assistants</p>
+        <small>96% uptime</small>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col5:
+    st.markdown(f"""
+    <div class="metrics-card">
+        <h3>${kpis['avg_cost']:.2f}</h3>
+        <p>Avg Cost/Call</p>
+        <small>{change_from_last_month(kpis['avg_cost'], previous_kpis['avg_cost'])}</small>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Performance Charts
+st.subheader("📈 Performance Overview")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    # Daily Call Volume Trend
+    daily_trend = analytics_engine.daily_trend(days=30)
+    
+    fig_trend = go.Figure()
+    fig_trend.add_trace(go.Scatter(
+        x=daily_trend['Date'], 
+        y=daily_trend['Calls'],
+        mode='lines+markers',
+        name='Daily Calls',
+        line=dict(color='#667eea', width=3)
+    ))
+    fig_trend.update_layout(
+        title="Daily Call Volume Trend (30 Days)",
+        xaxis_title="Date",
+        yaxis_title="Number of Calls",
+        height=400
+    )
+    st.plotly_chart(fig_trend, use_container_width=True)
+
+with col2:
+    # Success Rate by Specialization
+    specialization_summary = analytics_engine.specialization_summary(assistant_configs, days=30)
+    
+    fig_success = px.bar(
+        x=specialization_summary['Specialization'],
+        y=specialization_summary['Success Rate'],
+        title="Success Rate by Specialization",
+        color=specialization_summary['Success Rate'],
+        color_continuous_scale="Viridis"
+    )
+    fig_success.update_layout(height=400)
+    st.plotly_chart(fig_success, use_container_width=True)
+
+# Top Performers
+st.subheader("🏆 Top Performing Assistants")
+
+performance_df = performance_metrics()
+top_performers = performance_df.nlargest(5, 'Success Rate')[['Assistant Name', 'Success Rate', 'Daily Calls', 'Revenue Generated']]
+
+for idx, row in top_performers.iterrows():
+    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+    with col1:
+        st.write(f"**{row['Assistant Name']}**")
+    with col2:
+        st.write(f"{row['Success Rate']:.1f}%")
+    with col3:
+        st.write(f"{row['Daily Calls']} calls")
+    with col4:
+        st.write(f"${row['Revenue Generated']:,.0f}")
+
+# Recent Activity Feed
+st.subheader("🔔 Recent Activity")
+
+activities = [
+    {"time": "2 minutes ago", "event": "Assistant 5 completed high-value lead call", "type": "success"},
+    {"time": "5 minutes ago", "event": "Assistant 12 started appointment scheduling campaign", "type": "info"},
+    {"time": "8 minutes ago", "event": "Assistant 3 achieved 95% success rate milestone", "type": "success"},
+    {"time": "12 minutes ago", "event": "System maintenance completed successfully", "type": "info"},
+    {"time": "15 minutes ago", "event": "New webhook integration activated", "type": "warning"}
+]
+
+for activity in activities:
+    icon = "✅" if activity["type"] == "success" else "ℹ️" if activity["type"] == "info" else "⚠️"
+    st.markdown(f"""
+    <div class="call-log-row">
+        {icon} <strong>{activity['time']}</strong>: {activity['event']}
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,261 @@
+"""Live Analytics: the selected assistant's sheet metrics and fleet trends"""
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from ui.data import (
+    get_analytics_engine, get_sheets_manager, selected_assistant_config, performance_metrics, sentiment_trend,
+    keyword_hits
+)
+
+analytics_engine = get_analytics_engine()
+current_config = selected_assistant_config()
+sheets_manager = get_sheets_manager(st.session_state.google_credentials)
+
+st.title("📊 Live Analytics Dashboard")
+
+# Real-time refresh indicator
+auto_refresh = st.session_state.user_preferences['auto_refresh']
+if auto_refresh:
+    st.markdown('<span class="real-time-indicator"></span>Auto-refresh enabled', unsafe_allow_html=True)
+
+# Time range selector
+col1, col2, col3 = st.columns([2, 1, 1])
+with col1:
+    time_range = st.selectbox("Time Range", ["Last Hour", "Last 24 Hours", "Last 7 Days", "Last 30 Days", "Custom"])
+with col2:
+    if st.button("🔄 Refresh Now"):
+        st.rerun()
+with col3:
+    export_format = st.selectbox("Export", ["PDF", "CSV", "Excel"])
+
+# Tiles and charts re-render on their own timer; the table filters below keep their state
+@st.fragment(run_every=st.session_state.user_preferences['refresh_interval'] if auto_refresh else None)
+def live_performance():
+    """Live metric tiles and the analytics charts"""
+    # Live Metrics Grid
+    st.subheader("📈 Live Performance Metrics")
+
+    metrics_data, call_log = sheets_manager.get_sheet_data(current_config.sheet_id, current_config)
+
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+
+    metrics = [
+        ("Total Calls", metrics_data['calls_today'], "+12%"),
+        ("Success Rate", f"{metrics_data['success_rate']:.1f}%", "+3.2%"),
+        ("Avg Duration", f"{metrics_data['avg_duration']}s", "-5s"),
+        ("Conversion", f"{metrics_data['conversion_rate']:.1f}%", "+2.1%"),
+        ("Revenue", f"${metrics_data['total_revenue']:,.0f}", "+18%"),
+        ("Satisfaction", f"{metrics_data['customer_satisfaction']:.1f}/5", "+0.3")
+    ]
+
+    for i, (label, value, delta) in enumerate(metrics):
+        with [col1, col2, col3, col4, col5, col6][i]:
+            st.metric(label, value, delta)
+
+    # Advanced Charts Section
+    st.subheader("📊 Advanced Analytics")
+
+    tab1, tab2, tab3, tab4 = st.tabs(["📈 Trends", "🎯 Performance", "💰 Revenue", "😊 Sentiment"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Call Volume Heatmap
+            hours = list(range(24))
+            days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+            # Calls over the last four weeks, from the hourly rollups
+            heatmap_data = analytics_engine.hourly_heatmap(current_config.id, days=28)
+
+            fig_heatmap = go.Figure(data=go.Heatmap(
+                z=heatmap_data,
+                x=hours,
+                y=days,
+                colorscale='Viridis',
+                hoverongaps=False
+            ))
+            fig_heatmap.update_layout(
+                title="Call Volume Heatmap (Hour vs Day)",
+                xaxis_title="Hour of Day",
+                yaxis_title="Day of Week"
+            )
+            st.plotly_chart(fig_heatmap, use_container_width=True)
+
+        with col2:
+            # Success Rate Trend, from the hourly rollups
+            success_trend = analytics_engine.daily_trend(days=30, assistant_ids=[current_config.id])
+
+            fig_success_trend = go.Figure()
+            fig_success_trend.add_trace(go.Scatter(
+                x=success_trend['Date'],
+                y=success_trend['Success Rate'],
+                mode='lines+markers',
+                name='Success Rate',
+                line=dict(color='#28a745', width=3)
+            ))
+            fig_success_trend.update_layout(
+                title="Success Rate Trend (30 Days)",
+                xaxis_title="Date",
+                yaxis_title="Success Rate (%)",
+                yaxis=dict(range=[0, 100])
+            )
+            st.plotly_chart(fig_success_trend, use_container_width=True)
+
+    with tab2:
+        # Performance Comparison
+        performance_df = performance_metrics()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Top vs Bottom Performers
+            top_5 = performance_df.nlargest(5, 'Success Rate')
+            bottom_5 = performance_df.nsmallest(5, 'Success Rate')
+
+            fig_comparison = go.Figure()
+            fig_comparison.add_trace(go.Bar(
+                name='Top 5',
+                x=top_5['Assistant Name'],
+                y=top_5['Success Rate'],
+                marker_color='#28a745'
+            ))
+            fig_comparison.add_trace(go.Bar(
+                name='Bottom 5',
+                x=bottom_5['Assistant Name'],
+                y=bottom_5['Success Rate'],
+                marker_color='#dc3545'
+            ))
+            fig_comparison.update_layout(
+                title="Performance Comparison: Top vs Bottom 5",
+                xaxis_title="Assistant",
+                yaxis_title="Success Rate (%)"
+            )
+            st.plotly_chart(fig_comparison, use_container_width=True)
+
+        with col2:
+            # Performance Distribution
+            fig_dist = px.histogram(
+                performance_df,
+                x='Success Rate',
+                nbins=20,
+                title="Success Rate Distribution",
+                color_discrete_sequence=['#667eea']
+            )
+            st.plotly_chart(fig_dist, use_container_width=True)
+
+    with tab3:
+        # Revenue Analytics
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Revenue by Specialization
+            revenue_by_spec = performance_df.groupby('Specialization')['Revenue Generated'].sum().reset_index()
+
+            fig_revenue_pie = px.pie(
+                revenue_by_spec,
+                values='Revenue Generated',
+                names='Specialization',
+                title="Revenue Distribution by Specialization"
+            )
+            st.plotly_chart(fig_revenue_pie, use_container_width=True)
+
+        with col2:
+            # Cost vs Revenue Analysis
+            fig_cost_revenue = px.scatter(
+                performance_df,
+                x='Cost per Call',
+                y='Revenue Generated',
+                size='Daily Calls',
+                color='Success Rate',
+                hover_name='Assistant Name',
+                title="Cost vs Revenue Analysis",
+                color_continuous_scale='Viridis'
+            )
+            st.plotly_chart(fig_cost_revenue, use_container_width=True)
+
+    with tab4:
+        # Sentiment Analysis
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Sentiment Distribution
+            sentiment_data = {
+                'Sentiment': ['Positive', 'Neutral', 'Negative'],
+                'Percentage': [metrics_data['sentiment_positive'], metrics_data['sentiment_neutral'], metrics_data['sentiment_negative']]
+            }
+
+            fig_sentiment = px.pie(
+                sentiment_data,
+                values='Percentage',
+                names='Sentiment',
+                title="Overall Sentiment Distribution",
+                color_discrete_map={
+                    'Positive': '#28a745',
+                    'Neutral': '#ffc107',
+                    'Negative': '#dc3545'
+                }
+            )
+            st.plotly_chart(fig_sentiment, use_container_width=True)
+
+        with col2:
+            # Sentiment Trend
+            trend = sentiment_trend(days=7)
+
+            fig_sentiment_trend = go.Figure()
+            fig_sentiment_trend.add_trace(go.Scatter(x=trend['Date'], y=trend['Positive'], name='Positive', line=dict(color='#28a745')))
+            fig_sentiment_trend.add_trace(go.Scatter(x=trend['Date'], y=trend['Neutral'], name='Neutral', line=dict(color='#ffc107')))
+            fig_sentiment_trend.add_trace(go.Scatter(x=trend['Date'], y=trend['Negative'], name='Negative', line=dict(color='#dc3545')))
+
+            fig_sentiment_trend.update_layout(
+                title="Sentiment Trend (7 Days)",
+                xaxis_title="Date",
+                yaxis_title="Percentage (%)"
+            )
+            st.plotly_chart(fig_sentiment_trend, use_container_width=True)
+
+        # Keyword Tracking
+        top_keywords = keyword_hits(current_config.id, days=7)
+        if top_keywords.empty:
+            st.info("No tracked keywords heard in the last 7 days.")
+        else:
+            fig_keywords = px.bar(
+                top_keywords,
+                x='Hits',
+                y='Keyword',
+                color='Category',
+                orientation='h',
+                title="Top Tracked Keywords (7 Days)",
+                color_discrete_map={
+                    'Positive': '#28a745',
+                    'Buying Intent': '#17a2b8',
+                    'Objection': '#dc3545'
+                }
+            )
+            fig_keywords.update_layout(yaxis={'categoryorder': 'total ascending'})
+            st.plotly_chart(fig_keywords, use_container_width=True)
+
+live_performance()
+
+# Detailed Analytics Table
+st.subheader("📋 Detailed Performance Table")
+
+performance_df = performance_metrics()
+
+# Add filters for the table
+col1, col2, col3 = st.columns(3)
+with col1:
+    status_filter = st.multiselect("Filter by Status", performance_df['Status'].unique(), default=performance_df['Status'].unique())
+with col2:
+    spec_filter = st.multiselect("Filter by Specialization", performance_df['Specialization'].unique(), default=performance_df['Specialization'].unique())
+with col3:
+    min_success_rate = st.slider("Minimum Success Rate", 0, 100, 0)
+
+filtered_performance = performance_df[
+    (performance_df['Status'].isin(status_filter)) &
+    (performance_df['Specialization'].isin(spec_filter)) &
+    (performance_df['Success Rate'] >= min_success_rate)
+]
+
+st.dataframe(filtered_performance, use_container_width=True)
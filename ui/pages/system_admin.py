@@ -0,0 +1,188 @@
+"""System Admin: health, users, backups and system logs"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import time
+
+
+st.title("🔧 System Administration")
+
+# Admin Tabs
+admin_tab1, admin_tab2, admin_tab3, admin_tab4 = st.tabs(["👥 User Management", "🔐 Security", "🗄️ Database", "📊 System Logs"])
+
+with admin_tab1:
+    st.subheader("👥 User Management")
+    
+    # User List
+    users = [
+        {"username": "admin", "role": "Administrator", "last_login": "2024-01-15 10:30", "status": "Active"},
+        {"username": "manager1", "role": "Manager", "last_login": "2024-01-15 09:15", "status": "Active"},
+        {"username": "operator1", "role": "Operator", "last_login": "2024-01-14 16:45", "status": "Active"},
+        {"username": "analyst1", "role": "Analyst", "last_login": "2024-01-13 14:20", "status": "Inactive"}
+    ]
+    
+    users_df = pd.DataFrame(users)
+    st.dataframe(users_df, use_container_width=True)
+    
+    # Add New User
+    with st.expander("➕ Add New User"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_username = st.text_input("Username")
+            new_email = st.text_input("Email")
+            new_role = st.selectbox("Role", ["Administrator", "Manager", "Operator", "Analyst"])
+        
+        with col2:
+            new_password = st.text_input("Password", type="password")
+            confirm_password = st.text_input("Confirm Password", type="password")
+            send_invite = st.checkbox("Send Email Invitation", value=True)
+        
+        if st.button("👤 Create User"):
+            if new_password == confirm_password:
+                st.success(f"✅ User '{new_username}' created successfully!")
+            else:
+                st.error("❌ Passwords do not match")
+
+with admin_tab2:
+    st.subheader("🔐 Security Settings")
+    
+    # Security Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Failed Login Attempts", "12", delta="-3")
+    with col2:
+        st.metric("Active Sessions", "8", delta="+2")
+    with col3:
+        st.metric("API Calls Today", "15,432", delta="+1,234")
+    with col4:
+        st.metric("Security Score", "98%", delta="+2%")
+    
+    # Security Settings
+    st.subheader("🛡️ Security Configuration")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Authentication")
+        two_factor_auth = st.checkbox("Enable 2FA", value=True)
+        session_timeout = st.slider("Session Timeout (minutes)", 15, 480, 60)
+        password_policy = st.selectbox("Password Policy", ["Standard", "Strong", "Enterprise"])
+    
+    with col2:
+        st.markdown("### API Security")
+        rate_limiting = st.checkbox("Enable Rate Limiting", value=True)
+        api_key_rotation = st.slider("API Key Rotation (days)", 30, 365, 90)
+        ip_whitelist = st.text_area("IP Whitelist", placeholder="192.168.1.0/24\n10.0.0.0/8")
+    
+    # Recent Security Events
+    st.subheader("🚨 Recent Security Events")
+    
+    security_events = [
+        {"time": "2024-01-15 10:45", "event": "Failed login attempt", "user": "unknown", "ip": "192.168.1.100"},
+        {"time": "2024-01-15 10:30", "event": "Successful login", "user": "admin", "ip": "192.168.1.50"},
+        {"time": "2024-01-15 09:15", "event": "API key used", "user": "system", "ip": "10.0.0.1"},
+        {"time": "2024-01-15 08:30", "event": "Password changed", "user": "manager1", "ip": "192.168.1.75"}
+    ]
+    
+    for event in security_events:
+        icon = "🔴" if "failed" in event["event"].lower() else "🟢"
+        st.markdown(f"""
+        <div class="call-log-row">
+            {icon} <strong>{event['time']}</strong> - {event['event']}<br>
+            <small>User: {event['user']} | IP: {event['ip']}</small>
+        </div>
+        """, unsafe_allow_html=True)
+
+with admin_tab3:
+    st.subheader("🗄️ Database Management")
+    
+    # Database Status
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Database Size", "2.4 GB", delta="+120 MB")
+    with col2:
+        st.metric("Total Records", "1,234,567", delta="+12,345")
+    with col3:
+        st.metric("Query Performance", "45ms avg", delta="-5ms")
+    with col4:
+        st.metric("Uptime", "99.9%", delta="+0.1%")
+    
+    # Database Operations
+    st.subheader("🔧 Database Operations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Maintenance")
+        
+        if st.button("🧹 Optimize Database"):
+            with st.spinner("Optimizing database..."):
+                time.sleep(3)
+                st.success("✅ Database optimized successfully!")
+        
+        if st.button("💾 Create Backup"):
+            with st.spinner("Creating backup..."):
+                time.sleep(5)
+                st.success("✅ Backup created successfully!")
+        
+        if st.button("🔄 Sync Data"):
+            with st.spinner("Syncing data..."):
+                time.sleep(2)
+                st.success("✅ Data synchronized!")
+    
+    with col2:
+        st.markdown("### Data Management")
+        
+        retention_days = st.slider("Data Retention (days)", 30, 365, 90)
+        
+        if st.button("🗑️ Clean Old Data"):
+            st.warning("This will permanently delete old data. Are you sure?")
+            if st.button("⚠️ Confirm Deletion"):
+                st.success("✅ Old data cleaned successfully!")
+        
+        if st.button("📊 Generate DB Report"):
+            st.info("Database report generated and saved.")
+
+with admin_tab4:
+    st.subheader("📊 System Logs")
+    
+    # Log Filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        log_level = st.selectbox("Log Level", ["All", "Error", "Warning", "Info", "Debug"])
+    with col2:
+        log_source = st.selectbox("Source", ["All", "API", "Database", "Auth", "Webhook"])
+    with col3:
+        log_date = st.date_input("Date", value=datetime.now().date())
+    
+    # System Logs
+    system_logs = [
+        {"timestamp": "2024-01-15 10:45:23", "level": "ERROR", "source": "API", "message": "Rate limit exceeded for IP 192.168.1.100"},
+        {"timestamp": "2024-01-15 10:44:15", "level": "INFO", "source": "Auth", "message": "User 'admin' logged in successfully"},
+        {"timestamp": "2024-01-15 10:43:02", "level": "WARNING", "source": "Database", "message": "High connection count detected"},
+        {"timestamp": "2024-01-15 10:42:18", "level": "INFO", "source": "Webhook", "message": "Webhook delivered successfully to endpoint"},
+        {"timestamp": "2024-01-15 10:41:45", "level": "DEBUG", "source": "API", "message": "Processing call initiation request"},
+    ]
+    
+    for log in system_logs:
+        level_color = {
+            "ERROR": "🔴",
+            "WARNING": "🟡", 
+            "INFO": "🔵",
+            "DEBUG": "⚪"
+        }[log["level"]]
+        
+        st.markdown(f"""
+        <div class="call-log-row">
+            {level_color} <strong>{log['timestamp']}</strong> [{log['level']}] {log['source']}<br>
+            {log['message']}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Log Export
+    if st.button("📥 Export Logs"):
+        st.success("✅ Logs exported successfully!")